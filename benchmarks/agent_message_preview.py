@@ -0,0 +1,84 @@
+"""Benchmark for accumulating managed-agents `agent.message` previews.
+
+Compares folding every `event_delta` of a streamed `agent.message` with
+`accumulate_managed_agents_event()`, which returns a fresh snapshot per delta,
+against `AgentMessageAccumulator`, which buffers the text and builds the
+snapshot once at the end, for previews of increasing length. The snapshots are
+checked to be equal.
+
+    python benchmarks/agent_message_preview.py
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, List, Optional, cast
+
+from anthropic._models import construct_type
+from anthropic.lib.sessions import AccumulatedEvent, AgentMessageAccumulator, accumulate_managed_agents_event
+from anthropic.types.beta.sessions import BetaManagedAgentsStreamSessionEvents
+
+
+def preview_events(deltas: int, *, blocks: int = 1) -> List[BetaManagedAgentsStreamSessionEvents]:
+    raw: List[Any] = [{"type": "event_start", "event": {"id": "evt_1", "type": "agent.message"}}]
+    for i in range(deltas):
+        raw.append(
+            {
+                "type": "event_delta",
+                "event_id": "evt_1",
+                "delta": {
+                    "type": "content_delta",
+                    "index": i * blocks // deltas,
+                    "content": {"type": "text", "text": f"token {i} "},
+                },
+            }
+        )
+    return [
+        cast(
+            BetaManagedAgentsStreamSessionEvents,
+            construct_type(type_=cast(Any, BetaManagedAgentsStreamSessionEvents), value=event),
+        )
+        for event in raw
+    ]
+
+
+def fold(events: List[BetaManagedAgentsStreamSessionEvents]) -> Optional[AccumulatedEvent]:
+    snapshot: Optional[AccumulatedEvent] = None
+    for event in events:
+        snapshot = accumulate_managed_agents_event(snapshot, event)
+    return snapshot
+
+
+def accumulate(events: List[BetaManagedAgentsStreamSessionEvents]) -> Optional[AccumulatedEvent]:
+    accumulator = AgentMessageAccumulator()
+    for event in events:
+        accumulator.accumulate(event)
+    return accumulator.snapshot
+
+
+def bench(name: str, events: List[BetaManagedAgentsStreamSessionEvents], fn: Any) -> float:
+    start = time.perf_counter()
+    fn(events)
+    elapsed = time.perf_counter() - start
+    rate = (len(events) - 1) / elapsed
+    print(f"  {name:<6} {rate:>12,.0f} deltas/s")
+    return rate
+
+
+def main() -> None:
+    cases = {
+        "1k deltas": preview_events(1_000),
+        "10k deltas": preview_events(10_000),
+        "50k deltas": preview_events(50_000),
+        "50k deltas, 10 blocks": preview_events(50_000, blocks=10),
+    }
+    for label, events in cases.items():
+        assert fold(events) == accumulate(events)
+        print(label)
+        folded = bench("fold", events, fold)
+        buffered = bench("buffer", events, accumulate)
+        print(f"  speedup {buffered / folded:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
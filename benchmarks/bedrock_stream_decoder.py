@@ -0,0 +1,100 @@
+"""Benchmark for decoding Bedrock's `application/vnd.amazon.eventstream` streaming responses.
+
+Compares the previous decoding, which ran every message through botocore's `EventStreamBuffer`,
+`to_response_dict()` and `EventStreamJSONParser`, against the native `AWSEventStreamDecoder`,
+feeding a synthetic stream of text deltas in network sized chunks.
+
+Requires the `bedrock` extra for the botocore comparison: `pip install anthropic[bedrock]`.
+
+    python benchmarks/bedrock_stream_decoder.py
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import base64
+import struct
+import binascii
+from typing import Any, Callable, Iterator
+
+from botocore.model import ServiceModel
+from botocore.loaders import Loader
+from botocore.parsers import EventStreamJSONParser
+from botocore.eventstream import EventStreamBuffer
+
+from anthropic.lib.bedrock._stream_decoder import AWSEventStreamDecoder, _chunk_bytes_to_sse
+
+EVENTS = 20_000
+CHUNK_SIZE = 16 * 1024
+REPEAT = 3
+
+
+def encode_message(event: dict[str, Any]) -> bytes:
+    payload = json.dumps({"bytes": base64.b64encode(json.dumps(event).encode()).decode(), "p": "abcdefghijkl"})
+    headers = b""
+    for name, value in ((":event-type", "chunk"), (":content-type", "application/json"), (":message-type", "event")):
+        headers += struct.pack("!B", len(name)) + name.encode() + b"\x07" + struct.pack("!H", len(value))
+        headers += value.encode()
+
+    prelude = struct.pack("!II", 12 + len(headers) + len(payload) + 4, len(headers))
+    message = prelude + struct.pack("!I", binascii.crc32(prelude)) + headers + payload.encode()
+    return message + struct.pack("!I", binascii.crc32(message))
+
+
+def make_body(events: int) -> bytes:
+    return b"".join(
+        encode_message(
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": f"token {i} "}}
+        )
+        for i in range(events)
+    )
+
+
+def chunks(body: bytes) -> Iterator[bytes]:
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start : start + CHUNK_SIZE]
+
+
+def botocore_decode(body: bytes) -> int:
+    shape = ServiceModel(Loader().load_service_model("bedrock-runtime", "service-2")).shape_for("ResponseStream")
+    parser = EventStreamJSONParser()
+    buffer = EventStreamBuffer()
+    count = 0
+    for chunk in chunks(body):
+        buffer.add_data(chunk)
+        for message in buffer:
+            response_dict = message.to_response_dict()
+            parsed = parser.parse(response_dict, shape)
+            if response_dict["status_code"] != 200:
+                raise ValueError(f"Bad response code, expected 200: {response_dict}")
+            chunk_event = parsed.get("chunk")
+            if chunk_event and _chunk_bytes_to_sse(chunk_event.get("bytes")):
+                count += 1
+    return count
+
+
+def native_decode(body: bytes) -> int:
+    return sum(1 for _ in AWSEventStreamDecoder().iter_bytes(chunks(body)))
+
+
+def bench(name: str, decode: Callable[[bytes], int], body: bytes) -> float:
+    best = 0.0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        assert decode(body) == EVENTS
+        best = max(best, EVENTS / (time.perf_counter() - start))
+    print(f"  {name:<10} {best:>12,.0f} events/s")
+    return best
+
+
+def main() -> None:
+    body = make_body(EVENTS)
+    print(f"{EVENTS:,} events, {len(body):,} bytes in {CHUNK_SIZE:,} byte chunks")
+    legacy = bench("botocore", botocore_decode, body)
+    native = bench("native", native_decode, body)
+    print(f"  speedup    {native / legacy:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
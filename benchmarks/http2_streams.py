@@ -0,0 +1,215 @@
+"""Benchmark for concurrent streams over the SDK's HTTP/2 transport.
+
+A local cleartext HTTP/2 server stands in for the API. It answers each request
+with a stream of server-sent events, paced like a long generation, or with a
+large body sent as fast as flow control allows. The same number of concurrent
+streams are read through httpx's own HTTP/2 transport and through
+`DefaultAsyncHttpxClient(http2=True)` with a few `HTTP2Limits`. The output
+reports how many connections were opened, the peak streams per connection, and
+the throughput.
+
+The large bodies are read while another response on the same connection is left
+unread, as when its consumer is busy; with httpx's windows that response takes
+the whole connection window and the others stall.
+
+Requires the `h2` package (`pip install 'httpx[http2]'`).
+
+    python benchmarks/http2_streams.py
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional
+
+import httpx
+import h2.config
+import h2.events
+import h2.settings
+import h2.connection
+
+from anthropic import HTTP2Limits, DefaultAsyncHttpxClient
+
+STREAMS = 500
+EVENTS = 10
+EVENT_INTERVAL = 0.1
+LARGE_STREAMS = 4
+LARGE_BODY = 4 * 1024 * 1024
+UNREAD_BODY = 64 * 1024 * 1024
+STALL_TIMEOUT = 10.0
+# the most streams the server lets a client open per connection
+SERVER_MAX_STREAMS = 128
+
+
+class H2Server:
+    def __init__(self) -> None:
+        self.connections = 0
+        self.peak_streams: List[int] = []
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._writers: List[asyncio.StreamWriter] = []
+        self.port = 0
+
+    def __enter__(self) -> H2Server:
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def reset(self) -> None:
+        self.connections = 0
+        self.peak_streams = []
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(asyncio.start_server(self._serve, "127.0.0.1", 0, backlog=1024))
+        self.port = server.sockets[0].getsockname()[1]
+        self._started.set()
+        self._loop.run_forever()
+
+        server.close()
+        for writer in self._writers:
+            writer.close()
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.append(writer)
+        index = self.connections
+        self.connections += 1
+        self.peak_streams.append(0)
+
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.local_settings = h2.settings.Settings(
+            client=False, initial_values={h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: SERVER_MAX_STREAMS}
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        active: Dict[int, asyncio.Event] = {}
+        window_opened = asyncio.Event()
+
+        async def send_events(stream_id: int) -> None:
+            for i in range(EVENTS):
+                conn.send_data(stream_id, f'event: content_block_delta\ndata: {{"index": {i}}}\n\n'.encode())
+                writer.write(conn.data_to_send())
+                await asyncio.sleep(EVENT_INTERVAL)
+
+        async def send_body(stream_id: int, size: int) -> None:
+            chunk = b"x" * conn.max_outbound_frame_size
+            while size:
+                window = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size, size)
+                if window <= 0:
+                    window_opened.clear()
+                    await window_opened.wait()
+                    continue
+                conn.send_data(stream_id, chunk[:window])
+                writer.write(conn.data_to_send())
+                size -= window
+                # lets the reading loop run, as flow control already bounds what is buffered
+                await asyncio.sleep(0)
+
+        async def respond(stream_id: int, path: str) -> None:
+            conn.send_headers(stream_id, [(":status", "200"), ("content-type", "text/event-stream")])
+            if path == "/large":
+                await send_body(stream_id, LARGE_BODY)
+            elif path == "/unread":
+                await send_body(stream_id, UNREAD_BODY)
+            else:
+                await send_events(stream_id)
+            conn.end_stream(stream_id)
+            writer.write(conn.data_to_send())
+            active.pop(stream_id, None)
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    headers = dict(event.headers)
+                    active[event.stream_id] = asyncio.Event()
+                    self.peak_streams[index] = max(self.peak_streams[index], len(active))
+                    asyncio.ensure_future(respond(event.stream_id, headers[b":path"].decode()))
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_opened.set()
+            writer.write(conn.data_to_send())
+        writer.close()
+
+
+async def run(server: H2Server, client: httpx.AsyncClient, path: str, streams: int) -> "tuple[float, int]":
+    received = 0
+
+    async def fetch() -> None:
+        nonlocal received
+        async with client.stream("POST", f"http://127.0.0.1:{server.port}{path}") as response:
+            async for chunk in response.aiter_raw():
+                received += len(chunk)
+
+    server.reset()
+    start = time.perf_counter()
+    if path == "/large":
+        async with client.stream("POST", f"http://127.0.0.1:{server.port}/unread"):
+            # gives the server time to send the unread response as much as flow control lets it
+            await asyncio.sleep(0.5)
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(asyncio.gather(*[fetch() for _ in range(streams)]), STALL_TIMEOUT)
+            except (asyncio.TimeoutError, httpx.TimeoutException):
+                pass
+    else:
+        await asyncio.gather(*[fetch() for _ in range(streams)])
+    return time.perf_counter() - start, received
+
+
+def bench(server: H2Server, name: str, limits: Optional[HTTP2Limits], *, path: str, streams: int) -> float:
+    async def main() -> "tuple[float, int]":
+        if limits is None:
+            client = httpx.AsyncClient(http1=False, http2=True, limits=httpx.Limits(max_connections=1000))
+        else:
+            client = DefaultAsyncHttpxClient(http1=False, http2=True, limits=limits)
+        async with client:
+            return await run(server, client, path, streams)
+
+    elapsed, received = asyncio.run(main())
+    peak = max(server.peak_streams)
+    if path != "/large":
+        rate = f"{streams / elapsed:>10,.0f} streams/s"
+    elif received < streams * LARGE_BODY:
+        rate = f"stalled after {received / 1024 / 1024:,.0f}MiB"
+    else:
+        rate = f"{received / elapsed / 1e6:>10,.0f} MB/s"
+    print(f"  {name:<24} {server.connections:>4} conns  {peak:>4} peak streams/conn  {rate}")
+    return elapsed
+
+
+def main() -> None:
+    with H2Server() as server:
+        print(f"{STREAMS} concurrent event streams ({EVENTS} events, {EVENT_INTERVAL * 1000:.0f}ms apart):")
+        baseline = bench(server, "httpx http2", None, path="/events", streams=STREAMS)
+        sdk = bench(server, "sdk http2 (default)", HTTP2Limits(), path="/events", streams=STREAMS)
+        bench(server, "sdk max_streams=50", HTTP2Limits(max_concurrent_streams=50), path="/events", streams=STREAMS)
+        print(f"  speedup (default): {baseline / sdk:.2f}x")
+
+        print(f"{LARGE_STREAMS} concurrent {LARGE_BODY // (1024 * 1024)}MiB responses beside an unread one:")
+        bench(server, "httpx http2", None, path="/large", streams=LARGE_STREAMS)
+        bench(server, "sdk http2 (default)", HTTP2Limits(), path="/large", streams=LARGE_STREAMS)
+        bench(
+            server,
+            "sdk window=1MiB",
+            HTTP2Limits(initial_window_size=1024 * 1024),
+            path="/large",
+            streams=LARGE_STREAMS,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Micro-benchmark for the JSON backends.
+
+Encodes the request body for a prompt with a few hundred KB of context, decodes
+the matching non-streaming response, and decodes the event payloads of a long
+stream, with the standard library, jiter (which the SDK depends on) and each
+optional backend that is installed (`pip install orjson msgspec`). The
+body is built with `maybe_transform` the way `messages.create()` builds it, and
+every backend's output is checked against the standard library's.
+
+    python benchmarks/json_backend.py
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, List, Callable
+
+from anthropic import set_json_backend
+from anthropic.types import message_create_params
+from anthropic._utils import maybe_transform
+from anthropic._utils._json import json_loads, openapi_dumps
+
+TURNS = 200
+STREAM_EVENTS = 20_000
+TEXT = "The quick brown fox jumps over the lazy dog. Café — “quoted”.\n" * 30
+
+
+def make_body() -> Any:
+    messages: List[Any] = []
+    for i in range(TURNS):
+        messages.append({"role": "user", "content": [{"type": "text", "text": f"{i}: {TEXT}"}]})
+        messages.append({"role": "assistant", "content": f"{i}: {TEXT[:200]}"})
+    messages.append({"role": "user", "content": "Summarize the conversation."})
+    params = {
+        "model": "claude-sonnet-4-5",
+        "max_tokens": 4096,
+        "temperature": 0.7,
+        "system": [{"type": "text", "text": TEXT * 10, "cache_control": {"type": "ephemeral"}}],
+        "messages": messages,
+        "metadata": {"user_id": "user_123"},
+    }
+    return maybe_transform(params, message_create_params.MessageCreateParamsNonStreaming)
+
+
+def make_response() -> bytes:
+    return openapi_dumps(
+        {
+            "id": "msg_123",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-sonnet-4-5",
+            "content": [{"type": "text", "text": TEXT * 100}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 100_000, "output_tokens": 4_000},
+        }
+    )
+
+
+def make_events() -> List[str]:
+    return [
+        openapi_dumps(
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": f"token {i} "}}
+        ).decode()
+        for i in range(STREAM_EVENTS)
+    ]
+
+
+def bench(name: str, fn: Callable[[], object], *, repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {name:<8} {elapsed * 1000:>10.2f}ms")
+    return elapsed
+
+
+def available() -> List[str]:
+    names = ["stdlib", "jiter"]
+    for name in ("orjson", "msgspec"):
+        try:
+            set_json_backend(name)
+        except ImportError:
+            print(f"({name} is not installed)")
+        else:
+            names.append(name)
+    return names
+
+
+def main() -> None:
+    backends = available()
+    body = make_body()
+    response = make_response()
+    events = make_events()
+
+    set_json_backend("stdlib")
+    expected_body = openapi_dumps(body)
+    expected_response = json_loads(response)
+    expected_events = [json_loads(event) for event in events]
+
+    scenarios: List[Any] = [
+        (f"encode request body ({len(expected_body) / 1024:,.0f}KB)", lambda: openapi_dumps(body), 50),
+        (f"decode response body ({len(response) / 1024:,.0f}KB)", lambda: json_loads(response), 50),
+        (f"decode {STREAM_EVENTS:,} stream events", lambda: [json_loads(event) for event in events], 10),
+    ]
+    for title, fn, repeat in scenarios:
+        print(f"{title}:")
+        timings = {}
+        for name in backends:
+            set_json_backend(name)
+            assert openapi_dumps(body) == expected_body
+            assert json_loads(response) == expected_response
+            assert [json_loads(event) for event in events] == expected_events
+            timings[name] = bench(name, fn, repeat=repeat)
+        for name in backends[1:]:
+            print(f"  speedup ({name}): {timings['stdlib'] / timings[name]:.2f}x")
+
+    set_json_backend("auto")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Micro-benchmark for `JSONLDecoder` over a synthetic Message Batch results file.
+
+The body is replayed in 64 byte chunks (what the decoder used to be given) and 64KB
+chunks (roughly what a socket read returns) and decoded by the previous
+line-concatenating implementation and the current decoder, both into plain JSON
+values, to isolate line splitting and parsing, and into models. The `.lazy()` mode
+is measured with a consumer that only inspects one in every ten results.
+
+    python benchmarks/jsonl_decoder.py
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Callable, Iterator
+
+import httpx
+
+from anthropic._models import construct_type_unchecked
+from anthropic.types.messages import MessageBatchIndividualResponse
+from anthropic._decoders.jsonl import JSONLDecoder
+
+LINES = 5_000
+
+
+def legacy_decode(iterator: Iterator[bytes], line_type: type[Any]) -> Iterator[Any]:
+    buf = b""
+    for chunk in iterator:
+        for line in chunk.splitlines(keepends=True):
+            buf += line
+            if buf.endswith((b"\r", b"\n", b"\r\n")):
+                yield construct_type_unchecked(value=json.loads(buf), type_=line_type)
+                buf = b""
+    if buf:
+        yield construct_type_unchecked(value=json.loads(buf), type_=line_type)
+
+
+def current_decode(iterator: Iterator[bytes], line_type: type[Any], *, lazy: bool = False) -> Iterator[Any]:
+    decoder = JSONLDecoder(raw_iterator=iterator, line_type=line_type, http_response=httpx.Response(200))
+    return iter(decoder.lazy() if lazy else decoder)
+
+
+def make_body() -> bytes:
+    lines = []
+    for i in range(LINES):
+        result: Any = {
+            "custom_id": f"req_{i}",
+            "result": {
+                "type": "succeeded",
+                "message": {
+                    "id": f"msg_{i}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": "claude-sonnet-4-5",
+                    "content": [{"type": "text", "text": "The quick brown fox jumps over the lazy dog. " * 20}],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": 100, "output_tokens": 200},
+                },
+            },
+        }
+        lines.append(json.dumps(result))
+    return "\n".join(lines).encode() + b"\n"
+
+
+def chunked(body: bytes, size: int) -> list[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def bench(
+    name: str, decode: Callable[[Iterator[bytes]], Iterator[Any]], chunks: list[bytes], *, inspect_every: int = 1
+) -> float:
+    start = time.perf_counter()
+    lines = 0
+    for result in decode(iter(chunks)):
+        if lines % inspect_every == 0 and not isinstance(result, dict):
+            assert result.custom_id
+        lines += 1
+    elapsed = time.perf_counter() - start
+    rate = lines / elapsed
+    print(f"  {name:<8} {rate:>12,.0f} lines/s")
+    return rate
+
+
+def main() -> None:
+    body = make_body()
+    print(f"{LINES:,} results, {len(body) / 1024 / 1024:.1f}MB")
+
+    for label, chunks in (("64B chunks", chunked(body, 64)), ("64KB chunks", chunked(body, 65536))):
+        print(f"JSON values [{label}]")
+        legacy = bench("legacy", lambda it: legacy_decode(it, object), chunks)
+        current = bench("current", lambda it: current_decode(it, object), chunks)
+        print(f"  speedup  {current / legacy:>12.2f}x")
+
+        print(f"models [{label}]")
+        legacy = bench("legacy", lambda it: legacy_decode(it, MessageBatchIndividualResponse), chunks)
+        current = bench("current", lambda it: current_decode(it, MessageBatchIndividualResponse), chunks)
+        print(f"  speedup  {current / legacy:>12.2f}x")
+
+        print(f"models, inspecting 1 in 10 [{label}]")
+        legacy = bench("legacy", lambda it: legacy_decode(it, MessageBatchIndividualResponse), chunks, inspect_every=10)
+        lazy = bench(
+            "lazy",
+            lambda it: current_decode(it, MessageBatchIndividualResponse, lazy=True),
+            chunks,
+            inspect_every=10,
+        )
+        print(f"  speedup  {lazy / legacy:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
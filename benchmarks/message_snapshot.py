@@ -0,0 +1,100 @@
+"""Benchmark for accumulating stream events into a message snapshot.
+
+Compares `accumulate_event()` applying every delta to the snapshot straight away against
+buffering them in `PendingDeltas` and applying them when the block stops, for a long run of
+text deltas and for tool inputs of increasing size.
+
+    python benchmarks/message_snapshot.py
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Optional, cast
+
+from anthropic.types import RawMessageStreamEvent
+from anthropic._models import construct_type
+from anthropic.types.parsed_message import ParsedMessage
+from anthropic.lib.streaming._pending import PendingDeltas
+from anthropic.lib.streaming._messages import accumulate_event, parse_tool_input
+
+MESSAGE_START = {
+    "type": "message_start",
+    "message": {
+        "id": "msg_01",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-sonnet-4-5",
+        "content": [],
+        "stop_reason": None,
+        "stop_sequence": None,
+        "usage": {"input_tokens": 10, "output_tokens": 1},
+    },
+}
+
+
+def text_events(tokens: int) -> list[dict[str, Any]]:
+    return [
+        MESSAGE_START,
+        {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+        *(
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": f"token {i} "}}
+            for i in range(tokens)
+        ),
+        {"type": "content_block_stop", "index": 0},
+        {"type": "message_stop"},
+    ]
+
+
+def tool_use_events(size: int) -> list[dict[str, Any]]:
+    payload = json.dumps({"path": "notes.txt", "content": "lorem ipsum " * (size // 12)})
+    chunks = [payload[i : i + 16] for i in range(0, len(payload), 16)]
+    return [
+        MESSAGE_START,
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "tool_use", "id": "toolu_01", "name": "write_file", "input": {}},
+        },
+        *(
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "input_json_delta", "partial_json": chunk}}
+            for chunk in chunks
+        ),
+        {"type": "content_block_stop", "index": 0},
+        {"type": "message_stop"},
+    ]
+
+
+def bench(name: str, events: list[RawMessageStreamEvent], *, lazy: bool) -> float:
+    start = time.perf_counter()
+    snapshot: Optional[ParsedMessage[object]] = None
+    pending = PendingDeltas(parse_json=parse_tool_input) if lazy else None
+    for event in events:
+        snapshot = accumulate_event(event=event, current_snapshot=snapshot, pending=pending)
+    elapsed = time.perf_counter() - start
+    rate = len(events) / elapsed
+    print(f"  {name:<6} {rate:>12,.0f} deltas/s")
+    return rate
+
+
+def main() -> None:
+    cases = {
+        "text, 20k deltas": text_events(20_000),
+        "tool input, 5KB": tool_use_events(5_000),
+        "tool input, 50KB": tool_use_events(50_000),
+        "tool input, 200KB": tool_use_events(200_000),
+    }
+    for label, raw in cases.items():
+        events = [
+            cast(RawMessageStreamEvent, construct_type(type_=cast(Any, RawMessageStreamEvent), value=event))
+            for event in raw
+        ]
+        print(label)
+        eager = bench("eager", events, lazy=False)
+        lazy = bench("lazy", events, lazy=True)
+        print(f"  speedup {lazy / eager:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
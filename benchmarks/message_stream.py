@@ -0,0 +1,118 @@
+"""Benchmark for the ways of consuming a `MessageStream`.
+
+Streams a synthetic response of text deltas from an in-memory transport and reports tokens per
+second for iterating the raw SSE events, iterating the helper events, `.text_stream`,
+`.until_done()` and `.get_final_message()`, with and without `lazy_snapshot`. Iterating the
+helper events was also the cost of every other pattern before they stopped building events.
+
+    python benchmarks/message_stream.py
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Callable
+
+import httpx
+
+from anthropic import Anthropic
+from anthropic.lib.streaming import MessageStream
+
+TOKENS = 20_000
+REPEAT = 3
+
+
+def sse(event: dict[str, Any]) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+def make_body(tokens: int) -> bytes:
+    events: list[dict[str, Any]] = [
+        {
+            "type": "message_start",
+            "message": {
+                "id": "msg_01",
+                "type": "message",
+                "role": "assistant",
+                "model": "claude-sonnet-4-5",
+                "content": [],
+                "stop_reason": None,
+                "stop_sequence": None,
+                "usage": {"input_tokens": 10, "output_tokens": 1},
+            },
+        },
+        {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+        *(
+            {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": f"token {i} "}}
+            for i in range(tokens)
+        ),
+        {"type": "content_block_stop", "index": 0},
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+            "usage": {"output_tokens": tokens},
+        },
+        {"type": "message_stop"},
+    ]
+    return "".join(sse(event) for event in events).encode()
+
+
+def make_client(body: bytes) -> Anthropic:
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body)
+
+    return Anthropic(api_key="my-anthropic-api-key", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def consume_events(stream: MessageStream[Any]) -> None:
+    for _ in stream:
+        pass
+
+
+def consume_text_stream(stream: MessageStream[Any]) -> None:
+    for _ in stream.text_stream:
+        pass
+
+
+def bench(client: Anthropic, name: str, consume: Callable[[MessageStream[Any]], object], *, lazy: bool) -> None:
+    best = 0.0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        with client.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Hello"}],
+            model="claude-sonnet-4-5",
+            lazy_snapshot=lazy,
+        ) as stream:
+            consume(stream)
+        best = max(best, TOKENS / (time.perf_counter() - start))
+    print(f"  {name:<20} {best:>12,.0f} tokens/s")
+
+
+def main() -> None:
+    client = make_client(make_body(TOKENS))
+
+    best = 0.0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _event in client.messages.create(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Hello"}],
+            model="claude-sonnet-4-5",
+            stream=True,
+        ):
+            pass
+        best = max(best, TOKENS / (time.perf_counter() - start))
+    print(f"raw SSE events         {best:>12,.0f} tokens/s")
+
+    for lazy in (False, True):
+        print(f"lazy_snapshot={lazy}")
+        bench(client, "helper events", consume_events, lazy=lazy)
+        bench(client, ".text_stream", consume_text_stream, lazy=lazy)
+        bench(client, ".until_done()", MessageStream.until_done, lazy=lazy)
+        bench(client, ".get_final_message()", MessageStream.get_final_message, lazy=lazy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Micro-benchmark for the client's per-request overhead.
+
+Sends `messages.create()` calls through an `httpx.MockTransport` that answers
+immediately, so the timings are the SDK's own work: building the options,
+transforming the params, serializing the body, building the request and parsing
+the response. Each scenario is timed with the body serialized on every attempt,
+as it was before (re-implemented here), and with the serialized body cached for
+the call, for a short prompt and one with a few hundred KB of context, with and
+without retries and a middleware that reads the body.
+
+    python benchmarks/request_overhead.py
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, List, Callable
+from unittest import mock
+
+import httpx
+
+from anthropic import CallNext, Anthropic, APIRequest
+from anthropic._models import FinalRequestOptions
+from anthropic._base_client import BaseClient
+from anthropic._utils._json import openapi_dumps
+
+TEXT = "The quick brown fox jumps over the lazy dog.\n" * 30
+RESPONSE = json.dumps(
+    {
+        "id": "msg_123",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-sonnet-4-5",
+        "content": [{"type": "text", "text": "Hello!"}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 10, "output_tokens": 5},
+    }
+).encode()
+
+
+def legacy_serialized_json(self: FinalRequestOptions) -> bytes | None:
+    """Serializes the body on every call, like `_build_request()` did before the cache."""
+    json_data = self._merged_json_data()
+    if json_data is None:
+        return None
+    if isinstance(json_data, bytes):
+        return json_data
+    return openapi_dumps(json_data)
+
+
+def make_messages(turns: int) -> List[Any]:
+    messages: List[Any] = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": [{"type": "text", "text": f"{i}: {TEXT}"}]})
+        messages.append({"role": "assistant", "content": f"{i}: {TEXT[:200]}"})
+    messages.append({"role": "user", "content": "Hello"})
+    return messages
+
+
+def make_client(*, failures: int, middleware: bool) -> Anthropic:
+    attempts = 0
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts % (failures + 1):
+            return httpx.Response(500)
+        return httpx.Response(200, content=RESPONSE, headers={"content-type": "application/json"})
+
+    def read_body(request: APIRequest, call_next: CallNext) -> Any:
+        assert request.json_bytes is not None
+        return call_next(request)
+
+    return Anthropic(
+        api_key="my-anthropic-api-key",
+        max_retries=failures,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        middleware=[read_body] if middleware else [],
+    )
+
+
+def bench(name: str, fn: Callable[[], object], *, repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {name:<8} {elapsed * 1000:>10.3f}ms")
+    return elapsed
+
+
+def run(turns: int, *, failures: int, middleware: bool) -> None:
+    client = make_client(failures=failures, middleware=middleware)
+    messages = make_messages(turns)
+    size = len(openapi_dumps(messages))
+    print(f"{size / 1024:,.0f}KB body, {failures} retries{', middleware reading the body' if middleware else ''}:")
+
+    def send() -> object:
+        return client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=messages)
+
+    repeat = 2000 if turns < 10 else 50
+    with mock.patch.object(FinalRequestOptions, "_serialized_json", legacy_serialized_json):
+        legacy = bench("legacy", send, repeat=repeat)
+    current = bench("current", send, repeat=repeat)
+    print(f"  speedup  {legacy / current:>10.2f}x")
+
+
+def main() -> None:
+    with mock.patch.object(BaseClient, "_calculate_retry_timeout", lambda *_args, **_kwargs: 0):
+        for turns in (1, 200):
+            for failures, middleware in ((0, False), (2, False), (2, True)):
+                run(turns, failures=failures, middleware=middleware)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Micro-benchmark for transforming request params before they're sent.
+
+Builds `messages.create()` params for conversations of increasing length, made of
+plain text blocks, tool use / tool result pairs and, in a second variant, the
+assistant's content blocks passed back as the response models, then times
+`maybe_transform` with the previous recursive implementation (re-implemented
+here) and the current per-type plans. The outputs are checked to be equal.
+
+    python benchmarks/request_transform.py
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Mapping, Callable, cast
+from typing_extensions import get_args
+
+import pydantic
+
+from anthropic.types import TextBlock, ToolUseBlock, message_create_params
+from anthropic._types import Omit
+from anthropic._utils import is_list, is_given, is_mapping, is_iterable, is_sequence, maybe_transform
+from anthropic._compat import get_origin, model_dump, is_typeddict
+from anthropic._utils._typing import (
+    is_list_type,
+    is_union_type,
+    extract_type_arg,
+    is_iterable_type,
+    is_sequence_type,
+    strip_annotated_type,
+)
+from anthropic._utils._transform import (
+    PropertyInfo,
+    _format_data,
+    get_type_hints,
+    _get_annotated_type,
+    _maybe_transform_key,
+    _no_transform_needed,
+)
+
+PARAMS = message_create_params.MessageCreateParamsNonStreaming
+TEXT = "The quick brown fox jumps over the lazy dog. " * 20
+
+
+def legacy_transform(data: object, annotation: Any, inner_type: Any = None) -> object:
+    """The recursive implementation the plans replaced."""
+    if inner_type is None:
+        inner_type = annotation
+
+    stripped_type = strip_annotated_type(inner_type)
+    origin = get_origin(stripped_type) or stripped_type
+    if is_typeddict(stripped_type) and is_mapping(data):
+        result: Dict[str, object] = {}
+        annotations = get_type_hints(stripped_type, include_extras=True)
+        for key, value in cast(Mapping[str, object], data).items():
+            if not is_given(value):
+                continue
+            type_ = annotations.get(key)
+            if type_ is None:
+                result[key] = value
+            else:
+                result[_maybe_transform_key(key, type_)] = legacy_transform(value, type_)
+        return result
+
+    if origin == dict and is_mapping(data):
+        items_type = get_args(stripped_type)[1]
+        return {key: legacy_transform(value, items_type) for key, value in data.items()}
+
+    if (
+        (is_list_type(stripped_type) and is_list(data))
+        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
+        or (is_sequence_type(stripped_type) and is_sequence(data) and not isinstance(data, str))
+    ):
+        if isinstance(data, dict):
+            return cast(object, data)
+        inner_type = extract_type_arg(stripped_type, 0)
+        if _no_transform_needed(inner_type):
+            return data if is_list(data) else list(data)
+        return [legacy_transform(d, annotation, inner_type) for d in data]
+
+    if is_union_type(stripped_type):
+        for subtype in get_args(stripped_type):
+            data = legacy_transform(data, annotation, subtype)
+        return data
+
+    if isinstance(data, pydantic.BaseModel):
+        return model_dump(data, exclude_unset=True, mode="json", by_alias=True)
+
+    annotated_type = _get_annotated_type(annotation)
+    if annotated_type is None:
+        return data
+    for info in get_args(annotated_type)[1:]:
+        if isinstance(info, PropertyInfo) and info.format is not None:
+            return _format_data(data, info.format, info.format_template)
+    return data
+
+
+def make_params(turns: int, *, models: bool) -> Dict[str, Any]:
+    messages: List[Any] = []
+    for i in range(turns):
+        tool_use: Any = {"type": "tool_use", "id": f"toolu_{i}", "name": "search", "input": {"query": f"q{i}"}}
+        text: Any = {"type": "text", "text": TEXT}
+        if models:
+            tool_use = ToolUseBlock(type="tool_use", id=f"toolu_{i}", name="search", input={"query": f"q{i}"})
+            text = TextBlock(type="text", text=TEXT, citations=None)
+        messages.append({"role": "user", "content": [{"type": "text", "text": f"{i}: {TEXT}"}]})
+        messages.append({"role": "assistant", "content": [text, tool_use]})
+        messages.append(
+            {
+                "role": "user",
+                "content": [
+                    {"type": "tool_result", "tool_use_id": f"toolu_{i}", "content": [{"type": "text", "text": TEXT}]}
+                ],
+            }
+        )
+    return {
+        "model": "claude-sonnet-4-5",
+        "max_tokens": 1024,
+        "messages": messages,
+        "system": [{"type": "text", "text": TEXT, "cache_control": {"type": "ephemeral"}}],
+        "tools": [{"name": "search", "input_schema": {"type": "object", "properties": {"query": {"type": "string"}}}}],
+        "temperature": Omit(),
+    }
+
+
+def bench(name: str, fn: Callable[[], object], *, repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {name:<8} {elapsed * 1000:>10.3f}ms")
+    return elapsed
+
+
+def run(turns: int, *, models: bool) -> None:
+    params = make_params(turns, models=models)
+    blocks = sum(len(message["content"]) for message in params["messages"])
+    print(f"{turns * 3} messages, {blocks} content blocks{', models passed back' if models else ''}:")
+    assert maybe_transform(params, PARAMS) == legacy_transform(params, PARAMS)
+
+    repeat = max(1, 1000 // turns)
+    legacy = bench("legacy", lambda: legacy_transform(params, PARAMS), repeat=repeat)
+    current = bench("current", lambda: maybe_transform(params, PARAMS), repeat=repeat)
+    print(f"  speedup  {legacy / current:>10.2f}x")
+
+
+def main() -> None:
+    for models in (False, True):
+        for turns in (10, 100, 500):
+            run(turns, models=models)
+
+
+if __name__ == "__main__":
+    main()
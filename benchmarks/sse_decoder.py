@@ -0,0 +1,84 @@
+"""Micro-benchmark for `SSEDecoder` over the recorded message streams in `tests/lib/streaming/fixtures`.
+
+Each fixture is replayed in several chunkings (whole body, 64 byte chunks, and one chunk
+per line) and compared against the previous line-concatenating implementation.
+
+    python benchmarks/sse_decoder.py
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Iterator
+from pathlib import Path
+
+from anthropic._streaming import SSEDecoder, ServerSentEvent
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "lib" / "streaming" / "fixtures"
+REPEAT = 200
+
+
+def legacy_iter_bytes(iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
+    decoder = SSEDecoder()
+
+    def iter_chunks() -> Iterator[bytes]:
+        data = b""
+        for chunk in iterator:
+            for line in chunk.splitlines(keepends=True):
+                data += line
+                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
+                    yield data
+                    data = b""
+        if data:
+            yield data
+
+    for chunk in iter_chunks():
+        for raw_line in chunk.splitlines():
+            sse = decoder.decode(raw_line.decode("utf-8"))
+            if sse:
+                yield sse
+
+
+def chunked(body: bytes, size: int) -> list[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def bench(name: str, decode: Callable[[Iterator[bytes]], Iterator[ServerSentEvent]], chunks: list[bytes]) -> float:
+    events = 0
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for _sse in decode(iter(chunks)):
+            events += 1
+    elapsed = time.perf_counter() - start
+    rate = events / elapsed
+    print(f"  {name:<8} {rate:>12,.0f} events/s")
+    return rate
+
+
+def main() -> None:
+    # a long run of small `text_delta` events, the common shape of a streamed answer
+    long_text = b"".join(
+        b'event: content_block_delta\ndata: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":"token %d "}}\n\n'
+        % i
+        for i in range(2000)
+    )
+    bodies = {path.name: path.read_bytes() for path in sorted(FIXTURES.glob("*.txt"))}
+    bodies["long_text_run (synthetic)"] = long_text
+    # a single event spanning many network reads, e.g. a large `message_start` or tool input
+    bodies["large_event (synthetic)"] = b'event: message_start\ndata: {"text":"%s"}\n\n' % (b"x" * 1_000_000)
+
+    for name, body in bodies.items():
+        for label, chunks in (
+            ("whole body", [body]),
+            ("64B chunks", chunked(body, 64)),
+            ("4KB chunks", chunked(body, 4096)),
+            ("per line", body.splitlines(keepends=True)),
+        ):
+            print(f"{name} [{label}]")
+            legacy = bench("legacy", legacy_iter_bytes, chunks)
+            current = bench("current", lambda it: SSEDecoder().iter_bytes(it), chunks)
+            print(f"  speedup  {current / legacy:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
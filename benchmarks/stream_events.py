@@ -0,0 +1,69 @@
+"""Benchmark for converting raw stream events into typed models.
+
+Compares the generic `construct_type()` path that `Stream` used for every event against
+the precompiled constructor returned by `compile_constructor()`, over the events recorded
+in `tests/lib/streaming/fixtures` plus a long synthetic run of `text_delta` events.
+
+    python benchmarks/stream_events.py
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Callable
+from pathlib import Path
+
+from anthropic.types import RawMessageStreamEvent
+from anthropic._models import construct_type, compile_constructor
+from anthropic.types.beta import BetaRawMessageStreamEvent
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "lib" / "streaming" / "fixtures"
+REPEAT = 20
+
+
+def load_events() -> dict[str, list[dict[str, Any]]]:
+    events: dict[str, list[dict[str, Any]]] = {}
+    for path in sorted(FIXTURES.glob("*.txt")):
+        events[path.name] = [
+            json.loads(line[len("data: ") :])
+            for line in path.read_text().splitlines()
+            if line.startswith("data: ") and '"type": "ping"' not in line
+        ]
+
+    events["text_deltas (synthetic)"] = [
+        {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": f"token {i} "}}
+        for i in range(2000)
+    ]
+    return events
+
+
+def bench(name: str, construct: Callable[[dict[str, Any]], object], events: list[dict[str, Any]]) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for event in events:
+            construct(event)
+    elapsed = time.perf_counter() - start
+    rate = len(events) * REPEAT / elapsed
+    print(f"  {name:<9} {rate:>12,.0f} events/s")
+    return rate
+
+
+def main() -> None:
+    for label, type_ in (
+        ("RawMessageStreamEvent", RawMessageStreamEvent),
+        ("BetaRawMessageStreamEvent", BetaRawMessageStreamEvent),
+    ):
+        compiled = compile_constructor(type_)
+        assert compiled is not None
+
+        print(f"== {label}")
+        for name, events in load_events().items():
+            print(name)
+            generic = bench("generic", lambda value, type_=type_: construct_type(type_=type_, value=value), events)
+            current = bench("compiled", compiled, events)
+            print(f"  speedup   {current / generic:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 import typing as _t
 
 from . import types
+from ._http2 import HTTP2Limits
 from ._types import NOT_GIVEN, Omit, NoneType, NotGiven, Transport, ProxiesTypes, omit, not_given
 from ._utils import file_from_path
 from ._client import (
@@ -38,6 +39,7 @@ from ._exceptions import (
     APITimeoutError,
     BadRequestError,
     OverloadedError,
+    CircuitOpenError,
     APIConnectionError,
     AuthenticationError,
     InternalServerError,
@@ -56,8 +58,11 @@ from ._middleware import (
     AsyncMiddlewareCallable,
 )
 from ._base_client import DefaultHttpxClient, DefaultAioHttpClient, DefaultAsyncHttpxClient
+from ._utils._json import JSONBackend, get_json_backend, set_json_backend
 from ._utils._logs import setup_logging as _setup_logging
+from ._retry_policy import RetryBudget, CircuitState, CircuitStats, CircuitBreaker, RetryBudgetStats
 from .lib.middleware import BetaFallbackState, BetaRefusalFallbackMiddleware
+from ._connection_pool import ConnectionPoolStats
 from .lib._parse._transform import transform_schema
 
 __all__ = [
@@ -90,6 +95,7 @@ __all__ = [
     "InternalServerError",
     "OverloadedError",
     "RetryableError",
+    "CircuitOpenError",
     "Timeout",
     "RequestOptions",
     "Client",
@@ -105,6 +111,11 @@ __all__ = [
     "AsyncMiddlewareCallable",
     "CallNext",
     "AsyncCallNext",
+    "RetryBudget",
+    "RetryBudgetStats",
+    "CircuitBreaker",
+    "CircuitState",
+    "CircuitStats",
     "BetaFallbackState",
     "BetaRefusalFallbackMiddleware",
     "file_from_path",
@@ -112,6 +123,11 @@ __all__ = [
     "DEFAULT_TIMEOUT",
     "DEFAULT_MAX_RETRIES",
     "DEFAULT_CONNECTION_LIMITS",
+    "HTTP2Limits",
+    "ConnectionPoolStats",
+    "JSONBackend",
+    "get_json_backend",
+    "set_json_backend",
     "DefaultHttpxClient",
     "DefaultAsyncHttpxClient",
     "DefaultAioHttpClient",
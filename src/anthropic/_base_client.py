@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import os
 import sys
-import json
 import time
 import uuid
 import email
@@ -11,6 +11,7 @@ import inspect
 import logging
 import platform
 import warnings
+import threading
 import email.utils
 from types import TracebackType
 from random import random
@@ -25,6 +26,7 @@ from typing import (
     Generic,
     Mapping,
     TypeVar,
+    Callable,
     Iterable,
     Iterator,
     Optional,
@@ -46,6 +48,7 @@ from pydantic import PrivateAttr
 from . import _exceptions
 from ._qs import Querystring
 from ._files import to_httpx_files, async_to_httpx_files
+from ._http2 import HTTP2Transport, AsyncHTTP2Transport
 from ._types import (
     Body,
     Omit,
@@ -65,9 +68,9 @@ from ._types import (
     ModelBuilderProtocol,
     not_given,
 )
-from ._utils import is_dict, is_list, asyncify, is_given, lru_cache, is_mapping
+from ._utils import is_dict, is_list, asyncify, is_given, lru_cache, is_mapping, coerce_boolean
 from ._compat import PYDANTIC_V1, model_copy, model_dump
-from ._models import GenericModel, FinalRequestOptions, validate_type, construct_type
+from ._models import GenericModel, FinalRequestOptions, validate_type, construct_type, compile_constructor
 from ._request import APIRequest
 from ._response import (
     APIResponse,
@@ -103,8 +106,10 @@ from ._middleware import (
     validate_sync_middleware,
     validate_async_middleware,
 )
-from ._utils._json import openapi_dumps
+from ._utils._json import json_loads
+from ._retry_policy import RetryBudget, CircuitBreaker
 from ._utils._httpx import get_environment_proxies
+from ._connection_pool import ConnectionPoolStats, pool_stats, caching_transport
 from ._legacy_response import LegacyAPIResponse
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -389,6 +394,8 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
     _idempotency_header: str | None
     _default_stream_cls: type[_DefaultStreamT] | None = None
     _middleware: tuple[MiddlewareInput, ...]
+    _retry_budget: RetryBudget | None
+    _circuit_breaker: CircuitBreaker | None
 
     def __init__(
         self,
@@ -401,6 +408,8 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         self._version = version
         self._base_url = self._enforce_trailing_slash(URL(base_url))
@@ -412,6 +421,8 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         self._idempotency_header = None
         self._platform: Platform | None = None
         self._middleware = tuple(middleware or ())
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
 
         if max_retries is None:  # pyright: ignore[reportUnnecessaryComparison]
             raise TypeError(
@@ -438,7 +449,7 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             body = err_text
 
             try:
-                body = json.loads(err_text)
+                body = json_loads(err_text)
                 err_msg = f"Error code: {response.status_code} - {body}"
             except Exception:
                 err_msg = err_text or f"Error code: {response.status_code}"
@@ -505,6 +516,20 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
     def _make_sse_decoder(self) -> SSEDecoder | SSEBytesDecoder:
         return SSEDecoder()
 
+    def _make_stream_event_constructor(self, cast_to: type[object]) -> Callable[[object], object] | None:
+        """Returns a precompiled constructor for the events of a `Stream[cast_to]`, if one applies.
+
+        Events are otherwise converted through `_process_response_data()`. The fast path can be
+        disabled by setting the `ANTHROPIC_FAST_STREAM_EVENTS` environment variable to `false`.
+        """
+        if self._strict_response_validation:
+            return None
+
+        if not coerce_boolean(os.environ.get("ANTHROPIC_FAST_STREAM_EVENTS", "true")):
+            return None
+
+        return compile_constructor(cast_to)
+
     def _build_request(
         self,
         options: FinalRequestOptions,
@@ -527,14 +552,7 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             )
         kwargs: dict[str, Any] = {}
 
-        json_data = options.json_data
-        if options.extra_json is not None:
-            if json_data is None:
-                json_data = cast(Body, options.extra_json)
-            elif is_mapping(json_data):
-                json_data = _merge_mappings(json_data, options.extra_json)
-            else:
-                raise RuntimeError(f"Unexpected JSON data type, {type(json_data)}, cannot merge with `extra_body`")
+        json_data = options._merged_json_data()
 
         headers = self._build_headers(options, retries_taken=retries_taken)
         params = _merge_mappings(self.default_query, options.params)
@@ -593,7 +611,8 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             elif not files:
                 # Don't set content when JSON is sent as multipart/form-data,
                 # since httpx's content param overrides other body arguments
-                kwargs["content"] = openapi_dumps(json_data) if is_given(json_data) and json_data is not None else None
+                # serialized once per call and reused across retries
+                kwargs["content"] = options._serialized_json()
             kwargs["files"] = files
         else:
             headers.pop("Content-Type", None)
@@ -760,6 +779,16 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         """
         return self._middleware
 
+    @property
+    def retry_budget(self) -> RetryBudget | None:
+        """The `RetryBudget` shared by this client and every client derived from it."""
+        return self._retry_budget
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """The `CircuitBreaker` shared by this client and every client derived from it."""
+        return self._circuit_breaker
+
     def platform_headers(self) -> Dict[str, str]:
         # the actual implementation is in a separate `lru_cache` decorated
         # function because adding `lru_cache` to methods will leak memory
@@ -899,12 +928,79 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             current = current.__cause__
         return False, None
 
+    def _retry_allowed(self, options: FinalRequestOptions) -> bool:
+        """Whether the client-level retry policies allow retrying a failed attempt the SDK would otherwise retry.
+
+        Takes a retry from the `RetryBudget`, so this must only be called once the
+        attempt is known to be retryable.
+        """
+        breaker = self._circuit_breaker
+        if breaker is not None:
+            host = self._prepare_url(options.url).host
+            if breaker.state(host) == "open":
+                log.debug("Not retrying as the circuit breaker is open for %s", host)
+                return False
+
+        budget = self._retry_budget
+        if budget is not None and not budget.try_retry():
+            log.debug("Not retrying as the retry budget is exhausted")
+            return False
+
+        return True
+
+    def _record_attempt(
+        self,
+        request: httpx.Request,
+        *,
+        response: httpx.Response | None = None,
+        error: BaseException | None = None,
+        trial: bool = False,
+    ) -> None:
+        """Reports the outcome of a single HTTP attempt to the circuit breaker.
+
+        Connection failures, timeouts and 5xx responses count against the host and
+        any other response means it is healthy; errors raised by the SDK itself, or
+        cancellation, say nothing about the host. `trial` is what the breaker's
+        `before_request()` returned for the attempt.
+        """
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return
+
+        host = request.url.host
+        if response is not None:
+            if response.status_code >= 500:
+                breaker.record_failure(host, trial=trial)
+            else:
+                breaker.record_success(host, trial=trial)
+        elif error is not None and not isinstance(error, AnthropicError):
+            breaker.record_failure(host, trial=trial)
+        else:
+            breaker.release(host, trial=trial)
+
     def _idempotency_key(self) -> str:
         return f"stainless-python-retry-{uuid.uuid4()}"
 
 
+def _warmup_error(error: httpx.RequestError) -> APIConnectionError:
+    if isinstance(error, httpx.TimeoutException):
+        return APITimeoutError(request=error.request)
+    return APIConnectionError(request=error.request)
+
+
+def _warmup_wait_timeout(timeout: httpx.Timeout) -> float | None:
+    """How long an open warmup connection waits for the others, which is at most as long
+    as any of them can take to receive its response headers.
+    """
+    phases = (timeout.pool, timeout.connect, timeout.write, timeout.read)
+    if any(phase is None for phase in phases):
+        return None
+    return sum(cast(float, phase) for phase in phases)
+
+
 class _DefaultHttpxClient(httpx.Client):
     def __init__(self, **kwargs: Any) -> None:
+        connection_cache = kwargs.pop("connection_cache", False)
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
         kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
         kwargs.setdefault("follow_redirects", True)
@@ -936,11 +1032,18 @@ class _DefaultHttpxClient(httpx.Client):
 
             transport_kwargs["socket_options"] = socket_options
 
+            # over HTTP/2 many requests share each connection, with the stream limits and
+            # flow-control windows from `HTTP2Limits`
+            transport_cls = HTTP2Transport if kwargs.get("http2") else HTTPTransport
+
             proxy_mounts = {
-                key: None if proxy is None else HTTPTransport(proxy=proxy, **transport_kwargs)
+                key: None if proxy is None else transport_cls(proxy=proxy, **transport_kwargs)
                 for key, proxy in proxy_map.items()
             }
-            default_transport = HTTPTransport(**transport_kwargs)
+            if connection_cache:
+                default_transport = caching_transport(transport_cls, **transport_kwargs)
+            else:
+                default_transport = transport_cls(**transport_kwargs)
 
             # Prioritize the mounts set by the user over the environment variables.
             proxy_mounts.update(kwargs.get("mounts", {}))
@@ -959,6 +1062,9 @@ if TYPE_CHECKING:
 
     This is useful because overriding the `http_client` with your own instance of
     `httpx.Client` will result in httpx's defaults being used, not ours.
+
+    Pass `connection_cache=True` to reuse the address and TLS session of the last
+    connection to each host for new connections (see `connection_pool_stats()`).
     """
 else:
     DefaultHttpxClient = _DefaultHttpxClient
@@ -992,6 +1098,8 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool,
     ) -> None:
         if not is_given(timeout):
@@ -1028,6 +1136,8 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             custom_query=custom_query,
             custom_headers=custom_headers,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
         self._middleware_chain = self._build_middleware_chain()
@@ -1050,6 +1160,58 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         if hasattr(self, "_client"):
             self._client.close()
 
+    def warmup(self, connections: int = 1, *, timeout: float | None = None) -> ConnectionPoolStats | None:
+        """Opens connections to the `base_url` ahead of the first request, so that it doesn't
+        wait for DNS resolution and the TCP and TLS handshakes.
+
+        Each connection is opened with a `HEAD` request, which isn't authenticated. They stay
+        in the pool for as long as the HTTP client keeps idle connections alive, or are
+        reopened with a cached DNS result and an abbreviated TLS handshake once they've expired.
+        With HTTP/2 a single connection serves many requests, so only one may be opened.
+
+        Returns the state of the connection pool, see `connection_pool_stats()`.
+        """
+        if connections < 1:
+            raise ValueError(f"connections must be at least 1, got {connections}")
+
+        # every connection is held until all of them are open, so that none is reused
+        all_open = threading.Barrier(connections)
+        wait_timeout = _warmup_wait_timeout(self._client.timeout if timeout is None else httpx.Timeout(timeout))
+        errors: list[BaseException] = []
+
+        def connect() -> None:
+            try:
+                with self._client.stream(
+                    "HEAD", self.base_url, timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+                ) as response:
+                    all_open.wait(wait_timeout)
+                    # a connection is only kept in the pool once its response has been read
+                    response.read()
+            except threading.BrokenBarrierError:
+                pass
+            except BaseException as exc:
+                # the other connections would otherwise wait for this one forever
+                errors.append(exc)
+                all_open.abort()
+
+        threads = [threading.Thread(target=connect, daemon=True) for _ in range(connections)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            if isinstance(errors[0], httpx.RequestError):
+                raise _warmup_error(errors[0])
+            raise errors[0]
+        return self.connection_pool_stats()
+
+    def connection_pool_stats(self) -> ConnectionPoolStats | None:
+        """The number of pooled connections and how many are in use, or `None` if the
+        `http_client` isn't backed by an httpx connection pool.
+        """
+        return pool_stats(self._client)
+
     def __enter__(self: _T) -> _T:
         return self
 
@@ -1128,6 +1290,8 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
         chain = self._middleware_chain
         max_retries = input_options.get_max_retries(self.max_retries)
+        if self._retry_budget is not None:
+            self._retry_budget.record_request()
 
         for retries_taken in range(max_retries + 1):
             remaining_retries = max_retries - retries_taken
@@ -1147,8 +1311,10 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                             retries_taken=retries_taken,
                         )
                 else:
+                    # the base handler copies the options before preparing them, and
+                    # middleware derives modified requests with `APIRequest.copy()`
                     request = APIRequest(
-                        options=model_copy(input_options),
+                        options=input_options,
                         cast_to=cast_to,
                         stream=stream,
                         stream_cls=stream_cls,
@@ -1160,7 +1326,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                     response = result.http_response
             except Exception as err:
                 should_retry, failed_response = self._should_retry_exception(err)
-                if remaining_retries <= 0 or not should_retry:
+                if remaining_retries <= 0 or not should_retry or not self._retry_allowed(input_options):
                     raise
 
                 if failed_response is not None and not failed_response.is_closed:
@@ -1176,7 +1342,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
             # the attempt produced an error-status response — possibly inspected,
             # replaced or passed through by middleware
-            if remaining_retries > 0 and self._should_retry(response):
+            if remaining_retries > 0 and self._should_retry(response) and self._retry_allowed(input_options):
                 if not response.is_closed:
                     response.close()
                 self._sleep_for_retry(
@@ -1289,6 +1455,10 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         if options.follow_redirects is not None:
             kwargs["follow_redirects"] = options.follow_redirects
 
+        trial = False
+        if self._circuit_breaker is not None:
+            trial = self._circuit_breaker.before_request(request.url.host)
+
         log.debug("Sending HTTP Request: %s %s", request.method, request.url)
 
         try:
@@ -1298,15 +1468,23 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 **kwargs,
             )
         except httpx.TimeoutException as err:
+            self._record_attempt(request, error=err, trial=trial)
             log.debug("Encountered httpx.TimeoutException", exc_info=True)
             raise APITimeoutError(request=request) from err
         except Exception as err:
+            self._record_attempt(request, error=err, trial=trial)
             if isinstance(err, AnthropicError):
                 # SDK-originated errors already carry their own type; don't wrap.
                 raise
 
             log.debug("Encountered Exception", exc_info=True)
             raise APIConnectionError(request=request) from err
+        except BaseException:
+            # e.g. cancelled, which says nothing about the host
+            self._record_attempt(request, trial=trial)
+            raise
+
+        self._record_attempt(request, response=response, trial=trial)
 
         log.debug(
             'HTTP Response: %s %s "%i %s" %s',
@@ -1624,6 +1802,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
 class _DefaultAsyncHttpxClient(httpx.AsyncClient):
     def __init__(self, **kwargs: Any) -> None:
+        connection_cache = kwargs.pop("connection_cache", False)
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
         kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
         kwargs.setdefault("follow_redirects", True)
@@ -1655,11 +1834,18 @@ class _DefaultAsyncHttpxClient(httpx.AsyncClient):
 
             transport_kwargs["socket_options"] = socket_options
 
+            # over HTTP/2 many requests share each connection, with the stream limits and
+            # flow-control windows from `HTTP2Limits`
+            transport_cls = AsyncHTTP2Transport if kwargs.get("http2") else AsyncHTTPTransport
+
             proxy_mounts = {
-                key: None if proxy is None else AsyncHTTPTransport(proxy=proxy, **transport_kwargs)
+                key: None if proxy is None else transport_cls(proxy=proxy, **transport_kwargs)
                 for key, proxy in proxy_map.items()
             }
-            default_transport = AsyncHTTPTransport(**transport_kwargs)
+            if connection_cache:
+                default_transport = caching_transport(transport_cls, **transport_kwargs)
+            else:
+                default_transport = transport_cls(**transport_kwargs)
 
             # Prioritize the mounts set by the user over the environment variables.
             proxy_mounts.update(kwargs.get("mounts", {}))
@@ -1696,6 +1882,9 @@ if TYPE_CHECKING:
 
     This is useful because overriding the `http_client` with your own instance of
     `httpx.AsyncClient` will result in httpx's defaults being used, not ours.
+
+    Pass `connection_cache=True` to reuse the address and TLS session of the last
+    connection to each host for new connections (see `connection_pool_stats()`).
     """
 
     DefaultAioHttpClient = httpx.AsyncClient
@@ -1735,6 +1924,8 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
@@ -1770,6 +1961,8 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             custom_query=custom_query,
             custom_headers=custom_headers,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
         self._middleware_chain = self._build_middleware_chain()
@@ -1789,6 +1982,57 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         """
         await self._client.aclose()
 
+    async def warmup(self, connections: int = 1, *, timeout: float | None = None) -> ConnectionPoolStats | None:
+        """Opens connections to the `base_url` ahead of the first request, so that it doesn't
+        wait for DNS resolution and the TCP and TLS handshakes.
+
+        Each connection is opened with a `HEAD` request, which isn't authenticated. They stay
+        in the pool for as long as the HTTP client keeps idle connections alive, or are
+        reopened with a cached DNS result and an abbreviated TLS handshake once they've expired.
+        With HTTP/2 a single connection serves many requests, so only one may be opened.
+
+        Returns the state of the connection pool, see `connection_pool_stats()`.
+        """
+        if connections < 1:
+            raise ValueError(f"connections must be at least 1, got {connections}")
+
+        # every connection is held until all of them are open, so that none is reused
+        opened = 0
+        all_open = anyio.Event()
+        errors: list[httpx.RequestError] = []
+
+        async def connect() -> None:
+            nonlocal opened
+            try:
+                async with self._client.stream(
+                    "HEAD", self.base_url, timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+                ) as response:
+                    opened += 1
+                    if opened == connections:
+                        all_open.set()
+                    await all_open.wait()
+                    # a connection is only kept in the pool once its response has been read
+                    await response.aread()
+            except httpx.RequestError as exc:
+                errors.append(exc)
+            finally:
+                # the other connections would otherwise wait for this one forever
+                all_open.set()
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(connections):
+                tg.start_soon(connect)
+
+        if errors:
+            raise _warmup_error(errors[0])
+        return self.connection_pool_stats()
+
+    def connection_pool_stats(self) -> ConnectionPoolStats | None:
+        """The number of pooled connections and how many are in use, or `None` if the
+        `http_client` isn't backed by an httpx connection pool.
+        """
+        return pool_stats(self._client)
+
     async def __aenter__(self: _T) -> _T:
         return self
 
@@ -1872,6 +2116,8 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
         chain = self._middleware_chain
         max_retries = input_options.get_max_retries(self.max_retries)
+        if self._retry_budget is not None:
+            self._retry_budget.record_request()
 
         for retries_taken in range(max_retries + 1):
             remaining_retries = max_retries - retries_taken
@@ -1891,8 +2137,10 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                             retries_taken=retries_taken,
                         )
                 else:
+                    # the base handler copies the options before preparing them, and
+                    # middleware derives modified requests with `APIRequest.copy()`
                     request = APIRequest(
-                        options=model_copy(input_options),
+                        options=input_options,
                         cast_to=cast_to,
                         stream=stream,
                         stream_cls=stream_cls,
@@ -1906,7 +2154,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                     response = result.http_response
             except Exception as err:
                 should_retry, failed_response = self._should_retry_exception(err)
-                if remaining_retries <= 0 or not should_retry:
+                if remaining_retries <= 0 or not should_retry or not self._retry_allowed(input_options):
                     raise
 
                 if failed_response is not None and not failed_response.is_closed:
@@ -1922,7 +2170,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
             # the attempt produced an error-status response — possibly inspected,
             # replaced or passed through by middleware
-            if remaining_retries > 0 and self._should_retry(response):
+            if remaining_retries > 0 and self._should_retry(response) and self._retry_allowed(input_options):
                 if not response.is_closed:
                     await response.aclose()
                 await self._sleep_for_retry(
@@ -2041,6 +2289,10 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         if options.follow_redirects is not None:
             kwargs["follow_redirects"] = options.follow_redirects
 
+        trial = False
+        if self._circuit_breaker is not None:
+            trial = self._circuit_breaker.before_request(request.url.host)
+
         log.debug("Sending HTTP Request: %s %s", request.method, request.url)
 
         try:
@@ -2050,15 +2302,23 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                 **kwargs,
             )
         except httpx.TimeoutException as err:
+            self._record_attempt(request, error=err, trial=trial)
             log.debug("Encountered httpx.TimeoutException", exc_info=True)
             raise APITimeoutError(request=request) from err
         except Exception as err:
+            self._record_attempt(request, error=err, trial=trial)
             if isinstance(err, AnthropicError):
                 # SDK-originated errors already carry their own type; don't wrap.
                 raise
 
             log.debug("Encountered Exception", exc_info=True)
             raise APIConnectionError(request=request) from err
+        except BaseException:
+            # e.g. cancelled, which says nothing about the host
+            self._record_attempt(request, trial=trial)
+            raise
+
+        self._record_attempt(request, response=response, trial=trial)
 
         log.debug(
             'HTTP Response: %s %s "%i %s" %s',
@@ -36,14 +36,17 @@ from ._base_client import (
     AsyncAPIClient,
     merge_headers,
 )
+from ._retry_policy import RetryBudget, CircuitBreaker
 
 # --- credentials support (hand-written, upstream to Stainless) ---
 from .lib.credentials import (
     TokenCache,
     InMemoryConfig,
     AccessTokenAuth,
+    AsyncTokenCache,
     CredentialsFile,
     AccessTokenProvider,
+    AsyncAccessTokenProvider,
     default_credentials,
 )
 from .lib.credentials._auth import (
@@ -70,7 +73,20 @@ def _close_credentials(credentials: object) -> None:
         close()
 
 
-def _bind_credentials_base_url(credentials: AccessTokenProvider | None, base_url: str) -> None:
+async def _aclose_credentials(credentials: object) -> None:
+    """Async variant of :func:`_close_credentials`: prefers ``aclose()``, which
+    also closes the ``httpx.AsyncClient`` a built-in provider uses for
+    ``call_async()``, and falls back to ``close()``."""
+    aclose = getattr(credentials, "aclose", None)
+    if aclose is not None:
+        await aclose()
+    else:
+        _close_credentials(credentials)
+
+
+def _bind_credentials_base_url(
+    credentials: AccessTokenProvider | AsyncAccessTokenProvider | None, base_url: str
+) -> None:
     """If the credential provider supports ``bind_base_url``, pass it the
     client's resolved ``base_url`` so the token exchange and API calls hit
     the same deployment without the caller passing the URL twice.
@@ -163,6 +179,9 @@ class Anthropic(SyncAPIClient):
         # See the [httpx documentation](https://www.python-httpx.org/api/#client) for more details.
         http_client: httpx.Client | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        # Limit retries across requests and fail fast while a host is down.
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -290,6 +309,8 @@ class Anthropic(SyncAPIClient):
             custom_headers=default_headers,
             custom_query=default_query,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -439,6 +460,8 @@ class Anthropic(SyncAPIClient):
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = not_given,
+        retry_budget: RetryBudget | None | NotGiven = not_given,
+        circuit_breaker: CircuitBreaker | None | NotGiven = not_given,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -493,6 +516,8 @@ class Anthropic(SyncAPIClient):
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             **_extra_kwargs,
         )
 
@@ -556,8 +581,8 @@ class AsyncAnthropic(AsyncAPIClient):
     api_key: str | None
     auth_token: str | None
     webhook_key: str | None
-    credentials: AccessTokenProvider | None
-    _token_cache: TokenCache | None
+    credentials: AccessTokenProvider | AsyncAccessTokenProvider | None
+    _token_cache: AsyncTokenCache | TokenCache | None
     _custom_auth: AccessTokenAuth | None
 
     # constants
@@ -569,7 +594,7 @@ class AsyncAnthropic(AsyncAPIClient):
         *,
         api_key: str | None = None,
         auth_token: str | None = None,
-        credentials: AccessTokenProvider | None = None,
+        credentials: AccessTokenProvider | AsyncAccessTokenProvider | None = None,
         config: Mapping[str, Any] | None = None,
         profile: str | None = None,
         webhook_key: str | None = None,
@@ -583,6 +608,9 @@ class AsyncAnthropic(AsyncAPIClient):
         # See the [httpx documentation](https://www.python-httpx.org/api/#asyncclient) for more details.
         http_client: httpx.AsyncClient | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        # Limit retries across requests and fail fast while a host is down.
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -592,7 +620,7 @@ class AsyncAnthropic(AsyncAPIClient):
         # outlining your use-case to help us decide if it should be
         # part of our public interface in the future.
         _strict_response_validation: bool = False,
-        _token_cache: TokenCache | None | NotGiven = not_given,
+        _token_cache: AsyncTokenCache | TokenCache | None | NotGiven = not_given,
     ) -> None:
         """Construct a new async AsyncAnthropic client instance.
 
@@ -695,7 +723,7 @@ class AsyncAnthropic(AsyncAPIClient):
         if not isinstance(_token_cache, NotGiven):
             self._token_cache = _token_cache
         else:
-            self._token_cache = TokenCache(credentials) if credentials is not None else None
+            self._token_cache = AsyncTokenCache(credentials) if credentials is not None else None
         self._custom_auth = AccessTokenAuth(self._token_cache) if self._token_cache is not None else None
         if credential_headers:
             default_headers = {**credential_headers, **(default_headers or {})}
@@ -710,6 +738,8 @@ class AsyncAnthropic(AsyncAPIClient):
             custom_headers=default_headers,
             custom_query=default_query,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -831,9 +861,7 @@ class AsyncAnthropic(AsyncAPIClient):
     @override
     async def close(self) -> None:
         await super().close()
-        # Credential providers expose a sync close() even from the async client —
-        # they own a sync httpx.Client for the token-exchange POST.
-        _close_credentials(self.credentials)
+        await _aclose_credentials(self.credentials)
 
     # --- end credentials support ---
 
@@ -842,7 +870,7 @@ class AsyncAnthropic(AsyncAPIClient):
         *,
         api_key: str | None = None,
         auth_token: str | None = None,
-        credentials: AccessTokenProvider | None | NotGiven = not_given,
+        credentials: AccessTokenProvider | AsyncAccessTokenProvider | None | NotGiven = not_given,
         config: Mapping[str, Any] | None = None,
         profile: str | None = None,
         webhook_key: str | None = None,
@@ -855,6 +883,8 @@ class AsyncAnthropic(AsyncAPIClient):
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = not_given,
+        retry_budget: RetryBudget | None | NotGiven = not_given,
+        circuit_breaker: CircuitBreaker | None | NotGiven = not_given,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -909,6 +939,8 @@ class AsyncAnthropic(AsyncAPIClient):
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             **_extra_kwargs,
         )
 
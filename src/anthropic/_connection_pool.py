@@ -0,0 +1,349 @@
+"""Opt-in DNS and TLS session caching for the default httpx clients, and connection pool inspection.
+
+httpcore resolves the host and makes a full TLS handshake for every new connection.
+With `DefaultHttpxClient(connection_cache=True)` the network backends here keep the
+address the last connection to a host was made to for `DNS_CACHE_TTL` seconds, and
+its TLS session, so that connections opened after idle ones have expired from the
+pool skip the lookup and resume the session instead. The first connection to a host
+is made by hostname, so the backend's own resolution and fallback between addresses
+(Happy Eyeballs under anyio) pick the address that gets cached.
+"""
+
+from __future__ import annotations
+
+import ssl
+import sys
+import time
+import ipaddress
+import threading
+from typing import Any, Dict, Tuple, Union, Iterable, Optional
+from dataclasses import dataclass
+
+import httpx
+import httpcore
+
+__all__ = ["ConnectionPoolStats"]
+
+DNS_CACHE_TTL = 60.0
+"""How many seconds the address a host was last connected to is reused for."""
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    connections: int
+    """The number of open connections, including ones still being established."""
+
+    active: int
+    """Connections with a request in flight."""
+
+    idle: int
+    """Connections kept alive for the next request."""
+
+    http2: int
+    """Connections that negotiated HTTP/2, each of which can serve many requests at once."""
+
+    max_connections: Optional[int]
+    """`None` if the pool isn't limited."""
+
+    max_keepalive_connections: Optional[int]
+
+    dns_cache_entries: int
+    """Hosts whose address is cached."""
+
+    tls_sessions: int
+    """Hosts with a TLS session that new connections can resume."""
+
+
+class _ConnectionCache:
+    def __init__(self, *, dns_ttl: float = DNS_CACHE_TTL) -> None:
+        self._dns_ttl = dns_ttl
+        self._lock = threading.Lock()
+        self._addresses: Dict[Tuple[str, int], Tuple[float, str]] = {}
+        self._sessions: Dict[str, ssl.SSLSession] = {}
+
+    @property
+    def dns_cache_entries(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for expires_at, _ in self._addresses.values() if expires_at > now)
+
+    @property
+    def tls_sessions(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def address(self, host: str, port: int) -> Optional[str]:
+        with self._lock:
+            entry = self._addresses.get((host, port))
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def store_address(
+        self, host: str, port: int, stream: Union[httpcore.NetworkStream, httpcore.AsyncNetworkStream]
+    ) -> None:
+        server_addr = stream.get_extra_info("server_addr")
+        if not server_addr:
+            return
+        with self._lock:
+            self._addresses[(host, port)] = (time.monotonic() + self._dns_ttl, str(server_addr[0]))
+
+    def forget_address(self, host: str, port: int) -> None:
+        with self._lock:
+            self._addresses.pop((host, port), None)
+
+    def ssl_context(self, *, verify: Any, cert: Any, trust_env: bool) -> ssl.SSLContext:
+        """A new SSL context whose connections resume the TLS sessions cached here.
+
+        The context stays a plain `ssl.SSLContext`, which anyio wraps connections with
+        inline rather than in a worker thread; only the classes it creates its
+        `SSLSocket` and `SSLObject` instances with are replaced.
+        """
+        context = httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env)
+        cache = self
+
+        class _SessionResumingSocket(ssl.SSLSocket):
+            @classmethod
+            def _create(cls, *args: Any, **kwargs: Any) -> Any:  # type: ignore[override]
+                # a server that doesn't resume the session makes a full handshake instead
+                if kwargs.get("session") is None:
+                    kwargs["session"] = cache.session(kwargs.get("server_hostname"))
+                return super()._create(*args, **kwargs)  # type: ignore[misc]
+
+        class _SessionResumingObject(ssl.SSLObject):
+            @classmethod
+            def _create(cls, *args: Any, **kwargs: Any) -> Any:  # type: ignore[override]
+                if kwargs.get("session") is None:
+                    kwargs["session"] = cache.session(kwargs.get("server_hostname"))
+                return super()._create(*args, **kwargs)  # type: ignore[misc]
+
+        context.sslsocket_class = _SessionResumingSocket
+        context.sslobject_class = _SessionResumingObject
+        return context
+
+    def session(self, hostname: Optional[str]) -> Optional[ssl.SSLSession]:
+        if hostname is None:
+            return None
+        with self._lock:
+            return self._sessions.get(hostname)
+
+    def store_session(self, hostname: Optional[str], ssl_object: Any) -> None:
+        if hostname is None or ssl_object is None:
+            return
+        try:
+            session = ssl_object.session
+        except (AttributeError, ValueError):
+            return
+        if session is None or not session.has_ticket:
+            return
+        with self._lock:
+            self._sessions[hostname] = session
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class _CachingStream(httpcore.NetworkStream):
+    def __init__(self, stream: httpcore.NetworkStream, cache: _ConnectionCache) -> None:
+        self._stream = stream
+        self._cache = cache
+        self._hostname: Optional[str] = None
+        self._session_stored = False
+
+    def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        data = self._stream.read(max_bytes, timeout)
+        if not self._session_stored and self._hostname is not None:
+            # TLS 1.3 servers send their session tickets after the handshake
+            self._session_stored = True
+            self._cache.store_session(self._hostname, self._stream.get_extra_info("ssl_object"))
+        return data
+
+    def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        self._stream.write(buffer, timeout)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def start_tls(
+        self, ssl_context: ssl.SSLContext, server_hostname: Optional[str] = None, timeout: Optional[float] = None
+    ) -> httpcore.NetworkStream:
+        stream = _CachingStream(self._stream.start_tls(ssl_context, server_hostname, timeout), self._cache)
+        stream._hostname = server_hostname
+        return stream
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+
+class _AsyncCachingStream(httpcore.AsyncNetworkStream):
+    def __init__(self, stream: httpcore.AsyncNetworkStream, cache: _ConnectionCache) -> None:
+        self._stream = stream
+        self._cache = cache
+        self._hostname: Optional[str] = None
+        self._session_stored = False
+
+    async def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        data = await self._stream.read(max_bytes, timeout)
+        if not self._session_stored and self._hostname is not None:
+            self._session_stored = True
+            self._cache.store_session(self._hostname, self._stream.get_extra_info("ssl_object"))
+        return data
+
+    async def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        await self._stream.write(buffer, timeout)
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+    async def start_tls(
+        self, ssl_context: ssl.SSLContext, server_hostname: Optional[str] = None, timeout: Optional[float] = None
+    ) -> httpcore.AsyncNetworkStream:
+        stream = _AsyncCachingStream(await self._stream.start_tls(ssl_context, server_hostname, timeout), self._cache)
+        stream._hostname = server_hostname
+        return stream
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+
+class _CachingBackend(httpcore.NetworkBackend):
+    def __init__(self, backend: httpcore.NetworkBackend, cache: _ConnectionCache) -> None:
+        self._backend = backend
+        self._cache = cache
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.NetworkStream:
+        if local_address is not None or _is_ip_address(host):
+            return _CachingStream(
+                self._backend.connect_tcp(host, port, timeout, local_address, socket_options), self._cache
+            )
+
+        address = self._cache.address(host, port)
+        if address is not None:
+            try:
+                stream = self._backend.connect_tcp(address, port, timeout, None, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                self._cache.forget_address(host, port)
+            else:
+                return _CachingStream(stream, self._cache)
+
+        stream = self._backend.connect_tcp(host, port, timeout, None, socket_options)
+        self._cache.store_address(host, port, stream)
+        return _CachingStream(stream, self._cache)
+
+    def connect_unix_socket(
+        self, path: str, timeout: Optional[float] = None, socket_options: Optional[Iterable[Any]] = None
+    ) -> httpcore.NetworkStream:
+        return _CachingStream(self._backend.connect_unix_socket(path, timeout, socket_options), self._cache)
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+class _AsyncCachingBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, cache: _ConnectionCache) -> None:
+        self._backend = backend
+        self._cache = cache
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        if local_address is not None or _is_ip_address(host):
+            return _AsyncCachingStream(
+                await self._backend.connect_tcp(host, port, timeout, local_address, socket_options), self._cache
+            )
+
+        address = self._cache.address(host, port)
+        if address is not None:
+            try:
+                stream = await self._backend.connect_tcp(address, port, timeout, None, socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                self._cache.forget_address(host, port)
+            else:
+                return _AsyncCachingStream(stream, self._cache)
+
+        # by hostname, so that anyio resolves it and races the addresses (Happy Eyeballs)
+        stream = await self._backend.connect_tcp(host, port, timeout, None, socket_options)
+        self._cache.store_address(host, port, stream)
+        return _AsyncCachingStream(stream, self._cache)
+
+    async def connect_unix_socket(
+        self, path: str, timeout: Optional[float] = None, socket_options: Optional[Iterable[Any]] = None
+    ) -> httpcore.AsyncNetworkStream:
+        return _AsyncCachingStream(await self._backend.connect_unix_socket(path, timeout, socket_options), self._cache)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def caching_transport(transport_cls: Any, **transport_kwargs: Any) -> Any:
+    """Builds a transport whose new connections reuse cached addresses and TLS sessions.
+
+    TLS sessions are only resumed when the SSL context is created here, not for a
+    `verify=ssl.SSLContext(...)` given by the caller, which is left as it is.
+    """
+    cache = _ConnectionCache()
+    if not isinstance(transport_kwargs.get("verify"), ssl.SSLContext):
+        transport_kwargs["verify"] = cache.ssl_context(
+            verify=transport_kwargs.get("verify", True),
+            cert=transport_kwargs.pop("cert", None),
+            trust_env=transport_kwargs.get("trust_env", True),
+        )
+    transport = transport_cls(**transport_kwargs)
+
+    pool = transport._pool
+    if isinstance(pool, httpcore.ConnectionPool):
+        pool._network_backend = _CachingBackend(pool._network_backend, cache)
+    elif isinstance(pool, httpcore.AsyncConnectionPool):
+        pool._network_backend = _AsyncCachingBackend(pool._network_backend, cache)
+    return transport
+
+
+def pool_stats(client: Union[httpx.Client, httpx.AsyncClient]) -> Optional[ConnectionPoolStats]:
+    """The state of the client's default connection pool, `None` if it doesn't use one."""
+    transport = client._transport
+    pool = getattr(transport, "_pool", None)
+    if not isinstance(pool, (httpcore.ConnectionPool, httpcore.AsyncConnectionPool)):
+        return None
+
+    connections = pool.connections
+    active = idle = http2 = 0
+    for connection in connections:
+        if connection.is_idle():
+            idle += 1
+        elif not connection.is_closed():
+            active += 1
+        inner = getattr(connection, "_connection", connection)
+        if isinstance(inner, (httpcore.HTTP2Connection, httpcore.AsyncHTTP2Connection)):
+            http2 += 1
+
+    backend = pool._network_backend
+    cache: Optional[_ConnectionCache] = getattr(backend, "_cache", None)
+    return ConnectionPoolStats(
+        connections=len(connections),
+        active=active,
+        idle=idle,
+        http2=http2,
+        max_connections=None if pool._max_connections == sys.maxsize else pool._max_connections,
+        max_keepalive_connections=(
+            None if pool._max_keepalive_connections == sys.maxsize else pool._max_keepalive_connections
+        ),
+        dns_cache_entries=cache.dns_cache_entries if cache is not None else 0,
+        tls_sessions=cache.tls_sessions if cache is not None else 0,
+    )
@@ -1,14 +1,77 @@
 from __future__ import annotations
 
-import json
+from typing import Any, List
 from typing_extensions import Generic, TypeVar, Iterator, AsyncIterator
 
 import httpx
 
 from .._models import construct_type_unchecked
+from .._utils._json import json_loads
+from .._utils._proxy import LazyProxy
 
 _T = TypeVar("_T")
 
+_MISSING: Any = object()
+
+
+class _LineBuffer:
+    """Splits a stream of byte chunks into complete lines.
+
+    Chunks are appended to a single `bytearray` and only split once a newline has
+    been received, so long lines spread over many chunks aren't re-copied for every
+    chunk. A raw `\\r` can never appear inside a JSON value so it is treated as a line
+    break as well, which also covers `\\r\\n` line endings.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        if b"\r" in chunk:
+            chunk = chunk.replace(b"\r", b"\n")
+
+        buf = self._buf
+        buf += chunk
+        if b"\n" not in chunk:
+            return []
+
+        end = buf.rfind(b"\n")
+        with memoryview(buf) as view:
+            lines = bytes(view[:end]).split(b"\n")
+        del buf[: end + 1]
+        return lines
+
+    def flush(self) -> List[bytes]:
+        lines = [bytes(self._buf)]
+        self._buf.clear()
+        return lines
+
+
+class _LazyLine(LazyProxy[_T]):
+    """Holds the parsed JSON for a line and only constructs the model the first time it is accessed."""
+
+    def __init__(self, value: object, type_: type[_T]) -> None:
+        self._lazy_value = value
+        self._lazy_type = type_
+        self._lazy_model: _T = _MISSING
+
+    def __load__(self) -> _T:
+        if self._lazy_model is _MISSING:
+            self._lazy_model = construct_type_unchecked(value=self._lazy_value, type_=self._lazy_type)
+        return self._lazy_model
+
+
+def _parse_lines(lines: List[bytes], *, line_type: type[_T], lazy: bool) -> Iterator[_T]:
+    for line in lines:
+        if not line or line.isspace():
+            continue
+
+        value = json_loads(line)
+        if lazy:
+            yield _LazyLine(value, line_type).__as_proxied__()
+        else:
+            yield construct_type_unchecked(value=value, type_=line_type)
+
 
 class JSONLDecoder(Generic[_T]):
     """A decoder for [JSON Lines](https://jsonlines.org) format.
@@ -31,8 +94,24 @@ class JSONLDecoder(Generic[_T]):
         self.http_response = http_response
         self._raw_iterator = raw_iterator
         self._line_type = line_type
+        self._lazy = False
         self._iterator = self.__decode__()
 
+    def lazy(self) -> JSONLDecoder[_T]:
+        """Defer constructing each line's model until one of its attributes is first accessed.
+
+        Lines are still parsed as they're received, but the (comparatively expensive)
+        model construction is skipped for lines that are only filtered or counted,
+        e.g. when looking for the results of a handful of `custom_id`s.
+
+        ```py
+        for result in client.messages.batches.results(batch_id).lazy():
+            ...
+        ```
+        """
+        self._lazy = True
+        return self
+
     def close(self) -> None:
         """Close the response body stream.
 
@@ -41,23 +120,14 @@ class JSONLDecoder(Generic[_T]):
         self.http_response.close()
 
     def __decode__(self) -> Iterator[_T]:
-        buf = b""
+        buf = _LineBuffer()
         for chunk in self._raw_iterator:
-            for line in chunk.splitlines(keepends=True):
-                buf += line
-                if buf.endswith((b"\r", b"\n", b"\r\n")):
-                    yield construct_type_unchecked(
-                        value=json.loads(buf),
-                        type_=self._line_type,
-                    )
-                    buf = b""
+            lines = buf.feed(chunk)
+            if lines:
+                yield from _parse_lines(lines, line_type=self._line_type, lazy=self._lazy)
 
         # flush
-        if buf:
-            yield construct_type_unchecked(
-                value=json.loads(buf),
-                type_=self._line_type,
-            )
+        yield from _parse_lines(buf.flush(), line_type=self._line_type, lazy=self._lazy)
 
     def __next__(self) -> _T:
         return self._iterator.__next__()
@@ -87,8 +157,17 @@ class AsyncJSONLDecoder(Generic[_T]):
         self.http_response = http_response
         self._raw_iterator = raw_iterator
         self._line_type = line_type
+        self._lazy = False
         self._iterator = self.__decode__()
 
+    def lazy(self) -> AsyncJSONLDecoder[_T]:
+        """Defer constructing each line's model until one of its attributes is first accessed.
+
+        See `JSONLDecoder.lazy()`.
+        """
+        self._lazy = True
+        return self
+
     async def close(self) -> None:
         """Close the response body stream.
 
@@ -97,23 +176,16 @@ class AsyncJSONLDecoder(Generic[_T]):
         await self.http_response.aclose()
 
     async def __decode__(self) -> AsyncIterator[_T]:
-        buf = b""
+        buf = _LineBuffer()
         async for chunk in self._raw_iterator:
-            for line in chunk.splitlines(keepends=True):
-                buf += line
-                if buf.endswith((b"\r", b"\n", b"\r\n")):
-                    yield construct_type_unchecked(
-                        value=json.loads(buf),
-                        type_=self._line_type,
-                    )
-                    buf = b""
+            lines = buf.feed(chunk)
+            if lines:
+                for item in _parse_lines(lines, line_type=self._line_type, lazy=self._lazy):
+                    yield item
 
         # flush
-        if buf:
-            yield construct_type_unchecked(
-                value=json.loads(buf),
-                type_=self._line_type,
-            )
+        for item in _parse_lines(buf.flush(), line_type=self._line_type, lazy=self._lazy):
+            yield item
 
     async def __anext__(self) -> _T:
         return await self._iterator.__anext__()
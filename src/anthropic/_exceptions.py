@@ -105,6 +105,23 @@ class RetryableError(AnthropicError):
     """
 
 
+class CircuitOpenError(AnthropicError):
+    """Raised instead of sending a request while the client's `CircuitBreaker` is open for its host.
+
+    It is never retried.
+    """
+
+    host: str
+
+    retry_after: float
+    """Seconds until the circuit lets a trial request through."""
+
+    def __init__(self, *, host: str, retry_after: float) -> None:
+        super().__init__(f"Circuit breaker is open for {host}; retry in {retry_after:.1f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
 class BadRequestError(APIStatusError):
     status_code: Literal[400] = 400  # pyright: ignore[reportIncompatibleVariableOverride]
 
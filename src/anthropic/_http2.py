@@ -0,0 +1,406 @@
+"""HTTP/2 transports for `DefaultHttpxClient` and `DefaultAsyncHttpxClient`.
+
+httpcore opens a single HTTP/2 connection per origin, queueing every request on
+it once the server's stream limit is reached, and lets the server send up to 16MiB
+on each stream before it is read, which is as much as the whole connection allows,
+so that a single response that isn't being read stops every other response on its
+connection. These transports use a pool that opens another connection once
+`max_concurrent_streams` streams are in flight on each existing one, and that
+advertises the flow-control windows given by `HTTP2Limits`.
+
+Proxied requests use httpcore's own connections.
+
+The connections override private parts of httpcore's, so they are only used with the
+httpcore releases they have been tested against; other releases get httpx's own
+HTTP/2 transport."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional
+
+import httpx
+import httpcore
+
+from ._constants import DEFAULT_CONNECTION_LIMITS
+
+__all__ = ["HTTP2Limits"]
+
+# the initial connection and stream window sizes defined by RFC 9113
+_DEFAULT_WINDOW_SIZE = 65_535
+
+# the httpcore releases, from inclusive to exclusive, whose internals the connections below are written against
+_TESTED_HTTPCORE_VERSIONS = ((1, 0, 0), (1, 1, 0))
+
+
+def _httpcore_supported() -> bool:
+    try:
+        version = tuple(int(part) for part in httpcore.__version__.split(".")[:3])
+    except ValueError:
+        return False
+    low, high = _TESTED_HTTPCORE_VERSIONS
+    if not low <= version < high:
+        return False
+    # the private methods that are overridden or called
+    return all(
+        callable(getattr(cls, name, None))
+        for cls, name in (
+            (httpcore.HTTP2Connection, "_send_connection_init"),
+            (httpcore.HTTP2Connection, "_send_request_headers"),
+            (httpcore.HTTP2Connection, "_write_outgoing_data"),
+            (httpcore.AsyncHTTP2Connection, "_send_connection_init"),
+            (httpcore.AsyncHTTP2Connection, "_send_request_headers"),
+            (httpcore.AsyncHTTP2Connection, "_write_outgoing_data"),
+            (httpcore.HTTPConnection, "_connect"),
+            (httpcore.AsyncHTTPConnection, "_connect"),
+        )
+    )
+
+
+_HTTPCORE_SUPPORTED = _httpcore_supported()
+
+
+class HTTP2Limits(httpx.Limits):
+    """Connection limits for HTTP/2, with settings for the streams multiplexed over each connection.
+
+    Pass it as the `limits` of a `DefaultHttpxClient` or `DefaultAsyncHttpxClient` created
+    with `http2=True`; they use the default values when given a plain `httpx.Limits`.
+    HTTP/2 requires the `h2` package, e.g. `pip install 'httpx[http2]'`.
+
+    ```py
+    client = Anthropic(
+        http_client=DefaultHttpxClient(
+            http2=True,
+            limits=HTTP2Limits(max_connections=20, max_concurrent_streams=100),
+        ),
+    )
+    ```
+    """
+
+    max_concurrent_streams: int
+    """The most streams to open on one connection before opening another.
+
+    The server's own limit applies when it is lower.
+    """
+
+    initial_window_size: int
+    """How many bytes of each response the server may send before the client has read them."""
+
+    connection_window_size: int
+    """How many bytes of all responses on a connection the server may send before the client has read them.
+
+    Defaults to `max_concurrent_streams * initial_window_size`, so that a response that
+    isn't being read can't stop the others on its connection from being received.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: Optional[int] = 1000,
+        max_keepalive_connections: Optional[int] = 100,
+        keepalive_expiry: Optional[float] = 5.0,
+        max_concurrent_streams: int = 100,
+        initial_window_size: int = 256 * 1024,
+        connection_window_size: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        if max_concurrent_streams < 1:
+            raise ValueError(f"max_concurrent_streams must be at least 1, got {max_concurrent_streams}")
+        if not _DEFAULT_WINDOW_SIZE <= initial_window_size < 2**31:
+            raise ValueError(
+                f"initial_window_size must be in [{_DEFAULT_WINDOW_SIZE}, 2**31), got {initial_window_size}"
+            )
+        if connection_window_size is None:
+            connection_window_size = min(max_concurrent_streams * initial_window_size, 2**31 - 1)
+        if not _DEFAULT_WINDOW_SIZE <= connection_window_size < 2**31:
+            raise ValueError(
+                f"connection_window_size must be in [{_DEFAULT_WINDOW_SIZE}, 2**31), got {connection_window_size}"
+            )
+
+        self.max_concurrent_streams = max_concurrent_streams
+        self.initial_window_size = initial_window_size
+        self.connection_window_size = connection_window_size
+
+    @classmethod
+    def from_limits(cls, limits: httpx.Limits) -> HTTP2Limits:
+        if isinstance(limits, HTTP2Limits):
+            return limits
+        return cls(
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, HTTP2Limits)
+            and super().__eq__(other)
+            and self.max_concurrent_streams == other.max_concurrent_streams
+            and self.initial_window_size == other.initial_window_size
+            and self.connection_window_size == other.connection_window_size
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_connections={self.max_connections}, "
+            f"max_keepalive_connections={self.max_keepalive_connections}, keepalive_expiry={self.keepalive_expiry}, "
+            f"max_concurrent_streams={self.max_concurrent_streams}, initial_window_size={self.initial_window_size}, "
+            f"connection_window_size={self.connection_window_size})"
+        )
+
+
+def _request_headers(request: httpcore.Request) -> "tuple[list[tuple[bytes, bytes]], bool]":
+    # the same as httpcore's, mapping the HTTP/1.1 style headers onto HTTP/2 pseudo-headers
+    authority = [v for k, v in request.headers if k.lower() == b"host"][0]
+    headers = [
+        (b":method", request.method),
+        (b":authority", authority),
+        (b":scheme", request.url.scheme),
+        (b":path", request.url.target),
+    ] + [(k.lower(), v) for k, v in request.headers if k.lower() not in (b"host", b"transfer-encoding")]
+    end_stream = not any(k.lower() in (b"content-length", b"transfer-encoding") for k, _ in request.headers)
+    return headers, end_stream
+
+
+def _local_settings(limits: HTTP2Limits) -> Any:
+    import h2.settings
+
+    # mirrors httpcore's own settings, which it sets before the connection preamble
+    # so that no extra SETTINGS frame is sent
+    settings = h2.settings.Settings(
+        client=True,
+        initial_values={
+            h2.settings.SettingCodes.ENABLE_PUSH: 0,
+            h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: limits.max_concurrent_streams,
+            h2.settings.SettingCodes.MAX_HEADER_LIST_SIZE: 65536,
+            h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: limits.initial_window_size,
+        },
+    )
+    del settings[h2.settings.SettingCodes.ENABLE_CONNECT_PROTOCOL]
+    return settings
+
+
+class _HTTP2Connection(httpcore.HTTP2Connection):
+    def __init__(self, *, limits: HTTP2Limits, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._limits = limits
+        # requests that have been accepted but haven't opened their stream yet
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    def handle_request(self, request: httpcore.Request) -> httpcore.Response:
+        # Requests that arrive while the connection is being established are all assigned to
+        # it by the pool. Handing back the ones over the limit makes the pool open another.
+        with self._pending_lock:
+            if len(self._events) + self._pending >= self._limits.max_concurrent_streams:
+                raise httpcore.ConnectionNotAvailable()
+            self._pending += 1
+        try:
+            return super().handle_request(request)
+        finally:
+            with self._pending_lock:
+                self._pending -= 1
+
+    def _send_connection_init(self, request: httpcore.Request) -> None:
+        self._h2_state.local_settings = _local_settings(self._limits)
+        self._h2_state.initiate_connection()
+        self._h2_state.increment_flow_control_window(self._limits.connection_window_size - _DEFAULT_WINDOW_SIZE)
+        self._write_outgoing_data(request)
+
+    def _send_request_headers(self, request: httpcore.Request, stream_id: int) -> None:
+        # unlike httpcore, doesn't widen the stream's window beyond `initial_window_size`
+        headers, end_stream = _request_headers(request)
+        self._h2_state.send_headers(stream_id, headers, end_stream=end_stream)
+        self._write_outgoing_data(request)
+
+    def is_available(self) -> bool:
+        return super().is_available() and len(self._events) + self._pending < self._limits.max_concurrent_streams
+
+
+class _AsyncHTTP2Connection(httpcore.AsyncHTTP2Connection):
+    def __init__(self, *, limits: HTTP2Limits, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._limits = limits
+        self._pending = 0
+
+    async def handle_async_request(self, request: httpcore.Request) -> httpcore.Response:
+        if len(self._events) + self._pending >= self._limits.max_concurrent_streams:
+            raise httpcore.ConnectionNotAvailable()
+        self._pending += 1
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            self._pending -= 1
+
+    async def _send_connection_init(self, request: httpcore.Request) -> None:
+        self._h2_state.local_settings = _local_settings(self._limits)
+        self._h2_state.initiate_connection()
+        self._h2_state.increment_flow_control_window(self._limits.connection_window_size - _DEFAULT_WINDOW_SIZE)
+        await self._write_outgoing_data(request)
+
+    async def _send_request_headers(self, request: httpcore.Request, stream_id: int) -> None:
+        headers, end_stream = _request_headers(request)
+        self._h2_state.send_headers(stream_id, headers, end_stream=end_stream)
+        await self._write_outgoing_data(request)
+
+    def is_available(self) -> bool:
+        return super().is_available() and len(self._events) + self._pending < self._limits.max_concurrent_streams
+
+
+class _HTTPConnection(httpcore.HTTPConnection):
+    def __init__(self, *, limits: HTTP2Limits, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._limits = limits
+
+    def handle_request(self, request: httpcore.Request) -> httpcore.Response:
+        # the same as httpcore's, other than the HTTP/2 connection class
+        if not self.can_handle_request(request.url.origin):
+            raise RuntimeError(f"Attempted to send request to {request.url.origin} on connection to {self._origin}")
+
+        try:
+            with self._request_lock:
+                if self._connection is None:
+                    stream = self._connect(request)
+
+                    ssl_object = stream.get_extra_info("ssl_object")
+                    http2_negotiated = ssl_object is not None and ssl_object.selected_alpn_protocol() == "h2"
+                    if http2_negotiated or (self._http2 and not self._http1):
+                        self._connection = _HTTP2Connection(
+                            limits=self._limits,
+                            origin=self._origin,
+                            stream=stream,
+                            keepalive_expiry=self._keepalive_expiry,
+                        )
+                    else:
+                        self._connection = httpcore.HTTP11Connection(
+                            origin=self._origin,
+                            stream=stream,
+                            keepalive_expiry=self._keepalive_expiry,
+                        )
+        except BaseException as exc:
+            self._connect_failed = True
+            raise exc
+
+        return self._connection.handle_request(request)
+
+
+class _AsyncHTTPConnection(httpcore.AsyncHTTPConnection):
+    def __init__(self, *, limits: HTTP2Limits, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._limits = limits
+
+    async def handle_async_request(self, request: httpcore.Request) -> httpcore.Response:
+        # the same as httpcore's, other than the HTTP/2 connection class
+        if not self.can_handle_request(request.url.origin):
+            raise RuntimeError(f"Attempted to send request to {request.url.origin} on connection to {self._origin}")
+
+        try:
+            async with self._request_lock:
+                if self._connection is None:
+                    stream = await self._connect(request)
+
+                    ssl_object = stream.get_extra_info("ssl_object")
+                    http2_negotiated = ssl_object is not None and ssl_object.selected_alpn_protocol() == "h2"
+                    if http2_negotiated or (self._http2 and not self._http1):
+                        self._connection = _AsyncHTTP2Connection(
+                            limits=self._limits,
+                            origin=self._origin,
+                            stream=stream,
+                            keepalive_expiry=self._keepalive_expiry,
+                        )
+                    else:
+                        self._connection = httpcore.AsyncHTTP11Connection(
+                            origin=self._origin,
+                            stream=stream,
+                            keepalive_expiry=self._keepalive_expiry,
+                        )
+        except BaseException as exc:
+            self._connect_failed = True
+            raise exc
+
+        return await self._connection.handle_async_request(request)
+
+
+class _ConnectionPool(httpcore.ConnectionPool):
+    def __init__(self, *, limits: HTTP2Limits, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._limits = limits
+
+    def create_connection(self, origin: httpcore.Origin) -> httpcore.ConnectionInterface:
+        if self._proxy is not None:
+            return super().create_connection(origin)
+
+        return _HTTPConnection(
+            limits=self._limits,
+            origin=origin,
+            ssl_context=self._ssl_context,
+            keepalive_expiry=self._keepalive_expiry,
+            http1=self._http1,
+            http2=self._http2,
+            retries=self._retries,
+            local_address=self._local_address,
+            uds=self._uds,
+            network_backend=self._network_backend,
+            socket_options=self._socket_options,
+        )
+
+
+class _AsyncConnectionPool(httpcore.AsyncConnectionPool):
+    def __init__(self, *, limits: HTTP2Limits, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._limits = limits
+
+    def create_connection(self, origin: httpcore.Origin) -> httpcore.AsyncConnectionInterface:
+        if self._proxy is not None:
+            return super().create_connection(origin)
+
+        return _AsyncHTTPConnection(
+            limits=self._limits,
+            origin=origin,
+            ssl_context=self._ssl_context,
+            keepalive_expiry=self._keepalive_expiry,
+            http1=self._http1,
+            http2=self._http2,
+            retries=self._retries,
+            local_address=self._local_address,
+            uds=self._uds,
+            network_backend=self._network_backend,
+            socket_options=self._socket_options,
+        )
+
+
+def _pool_kwargs(pool: Any) -> dict[str, Any]:
+    # httpx builds the SSL context and resolves its options when creating its pool,
+    # so the replacement pool is created from the same values
+    return {
+        "ssl_context": pool._ssl_context,
+        "max_connections": pool._max_connections,
+        "max_keepalive_connections": pool._max_keepalive_connections,
+        "keepalive_expiry": pool._keepalive_expiry,
+        "http1": pool._http1,
+        "http2": pool._http2,
+        "retries": pool._retries,
+        "local_address": pool._local_address,
+        "uds": pool._uds,
+        "network_backend": pool._network_backend,
+        "socket_options": pool._socket_options,
+    }
+
+
+class HTTP2Transport(httpx.HTTPTransport):
+    def __init__(self, *, limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS, **kwargs: Any) -> None:
+        super().__init__(limits=limits, **kwargs)
+        # proxied connections are left to httpcore, as is everything with an untested httpcore
+        if _HTTPCORE_SUPPORTED and type(self._pool) is httpcore.ConnectionPool:
+            self._pool = _ConnectionPool(limits=HTTP2Limits.from_limits(limits), **_pool_kwargs(self._pool))
+
+
+class AsyncHTTP2Transport(httpx.AsyncHTTPTransport):
+    def __init__(self, *, limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS, **kwargs: Any) -> None:
+        super().__init__(limits=limits, **kwargs)
+        if _HTTPCORE_SUPPORTED and type(self._pool) is httpcore.AsyncConnectionPool:
+            self._pool = _AsyncConnectionPool(limits=HTTP2Limits.from_limits(limits), **_pool_kwargs(self._pool))
@@ -29,6 +29,7 @@ from ._models import BaseModel, is_basemodel, add_request_id
 from ._constants import RAW_RESPONSE_HEADER
 from ._streaming import Stream, AsyncStream, is_stream_class_type, extract_stream_chunk_type
 from ._exceptions import APIResponseValidationError
+from ._utils._json import json_loads
 from ._decoders.jsonl import JSONLDecoder, AsyncJSONLDecoder
 
 if TYPE_CHECKING:
@@ -214,7 +215,7 @@ class LegacyAPIResponse(Generic[R]):
                 return cast(
                     R,
                     cast("type[JSONLDecoder[Any]]", cast_to)(
-                        raw_iterator=self.http_response.iter_bytes(chunk_size=64),
+                        raw_iterator=self.http_response.iter_bytes(),
                         line_type=extract_type_arg(cast_to, 0),
                         http_response=self.http_response,
                     ),
@@ -224,7 +225,7 @@ class LegacyAPIResponse(Generic[R]):
                 return cast(
                     R,
                     cast("type[AsyncJSONLDecoder[Any]]", cast_to)(
-                        raw_iterator=self.http_response.aiter_bytes(chunk_size=64),
+                        raw_iterator=self.http_response.aiter_bytes(),
                         line_type=extract_type_arg(cast_to, 0),
                         http_response=self.http_response,
                     ),
@@ -333,7 +334,7 @@ class LegacyAPIResponse(Generic[R]):
         if not content_type.endswith("json"):
             if is_basemodel(cast_to):
                 try:
-                    data = response.json()
+                    data = json_loads(response.content)
                 except Exception as exc:
                     log.debug("Could not read JSON from response data due to %s - %s", type(exc), exc)
                 else:
@@ -355,7 +356,7 @@ class LegacyAPIResponse(Generic[R]):
             # handle the response however you need to.
             return response.text  # type: ignore
 
-        data = response.json()
+        data = json_loads(response.content)
 
         return self._client._process_response_data(
             data=data,
@@ -432,7 +433,9 @@ class HttpxBinaryResponseContent:
         return self.response.charset_encoding
 
     def json(self, **kwargs: Any) -> Any:
-        return self.response.json(**kwargs)
+        if kwargs:
+            return self.response.json(**kwargs)
+        return json_loads(self.response.content)
 
     def read(self) -> bytes:
         return self.response.read()
@@ -40,6 +40,7 @@ from pydantic.fields import FieldInfo
 
 from ._types import (
     Body,
+    Omit,
     IncEx,
     Query,
     ModelT,
@@ -79,6 +80,7 @@ from ._compat import (
     field_get_default,
 )
 from ._constants import RAW_RESPONSE_HEADER
+from ._utils._json import openapi_dumps
 
 if TYPE_CHECKING:
     from pydantic import GetCoreSchemaHandler, ValidatorFunctionWrapHandler
@@ -695,6 +697,194 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
     return value
 
 
+_PASSTHROUGH_TYPES: frozenset[Any] = frozenset({str, int, bool, object, Any, type(None)})
+
+
+@lru_cache(maxsize=256)
+def compile_constructor(type_: object) -> Callable[[object], object] | None:
+    """Compile a specialised equivalent of `construct_type(type_=type_, value=value)` for a
+    discriminated union of models, e.g. `RawMessageStreamEvent`.
+
+    The returned function dispatches on the discriminator value (and on the discriminators
+    of nested unions such as `delta.type`) straight to the variant model, skipping validation
+    against the whole union and all per-call type introspection. Data that doesn't match the
+    dispatch table is handed off to `construct_type()`.
+
+    Returns `None` if the type isn't a discriminated union of models or on Pydantic v1.
+    """
+    if PYDANTIC_V1:
+        return None
+
+    unwrapped = type_.__value__ if is_type_alias_type(type_) else type_  # type: ignore[attr-defined]
+    if not is_union(get_origin(strip_annotated_type(cast(type, unwrapped)))):
+        return None
+
+    converter = _compile_type(type_, None, {})
+    if converter is None or converter is _NOT_COMPILED:
+        return None
+    return converter
+
+
+def _not_compiled(value: object) -> object:
+    return value
+
+
+_NOT_COMPILED: Callable[[object], object] = _not_compiled
+
+
+def _compile_type(
+    type_: object, metadata: Optional[List[Any]], compiled: dict[type, Callable[[object], object]]
+) -> Callable[[object], object] | None:
+    """Returns a converter for the given type, or `None` if `construct_type()` would return values as-is."""
+
+    def fallback(value: object) -> object:
+        return construct_type(value=value, type_=type_, metadata=metadata)
+
+    inner_type = cast("type[object]", type_)
+    if is_type_alias_type(inner_type):
+        inner_type = inner_type.__value__  # type: ignore[unreachable]
+
+    if metadata:
+        meta: tuple[Any, ...] = tuple(metadata)
+    elif is_annotated_type(inner_type):
+        meta = get_args(inner_type)[1:]
+        inner_type = extract_type_arg(inner_type, 0)
+    else:
+        meta = ()
+
+    if inner_type in _PASSTHROUGH_TYPES or is_literal_type(inner_type):
+        return None
+
+    origin = get_origin(inner_type) or inner_type
+    args = get_args(inner_type)
+
+    if is_union(origin):
+        variants = [variant for variant in args if variant is not type(None)]
+        converters = [_compile_type(variant, None, compiled) for variant in variants]
+        if all(converter is None for converter in converters):
+            return None
+
+        discriminator = _build_discriminated_union_meta(union=inner_type, meta_annotations=meta)
+        if discriminator is None or not all(is_basemodel_type(strip_annotated_type(v)) for v in variants):
+            if len(variants) == 1 and converters[0] is not None:
+                # `Optional[Model]`, null values are handled by the model field itself
+                return converters[0]
+            return fallback
+
+        key = discriminator.field_alias_from or discriminator.field_name
+        table = {tag: _compile_model(variant, compiled) for tag, variant in discriminator.mapping.items()}
+
+        def construct_variant(value: object) -> object:
+            if is_mapping(value):
+                tag = value.get(key)
+                if isinstance(tag, str):
+                    build = table.get(tag)
+                    if build is not None:
+                        return build(value)
+
+            return fallback(value)
+
+        return construct_variant
+
+    if origin == list or origin == dict:
+        items_converter = _compile_type(args[-1], None, compiled) if args else None
+        if items_converter is None:
+            return None
+
+        if origin == list:
+
+            def construct_list(value: object) -> object:
+                if not is_list(value):
+                    return value
+                return [items_converter(entry) for entry in value]
+
+            return construct_list
+
+        def construct_dict(value: object) -> object:
+            if not is_mapping(value):
+                return value
+            return {key: items_converter(item) for key, item in value.items()}
+
+        return construct_dict
+
+    if inspect.isclass(inner_type) and issubclass(inner_type, BaseModel):
+        return _compile_model(inner_type, compiled)
+
+    return fallback
+
+
+def _compile_model(
+    model: type[pydantic.BaseModel], compiled: dict[type, Callable[[object], object]]
+) -> Callable[[object], object]:
+    """Returns a function equivalent to `model.construct(**value)` with the field conversions resolved up front."""
+    existing = compiled.get(model)
+    if existing is not None:
+        return existing
+
+    model_fields = get_model_fields(model)
+    if (
+        not issubclass(model, BaseModel)
+        or _get_extra_fields_type(model) is not None
+        or any(field.alias is not None and field.alias != name for name, field in model_fields.items())
+    ):
+        # `construct()` doesn't map aliased keys back onto their field names, so keep the
+        # existing validate-first behaviour for these models
+        def construct_model(value: object) -> object:
+            try:
+                return validate_type(type_=model, value=value)
+            except Exception:
+                return construct_type(value=value, type_=model)
+
+        compiled[model] = construct_model
+        return construct_model
+
+    # (field name, converter, field info, constant default)
+    plan: list[tuple[str, Callable[[object], object] | None, FieldInfo, object]] = []
+
+    def build(value: object) -> object:
+        if not is_mapping(value):
+            return construct_type(value=value, type_=model)
+
+        fields_values: dict[str, object] = {}
+        fields_set: set[str] = set()
+        for name, converter, field, default in plan:
+            if name in value:
+                item = value[name]
+                if item is None:
+                    fields_values[name] = default if default is not _NOT_COMPILED else field_get_default(field)
+                elif converter is None:
+                    fields_values[name] = item
+                else:
+                    fields_values[name] = converter(item)
+                fields_set.add(name)
+            else:
+                fields_values[name] = default if default is not _NOT_COMPILED else field_get_default(field)
+
+        extra: dict[str, object] = {}
+        if len(fields_set) != len(value):
+            extra = {key: item for key, item in value.items() if key not in model_fields}
+
+        # mirrors `BaseModel.construct()` on Pydantic v2
+        m = model.__new__(model)
+        object.__setattr__(m, "__dict__", fields_values)
+        object.__setattr__(m, "__pydantic_private__", None)
+        object.__setattr__(m, "__pydantic_extra__", extra)
+        object.__setattr__(m, "__pydantic_fields_set__", fields_set)
+        return m
+
+    # registered before the fields are compiled so that recursive models resolve to this builder
+    compiled[model] = build
+
+    for name, field in model_fields.items():
+        default = field_get_default(field)
+        if default is not None and not isinstance(default, (str, int, float, bool)):
+            # mutable defaults have to be resolved on every call, like `construct()` does
+            default = _NOT_COMPILED
+        plan.append((name, _compile_type(field.annotation, getattr(field, "metadata", None), compiled), field, default))
+
+    return build
+
+
 @runtime_checkable
 class CachedDiscriminatorType(Protocol):
     __discriminator__: DiscriminatorDetails
@@ -932,6 +1122,25 @@ class FinalRequestOptionsInput(TypedDict, total=False):
     follow_redirects: bool
 
 
+class _JSONBodyCache:
+    """The serialized JSON body of a request, shared by shallow copies of its options.
+
+    The entry is only used while the options still hold the same `json_data` and
+    `extra_json` objects it was built from. Deep copies start empty as their body
+    may be changed in place.
+    """
+
+    __slots__ = ("json_data", "extra_json", "content")
+
+    def __init__(self) -> None:
+        self.json_data: object = None
+        self.extra_json: object = None
+        self.content: bytes | None = None
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> _JSONBodyCache:
+        return _JSONBodyCache()
+
+
 @final
 class FinalRequestOptions(pydantic.BaseModel):
     method: str
@@ -951,6 +1160,8 @@ class FinalRequestOptions(pydantic.BaseModel):
     json_data: Union[Body, None] = None
     extra_json: Union[AnyMapping, None] = None
 
+    _json_body_cache: _JSONBodyCache = pydantic.PrivateAttr(default_factory=_JSONBodyCache)
+
     if PYDANTIC_V1:
 
         class Config(pydantic.BaseConfig):  # pyright: ignore[reportDeprecated]
@@ -963,6 +1174,42 @@ class FinalRequestOptions(pydantic.BaseModel):
             return max_retries
         return self.max_retries
 
+    def _merged_json_data(self) -> Body | None:
+        """The JSON body with `extra_json` merged in."""
+        json_data = self.json_data
+        if self.extra_json is None:
+            return json_data
+        if json_data is None:
+            return cast(Body, self.extra_json)
+        if is_mapping(json_data):
+            merged = {**json_data, **self.extra_json}
+            return {key: value for key, value in merged.items() if not isinstance(value, Omit)}
+        raise RuntimeError(f"Unexpected JSON data type, {type(json_data)}, cannot merge with `extra_body`")
+
+    def _serialized_json(self) -> bytes | None:
+        """The merged JSON body serialized with `openapi_dumps()`, or `None` if there isn't one.
+
+        The bytes are cached and shared with shallow copies of these options so that
+        retries, hedged attempts and middleware don't serialize the body again. This
+        relies on `json_data` and `extra_json` not being mutated in place once a request
+        has been made with them; replacing either of them invalidates the cache.
+        """
+        cache = self._json_body_cache
+        if cache.content is not None and cache.json_data is self.json_data and cache.extra_json is self.extra_json:
+            return cache.content
+
+        json_data = self._merged_json_data()
+        if json_data is None or not is_given(json_data):
+            return None
+        if isinstance(json_data, bytes):
+            return json_data
+
+        content = openapi_dumps(json_data)
+        cache.json_data = self.json_data
+        cache.extra_json = self.extra_json
+        cache.content = content
+        return content
+
     def _strip_raw_response_header(self) -> None:
         if not is_given(self.headers):
             return
@@ -9,7 +9,7 @@ import httpx
 from ._types import Body, Query, Headers, NotGiven, not_given
 from ._utils import is_given
 from ._compat import model_copy
-from ._models import FinalRequestOptions
+from ._models import FinalRequestOptions, _JSONBodyCache
 
 
 class APIRequest:
@@ -58,6 +58,18 @@ class APIRequest:
     def json(self) -> Body | None:
         return self.options.json_data
 
+    @property
+    def json_bytes(self) -> bytes | None:
+        """The JSON body as it is sent, or `None` if the request doesn't have one.
+
+        The body is serialized once per call and the bytes are shared by its retries and
+        hedged attempts, so reading this doesn't serialize it again.
+        """
+        options = self.options
+        if options.files is not None or options.content is not None or options.method.lower() == "get":
+            return None
+        return options._serialized_json()
+
     @property
     def timeout(self) -> float | httpx.Timeout | None | NotGiven:
         return self.options.timeout
@@ -82,6 +94,8 @@ class APIRequest:
         # Instead we shallow-copy the options and then deep-copy only the JSON-safe mutable
         # fields so that mutating the returned request never affects the original request.
         options = model_copy(self.options)
+        # the copy's body can be changed in place, so it's serialized separately
+        options._json_body_cache = _JSONBodyCache()
         options.json_data = _copy.deepcopy(options.json_data)
         options.extra_json = _copy.deepcopy(options.extra_json)
         options.params = _copy.deepcopy(options.params)
@@ -30,6 +30,7 @@ from ._models import BaseModel, is_basemodel, add_request_id
 from ._constants import RAW_RESPONSE_HEADER, OVERRIDE_CAST_TO_HEADER
 from ._streaming import Stream, AsyncStream, is_stream_class_type, extract_stream_chunk_type
 from ._exceptions import AnthropicError, APIResponseValidationError
+from ._utils._json import json_loads
 from ._decoders.jsonl import JSONLDecoder, AsyncJSONLDecoder
 
 if TYPE_CHECKING:
@@ -144,7 +145,7 @@ class BaseAPIResponse(Generic[R]):
                 return cast(
                     R,
                     cast("type[JSONLDecoder[Any]]", cast_to)(
-                        raw_iterator=self.http_response.iter_bytes(chunk_size=64),
+                        raw_iterator=self.http_response.iter_bytes(),
                         line_type=extract_type_arg(cast_to, 0),
                         http_response=self.http_response,
                     ),
@@ -154,7 +155,7 @@ class BaseAPIResponse(Generic[R]):
                 return cast(
                     R,
                     cast("type[AsyncJSONLDecoder[Any]]", cast_to)(
-                        raw_iterator=self.http_response.aiter_bytes(chunk_size=64),
+                        raw_iterator=self.http_response.aiter_bytes(),
                         line_type=extract_type_arg(cast_to, 0),
                         http_response=self.http_response,
                     ),
@@ -267,7 +268,7 @@ class BaseAPIResponse(Generic[R]):
         if not content_type.endswith("json"):
             if is_basemodel(cast_to):
                 try:
-                    data = response.json()
+                    data = json_loads(response.content)
                 except Exception as exc:
                     log.debug("Could not read JSON from response data due to %s - %s", type(exc), exc)
                 else:
@@ -289,7 +290,7 @@ class BaseAPIResponse(Generic[R]):
             # handle the response however you need to.
             return response.text  # type: ignore
 
-        data = response.json()
+        data = json_loads(response.content)
 
         return self._client._process_response_data(
             data=data,
@@ -375,7 +376,7 @@ class APIResponse(BaseAPIResponse[R]):
     def json(self) -> object:
         """Read and decode the JSON response content."""
         self.read()
-        return self.http_response.json()
+        return json_loads(self.http_response.content)
 
     def close(self) -> None:
         """Close the response and release the connection.
@@ -482,7 +483,7 @@ class AsyncAPIResponse(BaseAPIResponse[R]):
     async def json(self) -> object:
         """Read and decode the JSON response content."""
         await self.read()
-        return self.http_response.json()
+        return json_loads(self.http_response.content)
 
     async def close(self) -> None:
         """Close the response and release the connection.
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Dict
+from collections import deque
+from dataclasses import dataclass
+from typing_extensions import Literal
+
+from ._exceptions import CircuitOpenError
+
+__all__ = ["RetryBudget", "RetryBudgetStats", "CircuitBreaker", "CircuitState", "CircuitStats"]
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True)
+class RetryBudgetStats:
+    requests: int
+    """The number of requests recorded since the budget was created."""
+
+    retries: int
+    """The number of retries the budget allowed."""
+
+    rejected: int
+    """The number of retries the budget refused because it was exhausted."""
+
+    available: float
+    """How many more retries the budget currently allows."""
+
+
+class RetryBudget:
+    """Caps the retries of every request made through a client to a fraction of its recent requests.
+
+    Over a sliding `window` of seconds, retries are allowed while there have been fewer
+    than `ratio` times the requests made in that window, plus `min_retries_per_second`
+    so that a client making few requests can still retry. When the budget is exhausted
+    a failed request is raised to the caller instead of being retried, so that retries
+    can't multiply the load on the API during an incident.
+
+    A budget is shared by every client derived from the one it was given to, e.g. with
+    `client.with_options()`, and may be given to several clients.
+
+    ```py
+    client = Anthropic(retry_budget=RetryBudget(ratio=0.1))
+    ```
+    """
+
+    def __init__(self, *, ratio: float = 0.1, min_retries_per_second: float = 1.0, window: float = 10.0) -> None:
+        if ratio < 0:
+            raise ValueError(f"ratio must not be negative, got {ratio}")
+        if min_retries_per_second < 0:
+            raise ValueError(f"min_retries_per_second must not be negative, got {min_retries_per_second}")
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+
+        self._ratio = ratio
+        self._min_retries = min_retries_per_second * window
+        self._window = window
+        self._lock = threading.Lock()
+        self._request_times: deque[float] = deque()
+        self._retry_times: deque[float] = deque()
+        self._requests = 0
+        self._retries = 0
+        self._rejected = 0
+
+    @property
+    def stats(self) -> RetryBudgetStats:
+        with self._lock:
+            return RetryBudgetStats(
+                requests=self._requests,
+                retries=self._retries,
+                rejected=self._rejected,
+                available=max(0.0, self._available(time.monotonic())),
+            )
+
+    def record_request(self) -> None:
+        """Called once for every request, before its first attempt."""
+        with self._lock:
+            self._requests += 1
+            self._request_times.append(time.monotonic())
+
+    def try_retry(self) -> bool:
+        """Takes a retry from the budget, returning whether one was available."""
+        with self._lock:
+            now = time.monotonic()
+            if self._available(now) < 1:
+                self._rejected += 1
+                return False
+
+            self._retries += 1
+            self._retry_times.append(now)
+            return True
+
+    def _available(self, now: float) -> float:
+        cutoff = now - self._window
+        for times in (self._request_times, self._retry_times):
+            while times and times[0] < cutoff:
+                times.popleft()
+        return self._min_retries + self._ratio * len(self._request_times) - len(self._retry_times)
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    state: CircuitState
+
+    consecutive_failures: int
+    """Failed attempts since the last successful one."""
+
+    failures: int
+    """Failed attempts since the breaker was created."""
+
+    successes: int
+    """Successful attempts since the breaker was created."""
+
+    rejected: int
+    """Requests failed fast with a `CircuitOpenError` since the breaker was created."""
+
+
+class _Circuit:
+    __slots__ = ("state", "consecutive_failures", "opened_at", "trial_in_flight", "failures", "successes", "rejected")
+
+    def __init__(self) -> None:
+        self.state: CircuitState = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.failures = 0
+        self.successes = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """Fails requests fast with a `CircuitOpenError` while a host keeps failing.
+
+    Each host starts `"closed"`, sending every request. After `failure_threshold`
+    consecutive attempts fail with a connection error, a timeout, or a 5xx status, the
+    host's circuit opens and requests to it raise a `CircuitOpenError` without being
+    sent, and aren't retried. Once `recovery_timeout` seconds have passed the circuit
+    is `"half_open"`: a single trial request is let through, closing the circuit
+    again if it succeeds and re-opening it if it fails.
+
+    Like a `RetryBudget`, a breaker is shared by every client derived from the one it
+    was given to.
+
+    ```py
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+    client = Anthropic(circuit_breaker=breaker)
+
+    print(breaker.stats())  # {'api.anthropic.com': CircuitStats(state='closed', ...)}
+    ```
+    """
+
+    def __init__(self, *, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {failure_threshold}")
+        if recovery_timeout < 0:
+            raise ValueError(f"recovery_timeout must not be negative, got {recovery_timeout}")
+
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def state(self, host: str) -> CircuitState:
+        with self._lock:
+            circuit = self._circuits.get(host)
+            return "closed" if circuit is None else self._current_state(circuit, time.monotonic())
+
+    def stats(self) -> Dict[str, CircuitStats]:
+        """The state and counters of every host a request has been made to."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                host: CircuitStats(
+                    state=self._current_state(circuit, now),
+                    consecutive_failures=circuit.consecutive_failures,
+                    failures=circuit.failures,
+                    successes=circuit.successes,
+                    rejected=circuit.rejected,
+                )
+                for host, circuit in self._circuits.items()
+            }
+
+    def reset(self) -> None:
+        """Closes every circuit and clears all counters."""
+        with self._lock:
+            self._circuits.clear()
+
+    def before_request(self, host: str) -> bool:
+        """Called before every attempt, raises a `CircuitOpenError` if the attempt must not be made.
+
+        Returns whether the attempt is the trial request of a half-open circuit, which is
+        passed on to `record_success()`, `record_failure()` or `release()` with its outcome.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            now = time.monotonic()
+            state = self._current_state(circuit, now)
+            if state == "closed":
+                return False
+
+            if state == "half_open" and not circuit.trial_in_flight:
+                circuit.state = "half_open"
+                circuit.trial_in_flight = True
+                return True
+
+            circuit.rejected += 1
+            retry_after = max(0.0, circuit.opened_at + self._recovery_timeout - now)
+
+        raise CircuitOpenError(host=host, retry_after=retry_after)
+
+    def record_success(self, host: str, *, trial: bool = False) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.successes += 1
+            # a success of a request sent before the circuit opened doesn't close it, only the trial's does
+            if circuit.state == "closed" or trial:
+                circuit.consecutive_failures = 0
+                circuit.state = "closed"
+            if trial:
+                circuit.trial_in_flight = False
+
+    def record_failure(self, host: str, *, trial: bool = False) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.failures += 1
+            circuit.consecutive_failures += 1
+            if trial or circuit.consecutive_failures >= self._failure_threshold:
+                circuit.state = "open"
+                circuit.opened_at = time.monotonic()
+            if trial:
+                circuit.trial_in_flight = False
+
+    def release(self, host: str, *, trial: bool = False) -> None:
+        """Called when an attempt ended without telling whether the host is healthy, e.g. a client side error."""
+        if not trial:
+            return
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is not None:
+                circuit.trial_in_flight = False
+
+    def _current_state(self, circuit: _Circuit, now: float) -> CircuitState:
+        if circuit.state == "open" and now - circuit.opened_at >= self._recovery_timeout:
+            return "half_open"
+        return circuit.state
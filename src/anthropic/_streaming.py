@@ -1,17 +1,18 @@
 # Note: initially copied from https://github.com/florimondmanca/httpx-sse/blob/master/src/httpx_sse/_decoders.py
 from __future__ import annotations
 
+import re
 import abc
-import json
 import inspect
 import warnings
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, Iterator, Optional, AsyncIterator, cast
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, Iterator, Optional, Sequence, AsyncIterator, cast
 from typing_extensions import Self, Protocol, TypeGuard, override, get_origin, runtime_checkable
 
 import httpx
 
 from ._utils import is_dict, extract_type_var_from_base
+from ._utils._json import json_loads
 
 if TYPE_CHECKING:
     from ._client import Anthropic, AsyncAnthropic
@@ -62,6 +63,7 @@ class Stream(Generic[_T], metaclass=_SyncStreamMeta):
         self._client = client
         self._options = options
         self._decoder = client._make_sse_decoder()
+        self._construct_event = client._make_stream_event_constructor(cast(Any, cast_to))
         self._iterator = self.__stream__()
 
     def __next__(self) -> _T:
@@ -87,6 +89,7 @@ class Stream(Generic[_T], metaclass=_SyncStreamMeta):
         cast_to = cast(Any, self._cast_to)
         response = self.response
         process_data = self._client._process_response_data
+        construct_event = self._construct_event
         iterator = self._iter_events()
 
         try:
@@ -146,7 +149,10 @@ class Stream(Generic[_T], metaclass=_SyncStreamMeta):
                     if is_dict(data) and "type" not in data:
                         data["type"] = sse.event
 
-                    yield process_data(data=data, cast_to=cast_to, response=response)
+                    if construct_event is not None and is_dict(data):
+                        yield cast(_T, construct_event(data))
+                    else:
+                        yield process_data(data=data, cast_to=cast_to, response=response)
 
                 if sse.event == "ping":
                     continue
@@ -230,6 +236,7 @@ class AsyncStream(Generic[_T], metaclass=_AsyncStreamMeta):
         self._client = client
         self._options = options
         self._decoder = client._make_sse_decoder()
+        self._construct_event = client._make_stream_event_constructor(cast(Any, cast_to))
         self._iterator = self.__stream__()
 
     async def __anext__(self) -> _T:
@@ -256,6 +263,7 @@ class AsyncStream(Generic[_T], metaclass=_AsyncStreamMeta):
         cast_to = cast(Any, self._cast_to)
         response = self.response
         process_data = self._client._process_response_data
+        construct_event = self._construct_event
         iterator = self._iter_events()
 
         try:
@@ -315,7 +323,10 @@ class AsyncStream(Generic[_T], metaclass=_AsyncStreamMeta):
                     if is_dict(data) and "type" not in data:
                         data["type"] = sse.event
 
-                    yield process_data(data=data, cast_to=cast_to, response=response)
+                    if construct_event is not None and is_dict(data):
+                        yield cast(_T, construct_event(data))
+                    else:
+                        yield process_data(data=data, cast_to=cast_to, response=response)
 
                 if sse.event == "ping":
                     continue
@@ -403,19 +414,37 @@ class ServerSentEvent:
         return self._raw
 
     def json(self) -> Any:
-        return json.loads(self.data)
+        return json_loads(self.data)
 
     @override
     def __repr__(self) -> str:
         return f"ServerSentEvent(event={self.event}, data={self.data}, id={self.id}, retry={self.retry})"
 
 
+# A line terminator (`\r\n`, `\r` or `\n`) immediately followed by another one, i.e. the blank line
+# that ends an event. A lone `\r` only counts as the first terminator when it isn't part of `\r\n`.
+_FRAME_END = re.compile(rb"(?:\r\n|\r(?!\n)|\n)(?:\r\n|\r|\n)")
+
+_NO_EVENTS: tuple[ServerSentEvent, ...] = ()
+
+
+def _normalize_newlines(text: str) -> str:
+    # `str.splitlines()` also splits on characters like U+2028 that are valid inside JSON
+    # strings, so we normalise the line terminators defined by the SSE spec to `\n` and split on that.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 class SSEDecoder:
     _data: list[str]
     _event: str | None
     _retry: int | None
     _last_event_id: str | None
     _raw: list[str]
+    _buf: bytearray
+    _cr: bool
+    _skip_lf: bool
 
     def __init__(self) -> None:
         self._event = None
@@ -423,50 +452,150 @@ class SSEDecoder:
         self._last_event_id = None
         self._retry = None
         self._raw = []
+        self._buf = bytearray()
+        self._cr = False
+        self._skip_lf = False
 
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        for chunk in self._iter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    def _iter_chunks(self, iterator: Iterator[bytes]) -> Iterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
+        feed = self._feed
         for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            for sse in feed(chunk):
+                yield sse
+        yield from self._flush()
 
     async def aiter_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        async for chunk in self._aiter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    async def _aiter_chunks(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
+        feed = self._feed
         async for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            for sse in feed(chunk):
+                yield sse
+        for sse in self._flush():
+            yield sse
+
+    def _feed(self, chunk: bytes) -> Sequence[ServerSentEvent]:
+        """Append `chunk` to the internal buffer and return every event whose frame is now complete.
+
+        Frames are located by scanning the buffer in place, so bytes are never re-concatenated
+        and each frame is decoded to `str` exactly once.
+        """
+        buf = self._buf
+        if not self._cr and b"\r" not in chunk:
+            # fast path for streams that only use `\n` line endings, a boundary can
+            # straddle the previous buffer contents and the new chunk
+            pos = len(buf) - 1
+            buf += chunk
+            end = buf.find(b"\n\n", pos if pos > 0 else 0)
+            if end == -1:
+                return _NO_EVENTS
+
+            events: list[ServerSentEvent] = []
+            start = 0
+            while end != -1:
+                sse = self._decode_frame(buf[start:end].decode("utf-8"))
+                if sse is not None:
+                    events.append(sse)
+                start = end + 2
+                end = buf.find(b"\n\n", start)
+
+            del buf[:start]
+            return events
+
+        self._cr = True
+        events = []
+        start = 0
+        if self._skip_lf and chunk[:1] == b"\n":
+            # the previous frame ended on a `\r` that turned out to be the first half of `\r\n`
+            start = 1
+        self._skip_lf = False
+
+        pos = max(len(buf) - 3, start)
+        buf += chunk
+        match = _FRAME_END.search(buf, pos)
+        while match is not None:
+            sse = self._decode_frame(_normalize_newlines(buf[start : match.start()].decode("utf-8")))
+            if sse is not None:
+                events.append(sse)
+            start = match.end()
+            if start == len(buf) and buf[-1] == 0x0D:
+                self._skip_lf = True
+            match = _FRAME_END.search(buf, start)
+
+        if start:
+            del buf[:start]
+        return events
+
+    def _flush(self) -> Sequence[ServerSentEvent]:
+        """Decode whatever is left in the buffer once the underlying byte stream is exhausted."""
+        buf = self._buf
+        if not buf:
+            return _NO_EVENTS
+
+        lines = _normalize_newlines(buf.decode("utf-8")).split("\n")
+        del buf[:]
+        if lines[-1] == "":
+            # trailing line terminator, not a blank line
+            lines.pop()
+
+        events: list[ServerSentEvent] = []
+        for line in lines:
+            sse = self.decode(line)
+            if sse is not None:
+                events.append(sse)
+        return events
+
+    def _decode_frame(self, text: str) -> ServerSentEvent | None:
+        """Decode a complete frame, i.e. the `\n`-separated lines preceding a blank line.
+
+        This is equivalent to calling `decode()` for every line followed by an empty line,
+        but avoids the per-line method call overhead on the hot path.
+        """
+        raw = self._raw
+        data = self._data
+        for line in text.split("\n"):
+            if not line:
+                continue
+
+            raw.append(line)
+            fieldname, _, value = line.partition(":")
+            if not fieldname:
+                continue  # comment line
+
+            if value[:1] == " ":
+                value = value[1:]
+
+            if fieldname == "data":
+                data.append(value)
+            elif fieldname == "event":
+                self._event = value
+            elif fieldname == "id":
+                if "\0" not in value:
+                    self._last_event_id = value
+            elif fieldname == "retry":
+                try:
+                    self._retry = int(value)
+                except (TypeError, ValueError):
+                    pass
+
+        if not self._event and not data and not self._last_event_id and self._retry is None:
+            self._raw = []
+            return None
+
+        sse = ServerSentEvent(
+            event=self._event,
+            data="\n".join(data),
+            id=self._last_event_id,
+            retry=self._retry,
+            raw=raw,
+        )
+
+        # NOTE: as per the SSE spec, do not reset last_event_id.
+        self._event = None
+        self._data = []
+        self._retry = None
+        self._raw = []
+
+        return sse
 
     def decode(self, line: str) -> ServerSentEvent | None:
         # See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
@@ -1,20 +1,42 @@
+from __future__ import annotations
+
 import json
-from typing import Any
+from typing import Any, Union
 from datetime import datetime
 from typing_extensions import override
 
+import jiter
 import pydantic
 
 from .._compat import model_dump
 
+__all__ = ["JSONBackend", "get_json_backend", "set_json_backend", "openapi_dumps", "json_loads"]
 
-def openapi_dumps(obj: Any) -> bytes:
-    """
-    Serialize an object to UTF-8 encoded JSON bytes.
+JSONInput = Union[str, bytes, bytearray]
 
-    Extends the standard json.dumps with support for additional types
-    commonly used in the SDK, such as `datetime`, `pydantic.BaseModel`, etc.
-    """
+# the magnitudes `repr(float)` writes without an exponent, which orjson and msgspec write the same way
+_PLAIN_FLOAT_MIN = 1e-4
+_PLAIN_FLOAT_MAX = 1e16
+_INT64_MIN = -(2**63)
+_UINT64_MAX = 2**64 - 1
+# orjson decodes integers that don't fit in 64 bits as floats, so documents with a run of
+# that many digits are left to the standard library; mapping every digit to "0" and
+# searching for the run is much faster than a regular expression
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_NUMBER = b"0" * 19
+
+
+class _CustomEncoder(json.JSONEncoder):
+    @override
+    def default(self, o: Any) -> Any:
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, pydantic.BaseModel):
+            return model_dump(o, exclude_unset=True, mode="json", by_alias=True)
+        return super().default(o)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
     return json.dumps(
         obj,
         cls=_CustomEncoder,
@@ -25,11 +47,197 @@ def openapi_dumps(obj: Any) -> bytes:
     ).encode()
 
 
-class _CustomEncoder(json.JSONEncoder):
+def _is_plain(obj: object) -> bool:
+    """Whether `obj` only holds values that orjson and msgspec encode exactly like `json.dumps`.
+
+    Anything else, such as a pydantic model, a `datetime`, an enum or a float that
+    `json.dumps` writes with an exponent, is left to the standard library.
+    """
+    stack = [obj]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        value = pop()
+        type_ = type(value)
+        if type_ is str or type_ is bool or value is None:
+            continue
+        if type_ is dict:
+            for key in value:  # type: ignore[attr-defined]
+                if type(key) is not str:
+                    return False
+            push(value.values())  # type: ignore[attr-defined]
+        elif type_ is list or type_ is tuple:
+            push(value)  # type: ignore[arg-type]
+        elif type_ is int:
+            if not _INT64_MIN <= value <= _UINT64_MAX:  # type: ignore[operator]
+                return False
+        elif type_ is float:
+            # also rejects nan and infinity
+            if value != 0 and not _PLAIN_FLOAT_MIN <= abs(value) < _PLAIN_FLOAT_MAX:  # type: ignore[arg-type]
+                return False
+        else:
+            return False
+    return True
+
+
+class JSONBackend:
+    """Encodes request bodies and decodes response bodies and streamed events.
+
+    The base class uses the standard library `json` module. Subclasses may use a faster
+    library but must produce the same bytes and values, falling back to this
+    implementation for anything they can't handle identically.
+    """
+
+    name: str = "stdlib"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize an object to compact, UTF-8 encoded JSON bytes."""
+        return _stdlib_dumps(obj)
+
+    def loads(self, data: JSONInput) -> Any:
+        return json.loads(data)
+
     @override
-    def default(self, o: Any) -> Any:
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, pydantic.BaseModel):
-            return model_dump(o, exclude_unset=True, mode="json", by_alias=True)
-        return super().default(o)
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r})"
+
+
+class _OrjsonBackend(JSONBackend):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._decode_error = orjson.JSONDecodeError
+
+    @override
+    def dumps(self, obj: Any) -> bytes:
+        if _is_plain(obj):
+            try:
+                return self._dumps(obj)
+            except TypeError:
+                # e.g. lone surrogates, which the standard library reports differently
+                pass
+        return _stdlib_dumps(obj)
+
+    @override
+    def loads(self, data: JSONInput) -> Any:
+        raw = data.encode("utf-8", "surrogatepass") if isinstance(data, str) else data
+        if _LONG_NUMBER not in raw.translate(_DIGITS_TO_ZERO):
+            try:
+                return self._loads(data)
+            except self._decode_error:
+                # e.g. `NaN`, out of range floats or a byte order mark, which the standard library accepts
+                pass
+        return json.loads(data)
+
+
+class _MsgspecBackend(JSONBackend):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encode = msgspec.json.Encoder().encode
+        self._decode = msgspec.json.Decoder().decode
+        self._decode_error = msgspec.DecodeError
+
+    @override
+    def dumps(self, obj: Any) -> bytes:
+        if _is_plain(obj):
+            try:
+                return self._encode(obj)
+            except (TypeError, ValueError):
+                pass
+        return _stdlib_dumps(obj)
+
+    @override
+    def loads(self, data: JSONInput) -> Any:
+        try:
+            return self._decode(data)
+        except (self._decode_error, ValueError):
+            # e.g. `NaN`, out of range floats or a byte order mark, which the standard library accepts
+            return json.loads(data)
+
+
+class _JiterBackend(JSONBackend):
+    """Decodes with jiter, which the SDK already depends on, and encodes with the standard library."""
+
+    name = "jiter"
+
+    @override
+    def loads(self, data: JSONInput) -> Any:
+        try:
+            return jiter.from_json(data.encode() if isinstance(data, str) else bytes(data))
+        except ValueError:
+            # e.g. lone surrogates or a byte order mark, which the standard library accepts,
+            # and invalid documents, for which it raises its own error
+            return json.loads(data)
+
+
+_BACKENDS = {
+    "orjson": _OrjsonBackend,
+    "msgspec": _MsgspecBackend,
+    "jiter": _JiterBackend,
+    "stdlib": JSONBackend,
+}
+
+
+def _auto_backend() -> JSONBackend:
+    # msgspec decodes every document itself, while orjson leaves those with long integers to the standard library
+    for backend_cls in (_MsgspecBackend, _OrjsonBackend):
+        try:
+            return backend_cls()
+        except ImportError:
+            continue
+    return _JiterBackend()
+
+
+_backend: JSONBackend = _auto_backend()
+
+
+def get_json_backend() -> JSONBackend:
+    """Returns the JSON backend used for request bodies, responses and streamed events."""
+    return _backend
+
+
+def set_json_backend(backend: str | JSONBackend) -> JSONBackend:
+    """Sets the JSON backend used for request bodies, responses and streamed events.
+
+    `backend` is one of `"auto"`, `"orjson"`, `"msgspec"`, `"jiter"` or `"stdlib"`, or a
+    `JSONBackend` instance. `"auto"`, the default, uses msgspec or orjson if either is
+    installed and otherwise decodes with jiter and encodes with the standard library.
+    Every backend produces the same output as the standard library, so this only changes
+    how fast JSON is encoded and decoded.
+    """
+    global _backend
+
+    if isinstance(backend, JSONBackend):
+        _backend = backend
+    elif backend == "auto":
+        _backend = _auto_backend()
+    elif backend in _BACKENDS:
+        try:
+            _backend = _BACKENDS[backend]()
+        except ImportError as exc:
+            raise ImportError(f"The {backend!r} JSON backend requires the `{backend}` package") from exc
+    else:
+        raise ValueError(f"Unknown JSON backend {backend!r}; expected one of 'auto', {', '.join(map(repr, _BACKENDS))}")
+    return _backend
+
+
+def openapi_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+
+    Extends the standard json.dumps with support for additional types
+    commonly used in the SDK, such as `datetime`, `pydantic.BaseModel`, etc.
+    """
+    return _backend.dumps(obj)
+
+
+def json_loads(data: JSONInput) -> Any:
+    """Parse a JSON document with the configured backend."""
+    return _backend.loads(data)
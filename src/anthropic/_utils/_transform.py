@@ -169,70 +169,301 @@ def _transform_recursive(
 
             Defaults to the same value as the `annotation` argument.
     """
-    from .._compat import model_dump
-
     if inner_type is None:
         inner_type = annotation
 
-    stripped_type = strip_annotated_type(inner_type)
-    origin = get_origin(stripped_type) or stripped_type
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return _transform_typeddict(data, stripped_type)
-
-    if origin == dict and is_mapping(data):
-        items_type = get_args(stripped_type)[1]
-        return {key: _transform_recursive(value, annotation=items_type) for key, value in data.items()}
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-        # Sequence[T]
-        or (is_sequence_type(stripped_type) and is_sequence(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
-
-        inner_type = extract_type_arg(stripped_type, 0)
-        if _no_transform_needed(inner_type):
-            # for some types there is no need to transform anything, so we can get a small
-            # perf boost from skipping that work.
+    return _get_plan(annotation, inner_type).transform(data)
+
+
+@lru_cache(maxsize=8096)
+def _get_plan(annotation: type, inner_type: type) -> _TransformPlan:
+    return _TransformPlan(annotation, inner_type)
+
+
+def _is_plain_json(data: object) -> bool:
+    """Whether `data` only holds plain JSON values, which no type without aliases transforms."""
+    stack = [data]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        value = pop()
+        type_ = type(value)
+        if type_ is str or type_ is int or type_ is float or type_ is bool or value is None:
+            continue
+        if type_ is dict:
+            push(value.values())  # type: ignore[attr-defined]
+        elif type_ is list:
+            push(value)  # type: ignore[arg-type]
+        else:
+            return False
+    return True
+
+
+def _dump_model(data: pydantic.BaseModel) -> object:
+    from .._compat import model_dump
+
+    return model_dump(
+        data, exclude_unset=True, mode="json", by_alias=True, exclude=getattr(data, "__api_exclude__", None)
+    )
+
+
+class _TransformPlan:
+    """How data is transformed against a given annotation, worked out once per type.
+
+    Unwrapping the annotation, looking up type hints and resolving aliases and formats
+    for every value on every request is most of the cost of transforming large params,
+    such as conversations with hundreds of content blocks. Plans hold the result of that
+    work and are cached, with the plans for nested types built the first time they're
+    needed so that recursive types work.
+
+    Types that don't rename any keys, however deeply nested, only change values that
+    aren't plain JSON (e.g. pydantic models, dates, files, omitted values or iterators),
+    so plain JSON data for them, like a text content block, is returned as is.
+    """
+
+    def __init__(self, annotation: type, inner_type: type) -> None:
+        stripped_type = strip_annotated_type(inner_type)
+        origin = get_origin(stripped_type) or stripped_type
+
+        self.annotation = annotation
+        self.stripped_type = stripped_type
+        self.is_typeddict = is_typeddict(stripped_type)
+        self.is_dict = origin == dict
+        self.is_list = is_list_type(stripped_type)
+        self.is_iterable = is_iterable_type(stripped_type)
+        self.is_sequence = is_sequence_type(stripped_type)
+        self.is_union = is_union_type(stripped_type)
+
+        self.format: PropertyFormat | None = None
+        self.format_template: str | None = None
+        annotated_type = _get_annotated_type(annotation)
+        if annotated_type is not None:
+            # ignore the first argument as it is the actual type
+            for info in get_args(annotated_type)[1:]:
+                if isinstance(info, PropertyInfo) and info.format is not None:
+                    self.format = info.format
+                    self.format_template = info.format_template
+                    break
+
+        self._fields: dict[str, tuple[str, _TransformPlan]] | None = None
+        self._items: _TransformPlan | None = None
+        self._items_need_transform = False
+        self._members: tuple[_TransformPlan, ...] | None = None
+        self._skippable: bool | None = None
+
+    @property
+    def fields(self) -> dict[str, tuple[str, _TransformPlan]]:
+        """For TypedDicts, the key each field is sent as and the plan for its value."""
+        if self._fields is None:
+            self._fields = {
+                key: (_maybe_transform_key(key, type_), _get_plan(type_, type_))
+                for key, type_ in get_type_hints(self.stripped_type, include_extras=True).items()
+            }
+        return self._fields
+
+    @property
+    def items(self) -> _TransformPlan:
+        """For dicts the plan for the values, and for lists, iterables and sequences the plan for the entries."""
+        if self._items is None:
+            if self.is_dict:
+                items_type = get_args(self.stripped_type)[1]
+                self._items = _get_plan(items_type, items_type)
+            else:
+                inner_type = extract_type_arg(self.stripped_type, 0)
+                self._items_need_transform = not _no_transform_needed(inner_type)
+                self._items = _get_plan(self.annotation, inner_type)
+        return self._items
+
+    @property
+    def items_need_transform(self) -> bool:
+        """For lists, iterables and sequences, whether the entries are transformed at all."""
+        # worked out along with the plan for the entries
+        _ = self.items
+        return self._items_need_transform
+
+    @property
+    def members(self) -> tuple[_TransformPlan, ...]:
+        if self._members is None:
+            self._members = tuple(_get_plan(self.annotation, subtype) for subtype in get_args(self.stripped_type))
+        return self._members
+
+    @property
+    def skippable(self) -> bool:
+        """Whether neither this type nor any type nested in it renames keys."""
+        if self._skippable is None:
+            self._skippable = self._find_skippable()
+        return self._skippable
+
+    def _find_skippable(self) -> bool:
+        seen: set[int] = set()
+        stack: list[_TransformPlan] = [self]
+        while stack:
+            plan = stack.pop()
+            if id(plan) in seen:
+                continue
+            seen.add(id(plan))
+            if plan._skippable is not None:
+                if not plan._skippable:
+                    return False
+                continue
+
+            try:
+                if plan.is_typeddict:
+                    for key, (alias, field) in plan.fields.items():
+                        if alias != key:
+                            return False
+                        stack.append(field)
+                if plan.is_dict or plan.is_list or plan.is_iterable or plan.is_sequence:
+                    stack.append(plan.items)
+                if plan.is_union:
+                    stack.extend(plan.members)
+            except Exception:
+                # e.g. unresolved forward references, or a bare `list` or `dict`, for which
+                # transforming data raises, so the errors are left to surface there
+                return False
+        return True
+
+    def transform(self, data: object) -> object:
+        if self.skippable and _is_plain_json(data):
+            return data
+
+        if self.is_typeddict and is_mapping(data):
+            return self._transform_typeddict(data)
+
+        if self.is_dict and is_mapping(data):
+            items = self.items
+            return {key: items.transform(value) for key, value in data.items()}
+
+        if (
+            # List[T]
+            (self.is_list and is_list(data))
+            # Iterable[T]
+            or (self.is_iterable and is_iterable(data) and not isinstance(data, str))
+            # Sequence[T]
+            or (self.is_sequence and is_sequence(data) and not isinstance(data, str))
+        ):
+            # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
+            # intended as an iterable, so we don't transform it.
+            if isinstance(data, dict):
+                return cast(object, data)
+
+            if not self.items_need_transform:
+                # for some types there is no need to transform anything, so we can get a small
+                # perf boost from skipping that work.
+                #
+                # but we still need to convert to a list to ensure the data is json-serializable
+                if is_list(data):
+                    return data
+                return list(data)
+
+            items = self.items
+            return [items.transform(d) for d in data]
+
+        if self.is_union:
+            # For union types we run the transformation against all subtypes to ensure that everything is transformed.
             #
-            # but we still need to convert to a list to ensure the data is json-serializable
-            if is_list(data):
-                return data
-            return list(data)
-
-        return [_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
-
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = _transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
+            # TODO: there may be edge cases where the same normalized field name will transform to two different names
+            # in different subtypes.
+            for member in self.members:
+                data = member.transform(data)
+            return data
 
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(
-            data, exclude_unset=True, mode="json", by_alias=True, exclude=getattr(data, "__api_exclude__", None)
-        )
+        if isinstance(data, pydantic.BaseModel):
+            return _dump_model(data)
+
+        if self.format is not None:
+            return _format_data(data, self.format, self.format_template)
 
-    annotated_type = _get_annotated_type(annotation)
-    if annotated_type is None:
         return data
 
-    # ignore the first argument as it is the actual type
-    annotations = get_args(annotated_type)[1:]
-    for annotation in annotations:
-        if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return _format_data(data, annotation.format, annotation.format_template)
+    def _transform_typeddict(self, data: Mapping[str, object]) -> Mapping[str, object]:
+        result: dict[str, object] = {}
+        fields = self.fields
+        for key, value in data.items():
+            if not is_given(value):
+                # we don't need to include omitted values here as they'll
+                # be stripped out before the request is sent anyway
+                continue
+
+            field = fields.get(key)
+            if field is None:
+                # we do not have a type annotation for this field, leave it as is
+                result[key] = value
+            else:
+                alias, plan = field
+                result[alias] = plan.transform(value)
+        return result
+
+    async def async_transform(self, data: object) -> object:
+        if self.skippable and _is_plain_json(data):
+            return data
+
+        if self.is_typeddict and is_mapping(data):
+            return await self._async_transform_typeddict(data)
+
+        if self.is_dict and is_mapping(data):
+            items = self.items
+            return {key: items.transform(value) for key, value in data.items()}
+
+        if (
+            # List[T]
+            (self.is_list and is_list(data))
+            # Iterable[T]
+            or (self.is_iterable and is_iterable(data) and not isinstance(data, str))
+            # Sequence[T]
+            or (self.is_sequence and is_sequence(data) and not isinstance(data, str))
+        ):
+            # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
+            # intended as an iterable, so we don't transform it.
+            if isinstance(data, dict):
+                return cast(object, data)
+
+            if not self.items_need_transform:
+                # for some types there is no need to transform anything, so we can get a small
+                # perf boost from skipping that work.
+                #
+                # but we still need to convert to a list to ensure the data is json-serializable
+                if is_list(data):
+                    return data
+                return list(data)
+
+            items = self.items
+            return [await items.async_transform(d) for d in data]
+
+        if self.is_union:
+            # For union types we run the transformation against all subtypes to ensure that everything is transformed.
+            #
+            # TODO: there may be edge cases where the same normalized field name will transform to two different names
+            # in different subtypes.
+            for member in self.members:
+                data = await member.async_transform(data)
+            return data
 
-    return data
+        if isinstance(data, pydantic.BaseModel):
+            return _dump_model(data)
+
+        if self.format is not None:
+            return await _async_format_data(data, self.format, self.format_template)
+
+        return data
+
+    async def _async_transform_typeddict(self, data: Mapping[str, object]) -> Mapping[str, object]:
+        result: dict[str, object] = {}
+        fields = self.fields
+        for key, value in data.items():
+            if not is_given(value):
+                # we don't need to include omitted values here as they'll
+                # be stripped out before the request is sent anyway
+                continue
+
+            field = fields.get(key)
+            if field is None:
+                # we do not have a type annotation for this field, leave it as is
+                result[key] = value
+            else:
+                alias, plan = field
+                result[alias] = await plan.async_transform(value)
+        return result
 
 
 def _format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
@@ -262,27 +493,6 @@ def _format_data(data: object, format_: PropertyFormat, format_template: str | N
     return data
 
 
-def _transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        if not is_given(value):
-            # we don't need to include omitted values here as they'll
-            # be stripped out before the request is sent anyway
-            continue
-
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = _transform_recursive(value, annotation=type_)
-    return result
-
-
 async def async_maybe_transform(
     data: object,
     expected_type: object,
@@ -337,70 +547,10 @@ async def _async_transform_recursive(
 
             Defaults to the same value as the `annotation` argument.
     """
-    from .._compat import model_dump
-
     if inner_type is None:
         inner_type = annotation
 
-    stripped_type = strip_annotated_type(inner_type)
-    origin = get_origin(stripped_type) or stripped_type
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return await _async_transform_typeddict(data, stripped_type)
-
-    if origin == dict and is_mapping(data):
-        items_type = get_args(stripped_type)[1]
-        return {key: _transform_recursive(value, annotation=items_type) for key, value in data.items()}
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-        # Sequence[T]
-        or (is_sequence_type(stripped_type) and is_sequence(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
-
-        inner_type = extract_type_arg(stripped_type, 0)
-        if _no_transform_needed(inner_type):
-            # for some types there is no need to transform anything, so we can get a small
-            # perf boost from skipping that work.
-            #
-            # but we still need to convert to a list to ensure the data is json-serializable
-            if is_list(data):
-                return data
-            return list(data)
-
-        return [await _async_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
-
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = await _async_transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
-
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(
-            data, exclude_unset=True, mode="json", by_alias=True, exclude=getattr(data, "__api_exclude__", None)
-        )
-
-    annotated_type = _get_annotated_type(annotation)
-    if annotated_type is None:
-        return data
-
-    # ignore the first argument as it is the actual type
-    annotations = get_args(annotated_type)[1:]
-    for annotation in annotations:
-        if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return await _async_format_data(data, annotation.format, annotation.format_template)
-
-    return data
+    return await _get_plan(annotation, inner_type).async_transform(data)
 
 
 async def _async_format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
@@ -430,27 +580,6 @@ async def _async_format_data(data: object, format_: PropertyFormat, format_templ
     return data
 
 
-async def _async_transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        if not is_given(value):
-            # we don't need to include omitted values here as they'll
-            # be stripped out before the request is sent anyway
-            continue
-
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = await _async_transform_recursive(value, annotation=type_)
-    return result
-
-
 @lru_cache(maxsize=8096)
 def get_type_hints(
     obj: Any,
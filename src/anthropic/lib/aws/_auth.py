@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hmac
+import hashlib
+import threading
+from typing import TYPE_CHECKING, cast
 
 import httpx
 
@@ -8,6 +11,9 @@ from ..._utils import lru_cache
 
 if TYPE_CHECKING:
     import boto3
+    from botocore.auth import SigV4Auth
+    from botocore.awsrequest import AWSRequest
+    from botocore.credentials import RefreshableCredentials
 
 
 @lru_cache(maxsize=512)
@@ -30,6 +36,154 @@ def _get_session(
     )
 
 
+def _hmac_sha256(key: bytes, msg: str) -> hmac.HMAC:
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256)
+
+
+@lru_cache(maxsize=None)
+def _signing_key_caching_auth() -> type[SigV4Auth]:
+    from botocore.auth import SigV4Auth
+    from botocore.credentials import ReadOnlyCredentials
+
+    class SigningKeyCachingSigV4Auth(SigV4Auth):
+        """`SigV4Auth` that derives the signing key once per day instead of once per request.
+
+        The key only depends on the secret key, the date, the region and the service, and
+        instances are only ever created for a single set of frozen credentials.
+        """
+
+        def __init__(self, credentials: ReadOnlyCredentials, service_name: str, region_name: str) -> None:
+            super().__init__(credentials, service_name, region_name)
+            self._secret_key = credentials.secret_key
+            self._scope = (region_name, service_name, "aws4_request")
+            self._signing_key: tuple[str, bytes] | None = None
+
+        def signature(self, string_to_sign: str, request: AWSRequest) -> str:
+            datestamp = cast(str, request.context["timestamp"])[0:8]
+            cached = self._signing_key
+            if cached is not None and cached[0] == datestamp:
+                signing_key = cached[1]
+            else:
+                signing_key = _hmac_sha256(f"AWS4{self._secret_key}".encode("utf-8"), datestamp).digest()
+                for part in self._scope:
+                    signing_key = _hmac_sha256(signing_key, part).digest()
+                self._signing_key = (datestamp, signing_key)
+
+            return _hmac_sha256(signing_key, string_to_sign).hexdigest()
+
+    return SigningKeyCachingSigV4Auth
+
+
+class SigV4Signer:
+    """Signs requests with SigV4 for a fixed set of AWS options.
+
+    The session is only consulted when the signer is first used and when the credentials it
+    resolved are close to expiring, in between the same frozen credentials and `SigV4Auth`
+    instance are reused for every request. Instances are safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        aws_access_key: str | None,
+        aws_secret_key: str | None,
+        aws_session_token: str | None,
+        region: str | None,
+        profile: str | None,
+        service_name: str,
+    ) -> None:
+        self._aws_access_key = aws_access_key
+        self._aws_secret_key = aws_secret_key
+        self._aws_session_token = aws_session_token
+        self._region = region
+        self._profile = profile
+        self._service_name = service_name
+
+        self._lock = threading.Lock()
+        self._auth: SigV4Auth | None = None
+        self._refreshable_credentials: RefreshableCredentials | None = None
+
+    def _needs_refresh(self) -> bool:
+        if self._auth is None:
+            return True
+
+        # botocore refreshes temporary credentials ahead of their expiry, we re-freeze them in the same window
+        refreshable = self._refreshable_credentials
+        return refreshable is not None and refreshable.refresh_needed()
+
+    def _get_auth(self) -> SigV4Auth:
+        auth = self._auth
+        if auth is not None and not self._needs_refresh():
+            return auth
+
+        with self._lock:
+            auth = self._auth
+            if auth is not None and not self._needs_refresh():
+                return auth
+
+            from botocore.credentials import RefreshableCredentials
+
+            session = _get_session(
+                profile=self._profile,
+                region=self._region,
+                aws_access_key=self._aws_access_key,
+                aws_secret_key=self._aws_secret_key,
+                aws_session_token=self._aws_session_token,
+            )
+            credentials = session.get_credentials()
+            if not credentials:
+                raise RuntimeError("Could not resolve AWS credentials from session")
+
+            auth = _signing_key_caching_auth()(
+                credentials.get_frozen_credentials(), self._service_name, session.region_name
+            )
+            self._refreshable_credentials = credentials if isinstance(credentials, RefreshableCredentials) else None
+            self._auth = auth
+            return auth
+
+    def get_auth_headers(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: httpx.Headers,
+        data: str | None,
+    ) -> dict[str, str]:
+        from botocore.awsrequest import AWSRequest
+
+        # The connection header may be stripped by a proxy somewhere, so the receiver
+        # of this message may not see this header, so we remove it from the set of headers
+        # that are signed.
+        new_headers = {k: v for k, v in dict(headers).items() if k.lower() != "connection"}
+
+        request = AWSRequest(method=method.upper(), url=url, headers=new_headers, data=data)
+        self._get_auth().add_auth(request)
+
+        prepped = request.prepare()
+
+        return {key: value for key, value in dict(prepped.headers).items() if value is not None}
+
+
+@lru_cache(maxsize=512)
+def _get_signer(
+    *,
+    aws_access_key: str | None,
+    aws_secret_key: str | None,
+    aws_session_token: str | None,
+    region: str | None,
+    profile: str | None,
+    service_name: str,
+) -> SigV4Signer:
+    return SigV4Signer(
+        aws_access_key=aws_access_key,
+        aws_secret_key=aws_secret_key,
+        aws_session_token=aws_session_token,
+        region=region,
+        profile=profile,
+        service_name=service_name,
+    )
+
+
 def get_auth_headers(
     *,
     method: str,
@@ -43,30 +197,12 @@ def get_auth_headers(
     data: str | None,
     service_name: str,
 ) -> dict[str, str]:
-    from botocore.auth import SigV4Auth
-    from botocore.awsrequest import AWSRequest
-
-    session = _get_session(
-        profile=profile,
-        region=region,
+    signer = _get_signer(
         aws_access_key=aws_access_key,
         aws_secret_key=aws_secret_key,
         aws_session_token=aws_session_token,
+        region=region,
+        profile=profile,
+        service_name=service_name,
     )
-
-    # The connection header may be stripped by a proxy somewhere, so the receiver
-    # of this message may not see this header, so we remove it from the set of headers
-    # that are signed.
-    new_headers = {k: v for k, v in dict(headers).items() if k.lower() != "connection"}
-
-    request = AWSRequest(method=method.upper(), url=url, headers=new_headers, data=data)
-    credentials = session.get_credentials()
-    if not credentials:
-        raise RuntimeError("Could not resolve AWS credentials from session")
-
-    signer = SigV4Auth(credentials, service_name, session.region_name)
-    signer.add_auth(request)
-
-    prepped = request.prepare()
-
-    return {key: value for key, value in dict(prepped.headers).items() if value is not None}
+    return signer.get_auth_headers(method=method, url=url, headers=headers, data=data)
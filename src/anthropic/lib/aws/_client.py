@@ -18,6 +18,7 @@ from ._credentials import (
 from ..._exceptions import AnthropicError
 from ..._middleware import MiddlewareInput
 from ..._base_client import DEFAULT_MAX_RETRIES
+from ..._retry_policy import RetryBudget, CircuitBreaker
 from ..credentials._types import AccessTokenProvider
 
 
@@ -49,6 +50,8 @@ class AnthropicAWS(Anthropic):
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
         # Passed through to parent but not used for AWS auth
         auth_token: str | None = None,
@@ -117,6 +120,8 @@ class AnthropicAWS(Anthropic):
             default_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -188,6 +193,8 @@ class AnthropicAWS(Anthropic):
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         # The AWS client authenticates with SigV4 (or an API key), not a token
@@ -214,6 +221,8 @@ class AnthropicAWS(Anthropic):
             default_query=default_query,
             set_default_query=set_default_query,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _extra_kwargs={
                 "aws_access_key": aws_access_key or self.aws_access_key,
                 "aws_secret_key": aws_secret_key or self.aws_secret_key,
@@ -257,6 +266,8 @@ class AsyncAnthropicAWS(AsyncAnthropic):
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
         # Accepted for compatibility with AsyncAnthropic.copy() but not used
         auth_token: str | None = None,
@@ -325,6 +336,8 @@ class AsyncAnthropicAWS(AsyncAnthropic):
             default_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -396,6 +409,8 @@ class AsyncAnthropicAWS(AsyncAnthropic):
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         # The AWS client authenticates with SigV4 (or an API key), not a token
@@ -422,6 +437,8 @@ class AsyncAnthropicAWS(AsyncAnthropic):
             default_query=default_query,
             set_default_query=set_default_query,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _extra_kwargs={
                 "aws_access_key": aws_access_key or self.aws_access_key,
                 "aws_secret_key": aws_secret_key or self.aws_secret_key,
@@ -0,0 +1,11 @@
+from ._results import (
+    process_results as process_results,
+    download_results as download_results,
+    async_download_results as async_download_results,
+)
+from ._collector import (
+    BatchCollector as BatchCollector,
+    AsyncBatchFuture as AsyncBatchFuture,
+    BatchRequestError as BatchRequestError,
+    AsyncBatchCollector as AsyncBatchCollector,
+)
@@ -0,0 +1,541 @@
+"""Coalesce individual ``messages.create`` calls into Message Batches.
+
+:class:`BatchCollector` / :class:`AsyncBatchCollector` accept one request at a
+time, buffer them, and submit the buffer with ``messages.batches.create`` once
+it reaches ``max_batch_size`` requests or ``max_batch_bytes`` bytes, or once the
+oldest buffered request has waited ``max_wait`` seconds. Each batch is then
+polled every ``poll_interval`` seconds until it ends, and the future returned
+for every request is resolved from ``messages.batches.results``.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import math
+import time
+import uuid
+import logging
+import threading
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, List, Type, Union, Generic, TypeVar, Iterator, Optional, Generator, cast
+from collections import deque
+from dataclasses import dataclass
+from typing_extensions import Unpack
+from concurrent.futures import Future
+
+import anyio
+
+from ..._exceptions import AnthropicError
+from ...types.message import Message
+from ...types.message_create_params import MessageCreateParamsNonStreaming
+from ...types.messages.message_batch import MessageBatch
+from ...types.messages.batch_create_params import Request
+from ...types.messages.message_batch_result import MessageBatchResult
+from ...types.messages.message_batch_individual_response import MessageBatchIndividualResponse
+
+if TYPE_CHECKING:
+    from anyio.abc import TaskGroup
+
+    from ..._client import Anthropic, AsyncAnthropic
+
+__all__ = ["BatchCollector", "AsyncBatchCollector", "AsyncBatchFuture", "BatchRequestError"]
+
+log = logging.getLogger(__name__)
+
+# limits of a single Message Batch, the byte limit leaves some headroom for the
+# difference between our size estimate and the request body that is sent
+MAX_BATCH_REQUESTS = 100_000
+MAX_BATCH_BYTES = 256_000_000
+
+DEFAULT_MAX_WAIT = 60.0
+DEFAULT_POLL_INTERVAL = 30.0
+
+_FutureT = TypeVar("_FutureT", bound="Union[Future[Message], AsyncBatchFuture]")
+
+
+class BatchRequestError(AnthropicError):
+    """Raised from the future of a batched request that did not succeed.
+
+    ``result`` holds the API error for an ``errored`` request; the request may
+    also have been ``canceled`` or have ``expired``.
+    """
+
+    custom_id: str
+    result: MessageBatchResult
+
+    def __init__(self, custom_id: str, result: MessageBatchResult) -> None:
+        if result.type == "errored":
+            message = f"Batch request {custom_id!r} errored: {result.error.error.message}"
+        else:
+            message = f"Batch request {custom_id!r} {result.type}"
+        super().__init__(message)
+        self.custom_id = custom_id
+        self.result = result
+
+
+class AsyncBatchFuture:
+    """The eventual result of a request submitted to an :class:`AsyncBatchCollector`.
+
+    Await it, or :meth:`result`, to get the :class:`~anthropic.types.Message`;
+    a request that didn't succeed raises :class:`BatchRequestError`.
+    """
+
+    def __init__(self, custom_id: str) -> None:
+        self.custom_id = custom_id
+        self._event = anyio.Event()
+        self._result: Message | None = None
+        self._exception: BaseException | None = None
+
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    async def result(self) -> Message:
+        await self._event.wait()
+        if self._exception is not None:
+            raise self._exception
+        assert self._result is not None
+        return self._result
+
+    def __await__(self) -> Generator[Any, None, Message]:
+        return self.result().__await__()
+
+    def set_result(self, result: Message) -> None:
+        self._result = result
+        self._event.set()
+
+    def set_exception(self, exception: BaseException) -> None:
+        self._exception = exception
+        self._event.set()
+
+
+@dataclass
+class _BufferedRequest(Generic[_FutureT]):
+    request: Request
+    size: int
+    future: _FutureT
+
+
+@dataclass
+class _InFlightBatch(Generic[_FutureT]):
+    id: str
+    futures: Dict[str, _FutureT]
+    next_poll: float
+
+
+class _BaseBatchCollector(abc.ABC, Generic[_FutureT]):
+    def __init__(
+        self,
+        *,
+        max_batch_size: int,
+        max_batch_bytes: int,
+        max_wait: float,
+        poll_interval: float,
+    ) -> None:
+        if not 1 <= max_batch_size <= MAX_BATCH_REQUESTS:
+            raise ValueError(f"max_batch_size must be between 1 and {MAX_BATCH_REQUESTS}, got {max_batch_size}")
+
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+
+        self._id_prefix = uuid.uuid4().hex[:16]
+        self._next_id = 0
+        self._custom_ids: set[str] = set()
+        self._buffer: List[_BufferedRequest[_FutureT]] = []
+        self._buffer_bytes = 0
+        self._buffer_deadline = math.inf
+        # buffers that hit a size limit and are waiting to be submitted
+        self._ready: deque[List[_BufferedRequest[_FutureT]]] = deque()
+        self._in_flight: List[_InFlightBatch[_FutureT]] = []
+        self._closed = False
+
+    @abc.abstractmethod
+    def _new_future(self, custom_id: str) -> _FutureT:
+        """Creates the future that is resolved with the result of the request with `custom_id`."""
+        ...
+
+    def _start(self, future: _FutureT) -> bool:  # noqa: ARG002
+        """Called as the request is submitted, returns whether it should still be included."""
+        return True
+
+    def _add(self, params: MessageCreateParamsNonStreaming, custom_id: str | None) -> _FutureT:
+        if self._closed:
+            raise RuntimeError("Cannot submit requests to a closed batch collector")
+
+        if custom_id is None:
+            custom_id = f"{self._id_prefix}_{self._next_id}"
+            self._next_id += 1
+        elif custom_id in self._custom_ids:
+            raise ValueError(f"A request with custom_id {custom_id!r} is already pending")
+
+        # the params can be read several times, so generators have to be materialized
+        request: Request = {
+            "custom_id": custom_id,
+            "params": cast(
+                MessageCreateParamsNonStreaming,
+                {key: list(value) if isinstance(value, Iterator) else value for key, value in params.items()},
+            ),
+        }
+        size = len(json.dumps(request, separators=(",", ":"), default=str).encode("utf-8"))
+        if size > self.max_batch_bytes:
+            raise ValueError(f"Request of {size} bytes exceeds max_batch_bytes={self.max_batch_bytes}")
+
+        if self._buffer and self._buffer_bytes + size > self.max_batch_bytes:
+            self._seal()
+
+        future = self._new_future(custom_id)
+        self._custom_ids.add(custom_id)
+        self._buffer.append(_BufferedRequest(request=request, size=size, future=future))
+        self._buffer_bytes += size
+        if len(self._buffer) == 1:
+            self._buffer_deadline = time.monotonic() + self.max_wait
+        if len(self._buffer) >= self.max_batch_size:
+            self._seal()
+
+        return future
+
+    def _seal(self) -> None:
+        if self._buffer:
+            self._ready.append(self._buffer)
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_deadline = math.inf
+
+    def _take_ready(self, now: float) -> List[List[_BufferedRequest[_FutureT]]]:
+        if self._buffer and (self._closed or self._buffer_deadline <= now):
+            self._seal()
+
+        ready = list(self._ready)
+        self._ready.clear()
+        return ready
+
+    def _take_due(self, now: float) -> List[_InFlightBatch[_FutureT]]:
+        return [batch for batch in self._in_flight if batch.next_poll <= now]
+
+    def _next_deadline(self) -> float:
+        return min([self._buffer_deadline, *(batch.next_poll for batch in self._in_flight)])
+
+    def _is_finished(self) -> bool:
+        return self._closed and not self._buffer and not self._ready and not self._in_flight
+
+    def _requests_to_submit(self, buffered: List[_BufferedRequest[_FutureT]]) -> List[_BufferedRequest[_FutureT]]:
+        included: List[_BufferedRequest[_FutureT]] = []
+        for item in buffered:
+            if self._start(item.future):
+                included.append(item)
+            else:
+                self._custom_ids.discard(item.request["custom_id"])
+        return included
+
+    def _submitted(self, batch: MessageBatch, buffered: List[_BufferedRequest[_FutureT]]) -> None:
+        log.debug("Submitted message batch %s with %d requests", batch.id, len(buffered))
+        self._in_flight.append(
+            _InFlightBatch(
+                id=batch.id,
+                futures={item.request["custom_id"]: item.future for item in buffered},
+                next_poll=time.monotonic() + self.poll_interval,
+            )
+        )
+
+    def _submit_failed(self, buffered: List[_BufferedRequest[_FutureT]], exc: Exception) -> None:
+        log.warning("Failed to submit a message batch of %d requests", len(buffered), exc_info=exc)
+        for item in buffered:
+            self._custom_ids.discard(item.request["custom_id"])
+            item.future.set_exception(exc)
+
+    def _resolve(self, batch: _InFlightBatch[_FutureT], response: MessageBatchIndividualResponse) -> None:
+        future = batch.futures.pop(response.custom_id, None)
+        if future is None:
+            return
+
+        self._custom_ids.discard(response.custom_id)
+        if response.result.type == "succeeded":
+            future.set_result(response.result.message)
+        else:
+            future.set_exception(BatchRequestError(response.custom_id, response.result))
+
+    def _finish(self, batch: _InFlightBatch[_FutureT], exc: Exception | None = None) -> None:
+        self._in_flight.remove(batch)
+        for custom_id, future in batch.futures.items():
+            self._custom_ids.discard(custom_id)
+            future.set_exception(
+                exc or AnthropicError(f"Message batch {batch.id} ended without a result for {custom_id!r}")
+            )
+        batch.futures.clear()
+
+
+class BatchCollector(_BaseBatchCollector["Future[Message]"]):
+    """Buffers individual message requests and sends them as Message Batches.
+
+    Requests are submitted, and batches polled, from a background thread; every
+    :meth:`submit` call returns a :class:`concurrent.futures.Future` resolving to
+    the request's :class:`~anthropic.types.Message`, or raising
+    :class:`BatchRequestError` if the request errored, was canceled or expired.
+
+    Usage::
+
+        with BatchCollector(client, max_wait=300) as collector:
+            futures = [
+                collector.submit(model="claude-sonnet-4-5", max_tokens=1024, messages=[...]) for ... in ...
+            ]
+
+        for future in futures:
+            print(future.result().content)
+
+    Leaving the ``with`` block (or calling :meth:`close`) submits anything still
+    buffered and waits until every batch has ended.
+    """
+
+    def __init__(
+        self,
+        client: Anthropic,
+        *,
+        max_batch_size: int = MAX_BATCH_REQUESTS,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        super().__init__(
+            max_batch_size=max_batch_size,
+            max_batch_bytes=max_batch_bytes,
+            max_wait=max_wait,
+            poll_interval=poll_interval,
+        )
+        self._client = client
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self, *, custom_id: str | None = None, **params: Unpack[MessageCreateParamsNonStreaming]
+    ) -> Future[Message]:
+        """Buffer a request taking the same arguments as ``messages.create()``.
+
+        A ``custom_id`` is generated unless one is given.
+        """
+        with self._cond:
+            future = self._add(params, custom_id)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="anthropic-batch-collector", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def flush(self) -> None:
+        """Submit the buffered requests now rather than when a limit is reached."""
+        with self._cond:
+            self._seal()
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Submit the buffered requests and wait for every batch to end."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join()
+
+    def __enter__(self) -> BatchCollector:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _new_future(self, custom_id: str) -> Future[Message]:  # noqa: ARG002
+        return Future()
+
+    def _start(self, future: Future[Message]) -> bool:
+        # once running, the future can no longer be cancelled
+        return future.set_running_or_notify_cancel()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    ready = self._take_ready(now)
+                    due = self._take_due(now)
+                    if ready or due:
+                        break
+                    if self._is_finished():
+                        return
+                    deadline = self._next_deadline()
+                    self._cond.wait(None if deadline == math.inf else deadline - now)
+
+                ready = [self._requests_to_submit(buffered) for buffered in ready]
+
+            for buffered in ready:
+                if buffered:
+                    self._create(buffered)
+
+            for batch in due:
+                self._poll(batch)
+
+    def _create(self, buffered: List[_BufferedRequest[Future[Message]]]) -> None:
+        try:
+            batch = self._client.messages.batches.create(requests=[item.request for item in buffered])
+        except Exception as exc:
+            with self._cond:
+                self._submit_failed(buffered, exc)
+            return
+
+        with self._cond:
+            self._submitted(batch, buffered)
+
+    def _poll(self, batch: _InFlightBatch[Future[Message]]) -> None:
+        try:
+            status = self._client.messages.batches.retrieve(batch.id).processing_status
+        except Exception as exc:
+            log.warning("Failed to retrieve message batch %s, retrying", batch.id, exc_info=exc)
+            status = None
+
+        if status != "ended":
+            batch.next_poll = time.monotonic() + self.poll_interval
+            return
+
+        try:
+            for response in self._client.messages.batches.results(batch.id):
+                with self._cond:
+                    self._resolve(batch, response)
+        except Exception as exc:
+            with self._cond:
+                self._finish(batch, exc)
+            return
+
+        with self._cond:
+            self._finish(batch)
+
+
+class AsyncBatchCollector(_BaseBatchCollector[AsyncBatchFuture]):
+    """Buffers individual message requests and sends them as Message Batches.
+
+    The async counterpart to :class:`BatchCollector`; it must be entered with
+    ``async with``, which runs the submitting and polling in a background task.
+    :meth:`submit` returns an :class:`AsyncBatchFuture` to await the result.
+
+    Usage::
+
+        async with AsyncBatchCollector(client, max_wait=300) as collector:
+            future = collector.submit(model="claude-sonnet-4-5", max_tokens=1024, messages=[...])
+            message = await future
+    """
+
+    def __init__(
+        self,
+        client: AsyncAnthropic,
+        *,
+        max_batch_size: int = MAX_BATCH_REQUESTS,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        super().__init__(
+            max_batch_size=max_batch_size,
+            max_batch_bytes=max_batch_bytes,
+            max_wait=max_wait,
+            poll_interval=poll_interval,
+        )
+        self._client = client
+        self._wakeup = anyio.Event()
+        self._task_group: TaskGroup | None = None
+
+    def submit(
+        self, *, custom_id: str | None = None, **params: Unpack[MessageCreateParamsNonStreaming]
+    ) -> AsyncBatchFuture:
+        """Buffer a request taking the same arguments as ``messages.create()``.
+
+        A ``custom_id`` is generated unless one is given.
+        """
+        if self._task_group is None:
+            raise RuntimeError("AsyncBatchCollector must be entered with `async with` before submitting requests")
+
+        future = self._add(params, custom_id)
+        self._wakeup.set()
+        return future
+
+    def flush(self) -> None:
+        """Submit the buffered requests now rather than when a limit is reached."""
+        self._seal()
+        self._wakeup.set()
+
+    async def __aenter__(self) -> AsyncBatchCollector:
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self._run)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Optional[bool]:
+        assert self._task_group is not None
+        self._closed = True
+        self._wakeup.set()
+        return await self._task_group.__aexit__(exc_type, exc, exc_tb)
+
+    def _new_future(self, custom_id: str) -> AsyncBatchFuture:
+        return AsyncBatchFuture(custom_id)
+
+    async def _run(self) -> None:
+        while True:
+            # replaced before looking at the buffer, so a submit while we are busy below still wakes us up
+            self._wakeup = anyio.Event()
+            now = time.monotonic()
+            ready = self._take_ready(now)
+            due = self._take_due(now)
+
+            for buffered in ready:
+                await self._create(self._requests_to_submit(buffered))
+
+            for batch in due:
+                await self._poll(batch)
+
+            if self._is_finished():
+                return
+
+            if not ready and not due:
+                deadline = self._next_deadline()
+                with anyio.move_on_after(None if deadline == math.inf else deadline - time.monotonic()):
+                    await self._wakeup.wait()
+
+    async def _create(self, buffered: List[_BufferedRequest[AsyncBatchFuture]]) -> None:
+        if not buffered:
+            return
+
+        try:
+            batch = await self._client.messages.batches.create(requests=[item.request for item in buffered])
+        except Exception as exc:
+            self._submit_failed(buffered, exc)
+            return
+
+        self._submitted(batch, buffered)
+
+    async def _poll(self, batch: _InFlightBatch[AsyncBatchFuture]) -> None:
+        try:
+            status = (await self._client.messages.batches.retrieve(batch.id)).processing_status
+        except Exception as exc:
+            log.warning("Failed to retrieve message batch %s, retrying", batch.id, exc_info=exc)
+            status = None
+
+        if status != "ended":
+            batch.next_poll = time.monotonic() + self.poll_interval
+            return
+
+        try:
+            async for response in await self._client.messages.batches.results(batch.id):
+                self._resolve(batch, response)
+        except Exception as exc:
+            self._finish(batch, exc)
+            return
+
+        self._finish(batch)
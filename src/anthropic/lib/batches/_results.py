@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, List, Tuple, Union, TypeVar, Callable, Iterator
+from pathlib import Path
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import anyio
+
+from ...types.messages import MessageBatchIndividualResponse
+from ..._decoders.jsonl import _LineBuffer, _parse_lines
+
+if TYPE_CHECKING:
+    from ..._client import Anthropic, AsyncAnthropic
+
+__all__ = ["download_results", "async_download_results", "process_results"]
+
+_R = TypeVar("_R")
+
+StrPath = Union[str, "os.PathLike[str]"]
+
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def download_results(client: Anthropic, message_batch_id: str, path: StrPath) -> Path:
+    """Download the results of an ended Message Batch to a local `.jsonl` file.
+
+    The body is written to disk as it is received, without being parsed, and is
+    only moved to `path` once it has been downloaded completely. Returns the path
+    so it can be passed straight to `process_results()`.
+    """
+    path = Path(path)
+    partial = path.with_name(path.name + ".part")
+
+    decoder = client.messages.batches.results(message_batch_id)
+    try:
+        with open(partial, "wb") as f:
+            for chunk in decoder.http_response.iter_bytes():
+                f.write(chunk)
+    finally:
+        decoder.close()
+
+    os.replace(partial, path)
+    return path
+
+
+async def async_download_results(client: AsyncAnthropic, message_batch_id: str, path: StrPath) -> Path:
+    """Download the results of an ended Message Batch to a local `.jsonl` file.
+
+    See `download_results()`.
+    """
+    path = Path(path)
+    partial = path.with_name(path.name + ".part")
+
+    decoder = await client.messages.batches.results(message_batch_id)
+    try:
+        async with await anyio.open_file(partial, "wb") as f:
+            async for chunk in decoder.http_response.aiter_bytes():
+                await f.write(chunk)
+    finally:
+        await decoder.close()
+
+    await anyio.Path(partial).replace(path)
+    return path
+
+
+def process_results(
+    path: StrPath,
+    fn: Callable[[MessageBatchIndividualResponse], _R],
+    *,
+    max_workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[_R]:
+    """Call `fn` with every result in a downloaded results file, spread across a process pool.
+
+    The file is split into ranges of roughly `chunk_bytes` on line boundaries and
+    each worker process parses its own range, so only the return values of `fn`
+    are sent between processes. `fn` must be picklable, e.g. a module level function.
+
+    Return values are yielded in the order of the results in the file, with at most
+    two ranges per worker being processed ahead of the consumer.
+
+    ```py
+    def summarize(result: MessageBatchIndividualResponse) -> tuple[str, int]: ...
+
+
+    path = download_results(client, batch.id, "results.jsonl")
+    for custom_id, tokens in process_results(path, summarize):
+        ...
+    ```
+    """
+    if chunk_bytes < 1:
+        raise ValueError(f"chunk_bytes must be at least 1, got {chunk_bytes}")
+
+    ranges = _split_lines(path, chunk_bytes)
+    max_workers = max_workers or os.cpu_count() or 1
+    window = 2 * max_workers
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future[List[_R]]] = deque()
+        try:
+            for start, end in ranges:
+                pending.append(executor.submit(_process_range, path, start, end, fn))
+                if len(pending) >= window:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _split_lines(path: StrPath, chunk_bytes: int) -> List[Tuple[int, int]]:
+    """Returns `(start, end)` byte offsets covering the file, each ending after a newline."""
+    size = os.path.getsize(path)
+    ranges: List[Tuple[int, int]] = []
+
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = start + chunk_bytes
+            if end < size:
+                f.seek(end - 1)
+                f.readline()
+                end = f.tell()
+            else:
+                end = size
+
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def _process_range(path: StrPath, start: int, end: int, fn: Callable[[MessageBatchIndividualResponse], _R]) -> List[_R]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    buf = _LineBuffer()
+    lines = buf.feed(data) + buf.flush()
+    return [fn(result) for result in _parse_lines(lines, line_type=MessageBatchIndividualResponse, lazy=False)]
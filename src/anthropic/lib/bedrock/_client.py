@@ -25,6 +25,7 @@ from ..._base_client import (
     FinalRequestOptions,
     merge_headers,
 )
+from ..._retry_policy import RetryBudget, CircuitBreaker
 from ._stream_decoder import AWSEventStreamDecoder
 from ...resources.messages import Messages, AsyncMessages
 from ...resources.completions import Completions, AsyncCompletions
@@ -151,6 +152,8 @@ class AnthropicBedrock(BaseBedrockClient[httpx.Client, Stream[Any]], SyncAPIClie
         # Configure a custom httpx client. See the [httpx documentation](https://www.python-httpx.org/api/#client) for more details.
         http_client: httpx.Client | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -200,6 +203,8 @@ class AnthropicBedrock(BaseBedrockClient[httpx.Client, Stream[Any]], SyncAPIClie
             custom_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -255,6 +260,8 @@ class AnthropicBedrock(BaseBedrockClient[httpx.Client, Stream[Any]], SyncAPIClie
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -291,6 +298,8 @@ class AnthropicBedrock(BaseBedrockClient[httpx.Client, Stream[Any]], SyncAPIClie
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             **_extra_kwargs,
         )
 
@@ -331,6 +340,8 @@ class AsyncAnthropicBedrock(BaseBedrockClient[httpx.AsyncClient, AsyncStream[Any
         # Configure a custom httpx client. See the [httpx documentation](https://www.python-httpx.org/api/#client) for more details.
         http_client: httpx.AsyncClient | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -380,6 +391,8 @@ class AsyncAnthropicBedrock(BaseBedrockClient[httpx.AsyncClient, AsyncStream[Any
             custom_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -435,6 +448,8 @@ class AsyncAnthropicBedrock(BaseBedrockClient[httpx.AsyncClient, AsyncStream[Any
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -471,6 +486,8 @@ class AsyncAnthropicBedrock(BaseBedrockClient[httpx.AsyncClient, AsyncStream[Any
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             **_extra_kwargs,
         )
 
@@ -24,6 +24,7 @@ from ..._base_client import (
     AsyncAPIClient,
     merge_headers,
 )
+from ..._retry_policy import RetryBudget, CircuitBreaker
 from ..aws._credentials import (
     resolve_region,
     resolve_api_key,
@@ -191,6 +192,8 @@ class AnthropicBedrockMantle(BaseMantleClient[httpx.Client, Stream[Any]], SyncAP
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         resolved_api_key, resolved_base_url, use_sigv4, merged_headers = _resolve_mantle_config(
@@ -215,6 +218,8 @@ class AnthropicBedrockMantle(BaseMantleClient[httpx.Client, Stream[Any]], SyncAP
             custom_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -299,6 +304,8 @@ class AnthropicBedrockMantle(BaseMantleClient[httpx.Client, Stream[Any]], SyncAP
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -337,6 +344,8 @@ class AnthropicBedrockMantle(BaseMantleClient[httpx.Client, Stream[Any]], SyncAP
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             **_extra_kwargs,
         )
 
@@ -387,6 +396,8 @@ class AsyncAnthropicBedrockMantle(BaseMantleClient[httpx.AsyncClient, AsyncStrea
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         resolved_api_key, resolved_base_url, use_sigv4, merged_headers = _resolve_mantle_config(
@@ -411,6 +422,8 @@ class AsyncAnthropicBedrockMantle(BaseMantleClient[httpx.AsyncClient, AsyncStrea
             custom_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -495,6 +508,8 @@ class AsyncAnthropicBedrockMantle(BaseMantleClient[httpx.AsyncClient, AsyncStrea
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -533,6 +548,8 @@ class AsyncAnthropicBedrockMantle(BaseMantleClient[httpx.AsyncClient, AsyncStrea
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             **_extra_kwargs,
         )
 
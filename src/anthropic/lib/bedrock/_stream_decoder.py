@@ -1,75 +1,185 @@
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any, Dict, Iterator, AsyncIterator, cast
+import base64
+import struct
+import binascii
+from typing import Any, Dict, List, Tuple, Callable, Iterator, AsyncIterator, cast
 
-from ..._utils import lru_cache
 from ..._streaming import ServerSentEvent
+from ..._utils._json import json_loads
 
-if TYPE_CHECKING:
-    from botocore.model import Shape
-    from botocore.eventstream import EventStreamMessage
+# byte length of the prelude (total_length + headers_length + prelude_crc)
+_PRELUDE_LENGTH = 12
+# byte length of the trailing message crc
+_CRC_LENGTH = 4
+_MAX_HEADERS_LENGTH = 128 * 1024  # 128 KiB
+_MAX_PAYLOAD_LENGTH = 24 * 1024 * 1024  # 24 MiB
 
+_unpack_prelude = struct.Struct("!III").unpack_from
+_unpack_uint32 = struct.Struct("!I").unpack_from
+_unpack_uint16 = struct.Struct("!H").unpack_from
 
-@lru_cache(maxsize=None)
-def get_response_stream_shape() -> Shape:
-    from botocore.model import ServiceModel
-    from botocore.loaders import Loader
 
-    loader = Loader()
-    bedrock_service_dict = loader.load_service_model("bedrock-runtime", "service-2")
-    bedrock_service_model = ServiceModel(bedrock_service_dict)
-    return bedrock_service_model.shape_for("ResponseStream")
+def _unpack_fixed(fmt: str) -> Callable[[memoryview, int], Tuple[object, int]]:
+    unpack = struct.Struct(fmt).unpack_from
+    size = struct.calcsize(fmt)
+
+    def unpack_value(data: memoryview, offset: int) -> Tuple[object, int]:
+        return unpack(data, offset)[0], offset + size
+
+    return unpack_value
+
+
+def _unpack_bytes(data: memoryview, offset: int) -> Tuple[object, int]:
+    (length,) = _unpack_uint16(data, offset)
+    start = offset + 2
+    return bytes(data[start : start + length]), start + length
+
+
+def _unpack_string(data: memoryview, offset: int) -> Tuple[object, int]:
+    (length,) = _unpack_uint16(data, offset)
+    start = offset + 2
+    return str(data[start : start + length], "utf-8"), start + length
+
+
+# header value type -> function returning the value and the offset after it, these mirror
+# the value types produced by botocore's `EventStreamHeaderParser`
+_HEADER_VALUE_UNPACKERS: Dict[int, Callable[[memoryview, int], Tuple[object, int]]] = {
+    0: lambda _data, offset: (True, offset),
+    1: lambda _data, offset: (False, offset),
+    2: _unpack_fixed("!b"),
+    3: _unpack_fixed("!h"),
+    4: _unpack_fixed("!i"),
+    5: _unpack_fixed("!q"),
+    6: _unpack_bytes,
+    7: _unpack_string,
+    # timestamps are milliseconds since the epoch
+    8: _unpack_fixed("!q"),
+    9: lambda data, offset: (bytes(data[offset : offset + 16]), offset + 16),
+}
 
 
 class AWSEventStreamDecoder:
-    def __init__(self) -> None:
-        from botocore.parsers import EventStreamJSONParser
+    """Decodes the `application/vnd.amazon.eventstream` responses returned by Bedrock's streaming APIs.
 
-        self.parser = EventStreamJSONParser()
+    Every message is validated against its prelude and message CRCs and the base64 encoded
+    `bytes` of each `chunk` event is returned as a `ServerSentEvent`, without going through
+    botocore's generic response parsing.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
 
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
         """Given an iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
         for chunk in iterator:
-            event_stream_buffer.add_data(chunk)
-            for event in event_stream_buffer:
-                sse = self._parse_message_from_event(event)
-                if sse:
-                    yield sse
+            for sse in self._feed(chunk):
+                yield sse
 
     async def aiter_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[ServerSentEvent]:
         """Given an async iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
         async for chunk in iterator:
-            event_stream_buffer.add_data(chunk)
-            for event in event_stream_buffer:
-                sse = self._parse_message_from_event(event)
+            for sse in self._feed(chunk):
+                yield sse
+
+    def _feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        buf = self._buf
+        buf += chunk
+
+        events: List[ServerSentEvent] = []
+        pos = 0
+        size = len(buf)
+        with memoryview(buf) as data:
+            while size - pos >= _PRELUDE_LENGTH:
+                total_length, headers_length, prelude_crc = _unpack_prelude(data, pos)
+                _validate_checksum(data[pos : pos + _PRELUDE_LENGTH - _CRC_LENGTH], prelude_crc)
+                if headers_length > _MAX_HEADERS_LENGTH:
+                    raise ValueError(f"Header length of {headers_length} exceeded the maximum of {_MAX_HEADERS_LENGTH}")
+                payload_length = total_length - headers_length - _PRELUDE_LENGTH - _CRC_LENGTH
+                if payload_length > _MAX_PAYLOAD_LENGTH:
+                    raise ValueError(
+                        f"Payload length of {payload_length} exceeded the maximum of {_MAX_PAYLOAD_LENGTH}"
+                    )
+
+                end = pos + total_length
+                if size < end:
+                    break
+
+                payload_end = end - _CRC_LENGTH
+                (message_crc,) = _unpack_uint32(data, payload_end)
+                # the message crc covers everything before it, continuing from the crc of the first 8 bytes
+                _validate_checksum(
+                    data[pos + _PRELUDE_LENGTH - _CRC_LENGTH : payload_end], message_crc, crc=prelude_crc
+                )
+
+                headers_end = pos + _PRELUDE_LENGTH + headers_length
+                headers = _parse_headers(data[pos + _PRELUDE_LENGTH : headers_end])
+                sse = self._parse_message(headers, bytes(data[headers_end:payload_end]))
                 if sse:
-                    yield sse
+                    events.append(sse)
 
-    def _parse_message_from_event(self, event: EventStreamMessage) -> ServerSentEvent | None:
-        response_dict = event.to_response_dict()
-        parsed_response = self.parser.parse(response_dict, get_response_stream_shape())
-        if response_dict["status_code"] != 200:
+                pos = end
+
+        if pos:
+            del buf[:pos]
+
+        return events
+
+    def _parse_message(self, headers: Dict[str, object], payload: bytes) -> ServerSentEvent | None:
+        message_type = headers.get(":message-type")
+        if message_type == "error" or message_type == "exception":
+            response_dict = {"status_code": 400, "headers": headers, "body": payload}
             raise ValueError(f"Bad response code, expected 200: {response_dict}")
 
-        chunk = parsed_response.get("chunk")
-        if not chunk:
+        if headers.get(":event-type") != "chunk":
+            return None
+
+        chunk: Any = json_loads(payload) if payload else None
+        if not isinstance(chunk, dict):
+            return None
+
+        raw = cast("Dict[str, Any]", chunk).get("bytes")
+        if raw is None:
             return None
 
-        return _chunk_bytes_to_sse(chunk.get("bytes"))
+        return _chunk_bytes_to_sse(base64.b64decode(raw))
+
+
+def _validate_checksum(data: memoryview, checksum: int, crc: int = 0) -> None:
+    computed_checksum = binascii.crc32(data, crc) & 0xFFFFFFFF
+    if checksum != computed_checksum:
+        raise ValueError(f"Checksum mismatch: expected 0x{checksum:08x}, calculated 0x{computed_checksum:08x}")
+
+
+def _parse_headers(data: memoryview) -> Dict[str, object]:
+    headers: Dict[str, object] = {}
+    offset = 0
+    end = len(data)
+    while offset < end:
+        name_length = data[offset]
+        offset += 1
+        name = str(data[offset : offset + name_length], "utf-8")
+        offset += name_length
+
+        value_type = data[offset]
+        offset += 1
+        unpack_value = _HEADER_VALUE_UNPACKERS.get(value_type)
+        if unpack_value is None:
+            raise ValueError(f"Unknown event stream header value type: {value_type}")
+
+        value, offset = unpack_value(data, offset)
+        if name in headers:
+            raise ValueError(f'Duplicate header present: "{name}"')
+        headers[name] = value
+
+    return headers
 
 
 def _chunk_bytes_to_sse(raw: bytes) -> ServerSentEvent | None:
     decoded = raw.decode()
     data: Any
     try:
-        data = json.loads(decoded)
+        data = json_loads(decoded)
     except Exception:
         data = None
 
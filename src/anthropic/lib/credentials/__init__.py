@@ -1,12 +1,14 @@
 from ._auth import AccessTokenAuth as AccessTokenAuth
-from ._cache import TokenCache as TokenCache
+from ._cache import TokenCache as TokenCache, AsyncTokenCache as AsyncTokenCache
 from ._chain import default_credentials as default_credentials
 from ._types import (
     AccessToken as AccessToken,
     CredentialResult as CredentialResult,
     AccessTokenProvider as AccessTokenProvider,
     IdentityTokenProvider as IdentityTokenProvider,
+    AsyncAccessTokenProvider as AsyncAccessTokenProvider,
 )
+from ._shared import SharedTokenFile as SharedTokenFile
 from ._workload import (
     WorkloadIdentityError as WorkloadIdentityError,
     WorkloadIdentityCredentials as WorkloadIdentityCredentials,
@@ -23,6 +25,7 @@ from ._providers import (
 __all__ = [
     "AccessToken",
     "AccessTokenProvider",
+    "AsyncAccessTokenProvider",
     "CredentialResult",
     "IdentityTokenProvider",
     "StaticToken",
@@ -34,6 +37,8 @@ __all__ = [
     "WorkloadIdentityError",
     "exchange_federation_assertion",
     "TokenCache",
+    "AsyncTokenCache",
+    "SharedTokenFile",
     "AccessTokenAuth",
     "default_credentials",
 ]
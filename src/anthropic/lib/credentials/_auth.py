@@ -7,7 +7,7 @@ from typing_extensions import override
 
 import httpx
 
-from ._cache import TokenCache
+from ._cache import TokenCache, AsyncTokenCache
 from ..._utils import asyncify
 from ._constants import OAUTH_API_BETA_HEADER
 
@@ -63,7 +63,8 @@ def warn_env_static_shadows_auto_discovery(env_var: str) -> None:
 
 
 class AccessTokenAuth(httpx.Auth):
-    """Adapts a :class:`TokenCache` to httpx's :class:`~httpx.Auth` protocol.
+    """Adapts a :class:`TokenCache` (or, for async clients, an
+    :class:`AsyncTokenCache`) to httpx's :class:`~httpx.Auth` protocol.
 
     Used by :meth:`anthropic.Anthropic.custom_auth` to inject ``Authorization: Bearer``
     plus the OAuth beta header on every request, with proactive refresh handled by
@@ -78,7 +79,7 @@ class AccessTokenAuth(httpx.Auth):
 
     requires_response_body = False
 
-    def __init__(self, token_cache: TokenCache) -> None:
+    def __init__(self, token_cache: TokenCache | AsyncTokenCache) -> None:
         self._token_cache = token_cache
 
     @staticmethod
@@ -106,6 +107,8 @@ class AccessTokenAuth(httpx.Auth):
         if self._has_static_credential(request):
             yield request
             return
+        if isinstance(self._token_cache, AsyncTokenCache):
+            raise TypeError("AsyncTokenCache can only be used with an async HTTP client")
         token = self._token_cache.get_token()
         self._apply(request, token)
         yield request
@@ -115,9 +118,12 @@ class AccessTokenAuth(httpx.Auth):
         if self._has_static_credential(request):
             yield request
             return
-        # TokenCache.get_token is sync (and may make a blocking HTTP call); run it
-        # in a worker thread to avoid blocking the event loop. Uses the same
-        # ``asyncify`` helper as the rest of the SDK (see lib/vertex).
-        token = await asyncify(self._token_cache.get_token)()
+        if isinstance(self._token_cache, AsyncTokenCache):
+            token = await self._token_cache.get_token()
+        else:
+            # TokenCache.get_token is sync (and may make a blocking HTTP call); run it
+            # in a worker thread to avoid blocking the event loop. Uses the same
+            # ``asyncify`` helper as the rest of the SDK (see lib/vertex).
+            token = await asyncify(self._token_cache.get_token)()
         self._apply(request, token)
         yield request
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import time
+import inspect
 import logging
 import threading
-from typing import Callable, Optional
+from typing import Union, Callable, Optional
 
+import anyio
 import httpx
 
-from ._types import AccessToken, AccessTokenProvider
+from ._types import AccessToken, AccessTokenProvider, AsyncAccessTokenProvider
+from ..._utils import asyncify
 from ._workload import WorkloadIdentityError
 from ._constants import ADVISORY_REFRESH_SECONDS, MANDATORY_REFRESH_SECONDS
 from ..._exceptions import AnthropicError
 
-__all__ = ["TokenCache"]
+__all__ = ["TokenCache", "AsyncTokenCache"]
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -22,6 +25,36 @@ log: logging.Logger = logging.getLogger(__name__)
 ADVISORY_REFRESH_BACKOFF_SECONDS = 5
 
 
+def _invoke_provider(provider: AccessTokenProvider, *, force: bool) -> AccessToken:
+    """Invoke ``provider``, tolerating legacy zero-arg callables."""
+    try:
+        return provider(force_refresh=force)
+    except TypeError as err:
+        # Back-compat for legacy zero-arg providers. Argument-binding
+        # TypeErrors fire before the body runs, so this can't double-invoke;
+        # a TypeError from inside the provider won't mention the kwarg name.
+        if "force_refresh" not in str(err):
+            raise
+        return provider()  # type: ignore[call-arg]
+
+
+async def _invoke_provider_async(
+    provider: Union[AccessTokenProvider, AsyncAccessTokenProvider], *, force: bool
+) -> AccessToken:
+    """Invoke ``provider`` without blocking the event loop.
+
+    Prefers the built-in providers' ``call_async()``, then awaits async
+    providers directly; sync-only providers run in a worker thread.
+    """
+    call_async = getattr(provider, "call_async", None)
+    if callable(call_async):
+        token: AccessToken = await call_async(force_refresh=force)
+        return token
+    if inspect.iscoroutinefunction(provider) or inspect.iscoroutinefunction(type(provider).__call__):
+        return await provider(force_refresh=force)  # type: ignore[no-any-return, misc]
+    return await asyncify(_invoke_provider)(provider, force=force)  # type: ignore[arg-type]
+
+
 class TokenCache:
     """Thread-safe cache wrapping an :class:`AccessTokenProvider` with two-tier
     proactive refresh and single-flight semantics.
@@ -46,6 +79,10 @@ class TokenCache:
     under async: ``asyncify(get_token)`` runs on the thread pool, and holding
     the lock across the network call would pin an async worker for the whole
     exchange.
+
+    The cache is per process. To share tokens between the worker processes of
+    a server, wrap the provider in a :class:`SharedTokenFile`. The async client
+    uses :class:`AsyncTokenCache` instead.
     """
 
     def __init__(
@@ -74,16 +111,7 @@ class TokenCache:
         self._last_advisory_failure_time: float = 0.0
 
     def _invoke_provider(self, *, force: bool) -> AccessToken:
-        """Invoke ``self._provider``, tolerating legacy zero-arg callables."""
-        try:
-            return self._provider(force_refresh=force)
-        except TypeError as err:
-            # Back-compat for legacy zero-arg providers. Argument-binding
-            # TypeErrors fire before the body runs, so this can't double-invoke;
-            # a TypeError from inside the provider won't mention the kwarg name.
-            if "force_refresh" not in str(err):
-                raise
-            return self._provider()  # type: ignore[call-arg]
+        return _invoke_provider(self._provider, force=force)
 
     def _call_provider(self) -> AccessToken:
         """Call the provider, retrying once on a 401 from the token endpoint."""
@@ -183,3 +211,110 @@ class TokenCache:
         with self._lock:
             self._cached = None
             self._next_force = True
+
+
+class AsyncTokenCache:
+    """Async counterpart of :class:`TokenCache`, used by
+    :class:`anthropic.AsyncAnthropic`.
+
+    Applies the same refresh policy — advisory / mandatory windows, the
+    advisory-failure backoff, single-flight refresh, one retry on a 401 from
+    the token endpoint and the one-shot ``force_refresh`` after
+    :meth:`invalidate` — but waits on an ``anyio.Event`` instead of blocking a
+    thread, so concurrent requests on one event loop share a single refresh.
+
+    The provider may be an :class:`AsyncAccessTokenProvider`, a built-in
+    provider (whose ``call_async()`` performs the token exchange with an
+    ``httpx.AsyncClient``) or any sync :class:`AccessTokenProvider`, which is
+    run in a worker thread.
+
+    An instance belongs to one event loop; it is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        provider: Union[AccessTokenProvider, AsyncAccessTokenProvider],
+        *,
+        advisory_refresh_seconds: int = ADVISORY_REFRESH_SECONDS,
+        mandatory_refresh_seconds: int = MANDATORY_REFRESH_SECONDS,
+        time_source: Callable[[], float] = time.time,
+    ) -> None:
+        self._provider = provider
+        self._advisory = advisory_refresh_seconds
+        self._mandatory = mandatory_refresh_seconds
+        self._time_source = time_source
+        self._cached: Optional[AccessToken] = None
+        # Created by the leader of a refresh, on the running event loop.
+        self._refresh_event: Optional[anyio.Event] = None
+        self._next_force = False
+        self._last_advisory_failure_time: float = 0.0
+
+    async def _call_provider(self) -> AccessToken:
+        """Call the provider, retrying once on a 401 from the token endpoint."""
+        force = self._next_force
+        try:
+            result = await _invoke_provider_async(self._provider, force=force)
+        except WorkloadIdentityError as err:
+            if err.status_code != 401:
+                raise
+            log.debug("Token provider returned 401; retrying once")
+            result = await _invoke_provider_async(self._provider, force=True)
+        self._next_force = False
+        return result
+
+    async def get_token(self) -> str:
+        """Return a valid bearer token, refreshing if necessary."""
+        while True:
+            advisory_fallback: Optional[AccessToken] = None
+            remaining_seconds = 0
+            cached = self._cached
+            if cached is not None:
+                if cached.expires_at is None:
+                    return cached.token
+                remaining = cached.expires_at - self._time_source()
+                if remaining > self._advisory:
+                    return cached.token
+                if remaining > self._mandatory:
+                    if self._refresh_event is not None:
+                        return cached.token
+                    if self._time_source() - self._last_advisory_failure_time < ADVISORY_REFRESH_BACKOFF_SECONDS:
+                        return cached.token
+                    advisory_fallback = cached
+                    remaining_seconds = int(remaining)
+
+            if self._refresh_event is not None:
+                # Mandatory-window caller with a refresh in flight: wait, then
+                # re-read the cache.
+                await self._refresh_event.wait()
+                continue
+
+            released = self._refresh_event = anyio.Event()
+            try:
+                fresh = await self._call_provider()
+            except BaseException as err:
+                # BaseException so that cancellation also releases the waiters.
+                self._refresh_event = None
+                released.set()
+                if advisory_fallback is not None and isinstance(err, (AnthropicError, httpx.HTTPError)):
+                    log.warning(
+                        "Advisory token refresh failed (%ds remaining); serving cached token: %s",
+                        remaining_seconds,
+                        err,
+                    )
+                    self._last_advisory_failure_time = self._time_source()
+                    return advisory_fallback.token
+                raise
+
+            self._cached = fresh
+            self._refresh_event = None
+            released.set()
+            return fresh.token
+
+    def invalidate(self) -> None:
+        """Clear the cached token so the next :meth:`get_token` re-invokes the provider.
+
+        Also sets a one-shot ``force_refresh`` flag so on-disk providers skip
+        their freshness short-circuit instead of re-serving the revoked token.
+        """
+        self._cached = None
+        self._next_force = True
@@ -13,6 +13,7 @@ from typing_extensions import override
 import httpx
 
 from ._types import AccessToken, IdentityTokenProvider
+from ..._utils import asyncify
 from ._secrets import (
     SecretStr,
     _unwrap_secret,
@@ -50,7 +51,7 @@ from ..._exceptions import AnthropicError
 log: logging.Logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from ._workload import WorkloadIdentityCredentials
+    from ._workload import WorkloadIdentityCredentials, _TokenFlow
 
 __all__ = ["StaticToken", "EnvToken", "CredentialsFile", "InMemoryConfig", "IdentityTokenFile"]
 
@@ -189,12 +190,15 @@ class CredentialsFile:
         profile: Optional[str] = None,
         *,
         http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self._profile = profile if profile is not None else _active_profile()
         self._config_path = _config_file_path(self._profile)
         self._bound_base_url: Optional[str] = None
         self._http_client = http_client
         self._owned_http_client: Optional[httpx.Client] = None
+        self._async_http_client = async_http_client
+        self._owned_async_http_client: Optional[httpx.AsyncClient] = None
 
         # Populated on first __call__ — keeps construction cheap and exception-free
         # so the chain can construct us optimistically after an existence check.
@@ -414,6 +418,21 @@ class CredentialsFile:
         if self._workload_delegate is not None:
             self._workload_delegate.close()
 
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """Return an ``httpx.AsyncClient``, lazily creating (and tracking) one we own."""
+        if self._async_http_client is not None:
+            return self._async_http_client
+        if self._owned_async_http_client is None:
+            self._owned_async_http_client = httpx.AsyncClient(timeout=TOKEN_EXCHANGE_TIMEOUT)
+        return self._owned_async_http_client
+
+    async def aclose(self) -> None:
+        """Close the owned ``httpx.Client`` and ``httpx.AsyncClient`` if we created them."""
+        self.close()
+        if self._owned_async_http_client is not None:
+            await self._owned_async_http_client.aclose()
+            self._owned_async_http_client = None
+
     def reload(self) -> None:
         """Drop the cached config so the next call re-reads it from disk.
 
@@ -476,14 +495,35 @@ class CredentialsFile:
         return cast("Dict[str, Any]", config["authentication"])
 
     def __call__(self, *, force_refresh: bool = False) -> AccessToken:
+        from ._workload import _run_token_flow
+
+        return _run_token_flow(self._token_flow(force_refresh=force_refresh), self._get_http_client)
+
+    async def call_async(self, *, force_refresh: bool = False) -> AccessToken:
+        """Like :meth:`__call__`, but performs any token exchange with an
+        ``httpx.AsyncClient``: ``async_http_client=`` if given, else one
+        created (and closed by :meth:`aclose`) on first use.
+
+        A caller that configured only a sync ``http_client=`` gets the sync
+        exchange in a worker thread, so its transport settings still apply.
+        Reading and writing the profile files stays on the event loop; they
+        are small local files.
+        """
+        from ._workload import _arun_token_flow
+
+        if self._http_client is not None and self._async_http_client is None:
+            return await asyncify(self.__call__)(force_refresh=force_refresh)
+        return await _arun_token_flow(self._token_flow(force_refresh=force_refresh), self._get_async_http_client)
+
+    def _token_flow(self, *, force_refresh: bool) -> _TokenFlow:
         auth = self._auth_block()
         auth_type = auth.get("type")
 
         if auth_type == AUTH_TYPE_OIDC_FEDERATION:
-            return self._call_oidc_federation(auth, force_refresh=force_refresh)
+            return (yield from self._call_oidc_federation(auth, force_refresh=force_refresh))
 
         if auth_type == AUTH_TYPE_USER_OAUTH:
-            return self._call_user_oauth(auth, force_refresh=force_refresh)
+            return (yield from self._call_user_oauth(auth, force_refresh=force_refresh))
 
         raise AnthropicError(
             f"Unknown authentication.type {auth_type!r} at {self._config_path}. "
@@ -492,12 +532,12 @@ class CredentialsFile:
 
     # -- "user_oauth" -----------------------------------------------------
 
-    def _call_user_oauth(self, auth: Dict[str, Any], *, force_refresh: bool = False) -> AccessToken:
+    def _call_user_oauth(self, auth: Dict[str, Any], *, force_refresh: bool = False) -> _TokenFlow:
         """Interactive-login profile. With a ``client_id`` in the auth block,
         we run the refresh_token grant on expiry; without one, we treat the
         credentials file as externally rotated and just read it fresh.
         """
-        from ._workload import WorkloadIdentityError, _request_id, _raise_token_endpoint_error
+        from ._workload import WorkloadIdentityError, _request_id, _TokenRequest, _raise_token_endpoint_error
 
         creds = self._read_credentials()
         access_token = creds.get("access_token")
@@ -535,11 +575,9 @@ class CredentialsFile:
         }
 
         try:
-            resp = self._get_http_client().post(
+            resp = yield _TokenRequest(
                 f"{self._base_url}{TOKEN_ENDPOINT}",
-                # Serialized inline so the raw request bytes are never bound
-                # to a local here; SecretStr values unwrap at dump time.
-                content=_json_dumps_secrets(body),
+                body,
                 headers={
                     "Content-Type": "application/json",
                     # oauth-2025-04-20 unlocks the token endpoint family. Do
@@ -619,7 +657,7 @@ class CredentialsFile:
                 return None
             raise
 
-    def _call_oidc_federation(self, auth: Dict[str, Any], *, force_refresh: bool = False) -> AccessToken:
+    def _call_oidc_federation(self, auth: Dict[str, Any], *, force_refresh: bool = False) -> _TokenFlow:
         if self._workload_delegate is None:
             self._workload_delegate = self._build_workload_delegate(auth)
 
@@ -631,7 +669,7 @@ class CredentialsFile:
         # (``_load_config`` defaults it); subclasses (``InMemoryConfig``)
         # leave it ``None`` to opt out of the disk cache entirely.
         if self._credentials_path is None:
-            return self._workload_delegate()
+            return (yield from self._workload_delegate._exchange())
 
         # force_refresh (set by TokenCache.invalidate after a 401) bypasses
         # the disk-cache short-circuit so a revoked token isn't re-served.
@@ -650,7 +688,7 @@ class CredentialsFile:
                 # corrupted expires_at — fall through to re-exchange and overwrite
                 pass
 
-        token = self._workload_delegate()
+        token = yield from self._workload_delegate._exchange()
         try:
             self._atomic_write_credentials(
                 {
@@ -801,6 +839,7 @@ class InMemoryConfig(CredentialsFile):
         *,
         identity_token_provider: Optional[IdentityTokenProvider] = None,
         http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         raw_auth = config.get("authentication")
         if not isinstance(raw_auth, dict):
@@ -832,6 +871,8 @@ class InMemoryConfig(CredentialsFile):
         self._bound_base_url: Optional[str] = None
         self._http_client = http_client
         self._owned_http_client: Optional[httpx.Client] = None
+        self._async_http_client = async_http_client
+        self._owned_async_http_client: Optional[httpx.AsyncClient] = None
         self._workload_delegate: Optional[WorkloadIdentityCredentials] = None
         self._identity_token_provider_override = identity_token_provider
 
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import logging
+import pathlib
+import tempfile
+import contextlib
+from typing import Any, Callable, Iterator, Optional
+
+from ._cache import _invoke_provider
+from ._types import AccessToken, AccessTokenProvider
+from ._secrets import SecretStr, _unwrap_secret, _json_dumps_secrets, _wrap_secret_fields, _NonObjectPayloadError
+from ._constants import ADVISORY_REFRESH_SECONDS, MANDATORY_REFRESH_SECONDS
+from ..._exceptions import AnthropicError
+
+__all__ = ["SharedTokenFile"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class SharedTokenFile:
+    """Shares the tokens minted by an :class:`AccessTokenProvider` between the
+    processes on a host through a file, so that one process refreshes and the
+    others read.
+
+    A server with many worker processes otherwise runs one token exchange per
+    worker, at startup and on every refresh. Wrap the provider and pass the
+    wrapper wherever a provider is accepted::
+
+        credentials = SharedTokenFile(WorkloadIdentityCredentials(...), "/run/anthropic/token.json")
+        client = Anthropic(credentials=credentials)
+
+    Each process still keeps its own :class:`TokenCache`, with the usual
+    advisory / mandatory refresh windows and 401 handling; the wrapper only
+    changes where a refresh gets its token from:
+
+    * The file holds a token with more than ``advisory_refresh_seconds``
+      remaining (or no expiry) → return it without calling the provider.
+    * Otherwise take an exclusive ``fcntl`` lock on ``<path>.lock``, re-read
+      the file (another process may have just refreshed it) and only if it's
+      still stale call the provider and write the result.
+    * A process that still holds a token outside the mandatory window doesn't
+      wait for another process's refresh — it keeps serving that token, just
+      like advisory callers within one :class:`TokenCache`.
+    * ``force_refresh`` (after a 401) only reuses the file's token if another
+      process already replaced the one this process was using.
+
+    The file is written atomically with mode ``0600``. Put it on a tmpfs such
+    as ``/dev/shm`` to keep the token off persistent storage. Requires a POSIX
+    platform.
+    """
+
+    def __init__(
+        self,
+        provider: AccessTokenProvider,
+        path: str | os.PathLike[str],
+        *,
+        advisory_refresh_seconds: int = ADVISORY_REFRESH_SECONDS,
+        mandatory_refresh_seconds: int = MANDATORY_REFRESH_SECONDS,
+        time_source: Callable[[], float] = time.time,
+    ) -> None:
+        try:
+            import fcntl
+        except ImportError:
+            raise AnthropicError("SharedTokenFile requires `fcntl`, which is not available on this platform") from None
+
+        self._fcntl: Any = fcntl
+        self._provider = provider
+        self._path = pathlib.Path(path)
+        self._lock_path = self._path.with_name(f"{self._path.name}.lock")
+        self._advisory = advisory_refresh_seconds
+        self._mandatory = mandatory_refresh_seconds
+        self._time_source = time_source
+        # The token this process last handed to its TokenCache.
+        self._last: Optional[AccessToken] = None
+
+    def __call__(self, *, force_refresh: bool = False) -> AccessToken:
+        if not force_refresh:
+            shared = self._read()
+            if shared is not None and self._remaining(shared) > self._advisory:
+                return self._serve(shared)
+
+        last = self._last
+        blocking = force_refresh or last is None or self._remaining(last) <= self._mandatory
+        with self._locked(blocking=blocking) as acquired:
+            if not acquired:
+                # Another process is refreshing and our token is still good.
+                assert last is not None
+                return last
+
+            shared = self._read()
+            if shared is not None:
+                if force_refresh:
+                    if last is not None and shared.token != last.token and self._remaining(shared) > self._mandatory:
+                        return self._serve(shared)
+                elif self._remaining(shared) > self._advisory:
+                    return self._serve(shared)
+
+            fresh = _invoke_provider(self._provider, force=force_refresh)
+            self._write(fresh)
+            return self._serve(fresh)
+
+    def bind_base_url(self, base_url: str) -> None:
+        """Forwarded to the wrapped provider, if it supports it."""
+        bind = getattr(self._provider, "bind_base_url", None)
+        if callable(bind):
+            bind(base_url)
+
+    def close(self) -> None:
+        """Forwarded to the wrapped provider, if it supports it."""
+        close = getattr(self._provider, "close", None)
+        if close is not None:
+            close()
+
+    def _remaining(self, token: AccessToken) -> float:
+        if token.expires_at is None:
+            return float("inf")
+        return token.expires_at - self._time_source()
+
+    def _serve(self, token: AccessToken) -> AccessToken:
+        self._last = token
+        return token
+
+    @contextlib.contextmanager
+    def _locked(self, *, blocking: bool) -> Iterator[bool]:
+        fcntl = self._fcntl
+        self._path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _read(self) -> Optional[AccessToken]:
+        """The token in the shared file, or ``None`` if it's missing or unreadable."""
+        try:
+            payload = _wrap_secret_fields(json.loads(self._path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, _NonObjectPayloadError) as err:
+            log.debug("Ignoring unreadable shared token file %s: %s", self._path, type(err).__name__)
+            return None
+
+        token = _unwrap_secret(payload.get("access_token"))
+        expires_at = payload.get("expires_at")
+        if not isinstance(token, str) or not token:
+            return None
+        if expires_at is not None and (not isinstance(expires_at, int) or isinstance(expires_at, bool)):
+            return None
+        return AccessToken(token=token, expires_at=expires_at)
+
+    def _write(self, token: AccessToken) -> None:
+        """Atomically replace the shared file. Best-effort: a failed write only
+        means the other processes refresh on their own."""
+        parent = self._path.parent
+        try:
+            fd, tmp = tempfile.mkstemp(dir=parent, prefix=f".{self._path.name}.", suffix=".tmp")
+        except OSError as err:
+            log.warning("Could not write shared token file %s: %s", self._path, err)
+            return
+        try:
+            try:
+                os.fchmod(fd, 0o600)
+                os.write(
+                    fd, _json_dumps_secrets({"access_token": SecretStr(token.token), "expires_at": token.expires_at})
+                )
+            finally:
+                os.close(fd)
+            os.replace(tmp, self._path)
+        except OSError as err:
+            log.warning("Could not write shared token file %s: %s", self._path, err)
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
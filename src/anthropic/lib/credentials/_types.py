@@ -9,7 +9,13 @@ def _empty_headers() -> Dict[str, str]:
     return {}
 
 
-__all__ = ["AccessToken", "AccessTokenProvider", "IdentityTokenProvider", "CredentialResult"]
+__all__ = [
+    "AccessToken",
+    "AccessTokenProvider",
+    "AsyncAccessTokenProvider",
+    "IdentityTokenProvider",
+    "CredentialResult",
+]
 
 
 @dataclass(frozen=True)
@@ -53,6 +59,19 @@ class AccessTokenProvider(Protocol):
     def __call__(self, *, force_refresh: bool = False) -> AccessToken: ...
 
 
+class AsyncAccessTokenProvider(Protocol):
+    """Async counterpart of :class:`AccessTokenProvider`, for use with
+    :class:`AsyncTokenCache` (which the async client uses).
+
+    The built-in providers are sync callables that also define
+    ``call_async()``, which performs the token exchange with an
+    ``httpx.AsyncClient``; :class:`AsyncTokenCache` prefers it. Sync-only
+    providers still work — they run in a worker thread.
+    """
+
+    async def __call__(self, *, force_refresh: bool = False) -> AccessToken: ...
+
+
 # Innermost layer: returns the raw external JWT string (used as the
 # ``identity_token_provider`` argument to :class:`WorkloadIdentityCredentials`).
 IdentityTokenProvider = Callable[[], str]
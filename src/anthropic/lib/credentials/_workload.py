@@ -3,12 +3,14 @@ from __future__ import annotations
 import time
 import logging
 from types import TracebackType
-from typing import Any, Dict, Type, Union, NoReturn, Optional
+from typing import Any, Dict, Type, Union, Callable, NoReturn, Optional, Generator
+from dataclasses import dataclass
 from typing_extensions import override
 
 import httpx
 
 from ._types import AccessToken, IdentityTokenProvider
+from ..._utils import asyncify
 from ._secrets import (
     SecretStr,
     _unwrap_secret,
@@ -101,6 +103,85 @@ def _raise_token_endpoint_error(resp: httpx.Response, *, message_prefix: str, hi
     )
 
 
+@dataclass(frozen=True)
+class _TokenRequest:
+    """A POST to the token endpoint, yielded by a token flow for its driver to send.
+
+    ``body`` keeps its secret values :class:`SecretStr`-wrapped; drivers
+    serialize it inline in the ``post()`` call so the raw request bytes are
+    never bound to a local.
+    """
+
+    url: str
+    body: Dict[str, Union[str, SecretStr]]
+    headers: Dict[str, str]
+
+
+@dataclass(frozen=True)
+class _BlockingCall:
+    """A blocking call, e.g. reading an identity token file, yielded by a token flow for its driver to make.
+
+    The async driver makes it in a worker thread so that it doesn't block the event loop.
+    """
+
+    fn: Callable[[], Any]
+
+
+# A token flow yields the token-endpoint requests it needs sent, receives each
+# response (or has the transport's ``httpx.HTTPError`` thrown in at the
+# ``yield``) and returns the minted token. It also yields the blocking calls it
+# needs made and receives their results. Keeping the I/O in the drivers below
+# lets the sync and async providers share every parsing and error path.
+_TokenFlow = Generator[Union[_TokenRequest, _BlockingCall], Any, AccessToken]
+
+
+def _run_token_flow(flow: _TokenFlow, get_client: Callable[[], httpx.Client]) -> AccessToken:
+    """Drive a token flow with a sync ``httpx.Client``.
+
+    ``get_client`` is only called once the flow needs to send a request, so
+    flows served from disk never construct a client.
+    """
+    try:
+        request = next(flow)
+        while True:
+            if isinstance(request, _BlockingCall):
+                # sent straight in so that no frame here holds the result
+                request = flow.send(request.fn())
+                continue
+            try:
+                response = get_client().post(
+                    request.url, content=_json_dumps_secrets(request.body), headers=request.headers
+                )
+            except httpx.HTTPError as err:
+                request = flow.throw(err)
+            else:
+                request = flow.send(response)
+    except StopIteration as stop:
+        token: AccessToken = stop.value
+        return token
+
+
+async def _arun_token_flow(flow: _TokenFlow, get_client: Callable[[], httpx.AsyncClient]) -> AccessToken:
+    """Drive a token flow with an ``httpx.AsyncClient``."""
+    try:
+        request = next(flow)
+        while True:
+            if isinstance(request, _BlockingCall):
+                request = flow.send(await asyncify(request.fn)())
+                continue
+            try:
+                response = await get_client().post(
+                    request.url, content=_json_dumps_secrets(request.body), headers=request.headers
+                )
+            except httpx.HTTPError as err:
+                request = flow.throw(err)
+            else:
+                request = flow.send(response)
+    except StopIteration as stop:
+        token: AccessToken = stop.value
+        return token
+
+
 __all__ = ["WorkloadIdentityCredentials", "WorkloadIdentityError", "exchange_federation_assertion"]
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -168,6 +249,7 @@ class WorkloadIdentityCredentials:
         workspace_id: Optional[str] = None,
         scope: Optional[str] = None,
         http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self._identity_token_provider = identity_token_provider
         self._federation_rule_id = federation_rule_id
@@ -192,6 +274,8 @@ class WorkloadIdentityCredentials:
         else:
             self._http_client = http_client
             self._owns_http_client = False
+        self._async_http_client = async_http_client
+        self._owned_async_http_client: Optional[httpx.AsyncClient] = None
 
     @property
     def scope(self) -> Optional[str]:
@@ -217,6 +301,20 @@ class WorkloadIdentityCredentials:
         if self._owns_http_client:
             self._http_client.close()
 
+    async def aclose(self) -> None:
+        """Close the ``httpx.Client`` and ``httpx.AsyncClient`` we created, if any."""
+        self.close()
+        if self._owned_async_http_client is not None:
+            await self._owned_async_http_client.aclose()
+            self._owned_async_http_client = None
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        if self._async_http_client is not None:
+            return self._async_http_client
+        if self._owned_async_http_client is None:
+            self._owned_async_http_client = httpx.AsyncClient(timeout=TOKEN_EXCHANGE_TIMEOUT)
+        return self._owned_async_http_client
+
     def __enter__(self) -> "WorkloadIdentityCredentials":
         return self
 
@@ -229,11 +327,28 @@ class WorkloadIdentityCredentials:
         self.close()
 
     def __call__(self, *, force_refresh: bool = False) -> AccessToken:
-        # Re-invoke the identity token provider every time — the underlying
-        # file (e.g. a k8s projected SA token) may have rotated. force_refresh
-        # is a no-op: this provider has no cache to bypass.
+        # force_refresh is a no-op: this provider has no cache to bypass.
+        del force_refresh
+        return _run_token_flow(self._exchange(), lambda: self._http_client)
+
+    async def call_async(self, *, force_refresh: bool = False) -> AccessToken:
+        """Perform the exchange with an ``httpx.AsyncClient``.
+
+        Uses ``async_http_client=`` if given, else one created (and closed by
+        :meth:`aclose`) on first use. A caller that configured only a sync
+        ``http_client=`` gets the sync exchange in a worker thread, so its
+        transport settings still apply.
+        """
         del force_refresh
-        jwt = SecretStr(self._identity_token_provider())
+        if self._async_http_client is None and not self._owns_http_client:
+            return await asyncify(self.__call__)()
+        return await _arun_token_flow(self._exchange(), self._get_async_http_client)
+
+    def _exchange(self) -> _TokenFlow:
+        # Re-invoke the identity token provider every time — the underlying
+        # file (e.g. a k8s projected SA token) may have rotated. It may block,
+        # so it's called by the driver.
+        jwt = SecretStr((yield _BlockingCall(self._identity_token_provider)))
 
         assertion_bytes = len(jwt.get_secret_value().encode("utf-8"))
         if assertion_bytes > _MAX_ASSERTION_BYTES:
@@ -256,11 +371,9 @@ class WorkloadIdentityCredentials:
 
         url = f"{self._base_url}{TOKEN_ENDPOINT}"
         try:
-            resp = self._http_client.post(
+            resp = yield _TokenRequest(
                 url,
-                # Serialized inline so the raw request bytes are never bound
-                # to a local here; SecretStr values unwrap at dump time.
-                content=_json_dumps_secrets(body),
+                body,
                 headers={
                     "anthropic-beta": _JWT_BEARER_BETA_HEADER,
                     "Content-Type": "application/json",
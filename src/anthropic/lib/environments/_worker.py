@@ -180,7 +180,15 @@ class EnvironmentWorker:
     environment key with the parent client's ``X-Api-Key`` cleared.
 
     Async only — :meth:`run` loops forever, so bound it (cancel the task or wrap
-    it in :func:`asyncio.wait_for`) when you want it to stop.
+    it in :func:`asyncio.wait_for`) when you want it to stop, or call
+    :meth:`drain` to stop it gracefully.
+
+    By default the worker serves one session at a time. With
+    ``max_concurrent_sessions=N`` it serves up to ``N`` at once, each with its
+    own tool runner and heartbeat, and only polls for more work while it has a
+    free slot, so a host is sized by sessions rather than by processes.
+    :attr:`active_sessions` and :attr:`utilization` report how much of that
+    capacity is in use.
 
     Use :meth:`handle_item` if you already hold a claimed work item (e.g. a
     ``worker poll --on-work`` script handed one to a fresh process) and just
@@ -239,6 +247,11 @@ class EnvironmentWorker:
         disables it.
       worker_id: Optional identifier sent on each poll. Defaults to a unique,
         hostname-prefixed id.
+      max_concurrent_sessions: How many sessions :meth:`run` serves at once.
+        Defaults to 1. Above 1, each session's :class:`AgentToolContext` gets
+        its own ``{workdir}/{session_id}`` directory (created if missing and
+        left in place afterwards), so concurrent sessions don't share files
+        or downloaded skills.
       extra_headers: Optional headers passed through per request on every
         call the worker makes (poll / ack / stop / heartbeat and the session
         tool runner's event stream / list / send). They are threaded into
@@ -262,8 +275,11 @@ class EnvironmentWorker:
         max_file_bytes: int | None | NotGiven = not_given,
         max_idle: float | None = DEFAULT_MAX_IDLE,
         worker_id: str | None = None,
+        max_concurrent_sessions: int | None = None,
         extra_headers: Headers | None = None,
     ) -> None:
+        if max_concurrent_sessions is not None and max_concurrent_sessions < 1:
+            raise ValueError(f"max_concurrent_sessions must be at least 1, got {max_concurrent_sessions}")
         self._client = client
         self._environment_id = environment_id
         self._environment_key = environment_key
@@ -276,7 +292,35 @@ class EnvironmentWorker:
         self._max_file_bytes = max_file_bytes
         self._max_idle = max_idle
         self._worker_id = worker_id
+        self.max_concurrent_sessions = max_concurrent_sessions or 1
         self._extra_headers = extra_headers
+        # Work id -> session id of each session :meth:`run` is serving.
+        self._active: dict[str, str] = {}
+        self._draining = False
+        # The scope around :meth:`run`'s poll loop, cancelled by :meth:`drain`.
+        self._claiming: anyio.CancelScope | None = None
+
+    @property
+    def active_sessions(self) -> int:
+        """The number of sessions :meth:`run` is serving right now."""
+        return len(self._active)
+
+    @property
+    def utilization(self) -> float:
+        """The fraction of ``max_concurrent_sessions`` in use, from 0.0 to 1.0."""
+        return len(self._active) / self.max_concurrent_sessions
+
+    def drain(self) -> None:
+        """Stop claiming new work; :meth:`run` returns once the sessions it is
+        serving have finished.
+
+        Call it from the event loop, e.g. from a handler installed with
+        ``loop.add_signal_handler``. A poll in progress is cancelled; the
+        sessions are not.
+        """
+        self._draining = True
+        if self._claiming is not None:
+            self._claiming.cancel()
 
     def _tools_for(self, env: AgentToolContext) -> Sequence[BetaAnyRunnableTool]:
         if callable(self._tools):
@@ -290,12 +334,16 @@ class EnvironmentWorker:
         return beta_agent_toolset_20260401(env)
 
     async def run(self) -> None:
-        """Poll the environment and service each claimed session until cancelled.
+        """Poll the environment and service each claimed session until cancelled
+        or drained.
 
         Loops forever; cancel the task (or wrap it in :func:`asyncio.wait_for`)
-        to stop it. Equivalent to claiming work items via
+        to stop it, or call :meth:`drain` to stop claiming work and return once
+        the sessions in flight finish. Equivalent to claiming work items via
         ``client.beta.environments.work.poller`` and running the per-item flow
-        for each.
+        for each, up to ``max_concurrent_sessions`` at a time: the next poll
+        waits for a free slot. An exception from one session cancels the others
+        (each still force-stops its work item) and propagates.
 
         Raises:
           ValueError: if ``environment_id`` / ``environment_key`` were not passed
@@ -311,14 +359,64 @@ class EnvironmentWorker:
         poll_client = _copy_client_with_bearer_auth(
             self._client, auth_token=environment_key, helper="environments-work-poller"
         )
-        async for work_item in aiter_work(
-            poll_client.beta.environments.work,
-            environment_id=environment_id,
-            worker_id=self._worker_id,
-            auto_stop=False,
-            extra_headers=self._extra_headers,
-        ):
-            await self._handle_item(work_item, environment_key)
+        capacity = anyio.Semaphore(self.max_concurrent_sessions)
+        failure: Exception | None = None
+
+        async def _serve(work_item: BetaSelfHostedWork) -> None:
+            nonlocal failure
+            self._active[work_item.id] = work_item.data.id
+            log.info(
+                "serving session session_id=%s work_id=%s active=%d/%d",
+                work_item.data.id,
+                work_item.id,
+                len(self._active),
+                self.max_concurrent_sessions,
+            )
+            try:
+                await self._handle_item(work_item, environment_key)
+            except Exception as e:
+                # Re-raised from ``run`` itself once the other sessions have
+                # wound down, rather than wrapped in another ``ExceptionGroup``
+                # by this task group.
+                if failure is None:
+                    failure = e
+                tg.cancel_scope.cancel()
+            finally:
+                del self._active[work_item.id]
+                capacity.release()
+                log.info(
+                    "session finished session_id=%s work_id=%s active=%d/%d",
+                    work_item.data.id,
+                    work_item.id,
+                    len(self._active),
+                    self.max_concurrent_sessions,
+                )
+
+        try:
+            async with anyio.create_task_group() as tg:
+                # Claim only with a slot free: the poll generator only polls
+                # when asked for its next item. ``drain`` cancels this scope,
+                # after which the task group waits for the sessions in flight.
+                with anyio.CancelScope() as self._claiming:
+                    if self._draining:
+                        self._claiming.cancel()
+                    await capacity.acquire()
+                    async for work_item in aiter_work(
+                        poll_client.beta.environments.work,
+                        environment_id=environment_id,
+                        worker_id=self._worker_id,
+                        auto_stop=False,
+                        extra_headers=self._extra_headers,
+                    ):
+                        tg.start_soon(_serve, work_item)
+                        await capacity.acquire()
+                if self._draining:
+                    log.info("draining; waiting for %d session(s) to finish", len(self._active))
+        finally:
+            self._claiming = None
+            self._draining = False
+        if failure is not None:
+            raise failure
 
     async def handle_item(
         self,
@@ -436,8 +534,12 @@ class EnvironmentWorker:
                 # during __aenter__ still interrupts an in-progress skill
                 # download (the desired split-brain protection) — __aexit__ is
                 # then a no-op since no bash/skills were set up.
+                workdir = self._workdir
+                if self.max_concurrent_sessions > 1:
+                    workdir = os.path.join(workdir, session_id)
+                    os.makedirs(workdir, exist_ok=True)
                 env = AgentToolContext(
-                    workdir=self._workdir,
+                    workdir=workdir,
                     unrestricted_paths=self._unrestricted_paths,
                     max_file_bytes=self._max_file_bytes,
                     client=worker_client,
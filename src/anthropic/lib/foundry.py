@@ -21,6 +21,7 @@ from .._base_client import (
     BaseClient,
     merge_headers,
 )
+from .._retry_policy import RetryBudget, CircuitBreaker
 from ..resources.beta import Beta, AsyncBeta
 from ..resources.messages import Messages, AsyncMessages
 from ..resources.beta.messages import Messages as BetaMessages, AsyncMessages as AsyncBetaMessages
@@ -107,6 +108,8 @@ class AnthropicFoundry(BaseFoundryClient[httpx.Client, Stream[Any]], Anthropic):
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -124,6 +127,8 @@ class AnthropicFoundry(BaseFoundryClient[httpx.Client, Stream[Any]], Anthropic):
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -141,6 +146,8 @@ class AnthropicFoundry(BaseFoundryClient[httpx.Client, Stream[Any]], Anthropic):
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new synchronous Anthropic Foundry client instance.
@@ -182,6 +189,8 @@ class AnthropicFoundry(BaseFoundryClient[httpx.Client, Stream[Any]], Anthropic):
             default_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
         self._azure_ad_token_provider = azure_ad_token_provider
@@ -220,6 +229,8 @@ class AnthropicFoundry(BaseFoundryClient[httpx.Client, Stream[Any]], Anthropic):
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -254,6 +265,8 @@ class AnthropicFoundry(BaseFoundryClient[httpx.Client, Stream[Any]], Anthropic):
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             **_extra_kwargs,
         )
 
@@ -332,6 +345,8 @@ class AsyncAnthropicFoundry(BaseFoundryClient[httpx.AsyncClient, AsyncStream[Any
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -349,6 +364,8 @@ class AsyncAnthropicFoundry(BaseFoundryClient[httpx.AsyncClient, AsyncStream[Any
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -366,6 +383,8 @@ class AsyncAnthropicFoundry(BaseFoundryClient[httpx.AsyncClient, AsyncStream[Any
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new asynchronous Anthropic Foundry client instance.
@@ -407,6 +426,8 @@ class AsyncAnthropicFoundry(BaseFoundryClient[httpx.AsyncClient, AsyncStream[Any
             default_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
         self._azure_ad_token_provider = azure_ad_token_provider
@@ -445,6 +466,8 @@ class AsyncAnthropicFoundry(BaseFoundryClient[httpx.AsyncClient, AsyncStream[Any
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -479,6 +502,8 @@ class AsyncAnthropicFoundry(BaseFoundryClient[httpx.AsyncClient, AsyncStream[Any
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             **_extra_kwargs,
         )
 
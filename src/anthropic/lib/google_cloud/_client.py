@@ -17,6 +17,7 @@ from ..._streaming import Stream, AsyncStream
 from ..._exceptions import AnthropicError
 from ..._middleware import MiddlewareInput
 from ..._base_client import DEFAULT_MAX_RETRIES, BaseClient, merge_headers
+from ..._retry_policy import RetryBudget, CircuitBreaker
 from .._extras._google_auth import refresh_credentials, load_default_credentials
 
 # Bind the install-hint extra so a missing google-auth dep points users at
@@ -214,6 +215,8 @@ class AnthropicGoogleCloud(BaseGoogleCloudClient[httpx.Client, Stream[Any]], Ant
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new synchronous Claude Platform on Google Cloud client.
@@ -294,6 +297,8 @@ class AnthropicGoogleCloud(BaseGoogleCloudClient[httpx.Client, Stream[Any]], Ant
             default_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
         # Never inherit first-party static credentials from the environment — the
@@ -375,6 +380,8 @@ class AnthropicGoogleCloud(BaseGoogleCloudClient[httpx.Client, Stream[Any]], Ant
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.Client | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         max_retries: int | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -440,6 +447,8 @@ class AnthropicGoogleCloud(BaseGoogleCloudClient[httpx.Client, Stream[Any]], Ant
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             _strict_response_validation=self._strict_response_validation,
             **_extra_kwargs,
         )
@@ -476,6 +485,8 @@ class AsyncAnthropicGoogleCloud(BaseGoogleCloudClient[httpx.AsyncClient, AsyncSt
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
         middleware: Sequence[MiddlewareInput] | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new asynchronous Claude Platform on Google Cloud client.
@@ -538,6 +549,8 @@ class AsyncAnthropicGoogleCloud(BaseGoogleCloudClient[httpx.AsyncClient, AsyncSt
             default_query=default_query,
             http_client=http_client,
             middleware=middleware,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
             _strict_response_validation=_strict_response_validation,
         )
         self.api_key = None
@@ -614,6 +627,8 @@ class AsyncAnthropicGoogleCloud(BaseGoogleCloudClient[httpx.AsyncClient, AsyncSt
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.AsyncClient | None = None,
         middleware: Sequence[MiddlewareInput] | None | NotGiven = NOT_GIVEN,
+        retry_budget: RetryBudget | None | NotGiven = NOT_GIVEN,
+        circuit_breaker: CircuitBreaker | None | NotGiven = NOT_GIVEN,
         max_retries: int | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -675,6 +690,8 @@ class AsyncAnthropicGoogleCloud(BaseGoogleCloudClient[httpx.AsyncClient, AsyncSt
             default_headers=headers,
             default_query=params,
             middleware=self._middleware if isinstance(middleware, NotGiven) else middleware,
+            retry_budget=self._retry_budget if isinstance(retry_budget, NotGiven) else retry_budget,
+            circuit_breaker=self._circuit_breaker if isinstance(circuit_breaker, NotGiven) else circuit_breaker,
             _strict_response_validation=self._strict_response_validation,
             **_extra_kwargs,
         )
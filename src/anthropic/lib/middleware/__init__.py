@@ -1,5 +1,16 @@
+from ._hedging import (
+    HedgingStats as HedgingStats,
+    HedgingMiddleware as HedgingMiddleware,
+)
 from ._fallbacks import (
     DEFAULT_BETAS as DEFAULT_BETAS,
     BetaFallbackState as BetaFallbackState,
     BetaRefusalFallbackMiddleware as BetaRefusalFallbackMiddleware,
 )
+from ._rate_limit import (
+    RateLimitBucket as RateLimitBucket,
+    RateLimitBackend as RateLimitBackend,
+    RateLimitMiddleware as RateLimitMiddleware,
+    FileRateLimitBackend as FileRateLimitBackend,
+    InMemoryRateLimitBackend as InMemoryRateLimitBackend,
+)
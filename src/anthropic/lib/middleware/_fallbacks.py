@@ -29,6 +29,7 @@ from ..._streaming import Stream, AsyncStream, ServerSentEvent
 from ..._exceptions import AnthropicError
 from ..._middleware import CallNext, Middleware, AsyncCallNext
 from ..._base_client import merge_headers
+from ..._utils._json import json_loads
 from ...types.message import Message
 from .._stainless_helpers import helper_header
 from ...types.beta.beta_message import BetaMessage
@@ -1509,7 +1510,7 @@ def _merged_body(body: dict[str, Any], fallback: BetaFallbackParam, credit_token
 
 def _safe_json(text: str) -> Any:
     try:
-        return json.loads(text)
+        return json_loads(text)
     except Exception:
         return None
 
@@ -1524,14 +1525,14 @@ def _as_dict(value: object) -> dict[str, Any] | None:
 
 def _read_json(response: httpx.Response) -> Any:
     try:
-        return json.loads(response.read())
+        return json_loads(response.read())
     except Exception:
         return None
 
 
 async def _read_json_async(response: httpx.Response) -> Any:
     try:
-        return json.loads(await response.aread())
+        return json_loads(await response.aread())
     except Exception:
         return None
 
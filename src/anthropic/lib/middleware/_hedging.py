@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import math
+import time
+import logging
+import threading
+import contextvars
+from typing import Any, Dict, Tuple, Union, Callable, Iterable, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing_extensions import override
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+import anyio
+import httpx
+
+from ..._compat import model_copy
+from ..._request import APIRequest
+from ..._response import APIResponse, AsyncAPIResponse
+from ..._constants import RAW_RESPONSE_HEADER
+from ..._exceptions import APITimeoutError, APIConnectionError
+from ..._middleware import CallNext, Middleware, AsyncCallNext
+from ..._retry_policy import RetryBudget
+
+__all__ = ["HedgingStats", "HedgingMiddleware"]
+
+log: logging.Logger = logging.getLogger("anthropic.lib.middleware")
+
+DEFAULT_PATHS = ("/v1/messages", "/v1/messages/count_tokens")
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    requests: int
+    """The number of requests handled by the middleware."""
+
+    hedged: int
+    """The number of requests a duplicate attempt was sent for."""
+
+    hedge_wins: int
+    """The number of hedged requests answered by the duplicate attempt first."""
+
+
+class HedgingMiddleware(Middleware):
+    """Middleware that sends a duplicate of a slow non-streaming request and returns whichever responds first.
+
+    If an attempt hasn't received a response after the `percentile`th latency of
+    the recent responses to the same endpoint (`initial_delay` until `min_samples`
+    have been seen), the same request, with the same idempotency key, is sent again.
+    Attempts race until their response headers arrive, and the first successful
+    response is returned while the other attempt is cancelled, or with the sync client
+    closed without its body being read. An attempt that fails doesn't end the request
+    while the other is still running, and if both fail the original attempt's failure
+    is returned.
+
+    With the sync client each attempt runs in its own daemon thread, as a blocking
+    call can't be interrupted, and the caller returns as soon as either attempt has a
+    successful response.
+
+    Hedges are limited by a `RetryBudget` so that they can't add more than a small
+    fraction of load; by default at most 5% of requests are hedged.
+
+    Only `messages.create()` and `messages.count_tokens()` requests that don't stream
+    are hedged by default. To hedge specific calls only, derive a client with the
+    middleware:
+
+    ```py
+    hedging = HedgingMiddleware(percentile=95)
+    client.with_middleware(hedging).messages.count_tokens(...)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        min_samples: int = 20,
+        window: int = 200,
+        budget: RetryBudget | None = None,
+        paths: Iterable[str] = DEFAULT_PATHS,
+    ) -> None:
+        """
+        Args:
+            percentile: The percentile of recent response latencies after which a
+                request is hedged.
+
+            initial_delay: The delay in seconds used until `min_samples` latencies have been
+                recorded for an endpoint.
+
+            min_samples: How many latencies to record before using the percentile.
+
+            window: How many of the most recent latencies are kept per endpoint.
+
+            budget: Limits how many requests are hedged. Defaults to
+                `RetryBudget(ratio=0.05, min_retries_per_second=0.1)`.
+
+            paths: The URL paths whose non-streaming requests are hedged.
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError(f"percentile must be in (0, 100], got {percentile}")
+        if min_samples < 1:
+            raise ValueError(f"min_samples must be at least 1, got {min_samples}")
+        if window < min_samples:
+            raise ValueError(f"window must be at least min_samples ({min_samples}), got {window}")
+
+        self._percentile = percentile
+        self._initial_delay = initial_delay
+        self._min_samples = min_samples
+        self._window = window
+        self._budget = budget if budget is not None else RetryBudget(ratio=0.05, min_retries_per_second=0.1)
+        self._paths = frozenset(paths)
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, deque[float]] = {}
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    @property
+    def stats(self) -> HedgingStats:
+        with self._lock:
+            return HedgingStats(requests=self._requests, hedged=self._hedged, hedge_wins=self._hedge_wins)
+
+    def delay(self, path: str) -> float:
+        """How long a request to `path` is given to respond before it is hedged."""
+        with self._lock:
+            latencies = self._latencies.get(path)
+            if latencies is None or len(latencies) < self._min_samples:
+                return self._initial_delay
+
+            ordered = sorted(latencies)
+        # nearest rank
+        return ordered[max(0, math.ceil(self._percentile / 100 * len(ordered)) - 1)]
+
+    @override
+    def handle(self, request: APIRequest, call_next: CallNext) -> APIResponse[Any]:
+        path = self._path(request)
+        if path is None:
+            return call_next(request)
+
+        delay = self._start(path)
+        attempt_request, read_body = _until_headers(request)
+        primary = _Attempt(call_next, attempt_request)
+        attempts = {primary.future: primary}
+        done, pending = wait([primary.future], timeout=delay)
+        if not done and self._try_hedge():
+            hedge = _Attempt(call_next, attempt_request)
+            attempts[hedge.future] = hedge
+            pending.add(hedge.future)
+
+        winner: Optional[_Attempt] = None
+        while winner is None:
+            for future in done:
+                if winner is None and future.exception() is None and future.result().http_response.is_success:
+                    winner = attempts[future]
+            if winner is not None or not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+        # losing attempts are closed without their body being read, once their headers arrive
+        for future, attempt in attempts.items():
+            if attempt is not winner and (winner is not None or attempt is not primary):
+                future.add_done_callback(_close_response)
+
+        if winner is not None:
+            self._record(path, winner.elapsed, hedge=winner is not primary)
+            response = winner.future.result()
+            return _read_body(response) if read_body else response
+
+        # every attempt failed; the original attempt's failure is what the request would have seen without hedging
+        return primary.future.result()
+
+    @override
+    async def handle_async(self, request: APIRequest, call_next: AsyncCallNext) -> AsyncAPIResponse[Any]:
+        path = self._path(request)
+        if path is None:
+            return await call_next(request)
+
+        delay = self._start(path)
+        attempt_request, read_body = _until_headers(request)
+        winner: Optional[AsyncAPIResponse[Any]] = None
+        # keyed by whether the attempt is the hedge
+        failures: Dict[bool, Union[AsyncAPIResponse[Any], Exception]] = {}
+        first_done = anyio.Event()
+
+        async with anyio.create_task_group() as tg:
+
+            async def attempt(hedge: bool) -> None:
+                nonlocal winner
+                start = time.monotonic()
+                try:
+                    response = await call_next(attempt_request)
+                except Exception as exc:
+                    failures[hedge] = exc
+                else:
+                    if winner is None and response.http_response.is_success:
+                        winner = response
+                        self._record(path, time.monotonic() - start, hedge=hedge)
+                        tg.cancel_scope.cancel()
+                    elif winner is not None:
+                        await response.http_response.aclose()
+                    else:
+                        failures[hedge] = response
+                finally:
+                    first_done.set()
+
+            tg.start_soon(attempt, False)
+            with anyio.move_on_after(delay):
+                await first_done.wait()
+            if not first_done.is_set() and self._try_hedge():
+                tg.start_soon(attempt, True)
+
+        if winner is not None:
+            for failure in failures.values():
+                if not isinstance(failure, Exception):
+                    await failure.http_response.aclose()
+            return await _aread_body(winner) if read_body else winner
+
+        # every attempt failed; the original attempt's failure is what the request would have seen without hedging
+        hedge_failure = failures.pop(True, None)
+        if hedge_failure is not None and not isinstance(hedge_failure, Exception):
+            await hedge_failure.http_response.aclose()
+        failure = failures[False]
+        if isinstance(failure, Exception):
+            raise failure
+        return failure
+
+    def _path(self, request: APIRequest) -> str | None:
+        """The path the request is hedged by, `None` if it isn't hedged."""
+        if request.stream or request.method.lower() != "post":
+            return None
+        path = httpx.URL(request.url).path
+        return path if path in self._paths else None
+
+    def _start(self, path: str) -> float:
+        with self._lock:
+            self._requests += 1
+        self._budget.record_request()
+        return self.delay(path)
+
+    def _try_hedge(self) -> bool:
+        if not self._budget.try_retry():
+            log.debug("Not hedging request as the hedge budget is exhausted")
+            return False
+
+        log.debug("Hedging request after it received no response in time")
+        with self._lock:
+            self._hedged += 1
+        return True
+
+    def _record(self, path: str, latency: float, *, hedge: bool) -> None:
+        with self._lock:
+            latencies = self._latencies.get(path)
+            if latencies is None:
+                latencies = self._latencies[path] = deque(maxlen=self._window)
+            latencies.append(latency)
+            if hedge:
+                self._hedge_wins += 1
+
+
+class _Attempt:
+    """Runs `call_next(request)` in a new daemon thread, in a copy of the caller's context."""
+
+    def __init__(self, call_next: Callable[[APIRequest], APIResponse[Any]], request: APIRequest) -> None:
+        self.future: Future[APIResponse[Any]] = Future()
+        self.elapsed = 0.0
+        self._call_next = call_next
+        self._request = request
+        self._context = contextvars.copy_context()
+        threading.Thread(target=self._run, name="anthropic-hedged-request", daemon=True).start()
+
+    def _run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+
+        start = time.monotonic()
+        try:
+            response = self._context.run(self._call_next, self._request)
+        except BaseException as exc:
+            self.future.set_exception(exc)
+        else:
+            self.elapsed = time.monotonic() - start
+            self.future.set_result(response)
+
+
+def _until_headers(request: APIRequest) -> Tuple[APIRequest, bool]:
+    """The request that attempts send, which returns once the headers arrive, and whether its body is read after.
+
+    Attempts then race, and have their latency recorded, up to the response headers, and the
+    losing attempt is closed without its body being downloaded.
+    """
+    if request.headers.get(RAW_RESPONSE_HEADER) == "stream":
+        return request, False
+
+    # the body is serialized once and shared with the original request
+    options = model_copy(request.options)
+    options.headers = {**request.headers, RAW_RESPONSE_HEADER: "stream"}
+    return (
+        APIRequest(
+            options=options,
+            cast_to=request.cast_to,
+            stream=request.stream,
+            stream_cls=request.stream_cls,
+            retries_taken=request.retries_taken,
+        ),
+        True,
+    )
+
+
+def _read_body(response: APIResponse[Any]) -> APIResponse[Any]:
+    try:
+        response.http_response.read()
+    except httpx.TimeoutException as err:
+        raise APITimeoutError(request=response.http_response.request) from err
+    except httpx.HTTPError as err:
+        raise APIConnectionError(request=response.http_response.request) from err
+    return response
+
+
+async def _aread_body(response: AsyncAPIResponse[Any]) -> AsyncAPIResponse[Any]:
+    try:
+        await response.http_response.aread()
+    except httpx.TimeoutException as err:
+        raise APITimeoutError(request=response.http_response.request) from err
+    except httpx.HTTPError as err:
+        raise APIConnectionError(request=response.http_response.request) from err
+    return response
+
+
+def _close_response(future: Future[APIResponse[Any]]) -> None:
+    if future.exception() is None:
+        future.result().http_response.close()
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple, Union, Callable, Iterator, Optional, ContextManager, cast
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing_extensions import override
+
+import anyio
+import httpx
+
+from ..._utils import is_dict, is_list, asyncify
+from ..._request import APIRequest
+from ..._response import APIResponse, AsyncAPIResponse
+from ..._exceptions import AnthropicError
+from ..._middleware import CallNext, Middleware, AsyncCallNext
+
+__all__ = [
+    "RateLimitBucket",
+    "RateLimitBackend",
+    "InMemoryRateLimitBackend",
+    "FileRateLimitBackend",
+    "RateLimitMiddleware",
+]
+
+log: logging.Logger = logging.getLogger("anthropic.lib.middleware")
+
+_MESSAGES_PATH = "/v1/messages"
+
+# `anthropic-ratelimit-{dimension}-{limit,remaining}` response headers, keyed by bucket name
+_HEADER_DIMENSIONS = {
+    "requests": "requests",
+    "tokens": "tokens",
+    "input_tokens": "input-tokens",
+    "output_tokens": "output-tokens",
+}
+
+# rate limits are per minute and replenished continuously up to the limit
+_PERIOD = 60.0
+
+# images and documents are billed by size rather than by the length of their
+# base64 data, this is a rough upper bound for a single block
+_MEDIA_TOKEN_ESTIMATE = 1600
+
+
+@dataclass(frozen=True)
+class RateLimitBucket:
+    """A snapshot of one of the rate limits tracked by `RateLimitMiddleware`."""
+
+    limit: float
+    """The maximum number of requests or tokens per minute, from the `-limit` header."""
+
+    remaining: float
+    """How many are estimated to be available right now."""
+
+    refill_rate: float
+    """How many are replenished per second."""
+
+
+class _Bucket:
+    __slots__ = ("capacity", "level", "rate", "updated_at")
+
+    def __init__(self, capacity: float, level: float, rate: float, updated_at: float) -> None:
+        self.capacity = capacity
+        self.level = level
+        self.rate = rate
+        self.updated_at = updated_at
+
+    def refill(self, now: float) -> None:
+        if now > self.updated_at:
+            self.level = min(self.capacity, self.level + self.rate * (now - self.updated_at))
+            self.updated_at = now
+
+
+class _RateLimitState:
+    """The buckets shared by every request admitted through a backend; all times are `time.time()`."""
+
+    def __init__(self) -> None:
+        self.buckets: Dict[str, _Bucket] = {}
+        self.blocked_until = 0.0
+
+    def acquire(self, cost: Dict[str, float], now: float) -> float:
+        """Takes `cost` from every known bucket and returns `0`, or returns how long to wait if it can't yet."""
+        if self.blocked_until > now:
+            return self.blocked_until - now
+
+        wait = 0.0
+        amounts: List[Tuple[_Bucket, float]] = []
+        for name, amount in cost.items():
+            bucket = self.buckets.get(name)
+            if bucket is None:
+                # nothing is known about this limit until a response has reported it
+                continue
+
+            bucket.refill(now)
+            # a request larger than the whole bucket can only be sent once it's full
+            amount = min(amount, bucket.capacity)
+            if bucket.level < amount:
+                wait = max(wait, (amount - bucket.level) / bucket.rate if bucket.rate > 0 else 1.0)
+            amounts.append((bucket, amount))
+
+        if wait > 0:
+            return wait
+
+        for bucket, amount in amounts:
+            bucket.level -= amount
+        return 0.0
+
+    def observe(self, headers: httpx.Headers, now: float) -> None:
+        for name, dimension in _HEADER_DIMENSIONS.items():
+            limit = _parse_float(headers.get(f"anthropic-ratelimit-{dimension}-limit"))
+            remaining = _parse_float(headers.get(f"anthropic-ratelimit-{dimension}-remaining"))
+            if limit is None or remaining is None or limit <= 0:
+                continue
+
+            # the server's view includes other clients sharing the quota, so it replaces ours
+            self.buckets[name] = _Bucket(capacity=limit, level=remaining, rate=limit / _PERIOD, updated_at=now)
+
+        retry_after = _parse_retry_after(headers)
+        if retry_after is not None and retry_after > 0:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def snapshot(self, now: float) -> Dict[str, RateLimitBucket]:
+        snapshot: Dict[str, RateLimitBucket] = {}
+        for name, bucket in self.buckets.items():
+            bucket.refill(now)
+            snapshot[name] = RateLimitBucket(limit=bucket.capacity, remaining=bucket.level, refill_rate=bucket.rate)
+        return snapshot
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "blocked_until": self.blocked_until,
+            "buckets": {
+                name: [bucket.capacity, bucket.level, bucket.rate, bucket.updated_at]
+                for name, bucket in self.buckets.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> _RateLimitState:
+        state = cls()
+        state.blocked_until = float(data.get("blocked_until", 0.0))
+        for name, values in cast(Dict[str, List[float]], data.get("buckets", {})).items():
+            state.buckets[name] = _Bucket(*values)
+        return state
+
+
+class RateLimitBackend(ABC):
+    """Where `RateLimitMiddleware` keeps its buckets."""
+
+    @abstractmethod
+    def _locked(self) -> ContextManager[_RateLimitState]:
+        """Holds an exclusive lock on the state for the duration of the context."""
+        ...
+
+    def acquire(self, cost: Dict[str, float]) -> float:
+        with self._locked() as state:
+            return state.acquire(cost, time.time())
+
+    def observe(self, headers: httpx.Headers) -> None:
+        with self._locked() as state:
+            state.observe(headers, time.time())
+
+    def snapshot(self) -> Dict[str, RateLimitBucket]:
+        with self._locked() as state:
+            return state.snapshot(time.time())
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Keeps the buckets in memory, shared by every client in the process that uses the backend."""
+
+    def __init__(self) -> None:
+        self._state = _RateLimitState()
+        self._lock = threading.Lock()
+
+    @override
+    @contextmanager
+    def _locked(self) -> Iterator[_RateLimitState]:
+        with self._lock:
+            yield self._state
+
+
+class FileRateLimitBackend(RateLimitBackend):
+    """Keeps the buckets in a file, shared by every process on the host that uses the same `path`.
+
+    Access is serialized with an exclusive `fcntl.flock()`, so this backend is only
+    available on POSIX platforms.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        try:
+            import fcntl  # noqa: F401
+        except ImportError as exc:
+            raise AnthropicError(
+                "FileRateLimitBackend requires `fcntl`, which isn't available on this platform"
+            ) from exc
+
+        self._path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    @override
+    @contextmanager
+    def _locked(self) -> Iterator[_RateLimitState]:
+        import fcntl
+
+        # `flock()` locks are held per open file, so threads in this process also need a lock of their own
+        with self._lock, open(self._path, "a+b") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                data = f.read()
+                try:
+                    state = _RateLimitState.from_json(json.loads(data)) if data else _RateLimitState()
+                except (ValueError, TypeError):
+                    log.warning("Ignoring unreadable rate limit state in %s", self._path)
+                    state = _RateLimitState()
+
+                yield state
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state.to_json()).encode())
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class RateLimitMiddleware(Middleware):
+    """Middleware that delays `/v1/messages` requests until the rate limits reported by the API allow them.
+
+    Every response's `anthropic-ratelimit-*-limit` and `-remaining` headers reset a
+    token bucket per limit (requests, input tokens, output tokens, tokens) which then
+    refills continuously at `limit` per minute; a `retry-after` header pauses all
+    requests for that long. Before a request is sent it takes one request and its
+    estimated input tokens from the buckets, sleeping until they have refilled enough
+    if necessary, so that clients sharing a quota settle at its edge instead of
+    repeatedly hitting 429s.
+
+    Limits are only known once a response has reported them, so the first requests
+    are never delayed. Other requests, e.g. batches or token counting, have separate
+    limits and pass through untouched.
+
+    Share a `FileRateLimitBackend` to coordinate several processes on one host:
+
+    ```py
+    limiter = RateLimitMiddleware(backend=FileRateLimitBackend("/tmp/anthropic-ratelimit.json"))
+    client = Anthropic(middleware=[limiter])
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        backend: RateLimitBackend | None = None,
+        estimate_input_tokens: Callable[[Dict[str, Any]], float] | None = None,
+    ) -> None:
+        """
+        Args:
+            backend: Where the buckets are kept. Defaults to a new `InMemoryRateLimitBackend`;
+                pass the same backend to several middleware instances to share their limits.
+
+            estimate_input_tokens: Estimates the input tokens of a request from its JSON body.
+                Defaults to a character count based heuristic; `messages.count_tokens()` results
+                can be used for exact accounting.
+        """
+        self._backend = backend if backend is not None else InMemoryRateLimitBackend()
+        self._estimate_input_tokens = estimate_input_tokens or estimate_input_tokens_from_length
+
+    @property
+    def backend(self) -> RateLimitBackend:
+        return self._backend
+
+    @property
+    def buckets(self) -> Dict[str, RateLimitBucket]:
+        """The current state of every rate limit reported so far, keyed by `requests`, `input_tokens`, etc."""
+        return self._backend.snapshot()
+
+    @override
+    def handle(self, request: APIRequest, call_next: CallNext) -> APIResponse[Any]:
+        cost = self._cost(request)
+        if cost is None:
+            return call_next(request)
+
+        while True:
+            wait = self._backend.acquire(cost)
+            if wait <= 0:
+                break
+            log.debug("Delaying request by %.3f seconds to stay within rate limits", wait)
+            time.sleep(wait)
+
+        response = call_next(request)
+        self._backend.observe(response.headers)
+        return response
+
+    @override
+    async def handle_async(self, request: APIRequest, call_next: AsyncCallNext) -> AsyncAPIResponse[Any]:
+        cost = self._cost(request)
+        if cost is None:
+            return await call_next(request)
+
+        # backends may block, e.g. on `FileRateLimitBackend`'s file lock, so they're called on a worker thread
+        while True:
+            wait = await asyncify(self._backend.acquire)(cost)
+            if wait <= 0:
+                break
+            log.debug("Delaying request by %.3f seconds to stay within rate limits", wait)
+            await anyio.sleep(wait)
+
+        response = await call_next(request)
+        await asyncify(self._backend.observe)(response.headers)
+        return response
+
+    def _cost(self, request: APIRequest) -> Dict[str, float] | None:
+        """What admitting the request takes from each bucket, `None` if it isn't rate limited here."""
+        body = request.json
+        if request.method.lower() != "post" or httpx.URL(request.url).path != _MESSAGES_PATH or not is_dict(body):
+            return None
+
+        input_tokens = self._estimate_input_tokens(cast(Dict[str, Any], body))
+        return {
+            "requests": 1,
+            "input_tokens": input_tokens,
+            "tokens": input_tokens,
+            # output tokens are only known once the response is done, but an exhausted
+            # bucket still means the request would be rejected
+            "output_tokens": 1,
+        }
+
+
+def estimate_input_tokens_from_length(body: Dict[str, Any]) -> float:
+    """A rough estimate of a request's input tokens, at four characters per token."""
+    return max(1.0, _count_chars([body.get("system"), body.get("messages"), body.get("tools")]) / 4)
+
+
+def _count_chars(value: object) -> float:
+    if isinstance(value, str):
+        return len(value)
+    if is_dict(value):
+        if value.get("type") == "base64":
+            return _MEDIA_TOKEN_ESTIMATE * 4
+        return sum(_count_chars(item) for item in value.values())
+    if is_list(value):
+        return sum(_count_chars(item) for item in value)
+    return 0
+
+
+def _parse_float(value: Optional[str]) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(headers: httpx.Headers) -> float | None:
+    retry_after_ms = _parse_float(headers.get("retry-after-ms"))
+    if retry_after_ms is not None:
+        return retry_after_ms / 1000
+    return _parse_float(headers.get("retry-after"))
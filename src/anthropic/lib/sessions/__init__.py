@@ -1,6 +1,7 @@
-from ._accumulate import AccumulatedEvent, accumulate_managed_agents_event
+from ._accumulate import AccumulatedEvent, AgentMessageAccumulator, accumulate_managed_agents_event
 
 __all__ = [
     "AccumulatedEvent",
+    "AgentMessageAccumulator",
     "accumulate_managed_agents_event",
 ]
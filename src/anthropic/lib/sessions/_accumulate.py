@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, Dict, List, overload
 from datetime import datetime, timezone
 from typing_extensions import TypeAlias, assert_never
 
 from ..._compat import model_copy
 from ..._models import build
 from ..._exceptions import AnthropicError
-from ...types.beta.sessions import BetaManagedAgentsAgentMessageEvent, BetaManagedAgentsStreamSessionEvents
+from ...types.beta.sessions import (
+    BetaManagedAgentsAgentMessageEvent,
+    BetaManagedAgentsStreamSessionEvents,
+)
 
-__all__ = ["AccumulatedEvent", "accumulate_managed_agents_event"]
+__all__ = ["AccumulatedEvent", "AgentMessageAccumulator", "accumulate_managed_agents_event"]
 
 AccumulatedEvent: TypeAlias = BetaManagedAgentsAgentMessageEvent
 
@@ -18,6 +21,157 @@ AccumulatedEvent: TypeAlias = BetaManagedAgentsAgentMessageEvent
 _UNPROCESSED = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
+class AgentMessageAccumulator:
+    """Folds the ``event_start`` / ``event_delta`` previews of an ``agent.message``
+    into a snapshot, buffering the text of each delta instead of rebuilding the
+    snapshot on every one.
+
+    :func:`accumulate_managed_agents_event` returns a fresh snapshot per delta,
+    copying the content list and the growing text each time, so a long preview
+    costs time quadratic in its length. This class appends each fragment to a
+    per-index chunk buffer and only builds the snapshot when :attr:`snapshot` is
+    read (or the buffered final event replaces it). Each built snapshot is a new
+    object that later deltas don't mutate::
+
+        accumulator = AgentMessageAccumulator()
+        for event in stream:
+            accumulator.accumulate(event)
+        message = accumulator.snapshot
+
+    Events are handled as described on :func:`accumulate_managed_agents_event`.
+    Keep one accumulator per previewed event id.
+    """
+
+    def __init__(self, snapshot: AccumulatedEvent | None = None) -> None:
+        self._snapshot = snapshot
+        self._content = list(snapshot.content) if snapshot is not None else []
+        # Text appended to the text block at each index since the last build.
+        self._chunks: Dict[int, List[str]] = {}
+        self._stale = False
+
+    @property
+    def snapshot(self) -> AccumulatedEvent | None:
+        """The ``agent.message`` accumulated so far, or ``None`` before its ``event_start``."""
+        if self._stale:
+            assert self._snapshot is not None
+            for idx, chunks in self._chunks.items():
+                block = self._content[idx]
+                assert block.type == "text"
+                updated = model_copy(block)
+                updated.text = block.text + "".join(chunks)
+                self._content[idx] = updated
+            self._chunks.clear()
+            snapshot = model_copy(self._snapshot)
+            snapshot.content = list(self._content)
+            self._snapshot = snapshot
+            self._stale = False
+        return self._snapshot
+
+    def accumulate(self, event: BetaManagedAgentsStreamSessionEvents) -> None:
+        """Fold one stream event into the snapshot."""
+
+        if event.type == "event_start":
+            if event.event.type == "agent.message":
+                self._reset(
+                    build(
+                        BetaManagedAgentsAgentMessageEvent,
+                        id=event.event.id,
+                        type="agent.message",
+                        content=[],
+                        processed_at=_UNPROCESSED,
+                    )
+                )
+            elif event.event.type == "agent.thinking":
+                # This helper only tracks agent.message previews; agent.thinking
+                # previews are start-only and have no deltas to fold.
+                pass
+            else:
+                # we only want exhaustive checking for linters, not at runtime
+                if TYPE_CHECKING:  # type: ignore[unreachable]
+                    assert_never(event.event)
+
+        elif event.type == "agent.message":
+            self._reset(model_copy(event, deep=True))
+
+        elif event.type == "event_delta":
+            if self._snapshot is None:
+                raise AnthropicError(f"event_delta for {event.event_id} received before its event_start")
+
+            idx = event.delta.index
+            if idx is None:
+                idx = 0
+            fragment = event.delta.content
+
+            # Indices arrive in order — the first delta at a new index opens the slot.
+            # A gap means deltas arrived out of order or were mis-routed.
+            if idx > len(self._content):
+                raise AnthropicError(
+                    f"event_delta index {idx} is beyond the end of content (length {len(self._content)})",
+                )
+
+            if idx == len(self._content):
+                # New index: pass the fragment through as a fresh block.
+                self._content.append(model_copy(fragment))
+            else:
+                existing = self._content[idx]
+                if fragment.type == "text":
+                    if existing.type == "text":
+                        self._chunks.setdefault(idx, []).append(fragment.text)
+                else:
+                    # we only want exhaustive checking for linters, not at runtime
+                    if TYPE_CHECKING:  # type: ignore[unreachable]
+                        assert_never(fragment.type)
+            self._stale = True
+
+        elif (
+            event.type == "user.message"
+            or event.type == "user.interrupt"
+            or event.type == "user.tool_confirmation"
+            or event.type == "user.tool_result"
+            or event.type == "user.custom_tool_result"
+            or event.type == "user.define_outcome"
+            or event.type == "agent.thinking"
+            or event.type == "agent.tool_use"
+            or event.type == "agent.tool_result"
+            or event.type == "agent.custom_tool_use"
+            or event.type == "agent.mcp_tool_use"
+            or event.type == "agent.mcp_tool_result"
+            or event.type == "agent.thread_message_received"
+            or event.type == "agent.thread_message_sent"
+            or event.type == "agent.thread_context_compacted"
+            or event.type == "session.error"
+            or event.type == "session.updated"
+            or event.type == "session.deleted"
+            or event.type == "session.usage"
+            or event.type == "session.status_running"
+            or event.type == "session.status_idle"
+            or event.type == "session.status_rescheduled"
+            or event.type == "session.status_terminated"
+            or event.type == "session.thread_created"
+            or event.type == "session.thread_status_running"
+            or event.type == "session.thread_status_idle"
+            or event.type == "session.thread_status_rescheduled"
+            or event.type == "session.thread_status_terminated"
+            or event.type == "span.model_request_start"
+            or event.type == "span.model_request_end"
+            or event.type == "span.outcome_evaluation_start"
+            or event.type == "span.outcome_evaluation_ongoing"
+            or event.type == "span.outcome_evaluation_end"
+            or event.type == "system.message"
+        ):
+            pass
+        else:
+            # we only want exhaustive checking for linters, not at runtime
+            if TYPE_CHECKING:  # type: ignore[unreachable]
+                assert_never(event)
+
+    def _reset(self, snapshot: AccumulatedEvent) -> None:
+        self._snapshot = snapshot
+        self._content = list(snapshot.content)
+        self._chunks.clear()
+        self._stale = False
+
+
 @overload
 def accumulate_managed_agents_event(
     accumulated: AccumulatedEvent | None,
@@ -37,7 +191,9 @@ def accumulate_managed_agents_event(
     event: BetaManagedAgentsStreamSessionEvents,
 ) -> AccumulatedEvent | None:
     """Fold one preview event into an ``agent.message`` snapshot. Returns a fresh
-    snapshot — the ``accumulated`` argument is never mutated.
+    snapshot — the ``accumulated`` argument is never mutated. Folding a long
+    preview this way copies the snapshot on every delta; use
+    :class:`AgentMessageAccumulator` to build it once at the end instead.
 
     - ``event_start`` opens the preview: a new snapshot with empty content is
       returned (so ``accumulated`` may be ``None``). Its ``processed_at`` is an
@@ -55,103 +211,6 @@ def accumulate_managed_agents_event(
     - ``agent.message`` is the buffered final event: a copy of it is returned,
       replacing whatever the preview had accumulated.
     """
-    if event.type == "event_start":
-        if event.event.type == "agent.message":
-            return build(
-                BetaManagedAgentsAgentMessageEvent,
-                id=event.event.id,
-                type="agent.message",
-                content=[],
-                processed_at=_UNPROCESSED,
-            )
-        elif event.event.type == "agent.thinking":
-            # This helper only tracks agent.message previews; agent.thinking
-            # previews are start-only and have no deltas to fold.
-            return accumulated
-        else:
-            # we only want exhaustive checking for linters, not at runtime
-            if TYPE_CHECKING:  # type: ignore[unreachable]
-                assert_never(event.event)
-            return accumulated
-
-    elif event.type == "agent.message":
-        return model_copy(event, deep=True)
-
-    elif event.type == "event_delta":
-        if accumulated is None:
-            raise AnthropicError(f"event_delta for {event.event_id} received before its event_start")
-
-        idx = event.delta.index
-        if idx is None:
-            idx = 0
-        fragment = event.delta.content
-
-        # Indices arrive in order — the first delta at a new index opens the slot.
-        # A gap means deltas arrived out of order or were mis-routed.
-        if idx > len(accumulated.content):
-            raise AnthropicError(
-                f"event_delta index {idx} is beyond the end of content (length {len(accumulated.content)})",
-            )
-
-        content = list(accumulated.content)
-        if idx == len(content):
-            # New index: pass the fragment through as a fresh block.
-            content.append(model_copy(fragment))
-        else:
-            existing = content[idx]
-            if fragment.type == "text":
-                if existing.type == "text":
-                    updated = model_copy(existing)
-                    updated.text = existing.text + fragment.text
-                    content[idx] = updated
-            else:
-                # we only want exhaustive checking for linters, not at runtime
-                if TYPE_CHECKING:  # type: ignore[unreachable]
-                    assert_never(fragment.type)
-
-        snapshot = model_copy(accumulated)
-        snapshot.content = content
-        return snapshot
-
-    elif (
-        event.type == "user.message"
-        or event.type == "user.interrupt"
-        or event.type == "user.tool_confirmation"
-        or event.type == "user.tool_result"
-        or event.type == "user.custom_tool_result"
-        or event.type == "user.define_outcome"
-        or event.type == "agent.thinking"
-        or event.type == "agent.tool_use"
-        or event.type == "agent.tool_result"
-        or event.type == "agent.custom_tool_use"
-        or event.type == "agent.mcp_tool_use"
-        or event.type == "agent.mcp_tool_result"
-        or event.type == "agent.thread_message_received"
-        or event.type == "agent.thread_message_sent"
-        or event.type == "agent.thread_context_compacted"
-        or event.type == "session.error"
-        or event.type == "session.updated"
-        or event.type == "session.deleted"
-        or event.type == "session.usage"
-        or event.type == "session.status_running"
-        or event.type == "session.status_idle"
-        or event.type == "session.status_rescheduled"
-        or event.type == "session.status_terminated"
-        or event.type == "session.thread_created"
-        or event.type == "session.thread_status_running"
-        or event.type == "session.thread_status_idle"
-        or event.type == "session.thread_status_rescheduled"
-        or event.type == "session.thread_status_terminated"
-        or event.type == "span.model_request_start"
-        or event.type == "span.model_request_end"
-        or event.type == "span.outcome_evaluation_start"
-        or event.type == "span.outcome_evaluation_ongoing"
-        or event.type == "span.outcome_evaluation_end"
-        or event.type == "system.message"
-    ):
-        return accumulated
-    else:
-        # we only want exhaustive checking for linters, not at runtime
-        if TYPE_CHECKING:  # type: ignore[unreachable]
-            assert_never(event)
-        return accumulated
+    accumulator = AgentMessageAccumulator(accumulated)
+    accumulator.accumulate(event)
+    return accumulator.snapshot
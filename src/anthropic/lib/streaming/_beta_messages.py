@@ -3,6 +3,7 @@ from __future__ import annotations
 import builtins
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Type, Generic, Callable, cast
+from functools import partial
 from typing_extensions import Self, Iterator, Awaitable, AsyncIterator, assert_never
 
 import httpx
@@ -14,6 +15,7 @@ from anthropic.types.beta.beta_server_tool_use_block import BetaServerToolUseBlo
 
 from ..._types import NOT_GIVEN, NotGiven
 from ..._utils import consume_sync_iterator, consume_async_iterator
+from ._pending import JSON_BUF_PROPERTY, PendingDeltas, LazySnapshotEvent
 from ..._models import build, construct_type, construct_type_unchecked
 from ._beta_types import (
     BetaCitationEvent,
@@ -48,12 +50,20 @@ class BetaMessageStream(Generic[ResponseFormatT]):
         self,
         raw_stream: Stream[BetaRawMessageStreamEvent],
         output_format: ResponseFormatT | NotGiven,
+        *,
+        lazy_snapshot: bool = False,
     ) -> None:
         self._raw_stream = raw_stream
+        self.__accumulated = self.__accumulate__()
         self.text_stream = self.__stream_text__()
         self._iterator = self.__stream__()
         self.__final_message_snapshot: ParsedBetaMessage[ResponseFormatT] | None = None
         self.__output_format = output_format
+        self.__pending = (
+            PendingDeltas(parse_json=partial(parse_tool_input, request_headers=self.response.request.headers))
+            if lazy_snapshot
+            else None
+        )
 
     @property
     def response(self) -> httpx.Response:
@@ -94,8 +104,7 @@ class BetaMessageStream(Generic[ResponseFormatT]):
         the accumulated `Message` object.
         """
         self.until_done()
-        assert self.__final_message_snapshot is not None
-        return self.__final_message_snapshot
+        return self.current_message_snapshot
 
     def get_final_text(self) -> str:
         """Returns all `text` content blocks concatenated together.
@@ -120,29 +129,42 @@ class BetaMessageStream(Generic[ResponseFormatT]):
 
     def until_done(self) -> None:
         """Blocks until the stream has been consumed"""
-        consume_sync_iterator(self)
+        # nothing observes the higher-level events here so we only need to accumulate the snapshot
+        consume_sync_iterator(self.__accumulated)
 
     # properties
     @property
     def current_message_snapshot(self) -> ParsedBetaMessage[ResponseFormatT]:
         assert self.__final_message_snapshot is not None
+        if self.__pending:
+            self.__pending.flush(self.__final_message_snapshot.content)
         return self.__final_message_snapshot
 
-    def __stream__(self) -> Iterator[ParsedBetaMessageStreamEvent[ResponseFormatT]]:
+    def __accumulate__(self) -> Iterator[BetaRawMessageStreamEvent]:
         for sse_event in self._raw_stream:
             self.__final_message_snapshot = accumulate_event(
                 event=sse_event,
                 current_snapshot=self.__final_message_snapshot,
                 request_headers=self.response.request.headers,
                 output_format=self.__output_format,
+                pending=self.__pending,
             )
 
-            events_to_fire = build_events(event=sse_event, message_snapshot=self.current_message_snapshot)
+            yield sse_event
+
+    def __stream__(self) -> Iterator[ParsedBetaMessageStreamEvent[ResponseFormatT]]:
+        for sse_event in self.__accumulated:
+            # the snapshot isn't flushed here, events build their own `snapshot` from the
+            # pending deltas when it's read
+            assert self.__final_message_snapshot is not None
+            events_to_fire = build_events(
+                event=sse_event, message_snapshot=self.__final_message_snapshot, pending=self.__pending
+            )
             for event in events_to_fire:
                 yield event
 
     def __stream_text__(self) -> Iterator[str]:
-        for chunk in self:
+        for chunk in self.__accumulated:
             if chunk.type == "content_block_delta" and chunk.delta.type == "text_delta":
                 yield chunk.delta.text
 
@@ -162,14 +184,18 @@ class BetaMessageStreamManager(Generic[ResponseFormatT]):
         api_request: Callable[[], Stream[BetaRawMessageStreamEvent]],
         *,
         output_format: ResponseFormatT | NotGiven,
+        lazy_snapshot: bool = False,
     ) -> None:
         self.__stream: BetaMessageStream[ResponseFormatT] | None = None
         self.__api_request = api_request
         self.__output_format = output_format
+        self.__lazy_snapshot = lazy_snapshot
 
     def __enter__(self) -> BetaMessageStream[ResponseFormatT]:
         raw_stream = self.__api_request()
-        self.__stream = BetaMessageStream(raw_stream, output_format=self.__output_format)
+        self.__stream = BetaMessageStream(
+            raw_stream, output_format=self.__output_format, lazy_snapshot=self.__lazy_snapshot
+        )
         return self.__stream
 
     def __exit__(
@@ -197,12 +223,20 @@ class BetaAsyncMessageStream(Generic[ResponseFormatT]):
         self,
         raw_stream: AsyncStream[BetaRawMessageStreamEvent],
         output_format: ResponseFormatT | NotGiven,
+        *,
+        lazy_snapshot: bool = False,
     ) -> None:
         self._raw_stream = raw_stream
+        self.__accumulated = self.__accumulate__()
         self.text_stream = self.__stream_text__()
         self._iterator = self.__stream__()
         self.__final_message_snapshot: ParsedBetaMessage[ResponseFormatT] | None = None
         self.__output_format = output_format
+        self.__pending = (
+            PendingDeltas(parse_json=partial(parse_tool_input, request_headers=self.response.request.headers))
+            if lazy_snapshot
+            else None
+        )
 
     @property
     def response(self) -> httpx.Response:
@@ -243,8 +277,7 @@ class BetaAsyncMessageStream(Generic[ResponseFormatT]):
         the accumulated `Message` object.
         """
         await self.until_done()
-        assert self.__final_message_snapshot is not None
-        return self.__final_message_snapshot
+        return self.current_message_snapshot
 
     async def get_final_text(self) -> str:
         """Returns all `text` content blocks concatenated together.
@@ -269,29 +302,42 @@ class BetaAsyncMessageStream(Generic[ResponseFormatT]):
 
     async def until_done(self) -> None:
         """Waits until the stream has been consumed"""
-        await consume_async_iterator(self)
+        # nothing observes the higher-level events here so we only need to accumulate the snapshot
+        await consume_async_iterator(self.__accumulated)
 
     # properties
     @property
     def current_message_snapshot(self) -> ParsedBetaMessage[ResponseFormatT]:
         assert self.__final_message_snapshot is not None
+        if self.__pending:
+            self.__pending.flush(self.__final_message_snapshot.content)
         return self.__final_message_snapshot
 
-    async def __stream__(self) -> AsyncIterator[ParsedBetaMessageStreamEvent[ResponseFormatT]]:
+    async def __accumulate__(self) -> AsyncIterator[BetaRawMessageStreamEvent]:
         async for sse_event in self._raw_stream:
             self.__final_message_snapshot = accumulate_event(
                 event=sse_event,
                 current_snapshot=self.__final_message_snapshot,
                 request_headers=self.response.request.headers,
                 output_format=self.__output_format,
+                pending=self.__pending,
             )
 
-            events_to_fire = build_events(event=sse_event, message_snapshot=self.current_message_snapshot)
+            yield sse_event
+
+    async def __stream__(self) -> AsyncIterator[ParsedBetaMessageStreamEvent[ResponseFormatT]]:
+        async for sse_event in self.__accumulated:
+            # the snapshot isn't flushed here, events build their own `snapshot` from the
+            # pending deltas when it's read
+            assert self.__final_message_snapshot is not None
+            events_to_fire = build_events(
+                event=sse_event, message_snapshot=self.__final_message_snapshot, pending=self.__pending
+            )
             for event in events_to_fire:
                 yield event
 
     async def __stream_text__(self) -> AsyncIterator[str]:
-        async for chunk in self:
+        async for chunk in self.__accumulated:
             if chunk.type == "content_block_delta" and chunk.delta.type == "text_delta":
                 yield chunk.delta.text
 
@@ -313,14 +359,18 @@ class BetaAsyncMessageStreamManager(Generic[ResponseFormatT]):
         api_request: Awaitable[AsyncStream[BetaRawMessageStreamEvent]],
         *,
         output_format: ResponseFormatT | NotGiven = NOT_GIVEN,
+        lazy_snapshot: bool = False,
     ) -> None:
         self.__stream: BetaAsyncMessageStream[ResponseFormatT] | None = None
         self.__api_request = api_request
         self.__output_format = output_format
+        self.__lazy_snapshot = lazy_snapshot
 
     async def __aenter__(self) -> BetaAsyncMessageStream[ResponseFormatT]:
         raw_stream = await self.__api_request
-        self.__stream = BetaAsyncMessageStream(raw_stream, output_format=self.__output_format)
+        self.__stream = BetaAsyncMessageStream(
+            raw_stream, output_format=self.__output_format, lazy_snapshot=self.__lazy_snapshot
+        )
         return self.__stream
 
     async def __aexit__(
@@ -333,10 +383,23 @@ class BetaAsyncMessageStreamManager(Generic[ResponseFormatT]):
             await self.__stream.close()
 
 
+class _LazyParsedBetaTextEvent(LazySnapshotEvent, ParsedBetaTextEvent):
+    pass
+
+
+class _LazyBetaInputJsonEvent(LazySnapshotEvent, BetaInputJsonEvent):
+    pass
+
+
+class _LazyBetaThinkingEvent(LazySnapshotEvent, BetaThinkingEvent):
+    pass
+
+
 def build_events(
     *,
     event: BetaRawMessageStreamEvent,
     message_snapshot: ParsedBetaMessage[ResponseFormatT],
+    pending: PendingDeltas | None = None,
 ) -> list[ParsedBetaMessageStreamEvent[ResponseFormatT]]:
     events_to_fire: list[ParsedBetaMessageStreamEvent[ResponseFormatT]] = []
 
@@ -356,24 +419,42 @@ def build_events(
         content_block = message_snapshot.content[event.index]
         if event.delta.type == "text_delta":
             if content_block.type == "text":
-                events_to_fire.append(
-                    build(
-                        ParsedBetaTextEvent,
-                        type="text",
-                        text=event.delta.text,
-                        snapshot=content_block.text,
+                if pending is not None:
+                    events_to_fire.append(
+                        _LazyParsedBetaTextEvent.lazy(
+                            pending.text_snapshot(event.index, content_block.text),
+                            type="text",
+                            text=event.delta.text,
+                        )
+                    )
+                else:
+                    events_to_fire.append(
+                        build(
+                            ParsedBetaTextEvent,
+                            type="text",
+                            text=event.delta.text,
+                            snapshot=content_block.text,
+                        )
                     )
-                )
         elif event.delta.type == "input_json_delta":
             if content_block.type == "tool_use" or content_block.type == "mcp_tool_use":
-                events_to_fire.append(
-                    build(
-                        BetaInputJsonEvent,
-                        type="input_json",
-                        partial_json=event.delta.partial_json,
-                        snapshot=content_block.input,
+                if pending is not None:
+                    events_to_fire.append(
+                        _LazyBetaInputJsonEvent.lazy(
+                            pending.json_snapshot(event.index, content=content_block),
+                            type="input_json",
+                            partial_json=event.delta.partial_json,
+                        )
+                    )
+                else:
+                    events_to_fire.append(
+                        build(
+                            BetaInputJsonEvent,
+                            type="input_json",
+                            partial_json=event.delta.partial_json,
+                            snapshot=content_block.input,
+                        )
                     )
-                )
         elif event.delta.type == "citations_delta":
             if content_block.type == "text":
                 events_to_fire.append(
@@ -386,14 +467,23 @@ def build_events(
                 )
         elif event.delta.type == "thinking_delta":
             if content_block.type == "thinking":
-                events_to_fire.append(
-                    build(
-                        BetaThinkingEvent,
-                        type="thinking",
-                        thinking=event.delta.thinking,
-                        snapshot=content_block.thinking,
+                if pending is not None:
+                    events_to_fire.append(
+                        _LazyBetaThinkingEvent.lazy(
+                            pending.thinking_snapshot(event.index, content_block.thinking),
+                            type="thinking",
+                            thinking=event.delta.thinking,
+                        )
+                    )
+                else:
+                    events_to_fire.append(
+                        build(
+                            BetaThinkingEvent,
+                            type="thinking",
+                            thinking=event.delta.thinking,
+                            snapshot=content_block.thinking,
+                        )
                     )
-                )
         elif event.delta.type == "signature_delta":
             if content_block.type == "thinking":
                 events_to_fire.append(
@@ -437,8 +527,6 @@ def build_events(
     return events_to_fire
 
 
-JSON_BUF_PROPERTY = "__json_buf"
-
 TRACKS_TOOL_INPUT = (
     BetaToolUseBlock,
     BetaServerToolUseBlock,
@@ -452,7 +540,13 @@ def accumulate_event(
     current_snapshot: ParsedBetaMessage[ResponseFormatT] | None,
     request_headers: httpx.Headers,
     output_format: ResponseFormatT | NotGiven = NOT_GIVEN,
+    pending: PendingDeltas | None = None,
 ) -> ParsedBetaMessage[ResponseFormatT]:
+    """Apply `event` to the message snapshot, returning the updated snapshot.
+
+    If `pending` is given, text, thinking and tool input deltas are buffered in it instead of
+    being applied straight away, see `PendingDeltas` for details.
+    """
     if not isinstance(cast(Any, event), BaseModel):
         event = cast(  # pyright: ignore[reportUnnecessaryCast]
             BetaRawMessageStreamEvent,
@@ -490,31 +584,25 @@ def accumulate_event(
         content = current_snapshot.content[event.index]
         if event.delta.type == "text_delta":
             if content.type == "text":
-                content.text += event.delta.text
+                if pending is not None:
+                    pending.add_text(event.index, event.delta.text)
+                else:
+                    content.text += event.delta.text
         elif event.delta.type == "input_json_delta":
             if isinstance(content, TRACKS_TOOL_INPUT):
-                from jiter import from_json
-
-                # we need to keep track of the raw JSON string as well so that we can
-                # re-parse it for each delta, for now we just store it as an untyped
-                # property on the snapshot
-                json_buf = cast(bytes, getattr(content, JSON_BUF_PROPERTY, b""))
-                json_buf += bytes(event.delta.partial_json, "utf-8")
-
-                if json_buf:
-                    try:
-                        anthropic_beta = request_headers.get("anthropic-beta", "") if request_headers else ""
-
-                        if "fine-grained-tool-streaming-2025-05-14" in anthropic_beta:
-                            content.input = from_json(json_buf, partial_mode="trailing-strings")
-                        else:
-                            content.input = from_json(json_buf, partial_mode=True)
-                    except ValueError as e:
-                        raise ValueError(
-                            f"Unable to parse tool parameter JSON from model. Please retry your request or adjust your prompt. Error: {e}. JSON: {json_buf.decode('utf-8')}"
-                        ) from e
-
-                setattr(content, JSON_BUF_PROPERTY, json_buf)
+                if pending is not None:
+                    pending.add_json(event.index, event.delta.partial_json, content=content)
+                else:
+                    # we need to keep track of the raw JSON string as well so that we can
+                    # re-parse it for each delta, for now we just store it as an untyped
+                    # property on the snapshot
+                    json_buf = cast(bytes, getattr(content, JSON_BUF_PROPERTY, b""))
+                    json_buf += bytes(event.delta.partial_json, "utf-8")
+
+                    if json_buf:
+                        content.input = parse_tool_input(json_buf, request_headers=request_headers)
+
+                    setattr(content, JSON_BUF_PROPERTY, json_buf)
         elif event.delta.type == "citations_delta":
             if content.type == "text":
                 if not content.citations:
@@ -523,7 +611,10 @@ def accumulate_event(
                     content.citations.append(event.delta.citation)
         elif event.delta.type == "thinking_delta":
             if content.type == "thinking":
-                content.thinking += event.delta.thinking
+                if pending is not None:
+                    pending.add_thinking(event.index, event.delta.thinking)
+                else:
+                    content.thinking += event.delta.thinking
         elif event.delta.type == "signature_delta":
             if content.type == "thinking":
                 content.signature = event.delta.signature
@@ -536,6 +627,9 @@ def accumulate_event(
             if TYPE_CHECKING:  # type: ignore[unreachable]
                 assert_never(event.delta)
     elif event.type == "content_block_stop":
+        if pending is not None:
+            pending.flush_block(current_snapshot.content, event.index)
+
         content_block = current_snapshot.content[event.index]
         if content_block.type == "text" and is_given(output_format):
             content_block.parsed_output = parse_text(content_block.text, output_format)
@@ -561,5 +655,23 @@ def accumulate_event(
             current_snapshot.usage.iterations = event.usage.iterations
         if event.usage.fallback_credit is not None:
             current_snapshot.usage.fallback_credit = event.usage.fallback_credit
+    elif event.type == "message_stop":
+        if pending is not None:
+            pending.flush(current_snapshot.content)
 
     return current_snapshot
+
+
+def parse_tool_input(json_buf: bytes, *, request_headers: httpx.Headers | None) -> Any:
+    from jiter import from_json
+
+    try:
+        anthropic_beta = request_headers.get("anthropic-beta", "") if request_headers else ""
+
+        if "fine-grained-tool-streaming-2025-05-14" in anthropic_beta:
+            return from_json(json_buf, partial_mode="trailing-strings")
+        return from_json(json_buf, partial_mode=True)
+    except ValueError as e:
+        raise ValueError(
+            f"Unable to parse tool parameter JSON from model. Please retry your request or adjust your prompt. Error: {e}. JSON: {json_buf.decode('utf-8')}"
+        ) from e
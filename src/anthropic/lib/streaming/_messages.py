@@ -23,6 +23,7 @@ from ._types import (
 from ...types import RawMessageStreamEvent
 from ..._types import NOT_GIVEN, NotGiven
 from ..._utils import consume_sync_iterator, consume_async_iterator
+from ._pending import JSON_BUF_PROPERTY, PendingDeltas, LazySnapshotEvent
 from ..._models import build, construct_type, construct_type_unchecked
 from ..._streaming import Stream, AsyncStream
 from ..._utils._utils import is_given
@@ -45,12 +46,16 @@ class MessageStream(Generic[ResponseFormatT]):
         self,
         raw_stream: Stream[RawMessageStreamEvent],
         output_format: ResponseFormatT | NotGiven,
+        *,
+        lazy_snapshot: bool = False,
     ) -> None:
         self._raw_stream = raw_stream
+        self.__accumulated = self.__accumulate__()
         self.text_stream = self.__stream_text__()
         self._iterator = self.__stream__()
         self.__final_message_snapshot: ParsedMessage[ResponseFormatT] | None = None
         self.__output_format = output_format
+        self.__pending = PendingDeltas(parse_json=parse_tool_input) if lazy_snapshot else None
 
     @property
     def response(self) -> httpx.Response:
@@ -91,8 +96,7 @@ class MessageStream(Generic[ResponseFormatT]):
         the accumulated `Message` object.
         """
         self.until_done()
-        assert self.__final_message_snapshot is not None
-        return self.__final_message_snapshot
+        return self.current_message_snapshot
 
     def get_final_text(self) -> str:
         """Returns all `text` content blocks concatenated together.
@@ -117,28 +121,41 @@ class MessageStream(Generic[ResponseFormatT]):
 
     def until_done(self) -> None:
         """Blocks until the stream has been consumed"""
-        consume_sync_iterator(self)
+        # nothing observes the higher-level events here so we only need to accumulate the snapshot
+        consume_sync_iterator(self.__accumulated)
 
     # properties
     @property
     def current_message_snapshot(self) -> ParsedMessage[ResponseFormatT]:
         assert self.__final_message_snapshot is not None
+        if self.__pending:
+            self.__pending.flush(self.__final_message_snapshot.content)
         return self.__final_message_snapshot
 
-    def __stream__(self) -> Iterator[ParsedMessageStreamEvent[ResponseFormatT]]:
+    def __accumulate__(self) -> Iterator[RawMessageStreamEvent]:
         for sse_event in self._raw_stream:
             self.__final_message_snapshot = accumulate_event(
                 event=sse_event,
                 current_snapshot=self.__final_message_snapshot,
                 output_format=self.__output_format,
+                pending=self.__pending,
             )
 
-            events_to_fire = build_events(event=sse_event, message_snapshot=self.current_message_snapshot)
+            yield sse_event
+
+    def __stream__(self) -> Iterator[ParsedMessageStreamEvent[ResponseFormatT]]:
+        for sse_event in self.__accumulated:
+            # the snapshot isn't flushed here, events build their own `snapshot` from the
+            # pending deltas when it's read
+            assert self.__final_message_snapshot is not None
+            events_to_fire = build_events(
+                event=sse_event, message_snapshot=self.__final_message_snapshot, pending=self.__pending
+            )
             for event in events_to_fire:
                 yield event
 
     def __stream_text__(self) -> Iterator[str]:
-        for chunk in self:
+        for chunk in self.__accumulated:
             if chunk.type == "content_block_delta" and chunk.delta.type == "text_delta":
                 yield chunk.delta.text
 
@@ -158,14 +175,18 @@ class MessageStreamManager(Generic[ResponseFormatT]):
         api_request: Callable[[], Stream[RawMessageStreamEvent]],
         *,
         output_format: ResponseFormatT | NotGiven,
+        lazy_snapshot: bool = False,
     ) -> None:
         self.__stream: MessageStream[ResponseFormatT] | None = None
         self.__api_request = api_request
         self.__output_format = output_format
+        self.__lazy_snapshot = lazy_snapshot
 
     def __enter__(self) -> MessageStream[ResponseFormatT]:
         raw_stream = self.__api_request()
-        self.__stream = MessageStream(raw_stream, output_format=self.__output_format)
+        self.__stream = MessageStream(
+            raw_stream, output_format=self.__output_format, lazy_snapshot=self.__lazy_snapshot
+        )
         return self.__stream
 
     def __exit__(
@@ -193,12 +214,16 @@ class AsyncMessageStream(Generic[ResponseFormatT]):
         self,
         raw_stream: AsyncStream[RawMessageStreamEvent],
         output_format: ResponseFormatT | NotGiven,
+        *,
+        lazy_snapshot: bool = False,
     ) -> None:
         self._raw_stream = raw_stream
+        self.__accumulated = self.__accumulate__()
         self.text_stream = self.__stream_text__()
         self._iterator = self.__stream__()
         self.__final_message_snapshot: ParsedMessage[ResponseFormatT] | None = None
         self.__output_format = output_format
+        self.__pending = PendingDeltas(parse_json=parse_tool_input) if lazy_snapshot else None
 
     @property
     def response(self) -> httpx.Response:
@@ -239,8 +264,7 @@ class AsyncMessageStream(Generic[ResponseFormatT]):
         the accumulated `Message` object.
         """
         await self.until_done()
-        assert self.__final_message_snapshot is not None
-        return self.__final_message_snapshot
+        return self.current_message_snapshot
 
     async def get_final_text(self) -> str:
         """Returns all `text` content blocks concatenated together.
@@ -265,28 +289,41 @@ class AsyncMessageStream(Generic[ResponseFormatT]):
 
     async def until_done(self) -> None:
         """Waits until the stream has been consumed"""
-        await consume_async_iterator(self)
+        # nothing observes the higher-level events here so we only need to accumulate the snapshot
+        await consume_async_iterator(self.__accumulated)
 
     # properties
     @property
     def current_message_snapshot(self) -> ParsedMessage[ResponseFormatT]:
         assert self.__final_message_snapshot is not None
+        if self.__pending:
+            self.__pending.flush(self.__final_message_snapshot.content)
         return self.__final_message_snapshot
 
-    async def __stream__(self) -> AsyncIterator[ParsedMessageStreamEvent[ResponseFormatT]]:
+    async def __accumulate__(self) -> AsyncIterator[RawMessageStreamEvent]:
         async for sse_event in self._raw_stream:
             self.__final_message_snapshot = accumulate_event(
                 event=sse_event,
                 current_snapshot=self.__final_message_snapshot,
                 output_format=self.__output_format,
+                pending=self.__pending,
             )
 
-            events_to_fire = build_events(event=sse_event, message_snapshot=self.current_message_snapshot)
+            yield sse_event
+
+    async def __stream__(self) -> AsyncIterator[ParsedMessageStreamEvent[ResponseFormatT]]:
+        async for sse_event in self.__accumulated:
+            # the snapshot isn't flushed here, events build their own `snapshot` from the
+            # pending deltas when it's read
+            assert self.__final_message_snapshot is not None
+            events_to_fire = build_events(
+                event=sse_event, message_snapshot=self.__final_message_snapshot, pending=self.__pending
+            )
             for event in events_to_fire:
                 yield event
 
     async def __stream_text__(self) -> AsyncIterator[str]:
-        async for chunk in self:
+        async for chunk in self.__accumulated:
             if chunk.type == "content_block_delta" and chunk.delta.type == "text_delta":
                 yield chunk.delta.text
 
@@ -308,14 +345,18 @@ class AsyncMessageStreamManager(Generic[ResponseFormatT]):
         api_request: Awaitable[AsyncStream[RawMessageStreamEvent]],
         *,
         output_format: ResponseFormatT | NotGiven = NOT_GIVEN,
+        lazy_snapshot: bool = False,
     ) -> None:
         self.__stream: AsyncMessageStream[ResponseFormatT] | None = None
         self.__api_request = api_request
         self.__output_format = output_format
+        self.__lazy_snapshot = lazy_snapshot
 
     async def __aenter__(self) -> AsyncMessageStream[ResponseFormatT]:
         raw_stream = await self.__api_request
-        self.__stream = AsyncMessageStream(raw_stream, output_format=self.__output_format)
+        self.__stream = AsyncMessageStream(
+            raw_stream, output_format=self.__output_format, lazy_snapshot=self.__lazy_snapshot
+        )
         return self.__stream
 
     async def __aexit__(
@@ -328,10 +369,23 @@ class AsyncMessageStreamManager(Generic[ResponseFormatT]):
             await self.__stream.close()
 
 
+class _LazyTextEvent(LazySnapshotEvent, TextEvent):
+    pass
+
+
+class _LazyInputJsonEvent(LazySnapshotEvent, InputJsonEvent):
+    pass
+
+
+class _LazyThinkingEvent(LazySnapshotEvent, ThinkingEvent):
+    pass
+
+
 def build_events(
     *,
     event: RawMessageStreamEvent,
     message_snapshot: ParsedMessage[ResponseFormatT],
+    pending: PendingDeltas | None = None,
 ) -> list[ParsedMessageStreamEvent[ResponseFormatT]]:
     events_to_fire: list[ParsedMessageStreamEvent[ResponseFormatT]] = []
 
@@ -351,24 +405,42 @@ def build_events(
         content_block = message_snapshot.content[event.index]
         if event.delta.type == "text_delta":
             if content_block.type == "text":
-                events_to_fire.append(
-                    build(
-                        TextEvent,
-                        type="text",
-                        text=event.delta.text,
-                        snapshot=content_block.text,
+                if pending is not None:
+                    events_to_fire.append(
+                        _LazyTextEvent.lazy(
+                            pending.text_snapshot(event.index, content_block.text),
+                            type="text",
+                            text=event.delta.text,
+                        )
+                    )
+                else:
+                    events_to_fire.append(
+                        build(
+                            TextEvent,
+                            type="text",
+                            text=event.delta.text,
+                            snapshot=content_block.text,
+                        )
                     )
-                )
         elif event.delta.type == "input_json_delta":
             if content_block.type == "tool_use":
-                events_to_fire.append(
-                    build(
-                        InputJsonEvent,
-                        type="input_json",
-                        partial_json=event.delta.partial_json,
-                        snapshot=content_block.input,
+                if pending is not None:
+                    events_to_fire.append(
+                        _LazyInputJsonEvent.lazy(
+                            pending.json_snapshot(event.index, content=content_block),
+                            type="input_json",
+                            partial_json=event.delta.partial_json,
+                        )
+                    )
+                else:
+                    events_to_fire.append(
+                        build(
+                            InputJsonEvent,
+                            type="input_json",
+                            partial_json=event.delta.partial_json,
+                            snapshot=content_block.input,
+                        )
                     )
-                )
         elif event.delta.type == "citations_delta":
             if content_block.type == "text":
                 events_to_fire.append(
@@ -381,14 +453,23 @@ def build_events(
                 )
         elif event.delta.type == "thinking_delta":
             if content_block.type == "thinking":
-                events_to_fire.append(
-                    build(
-                        ThinkingEvent,
-                        type="thinking",
-                        thinking=event.delta.thinking,
-                        snapshot=content_block.thinking,
+                if pending is not None:
+                    events_to_fire.append(
+                        _LazyThinkingEvent.lazy(
+                            pending.thinking_snapshot(event.index, content_block.thinking),
+                            type="thinking",
+                            thinking=event.delta.thinking,
+                        )
+                    )
+                else:
+                    events_to_fire.append(
+                        build(
+                            ThinkingEvent,
+                            type="thinking",
+                            thinking=event.delta.thinking,
+                            snapshot=content_block.thinking,
+                        )
                     )
-                )
         elif event.delta.type == "signature_delta":
             if content_block.type == "thinking":
                 events_to_fire.append(
@@ -422,8 +503,6 @@ def build_events(
     return events_to_fire
 
 
-JSON_BUF_PROPERTY = "__json_buf"
-
 TRACKS_TOOL_INPUT = (
     ToolUseBlock,
     ServerToolUseBlock,
@@ -435,7 +514,13 @@ def accumulate_event(
     event: RawMessageStreamEvent,
     current_snapshot: ParsedMessage[ResponseFormatT] | None,
     output_format: ResponseFormatT | NotGiven = NOT_GIVEN,
+    pending: PendingDeltas | None = None,
 ) -> ParsedMessage[ResponseFormatT]:
+    """Apply `event` to the message snapshot, returning the updated snapshot.
+
+    If `pending` is given, text, thinking and tool input deltas are buffered in it instead of
+    being applied straight away, see `PendingDeltas` for details.
+    """
     if not isinstance(cast(Any, event), BaseModel):
         event = cast(  # pyright: ignore[reportUnnecessaryCast]
             RawMessageStreamEvent,
@@ -465,21 +550,25 @@ def accumulate_event(
         content = current_snapshot.content[event.index]
         if event.delta.type == "text_delta":
             if content.type == "text":
-                content.text += event.delta.text
+                if pending is not None:
+                    pending.add_text(event.index, event.delta.text)
+                else:
+                    content.text += event.delta.text
         elif event.delta.type == "input_json_delta":
             if isinstance(content, TRACKS_TOOL_INPUT):
-                from jiter import from_json
-
-                # we need to keep track of the raw JSON string as well so that we can
-                # re-parse it for each delta, for now we just store it as an untyped
-                # property on the snapshot
-                json_buf = cast(bytes, getattr(content, JSON_BUF_PROPERTY, b""))
-                json_buf += bytes(event.delta.partial_json, "utf-8")
+                if pending is not None:
+                    pending.add_json(event.index, event.delta.partial_json, content=content)
+                else:
+                    # we need to keep track of the raw JSON string as well so that we can
+                    # re-parse it for each delta, for now we just store it as an untyped
+                    # property on the snapshot
+                    json_buf = cast(bytes, getattr(content, JSON_BUF_PROPERTY, b""))
+                    json_buf += bytes(event.delta.partial_json, "utf-8")
 
-                if json_buf:
-                    content.input = from_json(json_buf, partial_mode=True)
+                    if json_buf:
+                        content.input = parse_tool_input(json_buf)
 
-                setattr(content, JSON_BUF_PROPERTY, json_buf)
+                    setattr(content, JSON_BUF_PROPERTY, json_buf)
         elif event.delta.type == "citations_delta":
             if content.type == "text":
                 if not content.citations:
@@ -488,7 +577,10 @@ def accumulate_event(
                     content.citations.append(event.delta.citation)
         elif event.delta.type == "thinking_delta":
             if content.type == "thinking":
-                content.thinking += event.delta.thinking
+                if pending is not None:
+                    pending.add_thinking(event.index, event.delta.thinking)
+                else:
+                    content.thinking += event.delta.thinking
         elif event.delta.type == "signature_delta":
             if content.type == "thinking":
                 content.signature = event.delta.signature
@@ -497,6 +589,9 @@ def accumulate_event(
             if TYPE_CHECKING:  # type: ignore[unreachable]
                 assert_never(event.delta)
     elif event.type == "content_block_stop":
+        if pending is not None:
+            pending.flush_block(current_snapshot.content, event.index)
+
         content_block = current_snapshot.content[event.index]
         if content_block.type == "text" and is_given(output_format):
             content_block.parsed_output = parse_text(content_block.text, output_format)
@@ -516,5 +611,14 @@ def accumulate_event(
             current_snapshot.usage.cache_read_input_tokens = event.usage.cache_read_input_tokens
         if event.usage.server_tool_use is not None:
             current_snapshot.usage.server_tool_use = event.usage.server_tool_use
+    elif event.type == "message_stop":
+        if pending is not None:
+            pending.flush(current_snapshot.content)
 
     return current_snapshot
+
+
+def parse_tool_input(json_buf: bytes) -> Any:
+    from jiter import from_json
+
+    return from_json(json_buf, partial_mode=True)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Type, TypeVar, Callable, Optional, cast
+from typing_extensions import Self
+
+import pydantic
+
+from ..._compat import PYDANTIC_V1
+
+_T = TypeVar("_T")
+
+JSON_BUF_PROPERTY = "__json_buf"
+
+_RESOLVE_SNAPSHOT = "__resolve_snapshot"
+
+
+class PendingDeltas:
+    """Buffers the text, thinking and tool input deltas of a message snapshot until they're needed.
+
+    `accumulate_event()` normally applies every delta to the snapshot as it arrives, which grows
+    strings by concatenation and re-parses the entire tool input JSON on every `input_json_delta`,
+    so the cost of each delta grows with the size of the block. When a `PendingDeltas` instance is
+    passed, deltas are instead appended to per-block chunk buffers and only applied to the snapshot
+    when a block is flushed, which happens when the block stops, when the message stops or when
+    the snapshot is read.
+    """
+
+    def __init__(self, *, parse_json: Callable[[bytes], object]) -> None:
+        self._parse_json = parse_json
+        self._text: Dict[int, List[str]] = {}
+        self._thinking: Dict[int, List[str]] = {}
+        self._json: Dict[int, bytearray] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._text or self._thinking or self._json)
+
+    def add_text(self, index: int, text: str) -> None:
+        self._text.setdefault(index, []).append(text)
+
+    def add_thinking(self, index: int, thinking: str) -> None:
+        self._thinking.setdefault(index, []).append(thinking)
+
+    def add_json(self, index: int, partial_json: str, *, content: Any) -> None:
+        buf = self._json.get(index)
+        if buf is None:
+            buf = self._json[index] = bytearray(getattr(content, JSON_BUF_PROPERTY, b""))
+        buf += partial_json.encode("utf-8")
+
+    def text_snapshot(self, index: int, text: str) -> Callable[[], str]:
+        """Return a function that builds the text of the block at `index` as of now, without flushing.
+
+        `text` is the text that has already been applied to the snapshot block.
+        """
+        parts = self._text.get(index)
+        if parts is None:
+            return lambda: text
+
+        count = len(parts)
+        return lambda: text + "".join(parts[:count])
+
+    def thinking_snapshot(self, index: int, thinking: str) -> Callable[[], str]:
+        """Return a function that builds the thinking of the block at `index` as of now, without flushing."""
+        parts = self._thinking.get(index)
+        if parts is None:
+            return lambda: thinking
+
+        count = len(parts)
+        return lambda: thinking + "".join(parts[:count])
+
+    def json_snapshot(self, index: int, *, content: Any) -> Callable[[], object]:
+        """Return a function that parses the tool input of the block at `index` as of now, without flushing."""
+        current_input = content.input
+        buf = self._json.get(index)
+        if buf is None:
+            return lambda: current_input
+
+        size = len(buf)
+        return lambda: self._parse_json(bytes(buf[:size])) if size else current_input
+
+    def flush_block(self, content: List[Any], index: int) -> None:
+        """Apply all of the buffered deltas for the block at `index` to the snapshot content."""
+        block = content[index]
+
+        text = self._text.pop(index, None)
+        if text is not None:
+            block.text += "".join(text)
+
+        thinking = self._thinking.pop(index, None)
+        if thinking is not None:
+            block.thinking += "".join(thinking)
+
+        json_buf = self._json.pop(index, None)
+        if json_buf is not None:
+            json_bytes = bytes(json_buf)
+            if json_bytes:
+                block.input = self._parse_json(json_bytes)
+
+            # we need to keep track of the raw JSON string as well so that we can
+            # re-parse it if more deltas arrive, for now we just store it as an untyped
+            # property on the snapshot
+            setattr(block, JSON_BUF_PROPERTY, json_bytes)
+
+    def flush(self, content: List[Any]) -> None:
+        """Apply all of the buffered deltas to the snapshot content."""
+        for index in sorted({*self._text, *self._thinking, *self._json}):
+            self.flush_block(content, index)
+
+
+class _SnapshotDescriptor:
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        if instance is None:
+            return self
+
+        resolve = instance.__dict__.pop(_RESOLVE_SNAPSHOT, None)
+        if resolve is not None:
+            instance.__dict__["snapshot"] = resolve()
+        return instance.__dict__.get("snapshot")
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__.pop(_RESOLVE_SNAPSHOT, None)
+        instance.__dict__["snapshot"] = value
+
+
+class LazySnapshotEvent:
+    """Mixin for stream events whose `snapshot` is built from a `PendingDeltas` buffer on first access.
+
+    This lets the stream yield events without flushing the buffered deltas into the message
+    snapshot, so the cost of building each snapshot is only paid if it's actually read.
+
+    The snapshot is also built before the event is serialized, compared or copied, so that a
+    lazy event behaves exactly like the same event built eagerly.
+    """
+
+    snapshot = _SnapshotDescriptor()
+
+    @classmethod
+    def lazy(cls: Type[_T], resolve_snapshot: Callable[[], object], **fields: Any) -> _T:
+        event = cast(Any, cls).construct(snapshot=None, **fields)
+        event.__dict__[_RESOLVE_SNAPSHOT] = resolve_snapshot
+        return cast(_T, event)
+
+    def _resolve_snapshot(self) -> None:
+        self.snapshot  # noqa: B018
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        self._resolve_snapshot()
+        return cast(Any, super()).model_dump(**kwargs)  # type: ignore[no-any-return]
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self._resolve_snapshot()
+        return cast(Any, super()).model_dump_json(**kwargs)  # type: ignore[no-any-return]
+
+    def __repr_args__(self) -> Any:
+        self._resolve_snapshot()
+        return cast(Any, super()).__repr_args__()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, pydantic.BaseModel):
+            return NotImplemented
+
+        self._resolve_snapshot()
+        if isinstance(other, LazySnapshotEvent):
+            other._resolve_snapshot()
+        # lazy events compare as the event type they're a subclass of
+        return _event_type(self) is _event_type(other) and self.__dict__ == other.__dict__
+
+    def __getstate__(self) -> Any:
+        self._resolve_snapshot()
+        return cast(Any, super()).__getstate__()
+
+    if PYDANTIC_V1:
+
+        def copy(self, **kwargs: Any) -> Any:
+            self._resolve_snapshot()
+            return cast(Any, super()).copy(**kwargs)
+
+    else:
+
+        def __copy__(self) -> Self:
+            self._resolve_snapshot()
+            return cast(Self, cast(Any, super()).__copy__())
+
+        def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Self:
+            self._resolve_snapshot()
+            return cast(Self, cast(Any, super()).__deepcopy__(memo))
+
+
+def _event_type(event: object) -> type:
+    return next(cls for cls in type(event).__mro__ if not issubclass(cls, LazySnapshotEvent))
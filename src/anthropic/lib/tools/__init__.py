@@ -9,6 +9,7 @@ from ._beta_functions import (
     beta_tool,
     beta_async_tool,
 )
+from ._beta_tool_cache import ToolCacheStats, ToolResultCache, SQLiteToolResultCache, InMemoryToolResultCache
 from ._beta_builtin_memory_tool import BetaAbstractMemoryTool, BetaAsyncAbstractMemoryTool
 
 __all__ = [
@@ -26,4 +27,8 @@ __all__ = [
     "BetaAbstractMemoryTool",
     "BetaAsyncAbstractMemoryTool",
     "ToolError",
+    "ToolCacheStats",
+    "ToolResultCache",
+    "InMemoryToolResultCache",
+    "SQLiteToolResultCache",
 ]
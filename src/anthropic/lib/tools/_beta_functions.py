@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Union, Generic, TypeVar, Callable, Iterable, Coroutine, cast, overload
+from typing import Any, Tuple, Union, Generic, TypeVar, Callable, Iterable, Coroutine, cast, overload
 from inspect import isawaitable, isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
 from collections.abc import Awaitable
 from typing_extensions import Literal, TypeAlias, override
@@ -14,11 +14,12 @@ import docstring_parser
 from pydantic import BaseModel
 
 from ... import _compat
-from ..._utils import is_dict
+from ..._utils import is_dict, asyncify
 from ..._compat import cached_property
 from ..._models import TypeAdapter
 from ...types.beta import BetaToolParam, BetaToolUnionParam, BetaCacheControlEphemeralParam
 from ..._utils._utils import CallableT
+from ._beta_tool_cache import ToolResultCache, tool_cache_key
 from ...types.tool_param import InputSchema
 from ...types.beta.beta_tool_result_block_param import Content as BetaContent
 
@@ -109,6 +110,9 @@ class BaseFunctionTool(Generic[CallableT]):
 
     input_schema: InputSchema
 
+    cache: ToolResultCache | None
+    """Memoizes the results of calls to this tool, see :class:`~anthropic.lib.tools.ToolResultCache`"""
+
     close: Callable[[], None | Awaitable[None]] | None = None
     """Optional cleanup hook.
 
@@ -152,6 +156,7 @@ class BaseFunctionTool(Generic[CallableT]):
         eager_input_streaming: bool | None = None,
         input_examples: Iterable[dict[str, object]] | None = None,
         strict: bool | None = None,
+        cache: ToolResultCache | None = None,
     ) -> None:
         if _compat.PYDANTIC_V1:
             raise RuntimeError("Tool functions are only supported with Pydantic v2")
@@ -165,6 +170,7 @@ class BaseFunctionTool(Generic[CallableT]):
         self._eager_input_streaming = eager_input_streaming
         self._input_examples = input_examples
         self._strict = strict
+        self.cache = cache
 
         self.description = description or self._get_description_from_docstring()
 
@@ -264,12 +270,29 @@ class BaseFunctionTool(Generic[CallableT]):
 
 class BetaFunctionTool(BaseFunctionTool[FunctionT]):
     def call(self, input: object) -> BetaFunctionToolResultType:
+        return self._call(input)[0]
+
+    def _call(self, input: object) -> Tuple[BetaFunctionToolResultType, Union[bool, None]]:
+        """Call the tool, also returning whether the result came from the cache (`None` without a cache)."""
         if iscoroutinefunction(self.func):
             raise RuntimeError("Cannot call a coroutine function synchronously. Use `@async_tool` instead.")
 
         if not is_dict(input):
             raise TypeError(f"Input must be a dictionary, got {type(input).__name__}")
 
+        if self.cache is None:
+            return self._invoke(input), None
+
+        key = tool_cache_key(self.name, input)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached, True
+
+        result = _materialize(self._invoke(input))
+        self.cache.set(key, result)
+        return result, False
+
+    def _invoke(self, input: dict[str, object]) -> BetaFunctionToolResultType:
         try:
             return self._func_with_validate(**cast(Any, input))
         except pydantic.ValidationError as e:
@@ -278,18 +301,45 @@ class BetaFunctionTool(BaseFunctionTool[FunctionT]):
 
 class BetaAsyncFunctionTool(BaseFunctionTool[AsyncFunctionT]):
     async def call(self, input: object) -> BetaFunctionToolResultType:
+        return (await self._call(input))[0]
+
+    async def _call(self, input: object) -> Tuple[BetaFunctionToolResultType, Union[bool, None]]:
+        """Call the tool, also returning whether the result came from the cache (`None` without a cache)."""
         if not iscoroutinefunction(self.func):
             raise RuntimeError("Cannot call a synchronous function asynchronously. Use `@tool` instead.")
 
         if not is_dict(input):
             raise TypeError(f"Input must be a dictionary, got {type(input).__name__}")
 
+        if self.cache is None:
+            return await self._invoke(input), None
+
+        # blocking caches, e.g. `SQLiteToolResultCache`, are called on a worker thread
+        cache = self.cache
+        key = tool_cache_key(self.name, input)
+        cached = await asyncify(cache.get)(key) if cache.blocking else cache.get(key)
+        if cached is not None:
+            return cached, True
+
+        result = _materialize(await self._invoke(input))
+        if cache.blocking:
+            await asyncify(cache.set)(key, result)
+        else:
+            cache.set(key, result)
+        return result, False
+
+    async def _invoke(self, input: dict[str, object]) -> BetaFunctionToolResultType:
         try:
             return await self._func_with_validate(**cast(Any, input))
         except pydantic.ValidationError as e:
             raise ValueError(f"Invalid arguments for function {self.name}") from e
 
 
+def _materialize(result: BetaFunctionToolResultType) -> BetaFunctionToolResultType:
+    # content blocks may be returned from a generator, which could only be consumed once
+    return result if isinstance(result, str) else list(result)
+
+
 def _is_sync_cm_factory(fn: object) -> bool:
     """True when ``fn`` is a function produced by :func:`contextlib.contextmanager`.
 
@@ -359,6 +409,7 @@ def beta_tool(
     eager_input_streaming: bool | None = None,
     input_examples: Iterable[dict[str, object]] | None = None,
     strict: bool | None = None,
+    cache: ToolResultCache | None = None,
 ) -> BetaFunctionTool[FunctionT]: ...
 
 
@@ -377,6 +428,7 @@ def beta_tool(
     eager_input_streaming: bool | None = None,
     input_examples: Iterable[dict[str, object]] | None = None,
     strict: bool | None = None,
+    cache: ToolResultCache | None = None,
 ) -> Callable[[FunctionT], BetaFunctionTool[FunctionT]]: ...
 
 
@@ -395,6 +447,7 @@ def beta_tool(
     eager_input_streaming: bool | None = None,
     input_examples: Iterable[dict[str, object]] | None = None,
     strict: bool | None = None,
+    cache: ToolResultCache | None = None,
 ) -> BetaFunctionTool[FunctionT] | Callable[[FunctionT], BetaFunctionTool[FunctionT]]:
     """Create a FunctionTool from a function with automatic schema inference.
 
@@ -437,6 +490,7 @@ def beta_tool(
                     eager_input_streaming=eager_input_streaming,
                     input_examples=input_examples,
                     strict=strict,
+                    cache=cache,
                 )
             except BaseException:
                 # Construction failed after we entered the context manager —
@@ -456,6 +510,7 @@ def beta_tool(
             eager_input_streaming=eager_input_streaming,
             input_examples=input_examples,
             strict=strict,
+            cache=cache,
         )
 
     if func is not None:
@@ -484,6 +539,7 @@ def beta_async_tool(
     eager_input_streaming: bool | None = None,
     input_examples: Iterable[dict[str, object]] | None = None,
     strict: bool | None = None,
+    cache: ToolResultCache | None = None,
 ) -> BetaAsyncFunctionTool[AsyncFunctionT]: ...  # noqa: E501
 
 
@@ -502,6 +558,7 @@ def beta_async_tool(
     eager_input_streaming: bool | None = None,
     input_examples: Iterable[dict[str, object]] | None = None,
     strict: bool | None = None,
+    cache: ToolResultCache | None = None,
 ) -> Callable[[AsyncFunctionT], BetaAsyncFunctionTool[AsyncFunctionT]]: ...
 
 
@@ -520,6 +577,7 @@ def beta_async_tool(
     eager_input_streaming: bool | None = None,
     input_examples: Iterable[dict[str, object]] | None = None,
     strict: bool | None = None,
+    cache: ToolResultCache | None = None,
 ) -> BetaAsyncFunctionTool[AsyncFunctionT] | Callable[[AsyncFunctionT], BetaAsyncFunctionTool[AsyncFunctionT]]:
     """Create an AsyncFunctionTool from a function with automatic schema inference.
 
@@ -587,6 +645,7 @@ def beta_async_tool(
                 eager_input_streaming=eager_input_streaming,
                 input_examples=input_examples,
                 strict=strict,
+                cache=cache,
             )
             tool_box.append(tool)
             return tool
@@ -601,6 +660,7 @@ def beta_async_tool(
             eager_input_streaming=eager_input_streaming,
             input_examples=input_examples,
             strict=strict,
+            cache=cache,
         )
 
     if func is not None:
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import math
+import time
 import logging
 import warnings
+import threading
+import contextvars
 from abc import ABC, abstractmethod
 from typing import (
     TYPE_CHECKING,
@@ -17,13 +21,16 @@ from typing import (
     AsyncIterator,
 )
 from contextlib import contextmanager, asynccontextmanager
+from collections import deque
 from typing_extensions import TypedDict, override
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
+import anyio
 import httpx
 
 from ..._types import Body, Query, Headers, NotGiven
 from ..._utils import consume_sync_iterator, consume_async_iterator
-from ...types.beta import BetaMessage, BetaMessageParam
+from ...types.beta import BetaMessage, BetaMessageParam, BetaToolUseBlock
 from ..._base_client import merge_headers
 from ._tool_dispatch import tool_registry, tool_error_content, available_tool_names
 from ._beta_functions import (
@@ -35,6 +42,7 @@ from ._beta_functions import (
     BetaBuiltinFunctionTool,
     BetaAsyncBuiltinFunctionTool,
 )
+from ._beta_tool_cache import ToolCacheStats
 from .._stainless_helpers import helper_header, stainless_helper_header
 from ._beta_compaction_control import DEFAULT_THRESHOLD, DEFAULT_SUMMARY_PROMPT, CompactionControl
 from ..streaming._beta_messages import BetaMessageStream, BetaAsyncMessageStream
@@ -73,7 +81,12 @@ class BaseToolRunner(Generic[AnyFunctionToolT, ResponseFormatT]):
         tools: Iterable[AnyFunctionToolT],
         max_iterations: int | None = None,
         compaction_control: CompactionControl | None = None,
+        max_concurrent_tools: int | None = None,
+        tool_timeout: float | None = None,
     ) -> None:
+        if max_concurrent_tools is not None and max_concurrent_tools < 1:
+            raise ValueError(f"max_concurrent_tools must be at least 1, got {max_concurrent_tools}")
+
         self._tools_by_name = tool_registry(tools)
         self._params: ParseMessageCreateParamsBase[ResponseFormatT] = {
             **params,
@@ -92,6 +105,29 @@ class BaseToolRunner(Generic[AnyFunctionToolT, ResponseFormatT]):
         self._max_iterations = max_iterations
         self._iteration_count = 0
         self._compaction_control = compaction_control
+        self._max_concurrent_tools = max_concurrent_tools or 1
+        self._tool_timeout = tool_timeout
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @property
+    def tool_cache_stats(self) -> ToolCacheStats:
+        """Hits and misses of the tool result caches over the tool calls made by this runner.
+
+        Only calls to tools created with a ``cache=`` are counted.
+        """
+        return ToolCacheStats(hits=self._cache_hits, misses=self._cache_misses)
+
+    def _record_cache_result(self, cache_hit: bool | None) -> None:
+        if cache_hit is None:
+            return
+
+        with self._cache_lock:
+            if cache_hit:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
 
     def set_messages_params(
         self,
@@ -137,6 +173,58 @@ class BaseToolRunner(Generic[AnyFunctionToolT, ResponseFormatT]):
         """
         return available_tool_names(self._params["messages"], self._tools_by_name)
 
+    def _resolve_tool_calls(
+        self, tool_use_blocks: list[BetaToolUseBlock], *, hint: str
+    ) -> tuple[dict[int, BetaToolResultBlockParam], list[tuple[int, AnyFunctionToolT, BetaToolUseBlock]]]:
+        """Split the ``tool_use`` blocks into the results for tools that can't be called and the
+        calls to make, keyed by the position of their block so results can be put back in order.
+        """
+        results: dict[int, BetaToolResultBlockParam] = {}
+        calls: list[tuple[int, AnyFunctionToolT, BetaToolUseBlock]] = []
+        available = self._available_tool_names()
+
+        for index, tool_use in enumerate(tool_use_blocks):
+            tool = self._tools_by_name.get(tool_use.name) if tool_use.name in available else None
+            if tool is None:
+                warnings.warn(
+                    f"Tool '{tool_use.name}' not found in tool runner. "
+                    f"Available tools: {list(self._tools_by_name.keys())}. "
+                    f"If using a raw tool definition, handle the tool call manually and use `append_messages()` to add the result. "
+                    f"Otherwise, {hint}.",
+                    UserWarning,
+                    stacklevel=4,
+                )
+                results[index] = {
+                    "type": "tool_result",
+                    "tool_use_id": tool_use.id,
+                    "content": f"Error: Tool '{tool_use.name}' not found",
+                    "is_error": True,
+                }
+                continue
+
+            calls.append((index, tool, tool_use))
+
+        return results, calls
+
+    def _tool_error_result(self, tool_use: BetaToolUseBlock, exc: Exception) -> BetaToolResultBlockParam:
+        if not isinstance(exc, ToolError):
+            log.exception(f"Error occurred while calling tool: {tool_use.name}", exc_info=exc)
+        return {
+            "type": "tool_result",
+            "tool_use_id": tool_use.id,
+            "content": tool_error_content(exc),
+            "is_error": True,
+        }
+
+    def _tool_timeout_result(self, tool_use: BetaToolUseBlock) -> BetaToolResultBlockParam:
+        log.warning(f"Tool call timed out after {self._tool_timeout}s: {tool_use.name}")
+        return {
+            "type": "tool_result",
+            "tool_use_id": tool_use.id,
+            "content": f"Error: Tool '{tool_use.name}' timed out after {self._tool_timeout}s",
+            "is_error": True,
+        }
+
 
 class BaseSyncToolRunner(BaseToolRunner[BetaRunnableTool, ResponseFormatT], Generic[RunnerItemT, ResponseFormatT], ABC):
     def __init__(
@@ -148,6 +236,8 @@ class BaseSyncToolRunner(BaseToolRunner[BetaRunnableTool, ResponseFormatT], Gene
         client: Anthropic,
         max_iterations: int | None = None,
         compaction_control: CompactionControl | None = None,
+        max_concurrent_tools: int | None = None,
+        tool_timeout: float | None = None,
     ) -> None:
         super().__init__(
             params=params,
@@ -155,6 +245,8 @@ class BaseSyncToolRunner(BaseToolRunner[BetaRunnableTool, ResponseFormatT], Gene
             tools=tools,
             max_iterations=max_iterations,
             compaction_control=compaction_control,
+            max_concurrent_tools=max_concurrent_tools,
+            tool_timeout=tool_timeout,
         )
         self._client = client
 
@@ -336,54 +428,72 @@ class BaseSyncToolRunner(BaseToolRunner[BetaRunnableTool, ResponseFormatT], Gene
         if not tool_use_blocks:
             return None
 
-        results: list[BetaToolResultBlockParam] = []
-        available = self._available_tool_names()
+        results, calls = self._resolve_tool_calls(
+            tool_use_blocks,
+            hint="pass the tool using `beta_tool(func)` or a `@beta_tool` decorated function",
+        )
+        if self._max_concurrent_tools > 1 or self._tool_timeout is not None:
+            results.update(self._call_tools_in_threads(calls))
+        else:
+            for index, tool, tool_use in calls:
+                results[index] = self._call_tool(tool, tool_use)
+
+        return {"role": "user", "content": [results[index] for index in range(len(tool_use_blocks))]}
+
+    def _call_tool(self, tool: BetaRunnableTool, tool_use: BetaToolUseBlock) -> BetaToolResultBlockParam:
+        try:
+            if isinstance(tool, BetaFunctionTool):
+                result, cache_hit = tool._call(tool_use.input)
+                self._record_cache_result(cache_hit)
+            else:
+                result = tool.call(tool_use.input)
+        except Exception as exc:
+            return self._tool_error_result(tool_use, exc)
+        return {"type": "tool_result", "tool_use_id": tool_use.id, "content": result}
 
-        for tool_use in tool_use_blocks:
-            tool = self._tools_by_name.get(tool_use.name) if tool_use.name in available else None
-            if tool is None:
-                warnings.warn(
-                    f"Tool '{tool_use.name}' not found in tool runner. "
-                    f"Available tools: {list(self._tools_by_name.keys())}. "
-                    f"If using a raw tool definition, handle the tool call manually and use `append_messages()` to add the result. "
-                    f"Otherwise, pass the tool using `beta_tool(func)` or a `@beta_tool` decorated function.",
-                    UserWarning,
-                    stacklevel=3,
-                )
-                results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_use.id,
-                        "content": f"Error: Tool '{tool_use.name}' not found",
-                        "is_error": True,
-                    }
-                )
-                continue
+    def _call_tools_in_threads(
+        self, calls: list[tuple[int, BetaRunnableTool, BetaToolUseBlock]]
+    ) -> dict[int, BetaToolResultBlockParam]:
+        """Run up to `max_concurrent_tools` calls at once on worker threads.
 
-            try:
-                result = tool.call(tool_use.input)
-                results.append({"type": "tool_result", "tool_use_id": tool_use.id, "content": result})
-            except ToolError as exc:
-                results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_use.id,
-                        "content": tool_error_content(exc),
-                        "is_error": True,
-                    }
-                )
-            except Exception as exc:
-                log.exception(f"Error occurred while calling tool: {tool.name}", exc_info=exc)
-                results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_use.id,
-                        "content": tool_error_content(exc),
-                        "is_error": True,
-                    }
+        A thread can't be interrupted, so a call that exceeds `tool_timeout` is reported as an
+        error straight away and left to finish in the background.
+        """
+        results: dict[int, BetaToolResultBlockParam] = {}
+        if not calls:
+            return results
+
+        pending = deque(calls)
+        running: dict[Future[BetaToolResultBlockParam], tuple[int, BetaToolUseBlock, float]] = {}
+        # one worker per call, so calls that timed out never hold up the ones queued behind them
+        executor = ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix="anthropic-tool-runner")
+        try:
+            while pending or running:
+                while pending and len(running) < self._max_concurrent_tools:
+                    index, tool, tool_use = pending.popleft()
+                    future = executor.submit(contextvars.copy_context().run, self._call_tool, tool, tool_use)
+                    deadline = math.inf if self._tool_timeout is None else time.monotonic() + self._tool_timeout
+                    running[future] = (index, tool_use, deadline)
+
+                next_deadline = min(deadline for _, _, deadline in running.values())
+                done, _ = wait(
+                    running,
+                    timeout=None if next_deadline == math.inf else max(next_deadline - time.monotonic(), 0),
+                    return_when=FIRST_COMPLETED,
                 )
+                for future in done:
+                    index, _, _ = running.pop(future)
+                    results[index] = future.result()
+
+                now = time.monotonic()
+                for future, (index, tool_use, deadline) in list(running.items()):
+                    if deadline <= now:
+                        del running[future]
+                        results[index] = self._tool_timeout_result(tool_use)
+        finally:
+            executor.shutdown(wait=False)
 
-        return {"role": "user", "content": results}
+        return results
 
     def _get_last_message(self) -> ParsedBetaMessage[ResponseFormatT] | None:
         if callable(self._last_message):
@@ -435,6 +545,8 @@ class BaseAsyncToolRunner(
         client: AsyncAnthropic,
         max_iterations: int | None = None,
         compaction_control: CompactionControl | None = None,
+        max_concurrent_tools: int | None = None,
+        tool_timeout: float | None = None,
     ) -> None:
         super().__init__(
             params=params,
@@ -442,6 +554,8 @@ class BaseAsyncToolRunner(
             tools=tools,
             max_iterations=max_iterations,
             compaction_control=compaction_control,
+            max_concurrent_tools=max_concurrent_tools,
+            tool_timeout=tool_timeout,
         )
         self._client = client
 
@@ -645,54 +759,40 @@ class BaseAsyncToolRunner(
         if not tool_use_blocks:
             return None
 
-        results: list[BetaToolResultBlockParam] = []
-        available = self._available_tool_names()
+        results, calls = self._resolve_tool_calls(
+            tool_use_blocks,
+            hint="pass the tool using `beta_async_tool(func)` or a `@beta_async_tool` decorated function",
+        )
+        if self._max_concurrent_tools > 1 and len(calls) > 1:
+            limiter = anyio.CapacityLimiter(self._max_concurrent_tools)
 
-        for tool_use in tool_use_blocks:
-            tool = self._tools_by_name.get(tool_use.name) if tool_use.name in available else None
-            if tool is None:
-                warnings.warn(
-                    f"Tool '{tool_use.name}' not found in tool runner. "
-                    f"Available tools: {list(self._tools_by_name.keys())}. "
-                    f"If using a raw tool definition, handle the tool call manually and use `append_messages()` to add the result. "
-                    f"Otherwise, pass the tool using `beta_async_tool(func)` or a `@beta_async_tool` decorated function.",
-                    UserWarning,
-                    stacklevel=3,
-                )
-                results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_use.id,
-                        "content": f"Error: Tool '{tool_use.name}' not found",
-                        "is_error": True,
-                    }
-                )
-                continue
+            async def call_tool(index: int, tool: BetaAsyncRunnableTool, tool_use: BetaToolUseBlock) -> None:
+                async with limiter:
+                    results[index] = await self._call_tool(tool, tool_use)
+
+            async with anyio.create_task_group() as tg:
+                for index, tool, tool_use in calls:
+                    tg.start_soon(call_tool, index, tool, tool_use)
+        else:
+            for index, tool, tool_use in calls:
+                results[index] = await self._call_tool(tool, tool_use)
+
+        return {"role": "user", "content": [results[index] for index in range(len(tool_use_blocks))]}
 
+    async def _call_tool(self, tool: BetaAsyncRunnableTool, tool_use: BetaToolUseBlock) -> BetaToolResultBlockParam:
+        with anyio.move_on_after(self._tool_timeout):
             try:
-                result = await tool.call(tool_use.input)
-                results.append({"type": "tool_result", "tool_use_id": tool_use.id, "content": result})
-            except ToolError as exc:
-                results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_use.id,
-                        "content": tool_error_content(exc),
-                        "is_error": True,
-                    }
-                )
+                if isinstance(tool, BetaAsyncFunctionTool):
+                    result, cache_hit = await tool._call(tool_use.input)
+                    self._record_cache_result(cache_hit)
+                else:
+                    result = await tool.call(tool_use.input)
             except Exception as exc:
-                log.exception(f"Error occurred while calling tool: {tool.name}", exc_info=exc)
-                results.append(
-                    {
-                        "type": "tool_result",
-                        "tool_use_id": tool_use.id,
-                        "content": tool_error_content(exc),
-                        "is_error": True,
-                    }
-                )
+                return self._tool_error_result(tool_use, exc)
+            return {"type": "tool_result", "tool_use_id": tool_use.id, "content": result}
 
-        return {"role": "user", "content": results}
+        # only reached when the timeout cancelled the call
+        return self._tool_timeout_result(tool_use)
 
 
 class BetaAsyncToolRunner(BaseAsyncToolRunner[ParsedBetaMessage[ResponseFormatT], ResponseFormatT]):
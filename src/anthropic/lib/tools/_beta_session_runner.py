@@ -17,12 +17,16 @@ force-stop.
 
 from __future__ import annotations
 
+import os
 import json
 import math
 import time
 import logging
+import pathlib
+import tempfile
 import contextlib
-from typing import TYPE_CHECKING, Union, Literal, cast
+from typing import TYPE_CHECKING, Any, Union, Literal, cast
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 from collections.abc import Sequence, AsyncIterator
 
@@ -30,6 +34,7 @@ import anyio
 
 from .._retry import TRANSIENT_ERRORS, is_fatal_status_error
 from ..._types import Headers
+from ..._models import validate_type
 from ._tool_dispatch import tool_registry, run_runnable_tool, tool_error_content
 from .._scoped_client import _copy_client_with_bearer_auth
 from ._beta_functions import (
@@ -121,10 +126,22 @@ STREAM_BACKOFF_CAP = 10.0
 # tests/lib/tools/test_session_runner.py::test_tool_timeout_exceeds_bash_default.
 TOOL_TIMEOUT = 150.0
 SEND_RETRIES = 3
+# Result coalescing: while other tool calls are still running, a finished
+# call's result waits up to ``RESULT_BATCH_WINDOW`` seconds for theirs so they
+# are posted in one ``events.send``, which carries at most
+# ``RESULT_BATCH_MAX_EVENTS`` results. A result with nothing else in flight is
+# posted straight away.
+RESULT_BATCH_WINDOW = 0.05
+RESULT_BATCH_MAX_EVENTS = 20
 # Grace period, in seconds, that the runner keeps running after the session goes
 # idle with stop_reason ``end_turn`` before it stops; any new event in that
 # window resets it. ``max_idle=None`` disables it (run until the session ends).
 DEFAULT_MAX_IDLE = 60.0
+# An incremental reconcile lists the events processed since the latest one the
+# runner has handled, minus this overlap, in case the server committed events
+# slightly out of ``processed_at`` order. Events read twice are deduplicated.
+RECONCILE_OVERLAP = timedelta(seconds=10)
+CHECKPOINT_VERSION = 1
 
 log = logging.getLogger(__name__)
 
@@ -224,6 +241,24 @@ class _IdleClock:
             self.arm()
 
 
+class _ResultBatch:
+    """Tool results collected for one ``events.send`` call.
+
+    The first result to arrive makes its caller the batch's leader, which
+    waits for the batch to fill up (:attr:`full`) or for the window to pass,
+    posts it, records the ids that landed in :attr:`posted` and sets
+    :attr:`done` for the callers whose results joined it.
+    """
+
+    __slots__ = ("items", "full", "done", "posted")
+
+    def __init__(self) -> None:
+        self.items: list[tuple[DispatchedToolResultParams, str]] = []
+        self.full = anyio.Event()
+        self.done = anyio.Event()
+        self.posted: set[str] = set()
+
+
 @dataclass(frozen=True)
 class DispatchedToolCall:
     """One tool call observed by :class:`SessionToolRunner`.
@@ -374,6 +409,22 @@ class SessionToolRunner:
     :class:`~anthropic.lib.environments.EnvironmentWorker` for heartbeating /
     force-stop.
 
+    Tool calls run one at a time by default. Pass ``max_concurrent_tools`` to
+    run up to that many at once when the agent emits several tool calls in a
+    row; each :class:`DispatchedToolCall` is yielded as its call finishes, so
+    the order can differ from the order the calls were emitted in. Only do so
+    if ``tools`` are safe to run concurrently — the agent toolset's ``bash``
+    tool runs its commands one at a time on its persistent shell either way.
+    Results of calls that finish close together are posted back in a single
+    ``events.send``.
+
+    The first attach reads the session's whole event history; after a
+    reconnect the runner only lists the events since the latest one it has
+    handled. Pass ``checkpoint_path`` to keep that position, and the tool calls
+    still unanswered at it, in a file, so a restarted runner resumes from it
+    instead of reading the whole history again. A checkpoint written for
+    another session, or one that can't be read, is ignored.
+
     Pass ``environment_key`` to authenticate the event stream / list / send
     calls with the self-hosted environment key (bearered, with the client's
     default ``x-api-key`` dropped); leave it unset to use the client's own
@@ -421,12 +472,19 @@ class SessionToolRunner:
         *,
         tools: Sequence[BetaAnyRunnableTool],
         max_idle: float | None = DEFAULT_MAX_IDLE,
+        max_concurrent_tools: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
         environment_key: str | None = None,
         extra_headers: Headers | None = None,
     ) -> None:
+        if max_concurrent_tools is not None and max_concurrent_tools < 1:
+            raise ValueError(f"max_concurrent_tools must be at least 1, got {max_concurrent_tools}")
+
         self.session_id = session_id
         self.tools: Sequence[BetaAnyRunnableTool] = tools
         self.max_idle = max_idle
+        self.max_concurrent_tools = max_concurrent_tools or 1
+        self.checkpoint_path = pathlib.Path(checkpoint_path) if checkpoint_path is not None else None
         # All event stream / list / send requests are issued via this scoped
         # sub-client: Bearer-only when an environment key is set, otherwise the
         # caller's own client with the helper-telemetry header layered on.
@@ -489,6 +547,23 @@ class SessionToolRunner:
         # recorded verdicts persist for the life of the run.
         self._confirmations: dict[str, Literal["allow", "deny"]] = {}
         self._awaiting_confirmation: dict[str, DispatchedToolUseEvent] = {}
+        # Tool calls a dispatch worker is executing, each with an event set once
+        # it is done (see :meth:`_dispatch_one`).
+        self._in_flight: dict[str, anyio.Event] = {}
+        # The result batch still accepting results, if any (see :meth:`_send_result`).
+        self._open_batch: _ResultBatch | None = None
+        # Incremental reconcile: ``_cursor`` is the ``processed_at`` of the
+        # latest event handled from the list or the stream, and a reconcile
+        # after a reconnect lists only the events since then. ``_calls`` keeps
+        # the tool-call events that may still be unanswered, since the tail
+        # won't list the older ones again. ``_synced`` is cleared while the
+        # history before the cursor hasn't been fully read (a failed list), so
+        # the stream doesn't move the cursor past it.
+        self._cursor: datetime | None = None
+        self._calls: dict[str, DispatchedToolUseEvent] = {}
+        self._last_was_end_turn = False
+        self._synced = False
+        self._load_checkpoint()
         self._stop = anyio.Event()
         self._idle_clock = _IdleClock()
 
@@ -547,29 +622,54 @@ class SessionToolRunner:
             with anyio.CancelScope(shield=True):
                 for tool in self.tools:
                     await aclose_runnable_tool(tool)
+            self._save_checkpoint()
 
     # -- event-stream + reconcile ------------------------------------------
 
     async def _reconcile(self) -> None:
-        """Read full history and enqueue every tool-call event still unanswered.
+        """Read the history and enqueue every tool-call event still unanswered.
 
-        Two-pass: read the whole history before emitting so a tool-call whose
+        Two-pass: read the history before emitting so a tool-call whose
         result appears later in the same history is not re-dispatched. Pairs
         ``agent.tool_use`` with ``user.tool_result`` and ``agent.custom_tool_use``
         with ``user.custom_tool_result`` when computing which calls are answered.
+
+        The first pass reads the whole history. Once a pass has succeeded, later
+        ones list only the tail since ``_cursor`` and carry over the tool calls
+        from before it that were still unanswered (``_calls``). A tail listing
+        the server rejects outright falls back to a full scan.
         """
-        pending: list[DispatchedToolUseEvent] = []
-        last_was_end_turn = False
+        cursor = self._cursor
+        # Keyed by id: the tail re-reads the overlap with what came before.
+        pending: dict[str, DispatchedToolUseEvent] = {}
+        listed: list[str] = []
+        if cursor is not None:
+            pending.update(self._calls)
+        newest = cursor
+        last_was_end_turn = self._last_was_end_turn if cursor is not None else False
         list_failed = False
         try:
-            async for ev in self._events.list(self.session_id, limit=1000, extra_headers=self.extra_headers):
+            if cursor is None:
+                history = self._events.list(self.session_id, limit=1000, extra_headers=self.extra_headers)
+            else:
+                history = self._events.list(
+                    self.session_id,
+                    limit=1000,
+                    created_at_gte=cursor - RECONCILE_OVERLAP,
+                    extra_headers=self.extra_headers,
+                )
+            async for ev in history:
+                processed_at = getattr(ev, "processed_at", None)
+                if isinstance(processed_at, datetime) and (newest is None or processed_at > newest):
+                    newest = processed_at
                 if ev.type == "agent.tool_use" or ev.type == "agent.custom_tool_use":
                     # Mark the event seen so the live stream doesn't re-enqueue it, but
                     # decide whether it still needs executing from ``_answered``, not
                     # ``_seen``: a call whose result post failed is seen-but-unanswered
                     # and must be retried on the next reconcile pass rather than dropped.
                     self._seen.add(ev.id)
-                    pending.append(ev)
+                    listed.append(ev.id)
+                    pending[ev.id] = ev
                 elif ev.type == "user.tool_result":
                     self._answered.add(ev.tool_use_id)
                 elif ev.type == "user.custom_tool_result":
@@ -589,6 +689,14 @@ class SessionToolRunner:
                     and getattr(getattr(ev, "stop_reason", None), "type", None) == "end_turn"
                 )
         except Exception as e:
+            if cursor is not None and is_fatal_status_error(e):
+                # The tail query itself was rejected; read the whole history.
+                log.warning("incremental reconcile rejected; falling back to a full scan error=%s", e)
+                for id in listed:
+                    self._seen.discard(id)
+                self._cursor = None
+                await self._reconcile()
+                return
             # Pagination may have failed partway through; the ``_answered`` set
             # could be incomplete, so dispatching ``pending`` now would risk
             # re-running a tool whose result was on a page we never reached.
@@ -599,11 +707,17 @@ class SessionToolRunner:
         if list_failed:
             # Roll back the ids we added to ``_seen`` so the live stream can
             # re-process them rather than silently dedup what we never finished
-            # reading.
-            for ev in pending:
-                self._seen.discard(ev.id)
+            # reading, and keep the stream from moving the cursor past them.
+            for id in listed:
+                self._seen.discard(id)
+            self._synced = False
             return
-        unanswered = [ev for ev in pending if ev.id not in self._answered]
+        unanswered = [ev for ev in pending.values() if ev.id not in self._answered]
+        self._calls = {ev.id: ev for ev in unanswered}
+        self._cursor = newest
+        self._last_was_end_turn = last_was_end_turn
+        self._synced = True
+        self._save_checkpoint()
         # Disarm before routing: enqueuing below can block on a full work
         # buffer while the clock may still be armed from before the reconnect.
         self._idle_clock.disarm()
@@ -645,9 +759,11 @@ class SessionToolRunner:
                         # clock itself defers the countdown while gated calls
                         # are held or in flight (see ``_IdleClock.hold``).
                         self._idle_clock.note_event(ev)
+                        self._note_processed(ev)
                         if ev.type == "agent.tool_use" or ev.type == "agent.custom_tool_use":
                             if ev.id not in self._seen:
                                 self._seen.add(ev.id)
+                                self._calls[ev.id] = ev
                                 await self._route_tool_event(ev)
                         elif ev.type == "user.tool_result":
                             self._answered.add(ev.tool_use_id)
@@ -673,6 +789,82 @@ class SessionToolRunner:
                 await self._stop.wait()
             backoff = min(backoff * 2, STREAM_BACKOFF_CAP)
 
+    def _note_processed(self, ev: object) -> None:
+        """Move the reconcile cursor past a live-stream event."""
+        self._last_was_end_turn = (
+            getattr(ev, "type", None) == "session.status_idle"
+            and getattr(getattr(ev, "stop_reason", None), "type", None) == "end_turn"
+        )
+        processed_at = getattr(ev, "processed_at", None)
+        if not self._synced or not isinstance(processed_at, datetime):
+            return
+        if self._cursor is None or processed_at > self._cursor:
+            self._cursor = processed_at
+
+    def _load_checkpoint(self) -> None:
+        """Resume the reconcile cursor and unanswered tool calls from ``checkpoint_path``."""
+        path = self.checkpoint_path
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning("ignoring unreadable session checkpoint path=%s error=%s", path, e)
+            return
+        try:
+            if data["version"] != CHECKPOINT_VERSION or data["session_id"] != self.session_id:
+                raise ValueError("checkpoint is for another session or version")
+            cursor = datetime.fromisoformat(data["cursor"])
+            calls = [
+                validate_type(type_=cast("type[DispatchedToolUseEvent]", DispatchedToolUseEvent), value=raw)
+                for raw in data["calls"]
+            ]
+            confirmations = {str(id): verdict for id, verdict in data["confirmations"].items()}
+            last_was_end_turn = bool(data["last_was_end_turn"])
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            log.warning("ignoring invalid session checkpoint path=%s error=%s", path, e)
+            return
+        log.info("resuming session tool runner from checkpoint cursor=%s calls=%d", cursor.isoformat(), len(calls))
+        self._cursor = cursor
+        self._calls = {ev.id: ev for ev in calls}
+        self._confirmations.update(confirmations)
+        self._last_was_end_turn = last_was_end_turn
+
+    def _save_checkpoint(self) -> None:
+        """Atomically write the reconcile cursor and unanswered tool calls to
+        ``checkpoint_path``. Best-effort: a failed write only means a restarted
+        runner reads more history."""
+        path = self.checkpoint_path
+        if path is None or self._cursor is None or not self._synced:
+            return
+        calls = [ev for ev in self._calls.values() if ev.id not in self._answered]
+        data: dict[str, Any] = {
+            "version": CHECKPOINT_VERSION,
+            "session_id": self.session_id,
+            "cursor": self._cursor.isoformat(),
+            "last_was_end_turn": self._last_was_end_turn,
+            "calls": [ev.to_dict(mode="json") for ev in calls],
+            "confirmations": {ev.id: self._confirmations[ev.id] for ev in calls if ev.id in self._confirmations},
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        except OSError as e:
+            log.warning("could not write session checkpoint path=%s error=%s", path, e)
+            return
+        try:
+            try:
+                os.write(fd, json.dumps(data).encode())
+            finally:
+                os.close(fd)
+            os.replace(tmp, path)
+        except OSError as e:
+            log.warning("could not write session checkpoint path=%s error=%s", path, e)
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+
     # -- confirmation gating (always_ask tools) ------------------------------
 
     async def _route_tool_event(self, ev: DispatchedToolUseEvent) -> None:
@@ -792,28 +984,11 @@ class SessionToolRunner:
     # -- tool dispatch ------------------------------------------------------
 
     async def _dispatch_loop(self) -> None:
+        """Run ``max_concurrent_tools`` workers that pull tool calls off the work queue."""
         try:
-            while True:
-                try:
-                    ev, confirmation = await self._recv_work.receive()
-                except anyio.EndOfStream:
-                    # Producer side closed — usually because ``_stop`` was set
-                    # (the idle watchdog or stream loop signalled it).
-                    return
-                try:
-                    if ev.id not in self._answered:
-                        # Shielded execute so consumer-side cancellation can't
-                        # interrupt an in-flight tool. The result will still be
-                        # posted and the DispatchedToolCall enqueued before the
-                        # cancel propagates.
-                        with anyio.CancelScope(shield=True):
-                            await self._execute(ev, confirmation)
-                finally:
-                    if confirmation == "allow":
-                        # The user-approved call is fully disposed of (executed,
-                        # or moot because it was answered elsewhere); drop the
-                        # idle-clock hold ``_apply_verdict`` kept on it.
-                        self._idle_clock.release()
+            async with anyio.create_task_group() as tg:
+                for _ in range(self.max_concurrent_tools):
+                    tg.start_soon(self._dispatch_worker)
         finally:
             # Closing the results stream signals the iterator that no more
             # results will arrive. Wrapped in a shield because we're often in a
@@ -821,6 +996,46 @@ class SessionToolRunner:
             with anyio.CancelScope(shield=True):
                 await self._send_results.aclose()
 
+    async def _dispatch_worker(self) -> None:
+        while True:
+            try:
+                ev, confirmation = await self._recv_work.receive()
+            except anyio.EndOfStream:
+                # Producer side closed — usually because ``_stop`` was set
+                # (the idle watchdog or stream loop signalled it).
+                return
+            try:
+                await self._dispatch_one(ev, confirmation)
+            finally:
+                if confirmation == "allow":
+                    # The user-approved call is fully disposed of (executed,
+                    # or moot because it was answered elsewhere); drop the
+                    # idle-clock hold ``_apply_verdict`` kept on it.
+                    self._idle_clock.release()
+
+    async def _dispatch_one(self, ev: DispatchedToolUseEvent, confirmation: Literal["allow"] | None) -> None:
+        # A reconcile after a reconnect re-enqueues every unanswered call,
+        # including ones another worker is still executing. Wait for that run
+        # to finish before checking ``_answered``, so the call runs again only
+        # if its result post failed — as it would with a single worker.
+        while True:
+            running = self._in_flight.get(ev.id)
+            if running is None:
+                break
+            await running.wait()
+        if ev.id in self._answered:
+            return
+        done = self._in_flight[ev.id] = anyio.Event()
+        try:
+            # Shielded execute so consumer-side cancellation can't interrupt
+            # an in-flight tool. The result will still be posted and the
+            # DispatchedToolCall enqueued before the cancel propagates.
+            with anyio.CancelScope(shield=True):
+                await self._execute(ev, confirmation)
+        finally:
+            del self._in_flight[ev.id]
+            done.set()
+
     async def _execute(self, ev: DispatchedToolUseEvent, confirmation: Literal["allow"] | None) -> None:
         """Run ``ev``'s tool, post its result, and surface the dispatched call.
 
@@ -891,26 +1106,83 @@ class SessionToolRunner:
         ``tool_use_id`` is the originating tool-call event id — passed
         explicitly because the result params key it differently
         (``tool_use_id`` vs ``custom_tool_use_id``) depending on the kind.
+
+        Results of calls finishing close together are coalesced into one
+        ``events.send`` (see ``RESULT_BATCH_WINDOW``); the return value still
+        reports whether this particular result landed.
+        """
+        batch = self._open_batch
+        leader = batch is None
+        if batch is None:
+            batch = self._open_batch = _ResultBatch()
+        batch.items.append((tool_result, tool_use_id))
+        if len(batch.items) >= RESULT_BATCH_MAX_EVENTS:
+            # Full: later results start a new batch.
+            self._open_batch = None
+            batch.full.set()
+
+        if not leader:
+            await batch.done.wait()
+            return tool_use_id in batch.posted
+
+        try:
+            # Only wait for other results if other calls are still running;
+            # the ones already in the batch are in flight too.
+            if len(self._in_flight) > len(batch.items):
+                with anyio.move_on_after(RESULT_BATCH_WINDOW):
+                    await batch.full.wait()
+            if self._open_batch is batch:
+                self._open_batch = None
+            batch.posted = await self._post_results(batch.items)
+        finally:
+            batch.done.set()
+        return tool_use_id in batch.posted
+
+    async def _post_results(self, items: list[tuple[DispatchedToolResultParams, str]]) -> set[str]:
+        """Post ``items`` in one ``events.send``, retrying transient failures.
+
+        Returns the ids of the results that landed. Before each retry, results
+        the live stream has since echoed back (so are in ``_answered``) are
+        dropped: the attempt that failed on our side had reached the session,
+        and posting them again would duplicate them. A batch the server rejects
+        outright is split and each result posted on its own, so one bad result
+        doesn't take the others down with it.
         """
+        pending = items
+        posted: set[str] = set()
         last_err: Exception | None = None
         for i in range(SEND_RETRIES):
+            landed = [tool_use_id for _, tool_use_id in pending if tool_use_id in self._answered]
+            if landed:
+                posted.update(landed)
+                pending = [item for item in pending if item[1] not in self._answered]
+                if not pending:
+                    return posted
             try:
                 await self._events.send(
                     self.session_id,
-                    events=[tool_result],
+                    events=[tool_result for tool_result, _ in pending],
                     extra_headers=self.extra_headers,
                 )
-                self._answered.add(tool_use_id)
-                return True
             except TRANSIENT_ERRORS as e:
                 last_err = e
                 if is_fatal_status_error(e):
+                    if len(pending) > 1:
+                        for item in pending:
+                            posted |= await self._post_results([item])
+                        return posted
                     break
                 # Don't sleep after the final attempt — there is no retry to wait for.
                 if i < SEND_RETRIES - 1:
                     await anyio.sleep(i + 1)
-        log.error("failed to send tool result tool_use_id=%s error=%s", tool_use_id, last_err)
-        return False
+            else:
+                for _, tool_use_id in pending:
+                    self._answered.add(tool_use_id)
+                    posted.add(tool_use_id)
+                return posted
+        for _, tool_use_id in pending:
+            log.error("failed to send tool result tool_use_id=%s error=%s", tool_use_id, last_err)
+        return posted
 
     # -- background watchers -----------------------------------------------
 
@@ -968,6 +1240,8 @@ async def _run_session_tools(
     *,
     tools: Sequence[BetaAnyRunnableTool],
     max_idle: float | None = DEFAULT_MAX_IDLE,
+    max_concurrent_tools: int | None = None,
+    checkpoint_path: str | os.PathLike[str] | None = None,
     environment_key: str | None = None,
     extra_headers: Headers | None = None,
 ) -> AsyncIterator[AsyncIterator[DispatchedToolCall]]:
@@ -984,6 +1258,8 @@ async def _run_session_tools(
         session_id,
         tools=tools,
         max_idle=max_idle,
+        max_concurrent_tools=max_concurrent_tools,
+        checkpoint_path=checkpoint_path,
         environment_key=environment_key,
         extra_headers=extra_headers,
     )
@@ -0,0 +1,192 @@
+"""Opt-in memoization of tool results for the tool runners.
+
+A :class:`ToolResultCache` passed as ``cache=`` to :func:`beta_tool` /
+:func:`beta_async_tool` (or the function tool constructors) makes repeated calls
+to the same tool with the same input return the stored result instead of running
+the function again. Only successful results are stored; a call that raises —
+including a :class:`ToolError` — always runs again.
+
+Two backends are provided: :class:`InMemoryToolResultCache` for a single process
+and :class:`SQLiteToolResultCache`, which persists results to a local SQLite
+file so they survive across runs. Both support a TTL and least-recently-used
+eviction past ``max_size`` entries.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Tuple, Union, Optional, cast
+from collections import OrderedDict
+from dataclasses import dataclass
+
+if TYPE_CHECKING:
+    from ._beta_functions import BetaFunctionToolResultType
+
+__all__ = [
+    "ToolCacheStats",
+    "ToolResultCache",
+    "InMemoryToolResultCache",
+    "SQLiteToolResultCache",
+    "tool_cache_key",
+]
+
+
+def tool_cache_key(name: str, input: object) -> str:
+    """The cache key for calling the tool ``name`` with ``input``.
+
+    The input is canonicalized (sorted keys, no insignificant whitespace) so that
+    inputs that only differ in key order share an entry.
+    """
+    canonical = json.dumps([name, input], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ToolCacheStats:
+    """Hit / miss counters for the cached tool calls made by a tool runner."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ToolResultCache(ABC):
+    """Storage backend for memoized tool results.
+
+    Implementations must be safe to call from multiple threads, as the sync tool
+    runner may call tools concurrently. ``get`` returns ``None`` on a miss,
+    including for an expired entry.
+
+    The async tools call a ``blocking`` cache on a worker thread, so that it doesn't
+    block the event loop, and any other cache directly.
+    """
+
+    blocking: bool = True
+    """Whether ``get`` and ``set`` may block, e.g. on disk or network I/O."""
+
+    @abstractmethod
+    def get(self, key: str) -> BetaFunctionToolResultType | None: ...
+
+    @abstractmethod
+    def set(self, key: str, value: BetaFunctionToolResultType) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class InMemoryToolResultCache(ToolResultCache):
+    """Keeps up to ``max_size`` results in memory, each for at most ``ttl`` seconds."""
+
+    blocking = False
+
+    def __init__(self, *, max_size: int | None = 1024, ttl: float | None = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (expires at, result), ordered from least to most recently used
+        self._entries: OrderedDict[str, Tuple[float, BetaFunctionToolResultType]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> BetaFunctionToolResultType | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        # results are handed to the runner which may mutate them, so never share the cached blocks
+        return value if isinstance(value, str) else copy.deepcopy(value)
+
+    def set(self, key: str, value: BetaFunctionToolResultType) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        stored = value if isinstance(value, str) else copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires_at, stored)
+            self._entries.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteToolResultCache(ToolResultCache):
+    """Persists results to the SQLite database at ``path``, so they are reused across runs.
+
+    Results must be JSON serializable, which is always the case for the text and
+    content blocks tools return.
+    """
+
+    def __init__(self, path: str, *, max_size: int | None = None, ttl: float | None = None) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tool_results ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, last_used REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> BetaFunctionToolResultType | None:
+        # wall clock time, as entries outlive the process
+        now = time.time()
+        with self._lock:
+            row: Optional[Tuple[str, Union[float, None]]] = self._conn.execute(
+                "SELECT value, expires_at FROM tool_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM tool_results WHERE key = ?", (key,))
+                return None
+
+            self._conn.execute("UPDATE tool_results SET last_used = ? WHERE key = ?", (now, key))
+
+        return cast("BetaFunctionToolResultType", json.loads(value))
+
+    def set(self, key: str, value: BetaFunctionToolResultType) -> None:
+        now = time.time()
+        encoded = json.dumps(value if isinstance(value, str) else list(value))
+        expires_at = now + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tool_results (key, value, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, encoded, expires_at, now),
+            )
+            if self.max_size is not None:
+                self._conn.execute(
+                    "DELETE FROM tool_results WHERE key NOT IN "
+                    "(SELECT key FROM tool_results ORDER BY last_used DESC LIMIT ?)",
+                    (self.max_size,),
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM tool_results")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
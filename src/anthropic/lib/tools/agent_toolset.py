@@ -486,6 +486,9 @@ def beta_bash_tool(ctx: AgentToolContext) -> BetaAsyncFunctionTool[Any]:
         # AgentToolContext purely for that lifecycle — it only reads the workdir
         # and subprocess env off ``ctx``.
         session: BashSession | None = None
+        # One shell runs one command at a time: calls that arrive together
+        # (a runner dispatching tool calls concurrently) take turns on it.
+        lock = anyio.Lock()
 
         async def _session() -> BashSession:
             nonlocal session
@@ -501,19 +504,32 @@ def beta_bash_tool(ctx: AgentToolContext) -> BetaAsyncFunctionTool[Any]:
         ) -> str:
             nonlocal session
             if restart:
-                if session is not None:
-                    await session.close()
-                    session = None
-                await _session()
+                async with lock:
+                    if session is not None:
+                        await session.close()
+                        session = None
+                    await _session()
                 return "bash session restarted"
             if not command:
                 raise ToolError("bash: command is required")
             timeout = timeout_ms / 1000.0 if timeout_ms else BASH_DEFAULT_TIMEOUT
+            # Time spent waiting for the shell counts against the command's
+            # timeout, so a queued call still finishes within the runner's
+            # outer per-call deadline.
+            deadline = anyio.current_time() + timeout
+            acquired = False
+            with anyio.move_on_after(timeout):
+                await lock.acquire()
+                acquired = True
+            if not acquired:
+                raise ToolError(f"bash: timed out after {timeout}s waiting for the previous command")
             try:
                 s = await _session()
-                out, code = await s.exec(command, timeout=timeout)
+                out, code = await s.exec(command, timeout=max(deadline - anyio.current_time(), 0.0))
             except (RuntimeError, TimeoutError) as e:
                 raise ToolError(f"bash: {e}") from e
+            finally:
+                lock.release()
             if code != 0:
                 raise ToolError(out)
             return out
@@ -1200,6 +1200,7 @@ class AsyncWork(AsyncAPIResource):
         max_file_bytes: int | None | NotGiven = not_given,
         max_idle: float | None | NotGiven = not_given,
         worker_id: str | None = None,
+        max_concurrent_sessions: int | None = None,
         extra_headers: Headers | None = None,
     ) -> EnvironmentWorker:
         """Build an :class:`~anthropic.lib.environments.EnvironmentWorker` bound to this async client.
@@ -1240,6 +1241,9 @@ class AsyncWork(AsyncAPIResource):
             when not given. ``None`` disables it.
           worker_id: Optional identifier sent on each poll. Defaults to a unique,
             hostname-prefixed id.
+          max_concurrent_sessions: How many sessions ``EnvironmentWorker.run``
+            serves at once; it only polls for more work while it has a free
+            slot. Defaults to 1.
           extra_headers: Optional headers passed through per request on every
             call the worker makes (poll / ack / stop / heartbeat and the
             session tool runner's event stream / list / send). They are
@@ -1270,6 +1274,7 @@ class AsyncWork(AsyncAPIResource):
             max_file_bytes=max_file_bytes,
             max_idle=max_idle,
             worker_id=worker_id,
+            max_concurrent_sessions=max_concurrent_sessions,
             extra_headers=extra_headers,
         )
 
@@ -1446,6 +1446,8 @@ class Messages(SyncAPIResource):
         fallbacks: Optional[BetaFallbacksParam] | Omit = omit,
         inference_geo: Optional[str] | Omit = omit,
         max_iterations: int | Omit = omit,
+        max_concurrent_tools: int | Omit = omit,
+        tool_timeout: float | Omit = omit,
         mcp_servers: Iterable[BetaRequestMCPServerURLDefinitionParam] | Omit = omit,
         metadata: BetaMetadataParam | Omit = omit,
         output_config: BetaOutputConfigParam | Omit = omit,
@@ -1482,6 +1484,8 @@ class Messages(SyncAPIResource):
         compaction_control: CompactionControl | Omit = omit,
         stream: Literal[True],
         max_iterations: int | Omit = omit,
+        max_concurrent_tools: int | Omit = omit,
+        tool_timeout: float | Omit = omit,
         container: Optional[message_create_params.Container] | Omit = omit,
         context_management: Optional[BetaContextManagementConfigParam] | Omit = omit,
         diagnostics: Optional[BetaDiagnosticsParam] | Omit = omit,
@@ -1522,6 +1526,8 @@ class Messages(SyncAPIResource):
         compaction_control: CompactionControl | Omit = omit,
         stream: bool,
         max_iterations: int | Omit = omit,
+        max_concurrent_tools: int | Omit = omit,
+        tool_timeout: float | Omit = omit,
         cache_control: Optional[BetaCacheControlEphemeralParam] | Omit = omit,
         container: Optional[message_create_params.Container] | Omit = omit,
         context_management: Optional[BetaContextManagementConfigParam] | Omit = omit,
@@ -1561,6 +1567,8 @@ class Messages(SyncAPIResource):
         tools: Iterable[BetaRunnableTool | BetaToolUnionParam],
         compaction_control: CompactionControl | Omit = omit,
         max_iterations: int | Omit = omit,
+        max_concurrent_tools: int | Omit = omit,
+        tool_timeout: float | Omit = omit,
         cache_control: Optional[BetaCacheControlEphemeralParam] | Omit = omit,
         container: Optional[message_create_params.Container] | Omit = omit,
         context_management: Optional[BetaContextManagementConfigParam] | Omit = omit,
@@ -1679,6 +1687,8 @@ class Messages(SyncAPIResource):
                 },
                 client=cast("Anthropic", self._client),
                 max_iterations=max_iterations if is_given(max_iterations) else None,
+                max_concurrent_tools=max_concurrent_tools if is_given(max_concurrent_tools) else None,
+                tool_timeout=tool_timeout if is_given(tool_timeout) else None,
                 compaction_control=compaction_control if is_given(compaction_control) else None,
             )
         return BetaToolRunner[ResponseFormatT](
@@ -1692,6 +1702,8 @@ class Messages(SyncAPIResource):
             },
             client=cast("Anthropic", self._client),
             max_iterations=max_iterations if is_given(max_iterations) else None,
+            max_concurrent_tools=max_concurrent_tools if is_given(max_concurrent_tools) else None,
+            tool_timeout=tool_timeout if is_given(tool_timeout) else None,
             compaction_control=compaction_control if is_given(compaction_control) else None,
         )
 
@@ -1708,6 +1720,7 @@ class Messages(SyncAPIResource):
         fallback_credit_token: Optional[message_create_params.FallbackCreditToken] | Omit = omit,
         fallbacks: Optional[BetaFallbacksParam] | Omit = omit,
         inference_geo: Optional[str] | Omit = omit,
+        lazy_snapshot: bool = False,
         mcp_servers: Iterable[BetaRequestMCPServerURLDefinitionParam] | Omit = omit,
         metadata: BetaMetadataParam | Omit = omit,
         output_config: BetaOutputConfigParam | Omit = omit,
@@ -1829,6 +1842,7 @@ class Messages(SyncAPIResource):
         return BetaMessageStreamManager(
             make_request,
             output_format=NOT_GIVEN if is_dict(output_format) else cast(ResponseFormatT, output_format),
+            lazy_snapshot=lazy_snapshot,
         )
 
     def count_tokens(
@@ -3457,6 +3471,8 @@ class AsyncMessages(AsyncAPIResource):
         cache_control: Optional[BetaCacheControlEphemeralParam] | Omit = omit,
         compaction_control: CompactionControl | Omit = omit,
         max_iterations: int | Omit = omit,
+        max_concurrent_tools: int | Omit = omit,
+        tool_timeout: float | Omit = omit,
         container: Optional[message_create_params.Container] | Omit = omit,
         context_management: Optional[BetaContextManagementConfigParam] | Omit = omit,
         diagnostics: Optional[BetaDiagnosticsParam] | Omit = omit,
@@ -3498,6 +3514,8 @@ class AsyncMessages(AsyncAPIResource):
         compaction_control: CompactionControl | Omit = omit,
         stream: Literal[True],
         max_iterations: int | Omit = omit,
+        max_concurrent_tools: int | Omit = omit,
+        tool_timeout: float | Omit = omit,
         cache_control: Optional[BetaCacheControlEphemeralParam] | Omit = omit,
         container: Optional[message_create_params.Container] | Omit = omit,
         context_management: Optional[BetaContextManagementConfigParam] | Omit = omit,
@@ -3539,6 +3557,8 @@ class AsyncMessages(AsyncAPIResource):
         compaction_control: CompactionControl | Omit = omit,
         stream: bool,
         max_iterations: int | Omit = omit,
+        max_concurrent_tools: int | Omit = omit,
+        tool_timeout: float | Omit = omit,
         cache_control: Optional[BetaCacheControlEphemeralParam] | Omit = omit,
         container: Optional[message_create_params.Container] | Omit = omit,
         context_management: Optional[BetaContextManagementConfigParam] | Omit = omit,
@@ -3578,6 +3598,8 @@ class AsyncMessages(AsyncAPIResource):
         tools: Iterable[BetaAsyncRunnableTool | BetaToolUnionParam],
         compaction_control: CompactionControl | Omit = omit,
         max_iterations: int | Omit = omit,
+        max_concurrent_tools: int | Omit = omit,
+        tool_timeout: float | Omit = omit,
         cache_control: Optional[BetaCacheControlEphemeralParam] | Omit = omit,
         container: Optional[message_create_params.Container] | Omit = omit,
         context_management: Optional[BetaContextManagementConfigParam] | Omit = omit,
@@ -3689,6 +3711,8 @@ class AsyncMessages(AsyncAPIResource):
                 },
                 client=cast("AsyncAnthropic", self._client),
                 max_iterations=max_iterations if is_given(max_iterations) else None,
+                max_concurrent_tools=max_concurrent_tools if is_given(max_concurrent_tools) else None,
+                tool_timeout=tool_timeout if is_given(tool_timeout) else None,
                 compaction_control=compaction_control if is_given(compaction_control) else None,
             )
         return BetaAsyncToolRunner[ResponseFormatT](
@@ -3702,6 +3726,8 @@ class AsyncMessages(AsyncAPIResource):
             },
             client=cast("AsyncAnthropic", self._client),
             max_iterations=max_iterations if is_given(max_iterations) else None,
+            max_concurrent_tools=max_concurrent_tools if is_given(max_concurrent_tools) else None,
+            tool_timeout=tool_timeout if is_given(tool_timeout) else None,
             compaction_control=compaction_control if is_given(compaction_control) else None,
         )
 
@@ -3721,6 +3747,7 @@ class AsyncMessages(AsyncAPIResource):
         fallback_credit_token: Optional[message_create_params.FallbackCreditToken] | Omit = omit,
         fallbacks: Optional[BetaFallbacksParam] | Omit = omit,
         inference_geo: Optional[str] | Omit = omit,
+        lazy_snapshot: bool = False,
         mcp_servers: Iterable[BetaRequestMCPServerURLDefinitionParam] | Omit = omit,
         service_tier: Literal["auto", "standard_only"] | Omit = omit,
         speed: Optional[Literal["standard", "fast"]] | Omit = omit,
@@ -3837,6 +3864,7 @@ class AsyncMessages(AsyncAPIResource):
         return BetaAsyncMessageStreamManager(
             request,
             output_format=NOT_GIVEN if is_dict(output_format) else cast(ResponseFormatT, output_format),
+            lazy_snapshot=lazy_snapshot,
         )
 
     async def count_tokens(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING, Any, List, Union, Iterable, cast
 from datetime import datetime
 from itertools import chain
@@ -512,6 +513,8 @@ class AsyncEvents(AsyncAPIResource):
         *,
         tools: Sequence[BetaAnyRunnableTool],
         max_idle: float | None | NotGiven = not_given,
+        max_concurrent_tools: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
         environment_key: str | None = None,
         extra_headers: Headers | None = None,
     ) -> SessionToolRunner:
@@ -567,6 +570,14 @@ class AsyncEvents(AsyncAPIResource):
             ``stop_reason`` ``end_turn`` before stopping; any new event resets
             the countdown. Defaults to ``DEFAULT_MAX_IDLE`` (60s) when not
             given. ``None`` disables it.
+          max_concurrent_tools: The maximum number of tool calls to run at
+            once. Defaults to one at a time. With more, calls are yielded as
+            they finish, so only raise it for tools that are safe to run
+            concurrently.
+          checkpoint_path: Optional file in which the runner keeps its position
+            in the session's event history (and the tool calls still
+            unanswered at it), so a restarted runner resumes from there
+            instead of reading the whole history again.
           environment_key: The self-hosted environment key. When set, the
             runner builds a Bearer-only scoped sub-client keyed to that
             environment for the event stream / list / send calls; leave it
@@ -595,6 +606,8 @@ class AsyncEvents(AsyncAPIResource):
             session_id,
             tools=tools,
             max_idle=max_idle,
+            max_concurrent_tools=max_concurrent_tools,
+            checkpoint_path=checkpoint_path,
             environment_key=environment_key,
             extra_headers=extra_headers,
         )
@@ -1088,6 +1088,7 @@ class Messages(SyncAPIResource):
         model: ModelParam,
         cache_control: Optional[CacheControlEphemeralParam] | Omit = omit,
         inference_geo: Optional[str] | Omit = omit,
+        lazy_snapshot: bool = False,
         metadata: MetadataParam | Omit = omit,
         output_config: OutputConfigParam | Omit = omit,
         output_format: None | JSONOutputFormatParam | type[ResponseFormatT] | Omit = omit,
@@ -1195,6 +1196,7 @@ class Messages(SyncAPIResource):
         return MessageStreamManager(
             make_request,
             output_format=NOT_GIVEN if is_dict(output_format) else cast(ResponseFormatT, output_format),
+            lazy_snapshot=lazy_snapshot,
         )
 
     def parse(
@@ -2583,6 +2585,7 @@ class AsyncMessages(AsyncAPIResource):
         model: ModelParam,
         cache_control: Optional[CacheControlEphemeralParam] | Omit = omit,
         inference_geo: Optional[str] | Omit = omit,
+        lazy_snapshot: bool = False,
         metadata: MetadataParam | Omit = omit,
         output_config: OutputConfigParam | Omit = omit,
         output_format: None | JSONOutputFormatParam | type[ResponseFormatT] | Omit = omit,
@@ -2689,6 +2692,7 @@ class AsyncMessages(AsyncAPIResource):
         return AsyncMessageStreamManager(
             request,
             output_format=NOT_GIVEN if is_dict(output_format) else cast(ResponseFormatT, output_format),
+            lazy_snapshot=lazy_snapshot,
         )
 
     async def parse(
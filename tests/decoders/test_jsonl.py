@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Iterator, AsyncIterator
+import json
+from typing import Any, List, Iterator, AsyncIterator
 from typing_extensions import TypeVar
 
 import httpx
 import pytest
 
+from anthropic import BaseModel
+from anthropic._decoders import jsonl
 from anthropic._decoders.jsonl import JSONLDecoder, AsyncJSONLDecoder
 
 _T = TypeVar("_T")
@@ -60,6 +63,71 @@ async def test_multi_byte_character_multiple_chunks(
     assert await iter_next(iterator) == {"content": "известни"}
 
 
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_line_endings_and_blank_lines(sync: bool) -> None:
+    def body() -> Iterator[bytes]:
+        yield b'{"a":1}\r\n\n{"b"'
+        yield b":2}\r"
+        yield b"  \n"
+        yield b'{"c":3}'
+
+    iterator = make_jsonl_iterator(content=body(), sync=sync, line_type=object)
+
+    assert await iter_next(iterator) == {"a": 1}
+    assert await iter_next(iterator) == {"b": 2}
+    assert await iter_next(iterator) == {"c": 3}
+    await assert_empty_iter(iterator)
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_line_split_across_many_chunks(sync: bool) -> None:
+    line = json.dumps({"content": "x" * 10_000}).encode()
+
+    def body() -> Iterator[bytes]:
+        for i in range(0, len(line), 7):
+            yield line[i : i + 7]
+        yield b"\n"
+
+    iterator = make_jsonl_iterator(content=body(), sync=sync, line_type=object)
+
+    assert await iter_next(iterator) == {"content": "x" * 10_000}
+    await assert_empty_iter(iterator)
+
+
+class Line(BaseModel):
+    id: str
+    value: int
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_lazy(sync: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    constructed: List[object] = []
+    original = jsonl.construct_type_unchecked
+
+    def construct_type_unchecked(*, value: object, type_: Any) -> Any:
+        constructed.append(value)
+        return original(value=value, type_=type_)
+
+    monkeypatch.setattr(jsonl, "construct_type_unchecked", construct_type_unchecked)
+
+    def body() -> Iterator[bytes]:
+        yield b'{"id":"a","value":1}\n{"id":"b","value":2}\n'
+
+    iterator = make_jsonl_iterator(content=body(), sync=sync, line_type=Line).lazy()
+
+    first = await iter_next(iterator)
+    second = await iter_next(iterator)
+    assert constructed == []
+
+    assert second.id == "b"
+    assert second.value == 2
+    assert isinstance(second, Line)
+    assert constructed == [{"id": "b", "value": 2}]
+
+    assert first.value == 1
+    assert len(constructed) == 2
+
+
 async def to_aiter(iter: Iterator[bytes]) -> AsyncIterator[bytes]:
     for chunk in iter:
         yield chunk
@@ -21,7 +21,7 @@ import os
 import asyncio
 import contextlib
 from types import SimpleNamespace
-from typing import Any
+from typing import Any, cast
 from collections.abc import AsyncIterator
 from typing_extensions import override
 
@@ -533,3 +533,151 @@ async def test_heartbeat_starts_before_skill_download(monkeypatch: pytest.Monkey
     assert order.index("heartbeat") < order.index("setup_end")
     # The work item was still force-stopped on exit.
     assert len(work.stop_calls) == 1
+
+
+def _install_gated_run_session_tools(
+    monkeypatch: pytest.MonkeyPatch, started: list[str], release: dict[str, asyncio.Event]
+) -> None:
+    """Each session runs until ``release[session_id]`` is set; a session whose
+    id starts with ``fail`` then raises instead of finishing."""
+
+    @contextlib.asynccontextmanager
+    async def fake_run_session_tools(
+        _client: Any,
+        session_id: str,
+        *,
+        tools: Any,  # noqa: ARG001
+        max_idle: Any = None,  # noqa: ARG001
+        environment_key: Any = None,  # noqa: ARG001
+        extra_headers: Any = None,  # noqa: ARG001
+    ) -> AsyncIterator[AsyncIterator[Any]]:
+        started.append(session_id)
+        gate = release.setdefault(session_id, asyncio.Event())
+
+        async def _iter() -> AsyncIterator[Any]:
+            await gate.wait()
+            if session_id.startswith("fail"):
+                raise RuntimeError(f"{session_id} broke")
+            # No tool calls; the loop only makes this an async generator function.
+            for never in range(0):
+                yield never
+
+        yield _iter()
+
+    monkeypatch.setattr(worker_mod, "_run_session_tools", fake_run_session_tools)
+
+
+async def _wait_until(predicate: Any) -> None:
+    async def poll() -> None:
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout=5)
+
+
+@pytest.mark.asyncio()
+async def test_run_serves_sessions_concurrently_up_to_the_limit(monkeypatch: pytest.MonkeyPatch, tmp_path: Any) -> None:
+    work = _FakeWorkResource(heartbeat_state="running")
+    client = _fake_client(work, _FakeSessions())
+    _install_scoped_client(monkeypatch, work)
+    pulled: list[str] = []
+
+    async def fake_aiter_work(_work: Any, **_kw: Any) -> AsyncIterator[Any]:
+        for i in (1, 2, 3):
+            pulled.append(f"w_{i}")
+            yield _work_item(work_id=f"w_{i}", session_id=f"s_{i}")
+
+    monkeypatch.setattr(worker_mod, "aiter_work", fake_aiter_work)
+    started: list[str] = []
+    release: dict[str, asyncio.Event] = {}
+    _install_gated_run_session_tools(monkeypatch, started, release)
+
+    worker = EnvironmentWorker(
+        client, environment_id="e_1", environment_key="env_key", workdir=tmp_path, tools=[], max_concurrent_sessions=2
+    )
+    task = asyncio.ensure_future(worker.run())
+    await _wait_until(lambda: started == ["s_1", "s_2"])
+    await asyncio.sleep(0.05)
+    # Both slots are taken, so the third item hasn't been polled for.
+    assert pulled == ["w_1", "w_2"]
+    assert worker.active_sessions == 2
+    assert worker.utilization == 1.0
+
+    release["s_1"].set()
+    await _wait_until(lambda: started == ["s_1", "s_2", "s_3"])
+    assert pulled == ["w_1", "w_2", "w_3"]
+    release["s_2"].set()
+    release["s_3"].set()
+    await asyncio.wait_for(task, timeout=5)
+
+    assert worker.active_sessions == 0
+    assert sorted(call["work_id"] for call in work.stop_calls) == ["w_1", "w_2", "w_3"]
+    # Each concurrent session got its own workdir.
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["s_1", "s_2", "s_3"]
+
+
+@pytest.mark.asyncio()
+async def test_drain_stops_polling_and_waits_for_sessions_in_flight(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    work = _FakeWorkResource(heartbeat_state="running")
+    client = _fake_client(work, _FakeSessions())
+    _install_scoped_client(monkeypatch, work)
+
+    async def fake_aiter_work(_work: Any, **_kw: Any) -> AsyncIterator[Any]:
+        yield _work_item(work_id="w_1", session_id="s_1")
+        # An empty queue: keep polling forever.
+        await asyncio.Event().wait()
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(worker_mod, "aiter_work", fake_aiter_work)
+    started: list[str] = []
+    release: dict[str, asyncio.Event] = {}
+    _install_gated_run_session_tools(monkeypatch, started, release)
+
+    worker = EnvironmentWorker(
+        client, environment_id="e_1", environment_key="env_key", workdir=tmp_path, tools=[], max_concurrent_sessions=4
+    )
+    task = asyncio.ensure_future(worker.run())
+    await _wait_until(lambda: started == ["s_1"])
+
+    worker.drain()
+    await asyncio.sleep(0.05)
+    assert not task.done(), "run() must wait for the session in flight"
+    assert worker.utilization == 0.25
+
+    release["s_1"].set()
+    await asyncio.wait_for(task, timeout=5)
+    assert [call["work_id"] for call in work.stop_calls] == ["w_1"]
+
+
+@pytest.mark.asyncio()
+async def test_failing_session_stops_the_others_and_propagates(monkeypatch: pytest.MonkeyPatch, tmp_path: Any) -> None:
+    work = _FakeWorkResource(heartbeat_state="running")
+    client = _fake_client(work, _FakeSessions())
+    _install_scoped_client(monkeypatch, work)
+    _install_aiter_work(
+        monkeypatch, [_work_item(work_id="w_1", session_id="fail_1"), _work_item(work_id="w_2", session_id="s_2")]
+    )
+    started: list[str] = []
+    release: dict[str, asyncio.Event] = {}
+    _install_gated_run_session_tools(monkeypatch, started, release)
+
+    worker = EnvironmentWorker(
+        client, environment_id="e_1", environment_key="env_key", workdir=tmp_path, tools=[], max_concurrent_sessions=2
+    )
+    task = asyncio.ensure_future(worker.run())
+    await _wait_until(lambda: started == ["fail_1", "s_2"])
+    release["fail_1"].set()
+
+    # Raised as-is from the failing session's own task group.
+    with pytest.raises(Exception) as exc_info:  # noqa: B017
+        await asyncio.wait_for(task, timeout=5)
+    assert [str(e) for e in cast(Any, exc_info.value).exceptions] == ["fail_1 broke"]
+    # The other session was cancelled and its work item still force-stopped.
+    assert sorted(call["work_id"] for call in work.stop_calls) == ["w_1", "w_2"]
+
+
+def test_max_concurrent_sessions_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_concurrent_sessions must be at least 1, got 0"):
+        EnvironmentWorker(cast(Any, None), max_concurrent_sessions=0)
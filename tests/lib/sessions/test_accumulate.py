@@ -14,8 +14,12 @@ from anthropic.types.beta import (
     BetaManagedAgentsAgentMessagePreview,
     BetaManagedAgentsAgentThinkingPreview,
 )
-from anthropic.lib.sessions import accumulate_managed_agents_event
-from anthropic.types.beta.sessions import BetaManagedAgentsTextBlock, BetaManagedAgentsAgentMessageEvent
+from anthropic.lib.sessions import AgentMessageAccumulator, accumulate_managed_agents_event
+from anthropic.types.beta.sessions import (
+    BetaManagedAgentsTextBlock,
+    BetaManagedAgentsAgentMessageEvent,
+    BetaManagedAgentsStreamSessionEvents,
+)
 
 
 def start(event_id: str) -> BetaManagedAgentsStartEvent:
@@ -168,3 +172,64 @@ def test_unknown_block_type_pair_is_a_noop_forward_compat() -> None:
     msg.content.append(cast(Any, future_block))
     next_ = fold(msg, delta("evt_1", "ignored", 0))
     assert next_.content[0].model_dump() == before
+
+
+def test_accumulator_matches_folding_each_event() -> None:
+    events: list[BetaManagedAgentsStreamSessionEvents] = [
+        start("evt_1"),
+        delta("evt_1", "Hel", 0),
+        delta("evt_1", "lo"),
+        delta("evt_1", "World", 1),
+        delta("evt_1", "!", 1),
+    ]
+    accumulator = AgentMessageAccumulator()
+    msg = None
+    for ev in events:
+        accumulator.accumulate(ev)
+        msg = accumulate_managed_agents_event(msg, ev)
+    assert accumulator.snapshot == msg
+    assert msg is not None
+    assert msg.content == [
+        BetaManagedAgentsTextBlock(type="text", text="Hello"),
+        BetaManagedAgentsTextBlock(type="text", text="World!"),
+    ]
+
+
+def test_accumulator_snapshot_is_none_before_event_start() -> None:
+    accumulator = AgentMessageAccumulator()
+    assert accumulator.snapshot is None
+    with pytest.raises(AnthropicError, match=r"event_delta for evt_1 received before its event_start"):
+        accumulator.accumulate(delta("evt_1", "x", 0))
+
+
+def test_accumulator_does_not_mutate_snapshots_it_returned() -> None:
+    accumulator = AgentMessageAccumulator()
+    accumulator.accumulate(start("evt_1"))
+    accumulator.accumulate(delta("evt_1", "a", 0))
+    first = accumulator.snapshot
+    assert accumulator.snapshot is first, "an unchanged snapshot is not rebuilt"
+
+    accumulator.accumulate(delta("evt_1", "b", 0))
+    accumulator.accumulate(delta("evt_1", "c", 1))
+    second = accumulator.snapshot
+    assert first is not None and second is not None
+    assert first.content == [BetaManagedAgentsTextBlock(type="text", text="a")]
+    assert second.content == [
+        BetaManagedAgentsTextBlock(type="text", text="ab"),
+        BetaManagedAgentsTextBlock(type="text", text="c"),
+    ]
+
+
+def test_accumulator_final_event_replaces_buffered_deltas() -> None:
+    accumulator = AgentMessageAccumulator()
+    accumulator.accumulate(start("evt_1"))
+    accumulator.accumulate(delta("evt_1", "partial", 0))
+    final = BetaManagedAgentsAgentMessageEvent(
+        id="evt_1",
+        type="agent.message",
+        content=[BetaManagedAgentsTextBlock(type="text", text="complete")],
+        processed_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    accumulator.accumulate(final)
+    assert accumulator.snapshot == final
+    assert accumulator.snapshot is not final
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import copy
 import json
 from typing import Any, Set, Dict, TypeVar, cast
 from unittest import TestCase
@@ -12,6 +13,7 @@ from respx import MockRouter
 from anthropic import Anthropic, AsyncAnthropic
 from anthropic._utils import assert_overloads_in_sync, assert_signatures_in_sync
 from anthropic._compat import PYDANTIC_V1
+from anthropic.lib.streaming._pending import PendingDeltas
 from anthropic.types.beta.beta_message import BetaMessage
 from anthropic.lib.streaming._beta_types import BetaCompactionEvent, ParsedBetaMessageStreamEvent
 from anthropic.resources.messages.messages import DEPRECATED_MODELS
@@ -309,6 +311,56 @@ class TestSyncMessages:
 
             assert_tool_use_response([event for event in stream], stream.get_final_message())
 
+    @pytest.mark.respx(base_url=base_url)
+    def test_lazy_snapshot(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/v1/messages").mock(
+            return_value=httpx.Response(200, content=get_response("tool_use_response.txt"))
+        )
+
+        with sync_client.beta.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+            lazy_snapshot=True,
+        ) as stream:
+            assert_tool_use_response([event for event in stream], stream.get_final_message())
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_lazy_snapshot_events_do_not_flush(self, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+        respx_mock.post("/v1/messages").mock(
+            return_value=httpx.Response(200, content=get_response("tool_use_response.txt"))
+        )
+        with sync_client.beta.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+        ) as stream:
+            eager = [event for event in stream]
+
+        flushes: list[object] = []
+        flush = PendingDeltas.flush
+        monkeypatch.setattr(PendingDeltas, "flush", lambda self, content: flushes.append(flush(self, content)))
+
+        respx_mock.post("/v1/messages").mock(
+            return_value=httpx.Response(200, content=get_response("tool_use_response.txt"))
+        )
+        with sync_client.beta.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+            lazy_snapshot=True,
+        ) as stream:
+            events = [event for event in stream]
+
+        # blocks are flushed as they stop, iterating the events never flushes the whole snapshot
+        assert flushes == []
+        # snapshots read after the stream has moved on still reflect the deltas seen so far,
+        # including when the events are copied or compared before they're read
+        copies = [copy.copy(event) for event in events]
+        assert copies == eager
+        assert events == eager
+        assert [event.to_dict() for event in events] == [event.to_dict() for event in eager]
+
     @pytest.mark.respx(base_url=base_url)
     def test_context_manager(self, respx_mock: MockRouter) -> None:
         respx_mock.post("/v1/messages").mock(
@@ -510,6 +562,24 @@ class TestAsyncMessages:
                 [event async for event in stream], await stream.get_final_message()
             )
 
+    @pytest.mark.asyncio
+    @pytest.mark.respx(base_url=base_url)
+    async def test_incomplete_response_lazy_snapshot(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/v1/messages").mock(
+            return_value=httpx.Response(
+                200, content=to_async_iter(get_response("incomplete_partial_json_response.txt"))
+            )
+        )
+
+        async with async_client.beta.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+            lazy_snapshot=True,
+        ) as stream:
+            await stream.until_done()
+            assert_message_matches(stream.current_message_snapshot, EXPECTED_INCOMPLETE_MESSAGE)
+
     @pytest.mark.asyncio
     @pytest.mark.respx(base_url=base_url)
     async def test_refusal_stop_details_propagated(self, respx_mock: MockRouter) -> None:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Set, TypeVar, cast
+import copy
+from typing import Any, Set, TypeVar, NoReturn, cast
 
 import httpx
 import pytest
@@ -10,9 +11,10 @@ from respx import MockRouter
 from anthropic import Stream, Anthropic, AsyncStream, AsyncAnthropic
 from anthropic._utils import assert_signatures_in_sync
 from anthropic._compat import PYDANTIC_V1
-from anthropic.lib.streaming import ParsedMessageStreamEvent
+from anthropic.lib.streaming import ParsedMessageStreamEvent, _messages
 from anthropic.types.message import Message
 from anthropic.resources.messages import DEPRECATED_MODELS
+from anthropic.lib.streaming._pending import PendingDeltas
 from anthropic.lib.streaming._messages import TRACKS_TOOL_INPUT
 
 from .helpers import get_response, to_async_iter
@@ -193,6 +195,83 @@ class TestSyncMessages:
 
             assert_tool_use_response([event for event in stream], stream.get_final_message())
 
+    @pytest.mark.respx(base_url=base_url)
+    @pytest.mark.parametrize("fixture", ["basic_response.txt", "tool_use_response.txt"])
+    def test_lazy_snapshot(self, respx_mock: MockRouter, fixture: str) -> None:
+        respx_mock.post("/v1/messages").mock(return_value=httpx.Response(200, content=get_response(fixture)))
+        with sync_client.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+        ) as stream:
+            events = [event for event in stream]
+            eager = stream.get_final_message()
+
+        respx_mock.post("/v1/messages").mock(return_value=httpx.Response(200, content=get_response(fixture)))
+        with sync_client.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+            lazy_snapshot=True,
+        ) as stream:
+            assert [event.to_dict() for event in stream] == [event.to_dict() for event in events]
+            assert stream.get_final_message().to_dict() == eager.to_dict()
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_lazy_snapshot_events_do_not_flush(self, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+        respx_mock.post("/v1/messages").mock(
+            return_value=httpx.Response(200, content=get_response("tool_use_response.txt"))
+        )
+        with sync_client.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+        ) as stream:
+            eager = [event for event in stream]
+
+        flushes: list[object] = []
+        flush = PendingDeltas.flush
+        monkeypatch.setattr(PendingDeltas, "flush", lambda self, content: flushes.append(flush(self, content)))
+
+        respx_mock.post("/v1/messages").mock(
+            return_value=httpx.Response(200, content=get_response("tool_use_response.txt"))
+        )
+        with sync_client.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+            lazy_snapshot=True,
+        ) as stream:
+            events = [event for event in stream]
+
+        # blocks are flushed as they stop, iterating the events never flushes the whole snapshot
+        assert flushes == []
+        # snapshots read after the stream has moved on still reflect the deltas seen so far,
+        # including when the events are copied or compared before they're read
+        copies = [copy.copy(event) for event in events]
+        assert copies == eager
+        assert events == eager
+        assert [event.to_dict() for event in events] == [event.to_dict() for event in eager]
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_text_stream_does_not_build_events(self, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+        respx_mock.post("/v1/messages").mock(
+            return_value=httpx.Response(200, content=get_response("basic_response.txt"))
+        )
+
+        def build_events(**_kwargs: object) -> NoReturn:
+            raise AssertionError("events should not be built")
+
+        monkeypatch.setattr(_messages, "build_events", build_events)
+
+        with sync_client.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+        ) as stream:
+            assert "".join(stream.text_stream) == "Hello there!"
+            assert stream.get_final_text() == "Hello there!"
+
     @pytest.mark.respx(base_url=base_url)
     def test_refusal_stop_details_propagated(self, respx_mock: MockRouter) -> None:
         respx_mock.post("/v1/messages").mock(
@@ -291,6 +370,45 @@ class TestAsyncMessages:
 
             assert_tool_use_response([event async for event in stream], await stream.get_final_message())
 
+    @pytest.mark.asyncio
+    @pytest.mark.respx(base_url=base_url)
+    async def test_lazy_snapshot(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/v1/messages").mock(
+            return_value=httpx.Response(200, content=to_async_iter(get_response("tool_use_response.txt")))
+        )
+
+        async with async_client.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+            lazy_snapshot=True,
+        ) as stream:
+            assert_tool_use_response([event async for event in stream], await stream.get_final_message())
+
+    @pytest.mark.asyncio
+    @pytest.mark.respx(base_url=base_url)
+    async def test_until_done_does_not_build_events(
+        self, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        respx_mock.post("/v1/messages").mock(
+            return_value=httpx.Response(200, content=to_async_iter(get_response("tool_use_response.txt")))
+        )
+
+        def build_events(**_kwargs: object) -> NoReturn:
+            raise AssertionError("events should not be built")
+
+        monkeypatch.setattr(_messages, "build_events", build_events)
+
+        async with async_client.messages.stream(
+            max_tokens=1024,
+            messages=[{"role": "user", "content": "Say hello there!"}],
+            model="claude-sonnet-4-5",
+            lazy_snapshot=True,
+        ) as stream:
+            message = await stream.get_final_message()
+            assert message.content[1].type == "tool_use"
+            assert message.content[1].input == {"location": "Paris"}
+
     @pytest.mark.asyncio
     @pytest.mark.respx(base_url=base_url)
     async def test_refusal_stop_details_propagated(self, respx_mock: MockRouter) -> None:
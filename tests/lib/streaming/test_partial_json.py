@@ -3,10 +3,17 @@ from typing import List, cast
 
 import httpx
 
-from anthropic.types.beta import BetaDirectCaller, BetaToolUseBlock, BetaInputJSONDelta, BetaRawContentBlockDeltaEvent
+from anthropic.types.beta import (
+    BetaDirectCaller,
+    BetaToolUseBlock,
+    BetaInputJSONDelta,
+    BetaRawContentBlockStopEvent,
+    BetaRawContentBlockDeltaEvent,
+)
 from anthropic.types.tool_use_block import ToolUseBlock
 from anthropic.types.beta.beta_usage import BetaUsage
-from anthropic.lib.streaming._beta_messages import accumulate_event
+from anthropic.lib.streaming._pending import PendingDeltas
+from anthropic.lib.streaming._beta_messages import accumulate_event, parse_tool_input
 from anthropic.types.beta.parsed_beta_message import ParsedBetaMessage
 
 
@@ -147,3 +154,52 @@ class TestPartialJson:
             )
         except Exception as e:
             raise AssertionError(f"Unexpected error type: {type(e).__name__} with message: {str(e)}") from e
+
+    def test_pending_deltas_are_applied_on_block_stop(self) -> None:
+        """Test that buffered tool input deltas are parsed once, when the block stops."""
+        message = ParsedBetaMessage(
+            id="msg_123",
+            type="message",
+            role="assistant",
+            content=[
+                BetaToolUseBlock(
+                    type="tool_use",
+                    input={},
+                    id="tool_123",
+                    name="test_tool",
+                    caller=BetaDirectCaller(type="direct"),
+                )
+            ],
+            model="claude-sonnet-4-5",
+            stop_reason=None,
+            stop_sequence=None,
+            usage=BetaUsage(input_tokens=10, output_tokens=10),
+        )
+        request_headers = httpx.Headers({"anthropic-beta": "fine-grained-tool-streaming-2025-05-14"})
+        pending = PendingDeltas(parse_json=lambda buf: parse_tool_input(buf, request_headers=request_headers))
+
+        for partial_json in ['{"items": ["item1",', ' "item2"], "field": "val', 'ue"}']:
+            accumulate_event(
+                event=BetaRawContentBlockDeltaEvent(
+                    type="content_block_delta",
+                    index=0,
+                    delta=BetaInputJSONDelta(type="input_json_delta", partial_json=partial_json),
+                ),
+                current_snapshot=message,
+                request_headers=request_headers,
+                pending=pending,
+            )
+
+        # nothing has been applied to the snapshot yet
+        assert pending
+        assert cast(ToolUseBlock, message.content[0]).input == {}
+
+        accumulate_event(
+            event=BetaRawContentBlockStopEvent(type="content_block_stop", index=0),
+            current_snapshot=message,
+            request_headers=request_headers,
+            pending=pending,
+        )
+
+        assert not pending
+        assert cast(ToolUseBlock, message.content[0]).input == {"items": ["item1", "item2"], "field": "value"}
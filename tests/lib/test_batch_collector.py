@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import os
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from anthropic import Anthropic, AsyncAnthropic
+from anthropic.lib.batches import BatchCollector, BatchRequestError, AsyncBatchCollector
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+
+class FakeBatchesAPI:
+    """Serves the Message Batches endpoints, succeeding every request by echoing its first message."""
+
+    def __init__(self, respx_mock: MockRouter, *, polls_until_ended: int = 1) -> None:
+        self.polls_until_ended = polls_until_ended
+        self.created: List[List[Dict[str, Any]]] = []
+        self.polls: Dict[str, int] = {}
+
+        respx_mock.post("/v1/messages/batches").mock(side_effect=self.create)
+        respx_mock.get(url__regex=r".*/v1/messages/batches/[^/]+/results$").mock(side_effect=self.results)
+        respx_mock.get(url__regex=r".*/v1/messages/batches/[^/]+$").mock(side_effect=self.retrieve)
+
+    def batch(self, batch_id: str, *, ended: bool) -> Dict[str, Any]:
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "created_at": "2024-01-01T00:00:00Z",
+            "expires_at": "2024-01-02T00:00:00Z",
+            "request_counts": {"canceled": 0, "errored": 0, "expired": 0, "processing": 0, "succeeded": 0},
+            "results_url": f"{base_url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def create(self, request: httpx.Request) -> httpx.Response:
+        batch_id = f"msgbatch_{len(self.created)}"
+        self.created.append(json.loads(request.content)["requests"])
+        self.polls[batch_id] = 0
+        return httpx.Response(200, json=self.batch(batch_id, ended=False))
+
+    def retrieve(self, request: httpx.Request) -> httpx.Response:
+        batch_id = request.url.path.rsplit("/", 1)[-1]
+        self.polls[batch_id] += 1
+        return httpx.Response(200, json=self.batch(batch_id, ended=self.polls[batch_id] >= self.polls_until_ended))
+
+    def results(self, request: httpx.Request) -> httpx.Response:
+        batch_id = request.url.path.split("/")[-2]
+        lines: List[str] = []
+        for item in self.created[int(batch_id.split("_")[1])]:
+            text = item["params"]["messages"][0]["content"]
+            if text == "fail":
+                result: Dict[str, Any] = {
+                    "type": "errored",
+                    "error": {"type": "error", "error": {"type": "invalid_request_error", "message": "bad request"}},
+                }
+            else:
+                result = {
+                    "type": "succeeded",
+                    "message": {
+                        "id": f"msg_{item['custom_id']}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": "claude-sonnet-4-5",
+                        "content": [{"type": "text", "text": text}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 1, "output_tokens": 1},
+                    },
+                }
+            lines.append(json.dumps({"custom_id": item["custom_id"], "result": result}))
+        # results come back out of order
+        return httpx.Response(200, content="\n".join(reversed(lines)).encode())
+
+
+def user_message(text: str) -> Any:
+    return {"model": "claude-sonnet-4-5", "max_tokens": 1024, "messages": [{"role": "user", "content": text}]}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_batch_collector_flushes_on_size(respx_mock: MockRouter) -> None:
+    api = FakeBatchesAPI(respx_mock, polls_until_ended=2)
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0) as client:
+        with BatchCollector(client, max_batch_size=2, max_wait=60, poll_interval=0.01) as collector:
+            futures = [collector.submit(**user_message(f"hello {i}")) for i in range(5)]
+            fail = collector.submit(custom_id="my-id", **user_message("fail"))
+
+        assert [future.result().content[0].text for future in futures] == [  # type: ignore[union-attr]
+            f"hello {i}" for i in range(5)
+        ]
+        with pytest.raises(BatchRequestError, match="'my-id' errored: bad request"):
+            fail.result()
+
+    assert [len(requests) for requests in api.created] == [2, 2, 2]
+    assert api.created[2][1]["custom_id"] == "my-id"
+    assert len({item["custom_id"] for requests in api.created for item in requests}) == 6
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_batch_collector_flushes_on_bytes(respx_mock: MockRouter) -> None:
+    api = FakeBatchesAPI(respx_mock)
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0) as client:
+        with BatchCollector(client, max_batch_bytes=300, max_wait=60, poll_interval=0.01) as collector:
+            futures = [collector.submit(**user_message("x" * 100)) for _ in range(3)]
+
+        assert all(future.result().content for future in futures)
+
+    assert [len(requests) for requests in api.created] == [1, 1, 1]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_batch_collector_flushes_on_time(respx_mock: MockRouter) -> None:
+    api = FakeBatchesAPI(respx_mock)
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0) as client:
+        collector = BatchCollector(client, max_wait=0.05, poll_interval=0.01)
+        future = collector.submit(**user_message("hello"))
+        assert future.result(timeout=5).content[0].text == "hello"  # type: ignore[union-attr]
+        collector.close()
+
+    assert len(api.created) == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_batch_collector_rejects_duplicate_custom_id(respx_mock: MockRouter) -> None:
+    FakeBatchesAPI(respx_mock)
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0) as client:
+        with BatchCollector(client, poll_interval=0.01) as collector:
+            collector.submit(custom_id="a", **user_message("hello"))
+            with pytest.raises(ValueError, match="already pending"):
+                collector.submit(custom_id="a", **user_message("hello"))
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_batch_collector_create_failure(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/messages/batches").mock(return_value=httpx.Response(400, json={"error": "bad"}))
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0) as client:
+        with BatchCollector(client, poll_interval=0.01) as collector:
+            future = collector.submit(**user_message("hello"))
+
+        with pytest.raises(Exception, match="400"):
+            future.result()
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_batch_collector(respx_mock: MockRouter) -> None:
+    api = FakeBatchesAPI(respx_mock, polls_until_ended=2)
+
+    async with AsyncAnthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0) as client:
+        async with AsyncBatchCollector(client, max_batch_size=2, max_wait=0.05, poll_interval=0.01) as collector:
+            futures = [collector.submit(**user_message(f"hello {i}")) for i in range(3)]
+            fail = collector.submit(**user_message("fail"))
+
+            # the last, partial, batch is submitted once max_wait has passed
+            message = await futures[2]
+            assert message.content[0].text == "hello 2"  # type: ignore[union-attr]
+
+        assert [(await future).content[0].text for future in futures] == [  # type: ignore[union-attr]
+            f"hello {i}" for i in range(3)
+        ]
+        with pytest.raises(BatchRequestError, match="errored"):
+            await fail.result()
+
+    assert [len(requests) for requests in api.created] == [2, 2]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import json
+from typing import Any, Dict, List, Tuple
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from anthropic import Anthropic, AsyncAnthropic
+from anthropic.lib.batches import process_results, download_results, async_download_results
+from anthropic.types.messages import MessageBatchIndividualResponse
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+
+def make_result(i: int) -> Dict[str, Any]:
+    return {
+        "custom_id": f"req_{i}",
+        "result": {
+            "type": "succeeded",
+            "message": {
+                "id": f"msg_{i}",
+                "type": "message",
+                "role": "assistant",
+                "model": "claude-sonnet-4-5",
+                "content": [{"type": "text", "text": "hello " * i}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 1, "output_tokens": i},
+            },
+        },
+    }
+
+
+RESULTS = "\n".join(json.dumps(make_result(i)) for i in range(50)) + "\n"
+
+
+def mock_batch(respx_mock: MockRouter) -> None:
+    respx_mock.get("/v1/messages/batches/msgbatch_1").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "id": "msgbatch_1",
+                "type": "message_batch",
+                "processing_status": "ended",
+                "created_at": "2024-01-01T00:00:00Z",
+                "expires_at": "2024-01-02T00:00:00Z",
+                "request_counts": {"canceled": 0, "errored": 0, "expired": 0, "processing": 0, "succeeded": 50},
+                "results_url": f"{base_url}/v1/messages/batches/msgbatch_1/results",
+            },
+        )
+    )
+    respx_mock.get("/v1/messages/batches/msgbatch_1/results").mock(
+        return_value=httpx.Response(200, content=RESULTS.encode())
+    )
+
+
+def output_tokens(result: MessageBatchIndividualResponse) -> Tuple[str, int, int]:
+    assert result.result.type == "succeeded"
+    return result.custom_id, result.result.message.usage.output_tokens, os.getpid()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_download_results(respx_mock: MockRouter, tmp_path: Path) -> None:
+    mock_batch(respx_mock)
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key") as client:
+        path = download_results(client, "msgbatch_1", tmp_path / "results.jsonl")
+
+    assert path.read_text() == RESULTS
+    assert os.listdir(tmp_path) == ["results.jsonl"]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_download_results(respx_mock: MockRouter, tmp_path: Path) -> None:
+    mock_batch(respx_mock)
+
+    async with AsyncAnthropic(base_url=base_url, api_key="my-anthropic-api-key") as client:
+        path = await async_download_results(client, "msgbatch_1", str(tmp_path / "results.jsonl"))
+
+    assert path.read_text() == RESULTS
+
+
+def test_process_results(tmp_path: Path) -> None:
+    path = tmp_path / "results.jsonl"
+    path.write_text(RESULTS)
+
+    results: List[Tuple[str, int, int]] = list(process_results(path, output_tokens, max_workers=2, chunk_bytes=1024))
+
+    # results are yielded in file order, even though they were spread over several processes
+    assert [(custom_id, tokens) for custom_id, tokens, _ in results] == [(f"req_{i}", i) for i in range(50)]
+    assert os.getpid() not in {pid for _, _, pid in results}
+
+
+def test_process_results_single_chunk(tmp_path: Path) -> None:
+    path = tmp_path / "results.jsonl"
+    path.write_text(RESULTS.rstrip("\n"))
+
+    assert len(list(process_results(path, output_tokens, max_workers=1))) == 50
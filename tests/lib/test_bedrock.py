@@ -1,7 +1,12 @@
 import re
+import json
+import base64
+import struct
 import typing as t
+import binascii
 import tempfile
 from typing import TypedDict, cast
+from pathlib import Path
 from typing_extensions import Protocol
 
 import httpx
@@ -9,7 +14,8 @@ import pytest
 from respx import MockRouter
 
 from anthropic import AnthropicBedrock, AsyncAnthropicBedrock
-from anthropic.lib.bedrock._stream_decoder import _chunk_bytes_to_sse
+from anthropic._streaming import ServerSentEvent
+from anthropic.lib.bedrock._stream_decoder import AWSEventStreamDecoder, _chunk_bytes_to_sse
 
 sync_client = AnthropicBedrock(
     aws_region="us-east-1",
@@ -319,3 +325,113 @@ def test_async_copy_x_stainless_helper_header_appends() -> None:
     client = async_client.with_options(default_headers={"x-stainless-helper": "parent"})
     copied = client.with_options(default_headers={"x-stainless-helper": "child"})
     assert copied.default_headers["x-stainless-helper"] == "parent, child"
+
+
+FIXTURES_DIR = Path(__file__).parent / "streaming" / "fixtures"
+
+
+def encode_event_stream_message(headers: t.Dict[str, str], payload: bytes) -> bytes:
+    """Encode a single `application/vnd.amazon.eventstream` message with string headers."""
+    encoded_headers = b""
+    for name, value in headers.items():
+        raw_name = name.encode()
+        raw_value = value.encode()
+        encoded_headers += struct.pack("!B", len(raw_name)) + raw_name + b"\x07"
+        encoded_headers += struct.pack("!H", len(raw_value)) + raw_value
+
+    total_length = 12 + len(encoded_headers) + len(payload) + 4
+    prelude = struct.pack("!II", total_length, len(encoded_headers))
+    prelude += struct.pack("!I", binascii.crc32(prelude) & 0xFFFFFFFF)
+    message = prelude + encoded_headers + payload
+    return message + struct.pack("!I", binascii.crc32(message) & 0xFFFFFFFF)
+
+
+def encode_chunk(event: bytes) -> bytes:
+    payload = json.dumps({"bytes": base64.b64encode(event).decode(), "p": "abcdefghijklmnopqrstuvwxyzABCDEF"})
+    return encode_event_stream_message(
+        {":event-type": "chunk", ":content-type": "application/json", ":message-type": "event"},
+        payload.encode(),
+    )
+
+
+def fixture_event_stream(name: str) -> bytes:
+    """Re-encode the SSE `data:` lines of a recorded first-party stream as a Bedrock event stream."""
+    lines = (FIXTURES_DIR / name).read_text().splitlines()
+    return b"".join(encode_chunk(line[len("data: ") :].encode()) for line in lines if line.startswith("data: "))
+
+
+def split(data: bytes, size: int) -> t.Iterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def botocore_decode(data: bytes) -> t.List[ServerSentEvent]:
+    """The botocore based decoding that `AWSEventStreamDecoder` replaced."""
+    from botocore.model import ServiceModel
+    from botocore.loaders import Loader
+    from botocore.parsers import EventStreamJSONParser
+    from botocore.eventstream import EventStreamBuffer
+
+    shape = ServiceModel(Loader().load_service_model("bedrock-runtime", "service-2")).shape_for("ResponseStream")
+    parser = EventStreamJSONParser()
+    buffer = EventStreamBuffer()
+    buffer.add_data(data)
+
+    events: t.List[ServerSentEvent] = []
+    for message in buffer:
+        chunk = parser.parse(message.to_response_dict(), shape).get("chunk")
+        if chunk:
+            sse = _chunk_bytes_to_sse(chunk["bytes"])
+            assert sse is not None
+            events.append(sse)
+    return events
+
+
+def as_tuples(events: t.Iterable[ServerSentEvent]) -> t.List[t.Tuple[t.Optional[str], str]]:
+    return [(sse.event, sse.data) for sse in events]
+
+
+@pytest.mark.parametrize("fixture", ["basic_response.txt", "tool_use_response.txt"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_event_stream_decoder_matches_botocore(fixture: str, chunk_size: int) -> None:
+    data = fixture_event_stream(fixture)
+    expected = as_tuples(botocore_decode(data))
+    assert expected
+
+    assert as_tuples(AWSEventStreamDecoder().iter_bytes(split(data, chunk_size))) == expected
+
+
+async def test_event_stream_decoder_async() -> None:
+    data = fixture_event_stream("basic_response.txt")
+
+    async def chunks() -> t.AsyncIterator[bytes]:
+        for chunk in split(data, 5):
+            yield chunk
+
+    events = [sse async for sse in AWSEventStreamDecoder().aiter_bytes(chunks())]
+    assert as_tuples(events) == as_tuples(botocore_decode(data))
+
+
+def test_event_stream_decoder_skips_other_events() -> None:
+    data = encode_event_stream_message({":event-type": "initial-response", ":message-type": "event"}, b"{}")
+    data += encode_chunk(b'{"type":"message_stop"}')
+
+    assert as_tuples(AWSEventStreamDecoder().iter_bytes(iter([data]))) == [("message_stop", '{"type":"message_stop"}')]
+
+
+def test_event_stream_decoder_checksum_mismatch() -> None:
+    data = bytearray(encode_chunk(b'{"type":"message_stop"}'))
+    data[-10] ^= 0xFF
+
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        list(AWSEventStreamDecoder().iter_bytes(iter([bytes(data)])))
+
+
+def test_event_stream_decoder_exception_message() -> None:
+    data = encode_event_stream_message(
+        {":exception-type": "throttlingException", ":content-type": "application/json", ":message-type": "exception"},
+        b'{"message":"Too many requests"}',
+    )
+
+    with pytest.raises(ValueError, match="Bad response code, expected 200"):
+        list(AWSEventStreamDecoder().iter_bytes(iter([data])))
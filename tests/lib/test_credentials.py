@@ -5,6 +5,7 @@ import json
 import time
 import logging
 import pathlib
+import threading
 from typing import Any, Dict, List, Callable, Optional, cast
 from typing_extensions import Protocol
 
@@ -22,7 +23,9 @@ from anthropic import (
     AnthropicError,
     AsyncAnthropic,
     InMemoryConfig,
+    AsyncTokenCache,
     CredentialsFile,
+    SharedTokenFile,
     IdentityTokenFile,
     WorkloadIdentityError,
     WorkloadIdentityCredentials,
@@ -587,6 +590,33 @@ class TestCredentialsFile:
             }
         }
 
+    async def test_authorized_user_refresh_call_async(self, tmp_path: pathlib.Path) -> None:
+        """``call_async()`` runs the refresh grant on the async client and writes
+        the rotated tokens back like the sync path."""
+        _write_profile(
+            tmp_path,
+            "default",
+            config={"type": "authorized_user", "client_id": "cid"},
+            credentials={"access_token": "old-tok", "expires_at": int(time.time()) - 1, "refresh_token": "refresh-old"},
+        )
+        bodies: List[Any] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={"access_token": "new-tok", "expires_in": 3600, "refresh_token": "rt-new"})
+
+        async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        creds = CredentialsFile(async_http_client=async_client)
+        tok = await creds.call_async()
+        assert tok.token == "new-tok"
+        assert bodies == [{"grant_type": "refresh_token", "refresh_token": "refresh-old", "client_id": "cid"}]
+        rewritten = json.loads((tmp_path / "credentials" / "default.json").read_text())
+        assert rewritten["refresh_token"] == "rt-new"
+        # Fresh on disk now: no second POST.
+        assert (await creds.call_async(force_refresh=False)).token == "new-tok"
+        assert len(bodies) == 1
+        assert creds._owned_http_client is None, "the async path must not create a sync client"
+
     def test_authorized_user_fresh_token_no_refresh(self, tmp_path: pathlib.Path) -> None:
         _write_profile(
             tmp_path,
@@ -934,6 +964,94 @@ class TestWorkloadIdentityCredentials:
         assert "workspace_id" not in body
         assert "scope" not in body
 
+    async def test_call_async_uses_async_client(self) -> None:
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"access_token": "sk-ant-oat01-async", "expires_in": 600})
+
+        def sync_handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError(f"unexpected sync request to {request.url}")
+
+        creds = WorkloadIdentityCredentials(
+            identity_token_provider=lambda: "ext.jwt.value",
+            federation_rule_id="fdrl_01abc",
+            organization_id="00000000-0000-0000-0000-000000000000",
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        creds._http_client = httpx.Client(transport=httpx.MockTransport(sync_handler))
+
+        token = await creds.call_async()
+        assert token.token == "sk-ant-oat01-async"
+        assert len(requests) == 1
+        assert str(requests[0].url) == TOKEN_URL
+        assert FEDERATION_BETA_HEADER in requests[0].headers["anthropic-beta"]
+        assert json.loads(requests[0].content)["assertion"] == "ext.jwt.value"
+
+    async def test_call_async_reads_identity_token_off_the_event_loop(self) -> None:
+        """The identity token provider may read a file, so the async exchange
+        calls it in a worker thread."""
+        threads: List[int] = []
+
+        def identity_token_provider() -> str:
+            threads.append(threading.get_ident())
+            return "ext.jwt.value"
+
+        def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+            return httpx.Response(200, json={"access_token": "t", "expires_in": 60})
+
+        creds = WorkloadIdentityCredentials(
+            identity_token_provider=identity_token_provider,
+            federation_rule_id="fdrl_01abc",
+            organization_id="00000000-0000-0000-0000-000000000000",
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        assert (await creds.call_async()).token == "t"
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
+    async def test_call_async_errors_match_sync(self) -> None:
+        responses: List[Any] = [httpx.Response(403, json={"error": {"message": "nope"}}), httpx.ConnectError("refused")]
+
+        def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return cast(httpx.Response, response)
+
+        creds = WorkloadIdentityCredentials(
+            identity_token_provider=lambda: "ext.jwt.value",
+            federation_rule_id="fdrl_01abc",
+            organization_id="00000000-0000-0000-0000-000000000000",
+            async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        with pytest.raises(WorkloadIdentityError) as exc_info:
+            await creds.call_async()
+        assert exc_info.value.status_code == 403
+
+        with pytest.raises(WorkloadIdentityError, match="refused"):
+            await creds.call_async()
+
+    async def test_call_async_with_sync_http_client_only(self) -> None:
+        """A caller that configured only a sync ``http_client=`` keeps its
+        transport: the exchange runs on it in a worker thread."""
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"access_token": "t", "expires_in": 60})
+
+        creds = WorkloadIdentityCredentials(
+            identity_token_provider=lambda: "ext.jwt.value",
+            federation_rule_id="fdrl_01abc",
+            organization_id="00000000-0000-0000-0000-000000000000",
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        assert (await creds.call_async()).token == "t"
+        assert len(requests) == 1
+        assert creds._owned_async_http_client is None
+
     @pytest.mark.respx()
     def test_service_account_included(self, respx_mock: MockRouter) -> None:
         respx_mock.post(TOKEN_URL).mock(return_value=httpx.Response(200, json={"access_token": "t", "expires_in": 60}))
@@ -1676,6 +1794,250 @@ class TestTokenCache:
         assert len(provider_calls) == 3, "provider must be retried after backoff window"
 
 
+class TestAsyncTokenCache:
+    async def test_first_call_fetches(self) -> None:
+        provider = CountingProvider([AccessToken("a", expires_at=2000)])
+        cache = AsyncTokenCache(provider, time_source=FakeClock(1000))
+        assert await cache.get_token() == "a"
+        assert await cache.get_token() == "a"
+        assert provider.calls == 1
+
+    async def test_refresh_windows(self, caplog: pytest.LogCaptureFixture) -> None:
+        clock = FakeClock(1000)
+        results: List[Any] = [
+            AccessToken("a", expires_at=1000 + 600),
+            AccessToken("b", expires_at=1000 + 1200),
+            WorkloadIdentityError("backend down"),
+            WorkloadIdentityError("backend down"),
+        ]
+
+        async def provider(*, force_refresh: bool = False) -> AccessToken:  # noqa: ARG001
+            result = results.pop(0)
+            if isinstance(result, BaseException):
+                raise result
+            return cast(AccessToken, result)
+
+        cache = AsyncTokenCache(provider, time_source=clock)
+        assert await cache.get_token() == "a"
+        clock.now = 1000 + 600 - 60  # advisory window
+        assert await cache.get_token() == "b"
+
+        clock.now = 1000 + 1200 - 60  # advisory window: failure serves stale
+        with caplog.at_level(logging.WARNING):
+            assert await cache.get_token() == "b"
+        assert any("Advisory token refresh failed" in r.message for r in caplog.records)
+
+        clock.now = 1000 + 1200 - 10  # mandatory window: failure raises
+        with pytest.raises(WorkloadIdentityError, match="backend down"):
+            await cache.get_token()
+        assert results == []
+
+    async def test_concurrent_mandatory_refresh_single_flight(self) -> None:
+        import asyncio
+
+        calls: List[int] = []
+
+        async def provider(*, force_refresh: bool = False) -> AccessToken:  # noqa: ARG001
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return AccessToken(token="fresh", expires_at=None)
+
+        cache = AsyncTokenCache(provider)
+        assert await asyncio.gather(*(cache.get_token() for _ in range(8))) == ["fresh"] * 8
+        assert len(calls) == 1
+
+    async def test_failed_refresh_releases_waiters(self) -> None:
+        import asyncio
+
+        calls: List[int] = []
+
+        async def provider(*, force_refresh: bool = False) -> AccessToken:  # noqa: ARG001
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return AccessToken(token="fresh", expires_at=None)
+
+        cache = AsyncTokenCache(provider)
+        results = await asyncio.gather(cache.get_token(), cache.get_token(), return_exceptions=True)
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] == "fresh"
+        assert len(calls) == 2
+
+    async def test_retries_once_on_401_and_invalidate_forces(self) -> None:
+        force_seen: List[bool] = []
+
+        async def provider(*, force_refresh: bool = False) -> AccessToken:
+            force_seen.append(force_refresh)
+            if len(force_seen) == 1:
+                raise WorkloadIdentityError("token exchange failed", status_code=401)
+            return AccessToken(token=f"tok-{len(force_seen)}", expires_at=None)
+
+        cache = AsyncTokenCache(provider)
+        assert await cache.get_token() == "tok-2"
+        cache.invalidate()
+        assert await cache.get_token() == "tok-3"
+        assert force_seen == [False, True, True]
+
+    async def test_provider_kinds(self) -> None:
+        """Prefers ``call_async()``, awaits async callables and runs sync
+        (including legacy zero-arg) providers in a worker thread."""
+        import threading
+
+        class BuiltinLike:
+            def __call__(self, *, force_refresh: bool = False) -> AccessToken:  # noqa: ARG002
+                raise AssertionError("call_async() should be preferred")
+
+            async def call_async(self, *, force_refresh: bool = False) -> AccessToken:  # noqa: ARG002
+                return AccessToken("builtin", expires_at=None)
+
+        class AsyncCallable:
+            async def __call__(self, *, force_refresh: bool = False) -> AccessToken:  # noqa: ARG002
+                return AccessToken("async", expires_at=None)
+
+        threads: List[threading.Thread] = []
+
+        def legacy_provider() -> AccessToken:
+            threads.append(threading.current_thread())
+            return AccessToken("legacy", expires_at=None)
+
+        assert await AsyncTokenCache(BuiltinLike()).get_token() == "builtin"
+        assert await AsyncTokenCache(AsyncCallable()).get_token() == "async"
+        assert await AsyncTokenCache(legacy_provider).get_token() == "legacy"  # type: ignore[arg-type]
+        assert threads and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="SharedTokenFile requires fcntl")
+class TestSharedTokenFile:
+    """Each ``SharedTokenFile`` instance stands in for one worker process: the
+    ``fcntl`` locks they take on separate file descriptors exclude each other
+    just as they would across processes."""
+
+    def test_one_process_fetches_and_others_read(self, tmp_path: pathlib.Path) -> None:
+        clock = FakeClock(1000)
+        provider = CountingProvider([AccessToken("a", expires_at=1000 + 600)])
+        path = tmp_path / "shared" / "token.json"
+        caches = [TokenCache(SharedTokenFile(provider, path, time_source=clock), time_source=clock) for _ in range(4)]
+
+        assert [cache.get_token() for cache in caches] == ["a"] * 4
+        assert provider.calls == 1
+        assert json.loads(path.read_text()) == {"access_token": "a", "expires_at": 1600}
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_refresh_windows(self, tmp_path: pathlib.Path) -> None:
+        clock = FakeClock(1000)
+        provider = CountingProvider([AccessToken("a", expires_at=1000 + 600), AccessToken("b", expires_at=1000 + 1200)])
+        first = TokenCache(SharedTokenFile(provider, tmp_path / "token.json", time_source=clock), time_source=clock)
+        second = TokenCache(SharedTokenFile(provider, tmp_path / "token.json", time_source=clock), time_source=clock)
+        assert first.get_token() == "a"
+        assert second.get_token() == "a"
+
+        clock.now = 1000 + 600 - 60  # advisory window
+        assert first.get_token() == "b"
+        assert second.get_token() == "b"
+        assert provider.calls == 2
+
+    def test_concurrent_refresh_single_flight(self, tmp_path: pathlib.Path) -> None:
+        import threading as _threading
+
+        provider_calls: List[int] = []
+        barrier = _threading.Barrier(8)
+
+        def slow_provider(*, force_refresh: bool = False) -> AccessToken:  # noqa: ARG001
+            provider_calls.append(1)
+            time.sleep(0.1)
+            return AccessToken(token="fresh", expires_at=None)
+
+        results: List[str] = []
+
+        def worker() -> None:
+            cache = TokenCache(SharedTokenFile(slow_provider, tmp_path / "token.json"))
+            barrier.wait()
+            results.append(cache.get_token())
+
+        threads = [_threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(provider_calls) == 1
+        assert results == ["fresh"] * 8
+
+    def test_advisory_caller_does_not_wait_for_other_process(self, tmp_path: pathlib.Path) -> None:
+        clock = FakeClock(1000)
+        provider = CountingProvider([AccessToken("a", expires_at=1000 + 600), AccessToken("b", expires_at=1000 + 1200)])
+        shared = SharedTokenFile(provider, tmp_path / "token.json", time_source=clock)
+        assert shared().token == "a"
+
+        clock.now = 1000 + 600 - 60  # advisory window
+        other = SharedTokenFile(provider, tmp_path / "token.json", time_source=clock)
+        with other._locked(blocking=True):
+            # another process holds the lock while refreshing
+            assert shared().token == "a"
+        assert provider.calls == 1
+
+        assert shared().token == "b"
+        assert provider.calls == 2
+
+    def test_force_refresh_reuses_token_refreshed_by_other_process(self, tmp_path: pathlib.Path) -> None:
+        provider = CountingProvider([AccessToken("a"), AccessToken("b"), AccessToken("c")])
+        first = SharedTokenFile(provider, tmp_path / "token.json")
+        second = SharedTokenFile(provider, tmp_path / "token.json")
+        assert first().token == "a"
+        assert second().token == "a"
+
+        # both processes get a 401 for "a"; only the first one exchanges again
+        assert first(force_refresh=True).token == "b"
+        assert second(force_refresh=True).token == "b"
+        assert provider.calls == 2
+
+        # a 401 for the token in the file always refreshes
+        assert second(force_refresh=True).token == "c"
+        assert provider.calls == 3
+
+    def test_401_retry_passes_through(self, tmp_path: pathlib.Path) -> None:
+        force_seen: List[bool] = []
+
+        def provider(*, force_refresh: bool = False) -> AccessToken:
+            force_seen.append(force_refresh)
+            if len(force_seen) == 1:
+                raise WorkloadIdentityError("token exchange failed", status_code=401, body="unauthorized")
+            return AccessToken("fresh", expires_at=None)
+
+        cache = TokenCache(SharedTokenFile(provider, tmp_path / "token.json"))
+        assert cache.get_token() == "fresh"
+        assert force_seen == [False, True]
+
+    def test_unreadable_file_is_ignored(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "token.json"
+        path.write_text("not json")
+        provider = CountingProvider([AccessToken("a", expires_at=None)])
+
+        assert SharedTokenFile(provider, path)().token == "a"
+        assert provider.calls == 1
+        assert json.loads(path.read_text()) == {"access_token": "a", "expires_at": None}
+
+    def test_forwards_bind_base_url_and_close(self, tmp_path: pathlib.Path) -> None:
+        class P(CountingProvider):
+            base_url: Optional[str] = None
+            closed = False
+
+            def bind_base_url(self, base_url: str) -> None:
+                self.base_url = base_url
+
+            def close(self) -> None:
+                self.closed = True
+
+        provider = P([AccessToken("a", expires_at=None)])
+        client = Anthropic(
+            credentials=SharedTokenFile(provider, tmp_path / "token.json"), base_url="https://example.com"
+        )
+        assert provider.base_url == "https://example.com"
+        client.close()
+        assert provider.closed
+
+
 # --------------------------------------------------------------------------- #
 # default_credentials chain
 # --------------------------------------------------------------------------- #
@@ -2609,7 +2971,8 @@ class TestAsyncAnthropicCredentials:
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Async client calling a CredentialsFile(authorized_user) provider: the
-        blocking refresh_token POST runs on the worker thread via asyncify."""
+        client's AsyncTokenCache runs the refresh_token POST through the
+        provider's ``call_async()``."""
         monkeypatch.setattr("anthropic.lib.credentials._constants._config_dir", lambda: tmp_path)
         _write_profile(
             tmp_path,
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import threading
+from typing import List, Iterator
+
+import anyio
+import httpx
+import pytest
+from respx import MockRouter
+
+from anthropic import Anthropic, RetryBudget, AsyncAnthropic, InternalServerError
+from anthropic.types import MessageParam
+from anthropic.lib.middleware import HedgingMiddleware
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+MESSAGE = {
+    "id": "msg_1",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-sonnet-4-5",
+    "content": [{"type": "text", "text": "hi"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 1, "output_tokens": 1},
+}
+
+MESSAGES: List[MessageParam] = [{"role": "user", "content": "hello"}]
+
+
+def always_hedge() -> RetryBudget:
+    return RetryBudget(ratio=1, min_retries_per_second=100)
+
+
+def test_delay_percentile() -> None:
+    hedging = HedgingMiddleware(percentile=90, initial_delay=2, min_samples=10)
+    assert hedging.delay("/v1/messages") == 2
+
+    for latency in range(1, 11):
+        hedging._record("/v1/messages", latency / 10, hedge=False)
+    assert hedging.delay("/v1/messages") == pytest.approx(0.9)
+    assert hedging.delay("/v1/messages/count_tokens") == 2
+
+
+class ClosingStream(httpx.SyncByteStream):
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.read = False
+        self.closed = threading.Event()
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.read = True
+        yield self.body
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_hedge_wins_when_first_attempt_is_slow(respx_mock: MockRouter) -> None:
+    calls: List[httpx.Request] = []
+    lock = threading.Lock()
+    returned = threading.Event()
+    primary_stream = ClosingStream(json.dumps(MESSAGE).encode())
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls.append(request)
+            first = len(calls) == 1
+        if first:
+            # the first attempt only responds once the hedge's response has been returned
+            assert returned.wait(5)
+            return httpx.Response(200, headers={"content-type": "application/json"}, stream=primary_stream)
+        return httpx.Response(200, json={**MESSAGE, "id": "msg_fast"})
+
+    respx_mock.post("/v1/messages").mock(side_effect=respond)
+    hedging = HedgingMiddleware(initial_delay=0.05, budget=always_hedge())
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0, middleware=[hedging]) as client:
+        message = client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+        returned.set()
+        assert primary_stream.closed.wait(5)
+
+    assert message.id == "msg_fast"
+    assert not primary_stream.read
+    assert len(calls) == 2
+    assert calls[0].content == calls[1].content
+    assert hedging.stats.requests == 1
+    assert hedging.stats.hedged == 1
+    assert hedging.stats.hedge_wins == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_losing_hedge_is_closed_unread(respx_mock: MockRouter) -> None:
+    calls = 0
+    lock = threading.Lock()
+    hedge_sent = threading.Event()
+    release_hedge = threading.Event()
+    hedge_stream = ClosingStream(json.dumps({**MESSAGE, "id": "msg_hedge"}).encode())
+
+    def respond(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        with lock:
+            calls += 1
+            first = calls == 1
+        if first:
+            assert hedge_sent.wait(5)
+            return httpx.Response(200, json=MESSAGE)
+        hedge_sent.set()
+        assert release_hedge.wait(5)
+        return httpx.Response(200, headers={"content-type": "application/json"}, stream=hedge_stream)
+
+    respx_mock.post("/v1/messages").mock(side_effect=respond)
+    hedging = HedgingMiddleware(initial_delay=0.05, budget=always_hedge())
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", middleware=[hedging]) as client:
+        message = client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+        assert message.id == "msg_1"
+
+        release_hedge.set()
+        assert hedge_stream.closed.wait(5)
+
+    assert not hedge_stream.read
+    assert hedging.stats.hedged == 1
+    assert hedging.stats.hedge_wins == 0
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_no_hedge_for_fast_requests(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/messages").mock(return_value=httpx.Response(200, json=MESSAGE))
+    hedging = HedgingMiddleware(initial_delay=1, budget=always_hedge())
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", middleware=[hedging]) as client:
+        client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+
+    assert route.call_count == 1
+    assert hedging.stats.requests == 1
+    assert hedging.stats.hedged == 0
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_hedge_budget(respx_mock: MockRouter) -> None:
+    def respond(_request: httpx.Request) -> httpx.Response:
+        time.sleep(0.1)
+        return httpx.Response(200, json=MESSAGE)
+
+    route = respx_mock.post("/v1/messages").mock(side_effect=respond)
+    hedging = HedgingMiddleware(initial_delay=0.01, budget=RetryBudget(ratio=0, min_retries_per_second=0.1))
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", middleware=[hedging]) as client:
+        for _ in range(3):
+            client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+
+    # the budget only allows a single hedge in its window
+    assert hedging.stats.hedged == 1
+    assert route.call_count == 4
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_failed_attempt_waits_for_the_other(respx_mock: MockRouter) -> None:
+    calls = 0
+    lock = threading.Lock()
+
+    def respond(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        with lock:
+            calls += 1
+            first = calls == 1
+        if first:
+            time.sleep(0.1)
+            return httpx.Response(500, json={"error": "down"})
+        time.sleep(0.2)
+        return httpx.Response(200, json=MESSAGE)
+
+    respx_mock.post("/v1/messages").mock(side_effect=respond)
+    hedging = HedgingMiddleware(initial_delay=0.05, budget=always_hedge())
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0, middleware=[hedging]) as client:
+        message = client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+
+    assert message.id == "msg_1"
+    assert hedging.stats.hedge_wins == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_all_attempts_fail(respx_mock: MockRouter) -> None:
+    calls = 0
+    lock = threading.Lock()
+    hedge_failed = threading.Event()
+
+    def respond(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        with lock:
+            calls += 1
+            first = calls == 1
+        if first:
+            # the hedge fails first, but the original attempt's failure is raised
+            assert hedge_failed.wait(5)
+            return httpx.Response(500, json={"error": "down"})
+        hedge_failed.set()
+        return httpx.Response(529, json={"error": "overloaded"})
+
+    route = respx_mock.post("/v1/messages").mock(side_effect=respond)
+    hedging = HedgingMiddleware(initial_delay=0.01, budget=always_hedge())
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0, middleware=[hedging]) as client:
+        with pytest.raises(InternalServerError):
+            client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+
+    assert route.call_count == 2
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_hedge_cancels_slow_attempt(respx_mock: MockRouter) -> None:
+    calls = 0
+    cancelled = False
+
+    async def respond(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls, cancelled
+        calls += 1
+        if calls == 1:
+            try:
+                await anyio.sleep(5)
+            except anyio.get_cancelled_exc_class():
+                cancelled = True
+                raise
+        return httpx.Response(200, json={"input_tokens": 7})
+
+    respx_mock.post("/v1/messages/count_tokens").mock(side_effect=respond)
+    hedging = HedgingMiddleware(initial_delay=0.05, budget=always_hedge())
+
+    async with AsyncAnthropic(base_url=base_url, api_key="my-anthropic-api-key", middleware=[hedging]) as client:
+        start = time.monotonic()
+        count = await client.messages.count_tokens(model="claude-sonnet-4-5", messages=MESSAGES)
+        assert time.monotonic() - start < 1
+
+    assert count.input_tokens == 7
+    assert calls == 2
+    assert cancelled
+    assert hedging.stats.hedge_wins == 1
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+import time
+import threading
+from typing import Dict, List
+from pathlib import Path
+from typing_extensions import override
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from anthropic import Anthropic, AsyncAnthropic
+from anthropic.types import MessageParam
+from anthropic.lib.middleware import (
+    RateLimitBucket,
+    RateLimitMiddleware,
+    FileRateLimitBackend,
+    InMemoryRateLimitBackend,
+)
+from anthropic.lib.middleware._rate_limit import _RateLimitState, estimate_input_tokens_from_length
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+MESSAGE = {
+    "id": "msg_1",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-sonnet-4-5",
+    "content": [{"type": "text", "text": "hi"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 1, "output_tokens": 1},
+}
+
+MESSAGES: List[MessageParam] = [{"role": "user", "content": "hello"}]
+
+
+def rate_limit_headers(**dimensions: "tuple[float, float]") -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    for name, (limit, remaining) in dimensions.items():
+        headers[f"anthropic-ratelimit-{name.replace('_', '-')}-limit"] = str(limit)
+        headers[f"anthropic-ratelimit-{name.replace('_', '-')}-remaining"] = str(remaining)
+    return headers
+
+
+def test_state_waits_for_refill() -> None:
+    state = _RateLimitState()
+    cost = {"requests": 1.0, "input_tokens": 100.0}
+
+    # nothing is known before the first response
+    assert state.acquire(cost, now=0) == 0
+
+    state.observe(httpx.Headers(rate_limit_headers(requests=(60, 1), input_tokens=(6000, 150))), now=0)
+    assert state.acquire(cost, now=0) == 0
+    # both buckets are now short: requests by 1 (1s at 1/s), input tokens by 50 (0.5s at 100/s)
+    assert state.acquire(cost, now=0) == pytest.approx(1.0)
+    assert state.acquire(cost, now=0.5) == pytest.approx(0.5)
+    assert state.acquire(cost, now=1.0) == 0
+
+    assert state.snapshot(now=1.0) == {
+        "requests": RateLimitBucket(limit=60, remaining=0, refill_rate=1),
+        "input_tokens": RateLimitBucket(limit=6000, remaining=50, refill_rate=100),
+    }
+
+
+def test_state_caps_cost_at_capacity() -> None:
+    state = _RateLimitState()
+    state.observe(httpx.Headers(rate_limit_headers(input_tokens=(60, 30))), now=0)
+
+    # a request larger than the limit is admitted once the bucket is full
+    assert state.acquire({"input_tokens": 1000}, now=0) == pytest.approx(30)
+    assert state.acquire({"input_tokens": 1000}, now=30) == 0
+
+
+def test_state_retry_after_blocks() -> None:
+    state = _RateLimitState()
+    state.observe(httpx.Headers({"retry-after": "2"}), now=10)
+
+    assert state.acquire({"requests": 1}, now=10) == pytest.approx(2)
+    assert state.acquire({"requests": 1}, now=12) == 0
+
+
+def test_file_backend_is_shared(tmp_path: Path) -> None:
+    path = tmp_path / "ratelimit.json"
+    first = FileRateLimitBackend(path)
+    second = FileRateLimitBackend(str(path))
+
+    first.observe(httpx.Headers(rate_limit_headers(requests=(60, 2))))
+    assert second.snapshot()["requests"].limit == 60
+
+    assert first.acquire({"requests": 1}) == 0
+    assert second.acquire({"requests": 1}) == 0
+    assert first.acquire({"requests": 1}) > 0
+
+
+def test_estimate_input_tokens() -> None:
+    body = {
+        "system": "x" * 400,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "y" * 400},
+                    {"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": "z" * 100_000}},
+                ],
+            }
+        ],
+    }
+    # the text at four characters per token, plus a fixed estimate for the image
+    assert estimate_input_tokens_from_length(body) == pytest.approx(200 + 1600, rel=0.05)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_middleware_delays_requests(respx_mock: MockRouter) -> None:
+    # 600 requests per minute is 10 per second, but only one is left
+    respx_mock.post("/v1/messages").mock(
+        return_value=httpx.Response(200, json=MESSAGE, headers=rate_limit_headers(requests=(600, 0)))
+    )
+    limiter = RateLimitMiddleware()
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", middleware=[limiter]) as client:
+        start = time.monotonic()
+        client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+        client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+        assert time.monotonic() - start >= 0.09
+
+    assert limiter.buckets["requests"].limit == 600
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_middleware_ignores_other_requests(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/messages/count_tokens").mock(
+        return_value=httpx.Response(200, json={"input_tokens": 1}, headers=rate_limit_headers(requests=(60, 0)))
+    )
+    limiter = RateLimitMiddleware()
+
+    with Anthropic(base_url=base_url, api_key="my-anthropic-api-key", middleware=[limiter]) as client:
+        client.messages.count_tokens(model="claude-sonnet-4-5", messages=MESSAGES)
+
+    assert limiter.buckets == {}
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_middleware_waits_out_retry_after(respx_mock: MockRouter) -> None:
+    responses: List[httpx.Response] = [
+        httpx.Response(
+            429, json={"error": "rate limited"}, headers={"retry-after-ms": "100", "x-should-retry": "false"}
+        ),
+        httpx.Response(200, json=MESSAGE),
+    ]
+    respx_mock.post("/v1/messages").mock(side_effect=responses)
+    backend = InMemoryRateLimitBackend()
+
+    async with AsyncAnthropic(
+        base_url=base_url, api_key="my-anthropic-api-key", middleware=[RateLimitMiddleware(backend=backend)]
+    ) as client:
+        with pytest.raises(Exception, match="429"):
+            await client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+
+        start = time.monotonic()
+        await client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+        assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_middleware_calls_backend_off_the_event_loop(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/messages").mock(return_value=httpx.Response(200, json=MESSAGE))
+    loop_thread = threading.get_ident()
+    threads: List[int] = []
+
+    class RecordingBackend(InMemoryRateLimitBackend):
+        @override
+        def acquire(self, cost: Dict[str, float]) -> float:
+            threads.append(threading.get_ident())
+            return super().acquire(cost)
+
+        @override
+        def observe(self, headers: httpx.Headers) -> None:
+            threads.append(threading.get_ident())
+            super().observe(headers)
+
+    async with AsyncAnthropic(
+        base_url=base_url, api_key="my-anthropic-api-key", middleware=[RateLimitMiddleware(backend=RecordingBackend())]
+    ) as client:
+        await client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+
+    assert len(threads) == 2
+    assert loop_thread not in threads
@@ -18,6 +18,7 @@ from anthropic.lib.tools.agent_toolset import (
     BashSession,
     AgentToolContext,
     resolve_path,
+    beta_bash_tool,
     beta_edit_tool,
     beta_glob_tool,
     beta_grep_tool,
@@ -543,6 +544,52 @@ async def test_bash_outer_cancel_closes_subprocess_no_stale_state(tmp_path: Path
         await s.close()
 
 
+@needs_pydantic_v2
+@pytest.mark.skipif(sys.platform == "win32", reason="bash session requires /bin/bash")
+async def test_bash_tool_serializes_concurrent_commands(tmp_path: Path) -> None:
+    """Concurrent calls (a session runner with ``max_concurrent_tools``) take
+    turns on the one persistent shell instead of interleaving on its pipes."""
+    from anthropic.lib.tools._beta_functions import aclose_runnable_tool
+
+    tool = beta_bash_tool(AgentToolContext(workdir=str(tmp_path)))
+    results: dict[int, Any] = {}
+
+    async def run(i: int) -> None:
+        results[i] = await tool.call({"command": f"sleep 0.0{i}; echo start-{i}; echo end-{i}"})
+
+    try:
+        async with anyio.create_task_group() as tg:
+            for i in range(1, 5):
+                tg.start_soon(run, i)
+    finally:
+        await aclose_runnable_tool(tool)
+    assert results == {i: f"start-{i}\nend-{i}" for i in range(1, 5)}
+
+
+@needs_pydantic_v2
+@pytest.mark.skipif(sys.platform == "win32", reason="bash session requires /bin/bash")
+async def test_bash_tool_wait_for_shell_counts_against_timeout(tmp_path: Path) -> None:
+    from anthropic.lib.tools._beta_functions import aclose_runnable_tool
+
+    tool = beta_bash_tool(AgentToolContext(workdir=str(tmp_path)))
+    errors: list[str] = []
+
+    async def queued() -> None:
+        await anyio.sleep(0.05)
+        try:
+            await tool.call({"command": "echo late", "timeout_ms": 200})
+        except ToolError as e:
+            errors.append(str(e))
+
+    try:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(queued)
+            assert await tool.call({"command": "sleep 0.6; echo done"}) == "done"
+    finally:
+        await aclose_runnable_tool(tool)
+    assert len(errors) == 1 and "waiting for the previous command" in errors[0]
+
+
 @needs_pydantic_v2
 async def test_read_through_symlink_escape_is_rejected(tmp_path: Path) -> None:
     """resolve_path realpaths, so a symlink that escapes the workdir is caught."""
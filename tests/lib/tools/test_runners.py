@@ -1,9 +1,12 @@
 import os
 import json
+import time
 import logging
+import threading
 from typing import Any, Dict, List, Union, cast
 from typing_extensions import Literal
 
+import anyio
 import httpx
 import pytest
 from respx import MockRouter
@@ -12,7 +15,7 @@ from inline_snapshot import external, snapshot
 from anthropic import Anthropic, AsyncAnthropic, beta_tool, beta_async_tool
 from anthropic._utils import assert_signatures_in_sync
 from anthropic._compat import PYDANTIC_V1
-from anthropic.lib.tools import BetaFunctionToolResultType
+from anthropic.lib.tools import ToolCacheStats, InMemoryToolResultCache, BetaFunctionToolResultType
 from anthropic.lib.tools._tool_dispatch import available_tool_names
 from anthropic.types.beta.beta_message_param import BetaMessageParam
 from anthropic.types.beta.beta_content_block_param import BetaContentBlockParam
@@ -1276,6 +1279,267 @@ def test_tool_addition_nested_in_mid_conv_system_block() -> None:
     assert available_tool_names(messages, ["get_weather"]) == {"get_weather"}
 
 
+def _multi_tool_use_response(*tool_uses: "tuple[str, str, Dict[str, Any]]") -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "id": "msg_multi_tool_use",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-haiku-4-5",
+            "content": [
+                {"type": "tool_use", "id": tool_use_id, "name": name, "input": input}
+                for tool_use_id, name, input in tool_uses
+            ],
+            "stop_reason": "tool_use",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        },
+    )
+
+
+def _delay_tool_uses(*delays: float) -> List["tuple[str, str, Dict[str, Any]]"]:
+    return [(f"toolu_{i}", "delay", {"seconds": delay}) for i, delay in enumerate(delays)]
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="tool runner not supported with pydantic v1")
+@pytest.mark.respx(base_url=base_url)
+def test_concurrent_tool_calls_sync(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/messages").mock(
+        side_effect=[_multi_tool_use_response(*_delay_tool_uses(0.3, 0.2, 0.1, 0.0)), _end_turn_response()]
+    )
+
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    @beta_tool
+    def delay(seconds: float) -> BetaFunctionToolResultType:
+        """Sleep for the given number of seconds."""
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(seconds)
+        with lock:
+            active -= 1
+        return f"slept {seconds}"
+
+    with Anthropic(
+        base_url=base_url, api_key="my-anthropic-api-key", _strict_response_validation=True, max_retries=0
+    ) as client:
+        runner = client.beta.messages.tool_runner(
+            max_tokens=1024,
+            model="claude-haiku-4-5",
+            tools=[delay],
+            messages=[{"role": "user", "content": "Sleep"}],
+            max_concurrent_tools=2,
+        )
+        results: List[BetaMessageParam] = []
+        for _ in runner:
+            response = runner.generate_tool_call_response()
+            if response is not None:
+                results.append(response)
+
+    assert max_active == 2
+    assert results == [
+        {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": "toolu_0", "content": "slept 0.3"},
+                {"type": "tool_result", "tool_use_id": "toolu_1", "content": "slept 0.2"},
+                {"type": "tool_result", "tool_use_id": "toolu_2", "content": "slept 0.1"},
+                {"type": "tool_result", "tool_use_id": "toolu_3", "content": "slept 0.0"},
+            ],
+        }
+    ]
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="tool runner not supported with pydantic v1")
+@pytest.mark.respx(base_url=base_url)
+def test_tool_timeout_sync(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/messages").mock(
+        side_effect=[_multi_tool_use_response(*_delay_tool_uses(10, 0)), _end_turn_response()]
+    )
+
+    release = threading.Event()
+
+    @beta_tool
+    def delay(seconds: float) -> BetaFunctionToolResultType:
+        """Sleep for the given number of seconds."""
+        release.wait(seconds)
+        return f"slept {seconds}"
+
+    with Anthropic(
+        base_url=base_url, api_key="my-anthropic-api-key", _strict_response_validation=True, max_retries=0
+    ) as client:
+        runner = client.beta.messages.tool_runner(
+            max_tokens=1024,
+            model="claude-haiku-4-5",
+            tools=[delay],
+            messages=[{"role": "user", "content": "Sleep"}],
+            tool_timeout=0.2,
+        )
+        try:
+            next(runner)
+            response = runner.generate_tool_call_response()
+        finally:
+            release.set()
+
+    assert response == {
+        "role": "user",
+        "content": [
+            {
+                "type": "tool_result",
+                "tool_use_id": "toolu_0",
+                "content": "Error: Tool 'delay' timed out after 0.2s",
+                "is_error": True,
+            },
+            {"type": "tool_result", "tool_use_id": "toolu_1", "content": "slept 0.0"},
+        ],
+    }
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="tool runner not supported with pydantic v1")
+@pytest.mark.respx(base_url=base_url)
+async def test_concurrent_tool_calls_async(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/messages").mock(
+        side_effect=[_multi_tool_use_response(*_delay_tool_uses(0.3, 0.2, 0.1, 10)), _end_turn_response()]
+    )
+
+    active = 0
+    max_active = 0
+
+    @beta_async_tool
+    async def delay(seconds: float) -> BetaFunctionToolResultType:
+        """Sleep for the given number of seconds."""
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        try:
+            await anyio.sleep(seconds)
+        finally:
+            active -= 1
+        return f"slept {seconds}"
+
+    async with AsyncAnthropic(
+        base_url=base_url, api_key="my-anthropic-api-key", _strict_response_validation=True, max_retries=0
+    ) as client:
+        runner = client.beta.messages.tool_runner(
+            max_tokens=1024,
+            model="claude-haiku-4-5",
+            tools=[delay],
+            messages=[{"role": "user", "content": "Sleep"}],
+            max_concurrent_tools=3,
+            tool_timeout=0.5,
+        )
+        await runner.__anext__()
+        start = time.monotonic()
+        response = await runner.generate_tool_call_response()
+        elapsed = time.monotonic() - start
+
+    assert max_active == 3
+    # the slowest call times out, the rest overlap with it instead of running one after another
+    assert elapsed < 1.5
+    assert response == {
+        "role": "user",
+        "content": [
+            {"type": "tool_result", "tool_use_id": "toolu_0", "content": "slept 0.3"},
+            {"type": "tool_result", "tool_use_id": "toolu_1", "content": "slept 0.2"},
+            {"type": "tool_result", "tool_use_id": "toolu_2", "content": "slept 0.1"},
+            {
+                "type": "tool_result",
+                "tool_use_id": "toolu_3",
+                "content": "Error: Tool 'delay' timed out after 0.5s",
+                "is_error": True,
+            },
+        ],
+    }
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="tool runner not supported with pydantic v1")
+@pytest.mark.respx(base_url=base_url)
+def test_tool_cache_stats_sync(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/messages").mock(
+        side_effect=[
+            _multi_tool_use_response(
+                ("toolu_0", "lookup", {"key": "a"}),
+                ("toolu_1", "lookup", {"key": "b"}),
+                ("toolu_2", "uncached", {"key": "a"}),
+            ),
+            _multi_tool_use_response(("toolu_3", "lookup", {"key": "a"}), ("toolu_4", "uncached", {"key": "a"})),
+            _end_turn_response(),
+        ]
+    )
+
+    calls: List[str] = []
+
+    @beta_tool(cache=InMemoryToolResultCache())
+    def lookup(key: str) -> BetaFunctionToolResultType:
+        """Look up a key."""
+        calls.append(key)
+        return key.upper()
+
+    @beta_tool
+    def uncached(key: str) -> BetaFunctionToolResultType:
+        """Look up a key without caching."""
+        return key.upper()
+
+    with Anthropic(
+        base_url=base_url, api_key="my-anthropic-api-key", _strict_response_validation=True, max_retries=0
+    ) as client:
+        runner = client.beta.messages.tool_runner(
+            max_tokens=1024,
+            model="claude-haiku-4-5",
+            tools=[lookup, uncached],
+            messages=[{"role": "user", "content": "Look up a and b"}],
+        )
+        runner.until_done()
+
+    assert calls == ["a", "b"]
+    assert runner.tool_cache_stats == ToolCacheStats(hits=1, misses=2)
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="tool runner not supported with pydantic v1")
+@pytest.mark.respx(base_url=base_url)
+async def test_tool_cache_stats_async(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/messages").mock(
+        side_effect=[
+            _multi_tool_use_response(("toolu_0", "lookup", {"key": "a"}), ("toolu_1", "lookup", {"key": "a"})),
+            _end_turn_response(),
+        ]
+    )
+
+    @beta_async_tool(cache=InMemoryToolResultCache())
+    async def lookup(key: str) -> BetaFunctionToolResultType:
+        """Look up a key."""
+        return key.upper()
+
+    async with AsyncAnthropic(
+        base_url=base_url, api_key="my-anthropic-api-key", _strict_response_validation=True, max_retries=0
+    ) as client:
+        runner = client.beta.messages.tool_runner(
+            max_tokens=1024,
+            model="claude-haiku-4-5",
+            tools=[lookup],
+            messages=[{"role": "user", "content": "Look up a twice"}],
+        )
+        await runner.until_done()
+
+    assert runner.tool_cache_stats == ToolCacheStats(hits=1, misses=1)
+
+
+def test_max_concurrent_tools_must_be_positive(client: Anthropic) -> None:
+    with pytest.raises(ValueError, match="max_concurrent_tools must be at least 1"):
+        client.beta.messages.tool_runner(
+            max_tokens=1024,
+            model="claude-haiku-4-5",
+            tools=[],
+            messages=[{"role": "user", "content": "Hello"}],
+            max_concurrent_tools=0,
+        )
+
+
 def _get_weather(location: str, units: Literal["c", "f"]) -> Dict[str, Any]:
     # Simulate a weather API call
     print(f"Fetching weather for {location} in {units}")
@@ -1304,6 +1568,8 @@ def test_tool_runner_method_in_sync(sync: bool, client: Anthropic, async_client:
         exclude_params={
             "tools",
             "output_format",
+            "max_concurrent_tools",
+            "tool_timeout",
             # TODO
             "stream",
         },
@@ -9,16 +9,20 @@ the fake stream actually yields control to the event loop.
 
 from __future__ import annotations
 
+import json
 import asyncio
 from typing import Any, Optional, cast
+from datetime import datetime, timezone, timedelta
 from collections.abc import Callable, Awaitable, AsyncIterator
 
+import anyio
 import httpx
 import pytest
 
 from anthropic import APIStatusError
 from anthropic._compat import PYDANTIC_V1
 from anthropic.lib.tools import ToolError, _beta_session_runner as session_runner_mod
+from anthropic.types.beta.sessions import BetaManagedAgentsAgentToolUseEvent
 from anthropic.lib.tools._beta_session_runner import (
     SessionToolRunner,
     DispatchedToolCall,
@@ -172,8 +176,8 @@ class FakeAsyncEvents:
         *,
         streams: list[_FakeStream | BaseException] | None = None,
         stream_events: list[_StubEvent] | None = None,
-        list_events: list[_StubEvent] | None = None,
-        list_events_per_call: list[list[_StubEvent]] | None = None,
+        list_events: list[Any] | None = None,
+        list_events_per_call: list[list[Any] | BaseException] | None = None,
         list_raises: BaseException | None = None,
         send_failures: list[BaseException | None] | None = None,
     ) -> None:
@@ -187,13 +191,17 @@ class FakeAsyncEvents:
         # When set, each ``list()`` call consumes the next entry (falling back
         # to ``list_events`` once exhausted) so reconnect tests can script a
         # different history per reconcile pass.
-        self._list_events_per_call = [list(evs) for evs in (list_events_per_call or [])]
+        # An exception in place of a history makes that ``list()`` call fail.
+        self._list_events_per_call = [
+            evs if isinstance(evs, BaseException) else list(evs) for evs in (list_events_per_call or [])
+        ]
         self._list_raises = list_raises
         self._send_failures: list[BaseException | None] = list(send_failures or [])
         self.send_calls: list[dict[str, Any]] = []
         self.stream_calls: int = 0
         self.stream_headers: list[Any] = []
         self.list_headers: list[Any] = []
+        self.list_created_at_gte: list[Any] = []
 
     async def stream(self, _session_id: str, *, extra_headers: Any = None) -> _FakeStream:
         self.stream_calls += 1
@@ -205,10 +213,21 @@ class FakeAsyncEvents:
             raise nxt
         return nxt
 
-    def list(self, _session_id: str, *, limit: int = 1000, extra_headers: Any = None) -> Any:  # noqa: ARG002
+    def list(
+        self,
+        _session_id: str,
+        *,
+        limit: int = 1000,  # noqa: ARG002
+        created_at_gte: Any = None,
+        extra_headers: Any = None,
+    ) -> Any:
         list_raises = self._list_raises
         self.list_headers.append(extra_headers)
+        self.list_created_at_gte.append(created_at_gte)
         list_events = self._list_events_per_call.pop(0) if self._list_events_per_call else self._list_events
+        if isinstance(list_events, BaseException):
+            list_raises = list_events
+            list_events = []
 
         async def _gen() -> Any:
             for ev in list_events:
@@ -261,15 +280,20 @@ async def _run_with_fakes(
     events: FakeAsyncEvents,
     tools: list[Any],
     max_idle: float | None = None,
+    max_concurrent_tools: int | None = None,
+    checkpoint_path: Any = None,
+    session_id: str = "s_1",
     environment_key: str | None = None,
     extra_headers: dict[str, Any] | None = None,
 ) -> AsyncIterator[DispatchedToolCall]:
     client = _FakeClient(events)
     runner = SessionToolRunner(
         cast(Any, client),
-        "s_1",
+        session_id,
         tools=tools,
         max_idle=max_idle,
+        max_concurrent_tools=max_concurrent_tools,
+        checkpoint_path=checkpoint_path,
         environment_key=environment_key,
         extra_headers=extra_headers,
     )
@@ -567,6 +591,101 @@ async def test_skipped_unowned_tool_does_not_trip_idle() -> None:
     assert events.send_calls == [], "runner must not post a result it does not own"
 
 
+# ---------- concurrent dispatch ---------------------------------------------
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_dispatch_yields_calls_as_they_finish() -> None:
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def slow(input: dict[str, Any]) -> str:
+        started.append(input["id"])
+        if len(started) == 3:
+            release.set()
+        await release.wait()
+        # Later calls finish first.
+        await asyncio.sleep(0.1 * (3 - int(input["id"])))
+        return str(input["id"])
+
+    tool = _FakeTool("slow", slow)
+    events = FakeAsyncEvents(
+        stream_events=[
+            *[_tool_use(f"tu_{i}", "slow", {"id": str(i)}) for i in range(3)],
+            _idle_end_turn(),
+        ]
+    )
+
+    items = [item async for item in _run_with_fakes(events=events, tools=[tool], max_idle=0.2, max_concurrent_tools=3)]
+
+    # All three were running at once (each waits for the third to start).
+    assert sorted(started) == ["0", "1", "2"]
+    assert [item.tool_use_id for item in items] == ["tu_2", "tu_1", "tu_0"]
+    assert all(item.posted for item in items)
+    assert len(events.send_calls) == 3
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_dispatch_is_bounded() -> None:
+    running = 0
+    peak = 0
+
+    async def work(_input: dict[str, Any]) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return "ok"
+
+    tool = _FakeTool("work", work)
+    events = FakeAsyncEvents(
+        stream_events=[*[_tool_use(f"tu_{i}", "work", {}) for i in range(6)], _idle_end_turn()],
+    )
+
+    items = [item async for item in _run_with_fakes(events=events, tools=[tool], max_idle=0.2, max_concurrent_tools=2)]
+
+    assert len(items) == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_dispatch_does_not_rerun_call_in_flight(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The reconcile after a reconnect re-enqueues a call another worker is
+    still running; the second worker waits for it and skips it once answered."""
+    monkeypatch.setattr(session_runner_mod, "STREAM_BACKOFF_START", 0.01)
+    counter = {"calls": 0}
+
+    async def slow(_input: dict[str, Any]) -> str:
+        counter["calls"] += 1
+        await asyncio.sleep(0.1)
+        return "ran"
+
+    tool = _FakeTool("slow", slow)
+    call = _tool_use("tu_1", "slow", {})
+    events = FakeAsyncEvents(
+        streams=[
+            _FakeStream([call], raise_after=1, raise_with=httpx.ReadError("dropped")),
+            _FakeStream([]),
+        ],
+        list_events_per_call=[[], [call]],
+    )
+
+    items: list[DispatchedToolCall] = []
+    with anyio.move_on_after(0.5):
+        async for item in _run_with_fakes(events=events, tools=[tool], max_concurrent_tools=4):
+            items.append(item)
+
+    assert counter["calls"] == 1
+    assert [item.tool_use_id for item in items] == ["tu_1"]
+    assert len(events.send_calls) == 1
+
+
+def test_max_concurrent_tools_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_concurrent_tools must be at least 1"):
+        SessionToolRunner(cast(Any, _FakeClient(FakeAsyncEvents())), "s_1", tools=[], max_concurrent_tools=0)
+
+
 # ---------- confirmation gating (always_ask tools) --------------------------
 
 
@@ -1269,6 +1388,113 @@ async def test_yields_with_posted_false_on_permanent_4xx() -> None:
     assert len(events.send_calls) == 1  # no retry on permanent 4xx
 
 
+@pytest.mark.asyncio()
+async def test_results_finishing_together_are_posted_in_one_send() -> None:
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def work(input: dict[str, Any]) -> str:
+        started.append(input["id"])
+        if len(started) == 3:
+            release.set()
+        await release.wait()
+        return "done"
+
+    tool = _FakeTool("work", work)
+    events = FakeAsyncEvents(
+        stream_events=[*[_tool_use(f"tu_{i}", "work", {"id": str(i)}) for i in range(3)], _idle_end_turn()],
+    )
+
+    items = [item async for item in _run_with_fakes(events=events, tools=[tool], max_idle=0.2, max_concurrent_tools=3)]
+
+    assert sorted(item.tool_use_id for item in items) == ["tu_0", "tu_1", "tu_2"]
+    assert all(item.posted for item in items)
+    assert len(events.send_calls) == 1
+    assert sorted(ev["tool_use_id"] for ev in events.send_calls[0]["events"]) == ["tu_0", "tu_1", "tu_2"]
+
+
+@pytest.mark.asyncio()
+async def test_result_batch_size_is_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(session_runner_mod, "RESULT_BATCH_MAX_EVENTS", 2)
+    release = asyncio.Event()
+    started: list[int] = []
+
+    async def work(_input: dict[str, Any]) -> str:
+        started.append(1)
+        if len(started) == 5:
+            release.set()
+        await release.wait()
+        return "done"
+
+    tool = _FakeTool("work", work)
+    events = FakeAsyncEvents(
+        stream_events=[*[_tool_use(f"tu_{i}", "work", {}) for i in range(5)], _idle_end_turn()],
+    )
+
+    items = [item async for item in _run_with_fakes(events=events, tools=[tool], max_idle=0.2, max_concurrent_tools=5)]
+
+    assert len(items) == 5 and all(item.posted for item in items)
+    assert sorted(len(call["events"]) for call in events.send_calls) == [1, 2, 2]
+
+
+@pytest.mark.asyncio()
+async def test_rejected_result_batch_is_posted_one_by_one() -> None:
+    """A batch the server rejects with a permanent 4xx is split so the one bad
+    result doesn't stop the others from landing."""
+    release = asyncio.Event()
+    started: list[int] = []
+
+    async def work(_input: dict[str, Any]) -> str:
+        started.append(1)
+        if len(started) == 2:
+            release.set()
+        await release.wait()
+        return "done"
+
+    tool = _FakeTool("work", work)
+    events = FakeAsyncEvents(
+        stream_events=[_tool_use("tu_0", "work", {}), _tool_use("tu_1", "work", {}), _idle_end_turn()],
+        send_failures=[_api_status_error(400), None, _api_status_error(400)],
+    )
+
+    items = [item async for item in _run_with_fakes(events=events, tools=[tool], max_idle=0.2, max_concurrent_tools=2)]
+
+    assert [len(call["events"]) for call in events.send_calls] == [2, 1, 1]
+    first = events.send_calls[1]["events"][0]["tool_use_id"]
+    assert {item.tool_use_id: item.posted for item in items} == {
+        first: True,
+        ("tu_1" if first == "tu_0" else "tu_0"): False,
+    }
+
+
+@pytest.mark.asyncio()
+async def test_result_retry_skips_results_that_already_landed() -> None:
+    """A result the stream has echoed back since a failed attempt is not posted again."""
+    answered: set[str] = set()
+
+    class _EchoingEvents(FakeAsyncEvents):
+        async def send(self, session_id: str, *, events: list[Any], extra_headers: Any = None) -> None:
+            try:
+                await super().send(session_id, events=events, extra_headers=extra_headers)
+            except httpx.ReadError:
+                # The first attempt reached the session; the stream echoes tu_0.
+                answered.add("tu_0")
+                raise
+
+    events = _EchoingEvents(send_failures=[httpx.ReadError("reset")])
+    runner = SessionToolRunner(cast(Any, _FakeClient(events)), "s_1", tools=[])
+    runner._events = cast(Any, events)
+    runner._answered = answered
+    results = [
+        (cast(Any, {"type": "user.tool_result", "tool_use_id": tool_use_id}), tool_use_id)
+        for tool_use_id in ("tu_0", "tu_1")
+    ]
+
+    assert await runner._post_results(results) == {"tu_0", "tu_1"}
+    assert [[ev["tool_use_id"] for ev in call["events"]] for call in events.send_calls] == [["tu_0", "tu_1"], ["tu_1"]]
+    assert answered == {"tu_0", "tu_1"}
+
+
 # ---------- tool execution edge cases --------------------------------------
 
 
@@ -1369,6 +1595,160 @@ async def test_reconcile_list_error_does_not_dispatch_partial() -> None:
     assert counter["calls"] == 0
 
 
+# ---------- incremental reconcile / checkpoint ------------------------------
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _at(seconds: int) -> datetime:
+    return T0 + timedelta(seconds=seconds)
+
+
+def _typed_tool_use(id: str, name: str, *, processed_at: datetime) -> BetaManagedAgentsAgentToolUseEvent:
+    return BetaManagedAgentsAgentToolUseEvent(
+        id=id, name=name, input={}, processed_at=processed_at, type="agent.tool_use"
+    )
+
+
+@pytest.mark.asyncio()
+async def test_reconnect_lists_only_events_since_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The first reconcile reads the whole history; the one after a reconnect
+    lists from the latest processed event (minus the overlap window), including
+    events that only arrived on the live stream."""
+    monkeypatch.setattr(session_runner_mod, "STREAM_BACKOFF_START", 0.01)
+    events = FakeAsyncEvents(
+        streams=[
+            _FakeStream(
+                [_StubEvent("agent.message", processed_at=_at(5))],
+                raise_after=1,
+                raise_with=httpx.ReadError("dropped"),
+            ),
+            _FakeStream([_terminated()]),
+        ],
+        list_events_per_call=[[_StubEvent("agent.message", processed_at=_at(1))], []],
+    )
+
+    items = [item async for item in _run_with_fakes(events=events, tools=[])]
+
+    assert items == []
+    assert events.list_created_at_gte == [None, _at(5) - session_runner_mod.RECONCILE_OVERLAP]
+
+
+@pytest.mark.asyncio()
+async def test_incremental_reconcile_redispatches_unanswered_call_before_cursor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A call from before the cursor whose result post failed is retried after
+    a reconnect even though the tail listing no longer contains it."""
+    monkeypatch.setattr(session_runner_mod, "STREAM_BACKOFF_START", 0.01)
+    counter = {"calls": 0}
+
+    async def echo(_input: dict[str, Any]) -> str:
+        counter["calls"] += 1
+        return "ok"
+
+    events = FakeAsyncEvents(
+        streams=[
+            _FakeStream(
+                [_StubEvent("agent.message", processed_at=_at(5))],
+                raise_after=1,
+                raise_with=httpx.ReadError("dropped"),
+            ),
+            _FakeStream([_terminated()]),
+        ],
+        list_events_per_call=[
+            [_typed_tool_use("tu_1", "echo", processed_at=_at(1))],
+            [_StubEvent("agent.message", processed_at=_at(5))],
+        ],
+        send_failures=[_api_status_error(400)],
+    )
+
+    items = [item async for item in _run_with_fakes(events=events, tools=[_FakeTool("echo", echo)])]
+
+    assert events.list_created_at_gte[1] is not None
+    assert counter["calls"] == 2
+    assert [it.posted for it in items] == [False, True]
+
+
+@pytest.mark.asyncio()
+async def test_tail_listing_rejected_falls_back_to_full_scan(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(session_runner_mod, "STREAM_BACKOFF_START", 0.01)
+    events = FakeAsyncEvents(
+        streams=[
+            _FakeStream(
+                [_StubEvent("agent.message", processed_at=_at(5))],
+                raise_after=1,
+                raise_with=httpx.ReadError("dropped"),
+            ),
+            _FakeStream([_terminated()]),
+        ],
+        list_events_per_call=[[_StubEvent("agent.message", processed_at=_at(1))], _api_status_error(400), []],
+    )
+
+    items = [item async for item in _run_with_fakes(events=events, tools=[])]
+
+    assert items == []
+    assert events.list_created_at_gte[0] is None
+    assert events.list_created_at_gte[1] is not None
+    assert events.list_created_at_gte[2] is None
+
+
+@pytest.mark.asyncio()
+async def test_checkpoint_resumes_cursor_and_unanswered_calls(tmp_path: Any) -> None:
+    """A runner restarted with the same checkpoint lists only the tail and
+    still executes the call left unanswered by the previous run."""
+    checkpoint = tmp_path / "session.json"
+    counter = {"calls": 0}
+
+    async def echo(_input: dict[str, Any]) -> str:
+        counter["calls"] += 1
+        return "ok"
+
+    first = FakeAsyncEvents(
+        stream_events=[_terminated()],
+        list_events=[_typed_tool_use("tu_1", "echo", processed_at=_at(1))],
+        send_failures=[_api_status_error(400)],
+    )
+    items = [
+        item
+        async for item in _run_with_fakes(events=first, tools=[_FakeTool("echo", echo)], checkpoint_path=checkpoint)
+    ]
+    assert [it.posted for it in items] == [False]
+    assert json.loads(checkpoint.read_text())["calls"][0]["id"] == "tu_1"
+
+    second = FakeAsyncEvents(stream_events=[_terminated()], list_events=[])
+    items = [
+        item
+        async for item in _run_with_fakes(events=second, tools=[_FakeTool("echo", echo)], checkpoint_path=checkpoint)
+    ]
+
+    assert second.list_created_at_gte == [_at(1) - session_runner_mod.RECONCILE_OVERLAP]
+    assert counter["calls"] == 2
+    assert [(it.tool_use_id, it.posted) for it in items] == [("tu_1", True)]
+    assert json.loads(checkpoint.read_text())["calls"] == []
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "not json",
+        json.dumps({"version": 1, "session_id": "s_other", "cursor": T0.isoformat()}),
+        json.dumps({"version": 99, "session_id": "s_1", "cursor": T0.isoformat()}),
+        json.dumps({"version": 1, "session_id": "s_1", "cursor": "yesterday"}),
+    ],
+)
+async def test_invalid_checkpoint_falls_back_to_full_scan(tmp_path: Any, contents: str) -> None:
+    checkpoint = tmp_path / "session.json"
+    checkpoint.write_text(contents)
+    events = FakeAsyncEvents(stream_events=[_terminated()], list_events=[])
+
+    items = [item async for item in _run_with_fakes(events=events, tools=[], checkpoint_path=checkpoint)]
+
+    assert items == []
+    assert events.list_created_at_gte == [None]
+
+
 # ---------- environment-key auth -----------------------------------------
 
 
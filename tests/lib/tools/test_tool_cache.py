@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, List, Union
+from pathlib import Path
+from typing_extensions import override
+
+import pytest
+
+from anthropic import beta_tool, beta_async_tool
+from anthropic._compat import PYDANTIC_V1
+from anthropic.lib.tools import (
+    ToolError,
+    ToolResultCache,
+    SQLiteToolResultCache,
+    InMemoryToolResultCache,
+    BetaFunctionToolResultType,
+)
+from anthropic.lib.tools._beta_tool_cache import tool_cache_key
+
+
+def test_cache_key_is_canonical() -> None:
+    assert tool_cache_key("lookup", {"a": 1, "b": [1, 2]}) == tool_cache_key("lookup", {"b": [1, 2], "a": 1})
+    assert tool_cache_key("lookup", {"a": 1}) != tool_cache_key("other", {"a": 1})
+    assert tool_cache_key("lookup", {"a": 1}) != tool_cache_key("lookup", {"a": "1"})
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request: pytest.FixtureRequest, tmp_path: Path) -> Any:
+    def make(**kwargs: Any) -> ToolResultCache:
+        if request.param == "memory":
+            return InMemoryToolResultCache(**kwargs)
+        return SQLiteToolResultCache(str(tmp_path / "tools.db"), **kwargs)
+
+    return make
+
+
+def test_cache_get_set(make_cache: Any) -> None:
+    cache: ToolResultCache = make_cache()
+    assert cache.get("a") is None
+
+    cache.set("a", "result")
+    cache.set("b", [{"type": "text", "text": "block"}])
+    assert cache.get("a") == "result"
+    assert cache.get("b") == [{"type": "text", "text": "block"}]
+
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_cache_ttl(make_cache: Any) -> None:
+    cache: ToolResultCache = make_cache(ttl=0)
+    cache.set("a", "result")
+    assert cache.get("a") is None
+
+
+def test_cache_evicts_least_recently_used(make_cache: Any) -> None:
+    cache: ToolResultCache = make_cache(max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_in_memory_cache_returns_copies() -> None:
+    cache = InMemoryToolResultCache()
+    cache.set("a", [{"type": "text", "text": "block"}])
+
+    result = cache.get("a")
+    assert isinstance(result, list)
+    result.append({"type": "text", "text": "mutated"})
+
+    assert cache.get("a") == [{"type": "text", "text": "block"}]
+
+
+def test_sqlite_cache_persists(tmp_path: Path) -> None:
+    path = str(tmp_path / "tools.db")
+    cache = SQLiteToolResultCache(path)
+    cache.set("a", "result")
+    cache.close()
+
+    assert SQLiteToolResultCache(path).get("a") == "result"
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="only applicable in pydantic v2")
+def test_cached_tool() -> None:
+    calls: List[str] = []
+
+    @beta_tool(cache=InMemoryToolResultCache())
+    def lookup(key: str) -> BetaFunctionToolResultType:
+        """Look up a key."""
+        calls.append(key)
+        if key == "missing":
+            raise ToolError(f"{key} not found")
+        return [{"type": "text", "text": key.upper()}]
+
+    assert lookup.call({"key": "a"}) == [{"type": "text", "text": "A"}]
+    assert lookup.call({"key": "a"}) == [{"type": "text", "text": "A"}]
+    assert lookup.call({"key": "b"}) == [{"type": "text", "text": "B"}]
+    assert calls == ["a", "b"]
+
+    # errors are never cached
+    for _ in range(2):
+        with pytest.raises(ToolError):
+            lookup.call({"key": "missing"})
+    assert calls == ["a", "b", "missing", "missing"]
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="only applicable in pydantic v2")
+async def test_cached_async_tool() -> None:
+    calls: List[str] = []
+
+    @beta_async_tool(cache=InMemoryToolResultCache())
+    async def lookup(key: str) -> BetaFunctionToolResultType:
+        """Look up a key."""
+        calls.append(key)
+        return key.upper()
+
+    assert await lookup.call({"key": "a"}) == "A"
+    assert await lookup.call({"key": "a"}) == "A"
+    assert calls == ["a"]
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="only applicable in pydantic v2")
+async def test_async_tool_calls_blocking_cache_off_the_event_loop() -> None:
+    threads: List[int] = []
+
+    class RecordingCache(InMemoryToolResultCache):
+        blocking = True
+
+        @override
+        def get(self, key: str) -> Union[BetaFunctionToolResultType, None]:
+            threads.append(threading.get_ident())
+            return super().get(key)
+
+        @override
+        def set(self, key: str, value: BetaFunctionToolResultType) -> None:
+            threads.append(threading.get_ident())
+            super().set(key, value)
+
+    @beta_async_tool(cache=RecordingCache())
+    async def lookup(key: str) -> BetaFunctionToolResultType:
+        """Look up a key."""
+        return key.upper()
+
+    assert await lookup.call({"key": "a"}) == "A"
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+    # the in-memory cache doesn't block, so it's called on the event loop
+    threads.clear()
+    RecordingCache.blocking = False
+    assert await lookup.call({"key": "b"}) == "B"
+    assert threads == [threading.get_ident()] * 2
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="only applicable in pydantic v2")
+def test_cache_is_shared_between_tools_by_name() -> None:
+    cache = InMemoryToolResultCache()
+
+    @beta_tool(cache=cache)
+    def upper(text: str) -> BetaFunctionToolResultType:
+        """Upper case."""
+        return text.upper()
+
+    @beta_tool(cache=cache)
+    def lower(text: str) -> BetaFunctionToolResultType:
+        """Lower case."""
+        return text.lower()
+
+    assert upper.call({"text": "Hi"}) == "HI"
+    assert lower.call({"text": "Hi"}) == "hi"
+    assert len(cache) == 2
@@ -35,6 +35,7 @@ from anthropic._base_client import (
     get_platform,
     make_request_options,
 )
+from anthropic._utils._json import openapi_dumps
 
 from .utils import update_env
 
@@ -1067,6 +1068,33 @@ class TestAnthropic:
         assert response.retries_taken == failures_before_success
         assert int(response.http_request.headers.get("x-stainless-retry-count")) == failures_before_success
 
+    @mock.patch("anthropic._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    def test_retries_reuse_serialized_body(self, client: Anthropic, respx_mock: MockRouter) -> None:
+        client = client.with_options(max_retries=4)
+
+        bodies: list[bytes] = []
+
+        def retry_handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(500 if len(bodies) < 3 else 200)
+
+        respx_mock.post("/v1/messages").mock(side_effect=retry_handler)
+
+        with mock.patch("anthropic._models.openapi_dumps", wraps=openapi_dumps) as dumps:
+            response = client.messages.with_raw_response.create(
+                max_tokens=1024,
+                messages=[{"content": "Hello, world", "role": "user"}],
+                model="claude-opus-4-6",
+                extra_body={"metadata": {"user_id": "123"}},
+            )
+
+        assert response.retries_taken == 2
+        assert dumps.call_count == 1
+        assert len(set(bodies)) == 1
+        assert json.loads(bodies[0])["metadata"] == {"user_id": "123"}
+        assert response.http_request.headers.get("x-stainless-retry-count") == "2"
+
     @pytest.mark.parametrize("failures_before_success", [0, 2, 4])
     @mock.patch("anthropic._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
     @pytest.mark.respx(base_url=base_url)
@@ -2198,6 +2226,33 @@ class TestAsyncAnthropic:
         assert response.retries_taken == failures_before_success
         assert int(response.http_request.headers.get("x-stainless-retry-count")) == failures_before_success
 
+    @mock.patch("anthropic._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    async def test_retries_reuse_serialized_body(self, async_client: AsyncAnthropic, respx_mock: MockRouter) -> None:
+        client = async_client.with_options(max_retries=4)
+
+        bodies: list[bytes] = []
+
+        def retry_handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(500 if len(bodies) < 3 else 200)
+
+        respx_mock.post("/v1/messages").mock(side_effect=retry_handler)
+
+        with mock.patch("anthropic._models.openapi_dumps", wraps=openapi_dumps) as dumps:
+            response = await client.messages.with_raw_response.create(
+                max_tokens=1024,
+                messages=[{"content": "Hello, world", "role": "user"}],
+                model="claude-opus-4-6",
+                extra_body={"metadata": {"user_id": "123"}},
+            )
+
+        assert response.retries_taken == 2
+        assert dumps.call_count == 1
+        assert len(set(bodies)) == 1
+        assert json.loads(bodies[0])["metadata"] == {"user_id": "123"}
+        assert response.http_request.headers.get("x-stainless-retry-count") == "2"
+
     @pytest.mark.parametrize("failures_before_success", [0, 2, 4])
     @mock.patch("anthropic._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
     @pytest.mark.respx(base_url=base_url)
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import ssl
+import socket
+import datetime
+import threading
+from typing import Any, Set, List, Iterable, Iterator, Optional, cast
+from pathlib import Path
+from unittest import mock
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing_extensions import override
+
+import httpx
+import pytest
+import httpcore
+
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    APIConnectionError,
+    DefaultHttpxClient,
+    DefaultAsyncHttpxClient,
+)
+from anthropic._connection_pool import _ConnectionCache, _AsyncCachingBackend
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self) -> None:
+        self.send_response(404)
+        self.send_header("content-length", "0")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("content-length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.connections = 0
+
+    def get_request(self) -> Any:
+        request = super().get_request()
+        self.connections += 1
+        return request
+
+
+@pytest.fixture
+def server() -> Iterator[Server]:
+    server = Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url(server: Server, scheme: str = "http") -> str:
+    return f"{scheme}://localhost:{server.server_address[1]}"
+
+
+def test_warmup_opens_connections(server: Server) -> None:
+    with Anthropic(base_url=url(server), api_key="my-anthropic-api-key") as client:
+        stats = client.warmup(3)
+        assert stats is not None
+        assert (stats.connections, stats.idle, stats.active) == (3, 3, 0)
+        assert server.connections == 3
+
+        # the first requests reuse the warm connections
+        client._client.get(url(server))
+        client._client.get(url(server))
+        assert server.connections == 3
+
+
+async def test_async_warmup_opens_connections(server: Server) -> None:
+    async with AsyncAnthropic(base_url=url(server), api_key="my-anthropic-api-key") as client:
+        stats = await client.warmup(3)
+        assert stats is not None
+        assert (stats.connections, stats.idle) == (3, 3)
+        assert server.connections == 3
+
+
+def test_warmup_connection_error() -> None:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    with Anthropic(base_url=f"http://127.0.0.1:{port}", api_key="my-anthropic-api-key") as client:
+        with pytest.raises(APIConnectionError):
+            client.warmup(2)
+
+
+def test_warmup_error_does_not_hang_other_connections() -> None:
+    calls = 0
+    lock = threading.Lock()
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        with lock:
+            calls += 1
+            first = calls == 1
+        if first:
+            return httpx.Response(404)
+        raise RuntimeError("transport failure")
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    with Anthropic(base_url="http://localhost", api_key="my-anthropic-api-key", http_client=http_client) as client:
+        with pytest.raises(RuntimeError, match="transport failure"):
+            client.warmup(2)
+
+
+def test_dns_cache(server: Server) -> None:
+    calls: List[str] = []
+    getaddrinfo = socket.getaddrinfo
+
+    def counting_getaddrinfo(host: str, *args: Any, **kwargs: Any) -> Any:
+        calls.append(host)
+        return getaddrinfo(host, *args, **kwargs)
+
+    # without keepalive every request opens a new connection
+    with DefaultHttpxClient(  # type: ignore[call-arg]
+        connection_cache=True, limits=httpx.Limits(max_keepalive_connections=0)
+    ) as http_client:
+        client = Anthropic(base_url=url(server), api_key="my-anthropic-api-key", http_client=http_client)
+        with mock.patch("socket.getaddrinfo", counting_getaddrinfo):
+            for _ in range(3):
+                assert http_client.get(url(server)).text == "ok"
+
+        stats = client.connection_pool_stats()
+        assert stats is not None
+        assert stats.dns_cache_entries == 1
+
+    assert server.connections == 3
+    # later connections go to the cached address, which doesn't make a DNS query
+    assert calls.count("localhost") == 1
+
+
+def test_connection_cache_is_opt_in(server: Server) -> None:
+    calls: List[str] = []
+    getaddrinfo = socket.getaddrinfo
+
+    def counting_getaddrinfo(host: str, *args: Any, **kwargs: Any) -> Any:
+        calls.append(host)
+        return getaddrinfo(host, *args, **kwargs)
+
+    with DefaultHttpxClient(limits=httpx.Limits(max_keepalive_connections=0)) as http_client:
+        client = Anthropic(base_url=url(server), api_key="my-anthropic-api-key", http_client=http_client)
+        with mock.patch("socket.getaddrinfo", counting_getaddrinfo):
+            for _ in range(2):
+                assert http_client.get(url(server)).text == "ok"
+
+        stats = client.connection_pool_stats()
+        assert stats is not None
+        assert stats.dns_cache_entries == 0
+
+    assert calls.count("localhost") == 2
+
+
+class _FakeStream(httpcore.AsyncNetworkStream):
+    def __init__(self, address: str) -> None:
+        self.address = address
+
+    @override
+    def get_extra_info(self, info: str) -> Any:
+        return (self.address, 443) if info == "server_addr" else None
+
+
+class _FakeBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, *, unreachable: Set[str]) -> None:
+        self.hosts: List[str] = []
+        self.unreachable = unreachable
+
+    @override
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,  # noqa: ARG002
+        timeout: Optional[float] = None,  # noqa: ARG002
+        local_address: Optional[str] = None,  # noqa: ARG002
+        socket_options: Optional[Iterable[Any]] = None,  # noqa: ARG002
+    ) -> httpcore.AsyncNetworkStream:
+        self.hosts.append(host)
+        if host in self.unreachable:
+            raise httpcore.ConnectError(f"{host} is unreachable")
+        return _FakeStream("2001:db8::1" if host == "api.example.com" else host)
+
+
+async def test_async_backend_connects_by_hostname_until_an_address_is_cached() -> None:
+    backend = _FakeBackend(unreachable=set())
+    caching = _AsyncCachingBackend(backend, _ConnectionCache())
+
+    await caching.connect_tcp("api.example.com", 443)
+    await caching.connect_tcp("api.example.com", 443)
+    # the first connection is left to anyio (and its Happy Eyeballs), the next one reuses its address
+    assert backend.hosts == ["api.example.com", "2001:db8::1"]
+
+    # once the cached address stops answering, the hostname is resolved again
+    backend.unreachable.add("2001:db8::1")
+    backend.hosts.clear()
+    await caching.connect_tcp("api.example.com", 443)
+    assert backend.hosts == ["2001:db8::1", "api.example.com"]
+
+
+def test_stats_without_connection_pool() -> None:
+    http_client = httpx.Client(transport=httpx.MockTransport(lambda _request: httpx.Response(200)))
+    client = Anthropic(api_key="my-anthropic-api-key", http_client=http_client)
+    assert client.connection_pool_stats() is None
+
+
+def _self_signed_certificate(directory: Path) -> "tuple[Path, Path]":
+    x509 = pytest.importorskip("cryptography.x509")
+    from cryptography.x509.oid import NameOID
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    )
+    return cert_path, key_path
+
+
+def test_tls_session_resumption(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cert_path, key_path = _self_signed_certificate(tmp_path)
+    # the SSL context is created by the connection cache, so trust the certificate through the environment
+    monkeypatch.setenv("SSL_CERT_FILE", str(cert_path))
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(cert_path, key_path)
+
+    server = Server()
+    server.socket = server_context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with DefaultHttpxClient(  # type: ignore[call-arg]
+            connection_cache=True, limits=httpx.Limits(max_keepalive_connections=0)
+        ) as http_client:
+            reused: List[bool] = []
+            for _ in range(3):
+                with http_client.stream("GET", url(server, "https")) as response:
+                    reused.append(response.extensions["network_stream"].get_extra_info("ssl_object").session_reused)
+                    response.read()
+
+            client = Anthropic(base_url=url(server, "https"), api_key="my-anthropic-api-key", http_client=http_client)
+            stats = client.connection_pool_stats()
+            assert stats is not None
+            assert stats.tls_sessions == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert reused == [False, True, True]
+
+
+async def test_async_tls_session_resumption(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cert_path, key_path = _self_signed_certificate(tmp_path)
+    # the SSL context is created by the connection cache, so trust the certificate through the environment
+    monkeypatch.setenv("SSL_CERT_FILE", str(cert_path))
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(cert_path, key_path)
+
+    server = Server()
+    server.socket = server_context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        reused: List[bool] = []
+        async with DefaultAsyncHttpxClient(  # type: ignore[call-arg]
+            connection_cache=True, limits=httpx.Limits(max_keepalive_connections=0)
+        ) as http_client:
+            # a plain SSLContext, which anyio doesn't hand to a worker thread
+            assert type(cast(Any, http_client)._transport._pool._ssl_context) is ssl.SSLContext
+            for _ in range(2):
+                async with http_client.stream("GET", url(server, "https")) as response:
+                    await response.aread()
+                    reused.append(response.extensions["network_stream"].get_extra_info("ssl_object").session_reused)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert reused == [False, True]
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Iterator, cast
+
+import httpx
+import pytest
+import httpcore
+
+from anthropic import HTTP2Limits, DefaultHttpxClient, DefaultAsyncHttpxClient, _http2
+from anthropic._http2 import HTTP2Transport, AsyncHTTP2Transport
+
+h2 = pytest.importorskip("h2")
+
+import h2.config  # noqa: E402
+import h2.events  # noqa: E402
+import h2.connection  # noqa: E402
+
+
+class H2Server:
+    """A cleartext HTTP/2 server that answers every request with a short event stream."""
+
+    def __init__(self, *, events: int = 3, interval: float = 0.05) -> None:
+        self.events = events
+        self.interval = interval
+        self.connections = 0
+        self.peak_streams: List[int] = []
+        self.client_settings: List[Dict[int, int]] = []
+        self.client_windows: List[int] = []
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.port = 0
+        self._writers: List[asyncio.StreamWriter] = []
+
+    def __enter__(self) -> H2Server:
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(asyncio.start_server(self._serve, "127.0.0.1", 0))
+        self.port = server.sockets[0].getsockname()[1]
+        self._started.set()
+        self._loop.run_forever()
+
+        server.close()
+        for writer in self._writers:
+            writer.close()
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(server.wait_closed(), *tasks, return_exceptions=True))
+        self._loop.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.append(writer)
+        index = self.connections
+        self.connections += 1
+        self.peak_streams.append(0)
+        self.client_settings.append({})
+        self.client_windows.append(0)
+
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        active = set()
+        window_opened = asyncio.Event()
+
+        async def send_unread(stream_id: int) -> None:
+            # as much as flow control allows, which the client never acknowledges
+            while True:
+                window = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size)
+                if window <= 0:
+                    window_opened.clear()
+                    await window_opened.wait()
+                    continue
+                conn.send_data(stream_id, b"x" * window)
+                writer.write(conn.data_to_send())
+                await asyncio.sleep(0)
+
+        async def respond(stream_id: int, path: bytes) -> None:
+            conn.send_headers(stream_id, [(":status", "200"), ("content-type", "text/event-stream")])
+            if path == b"/unread":
+                await send_unread(stream_id)
+            for i in range(self.events):
+                conn.send_data(stream_id, f"data: {i}\n\n".encode())
+                writer.write(conn.data_to_send())
+                await asyncio.sleep(self.interval)
+            conn.end_stream(stream_id)
+            writer.write(conn.data_to_send())
+            active.discard(stream_id)
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RemoteSettingsChanged):
+                    self.client_settings[index].update(
+                        {code: setting.new_value for code, setting in event.changed_settings.items()}
+                    )
+                elif isinstance(event, h2.events.WindowUpdated):
+                    window_opened.set()
+                    if event.stream_id == 0:
+                        self.client_windows[index] = conn.outbound_flow_control_window
+                elif isinstance(event, h2.events.RequestReceived):
+                    active.add(event.stream_id)
+                    self.peak_streams[index] = max(self.peak_streams[index], len(active))
+                    asyncio.ensure_future(respond(event.stream_id, dict(event.headers)[b":path"]))
+            writer.write(conn.data_to_send())
+        writer.close()
+
+
+@pytest.fixture
+def server() -> Iterator[H2Server]:
+    with H2Server() as server:
+        yield server
+
+
+def test_default_client_uses_http2_transport() -> None:
+    with DefaultHttpxClient(http2=True) as client:
+        assert isinstance(client._transport, HTTP2Transport)
+
+    with DefaultHttpxClient() as client:
+        assert not isinstance(client._transport, HTTP2Transport)
+
+
+def test_untested_httpcore_uses_httpx_transport(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert _http2._httpcore_supported()
+
+    monkeypatch.setattr(httpcore, "__version__", "1.1.0")
+    assert not _http2._httpcore_supported()
+
+    monkeypatch.setattr(_http2, "_HTTPCORE_SUPPORTED", False)
+    with DefaultHttpxClient(http2=True, limits=HTTP2Limits(max_concurrent_streams=5)) as client:
+        assert type(cast(Any, client._transport)._pool) is httpcore.ConnectionPool
+        assert cast(Any, client._transport)._pool._http2
+
+
+def test_limits() -> None:
+    limits = HTTP2Limits(max_concurrent_streams=10, initial_window_size=1024 * 1024)
+    assert limits.connection_window_size == 10 * 1024 * 1024
+    assert limits == HTTP2Limits(max_concurrent_streams=10, initial_window_size=1024 * 1024)
+    assert limits != httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+    assert HTTP2Limits.from_limits(httpx.Limits(max_connections=5)).max_connections == 5
+
+    with pytest.raises(ValueError):
+        HTTP2Limits(initial_window_size=1024)
+
+
+def test_streams_share_connections(server: H2Server) -> None:
+    limits = HTTP2Limits(max_concurrent_streams=5, initial_window_size=1024 * 1024)
+    with DefaultHttpxClient(http1=False, http2=True, limits=limits) as client:
+
+        def fetch() -> None:
+            with client.stream("GET", server.url) as response:
+                assert response.http_version == "HTTP/2"
+                assert list(response.iter_lines()) == ["data: 0", "", "data: 1", "", "data: 2", ""]
+
+        threads = [threading.Thread(target=fetch) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert 4 <= server.connections < 20
+    assert max(server.peak_streams) <= 5
+    assert server.client_settings[0][h2.settings.SettingCodes.INITIAL_WINDOW_SIZE] == 1024 * 1024
+    assert server.client_settings[0][h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS] == 5
+    assert server.client_windows[0] == 5 * 1024 * 1024
+
+
+async def test_async_streams_share_connections(server: H2Server) -> None:
+    limits = HTTP2Limits(max_concurrent_streams=5)
+    async with DefaultAsyncHttpxClient(http1=False, http2=True, limits=limits) as client:
+        assert isinstance(client._transport, AsyncHTTP2Transport)
+
+        async def fetch() -> None:
+            async with client.stream("GET", server.url) as response:
+                assert response.http_version == "HTTP/2"
+                assert [line async for line in response.aiter_lines() if line] == ["data: 0", "data: 1", "data: 2"]
+
+        await asyncio.gather(*[fetch() for _ in range(20)])
+
+    # each connection is filled before the next is opened
+    assert server.connections == 4
+    assert server.peak_streams == [5, 5, 5, 5]
+
+
+async def test_unread_response_does_not_stall_connection(server: H2Server) -> None:
+    async with DefaultAsyncHttpxClient(http1=False, http2=True, timeout=5) as client:
+        async with client.stream("GET", f"{server.url}/unread"):
+            # the server sends the unread response as much as flow control allows
+            await asyncio.sleep(0.2)
+
+            async with client.stream("GET", server.url) as response:
+                assert [line async for line in response.aiter_lines() if line] == ["data: 0", "data: 1", "data: 2"]
+
+    assert server.connections == 1
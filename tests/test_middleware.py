@@ -32,10 +32,12 @@ from anthropic import (
     AnthropicBedrockMantle,
     AsyncAnthropicBedrockMantle,
 )
+from anthropic._compat import model_copy
 from anthropic._models import FinalRequestOptions
 from anthropic.lib.aws import AnthropicAWS, AsyncAnthropicAWS
 from anthropic._response import BinaryAPIResponse, AsyncBinaryAPIResponse, StreamedBinaryAPIResponse
 from anthropic.lib.foundry import AnthropicFoundry, AsyncAnthropicFoundry
+from anthropic._utils._json import openapi_dumps
 from anthropic.types.message import Message
 from anthropic._legacy_response import LegacyAPIResponse
 
@@ -492,6 +494,38 @@ class TestAPIRequest:
 
         assert request.headers == {"x-foo": "bar"}
 
+    def test_json_bytes(self, tmp_path: Path) -> None:
+        options = FinalRequestOptions.construct(
+            method="post",
+            url="/v1/messages",
+            json_data={"model": "claude-opus-4-6", "max_tokens": 16},
+            extra_json={"metadata": {"user_id": "123"}},
+        )
+        request = APIRequest(options=options, cast_to=Message)
+
+        with mock.patch("anthropic._models.openapi_dumps", wraps=openapi_dumps) as dumps:
+            content = request.json_bytes
+            assert content == b'{"model":"claude-opus-4-6","max_tokens":16,"metadata":{"user_id":"123"}}'
+            # later attempts share the bytes
+            assert APIRequest(options=model_copy(options), cast_to=Message, retries_taken=1).json_bytes is content
+            assert dumps.call_count == 1
+
+            copied = request.copy(body={"model": "claude-sonnet-4-5"})
+            assert copied.json_bytes == b'{"model":"claude-sonnet-4-5","metadata":{"user_id":"123"}}'
+            assert request.json_bytes is content
+            assert dumps.call_count == 2
+
+        get = APIRequest(options=FinalRequestOptions(method="get", url="/v1/models"), cast_to=Message)
+        assert get.json_bytes is None
+
+        path = tmp_path / "upload.txt"
+        path.write_bytes(b"file contents")
+        with path.open("rb") as reader:
+            upload = FinalRequestOptions.construct(
+                method="post", url="/v1/files?beta=true", json_data={"purpose": "test"}, files=[("file", reader)]
+            )
+            assert APIRequest(options=upload, cast_to=Message).json_bytes is None
+
 
 class TestDefaultMiddleware:
     def test_handle_is_passthrough(self) -> None:
@@ -771,6 +805,37 @@ class TestSyncMiddleware:
         assert recorder.errors == []
         assert len(respx_mock.calls) == 3
 
+    @mock.patch("anthropic._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    def test_body_is_serialized_once_across_attempts(self, respx_mock: MockRouter) -> None:
+        respx_mock.post("/v1/messages").mock(
+            side_effect=[
+                httpx.Response(500),
+                httpx.Response(500),
+                httpx.Response(200, json=message_body()),
+            ]
+        )
+
+        seen: list[bytes | None] = []
+
+        def read_body(request: APIRequest, call_next: CallNext) -> Any:
+            seen.append(request.json_bytes)
+            return call_next(request)
+
+        client = make_sync_client(middleware=[read_body], max_retries=2)
+
+        with mock.patch("anthropic._models.openapi_dumps", wraps=openapi_dumps) as dumps:
+            client.messages.create(
+                max_tokens=1024,
+                messages=[{"role": "user", "content": "Hello"}],
+                model="claude-opus-4-6",
+            )
+
+        assert dumps.call_count == 1
+        assert len(seen) == 3
+        assert all(content is seen[0] for content in seen)
+        assert [call.request.content for call in respx_mock.calls] == [seen[0]] * 3
+
     @mock.patch("anthropic._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
     @pytest.mark.respx(base_url=base_url, assert_all_called=False)
     def test_middleware_error_is_not_retried(self, respx_mock: MockRouter) -> None:
@@ -10,7 +10,7 @@ from pydantic import Field
 
 from anthropic._utils import PropertyInfo
 from anthropic._compat import PYDANTIC_V1, parse_obj, model_dump, model_json
-from anthropic._models import DISCRIMINATOR_CACHE, BaseModel, EagerIterable, construct_type
+from anthropic._models import DISCRIMINATOR_CACHE, BaseModel, EagerIterable, construct_type, compile_constructor
 
 
 class BasicModel(BaseModel):
@@ -937,6 +937,67 @@ def test_nested_discriminated_union() -> None:
     assert isinstance(model.value, InnerType2)
 
 
+@pytest.mark.skipif(PYDANTIC_V1, reason="compiled constructors are only supported in pydantic v2")
+def test_compiled_constructor_matches_construct_type() -> None:
+    class InnerType1(BaseModel):
+        type: Literal["type_1"]
+        text: str
+
+    class InnerType2(BaseModel):
+        type: Literal["type_2"]
+        created_at: datetime
+        amount: float
+
+    class Type1(BaseModel):
+        base_type: Literal["base_type_1"]
+        index: int
+        value: Annotated[Union[InnerType1, InnerType2], PropertyInfo(discriminator="type")]
+        values: List[Annotated[Union[InnerType1, InnerType2], PropertyInfo(discriminator="type")]] = []
+        note: Optional[str] = None
+
+    class Type2(BaseModel):
+        base_type: Literal["base_type_2"]
+
+    T = Annotated[Union[Type1, Type2], PropertyInfo(discriminator="base_type")]
+
+    construct = compile_constructor(T)
+    assert construct is not None
+
+    for value in [
+        {"base_type": "base_type_1", "index": 0, "value": {"type": "type_1", "text": "hi"}},
+        {
+            "base_type": "base_type_1",
+            "index": 1,
+            "value": {"type": "type_2", "created_at": "2024-01-01T00:00:00Z", "amount": 1},
+            "values": [{"type": "type_1", "text": "a"}, {"type": "type_2", "created_at": "2024-01-01T00:00:00Z"}],
+            "note": None,
+            "extra": {"foo": "bar"},
+        },
+        {"base_type": "base_type_2"},
+        {"base_type": "unknown"},
+    ]:
+        expected = construct_type(type_=T, value=value)
+        actual = construct(value)
+        assert type(actual) is type(expected)
+        assert actual == expected
+        if isinstance(expected, BaseModel):
+            assert isinstance(actual, BaseModel)
+            assert actual.model_fields_set == expected.model_fields_set
+            assert actual.to_dict() == expected.to_dict()
+
+    model = cast(Type1, construct({"base_type": "base_type_1", "index": 0, "value": {"type": "type_2", "amount": 1}}))
+    assert isinstance(model.value, InnerType2)
+    assert model.value.amount == 1.0
+    assert isinstance(model.value.amount, float)
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="compiled constructors are only supported in pydantic v2")
+def test_compiled_constructor_only_applies_to_unions() -> None:
+    assert compile_constructor(BasicModel) is None
+    assert compile_constructor(Union[str, int]) is None
+    assert compile_constructor(object) is None
+
+
 @pytest.mark.skipif(PYDANTIC_V1, reason="this is only supported in pydantic v2 for now")
 def test_extra_properties() -> None:
     class Item(BaseModel):
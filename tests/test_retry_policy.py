@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import os
+from typing import Any, List
+from unittest import mock
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from anthropic import (
+    Anthropic,
+    RetryBudget,
+    AsyncAnthropic,
+    CircuitBreaker,
+    CircuitOpenError,
+    InternalServerError,
+)
+from anthropic.types import MessageParam
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+MESSAGES: List[MessageParam] = [{"role": "user", "content": "hello"}]
+
+MESSAGE = {
+    "id": "msg_1",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-sonnet-4-5",
+    "content": [{"type": "text", "text": "hi"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 1, "output_tokens": 1},
+}
+
+
+def _no_retry_timeout(*_args: Any, **_kwargs: Any) -> float:
+    return 0
+
+
+def test_retry_budget() -> None:
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0)
+    assert not budget.try_retry()
+
+    for _ in range(4):
+        budget.record_request()
+    assert budget.try_retry()
+    assert budget.try_retry()
+    assert not budget.try_retry()
+
+    stats = budget.stats
+    assert (stats.requests, stats.retries, stats.rejected, stats.available) == (4, 2, 2, 0)
+
+
+def test_retry_budget_window() -> None:
+    budget = RetryBudget(ratio=1, min_retries_per_second=0, window=10)
+    with mock.patch("anthropic._retry_policy.time.monotonic", return_value=0):
+        budget.record_request()
+        assert budget.try_retry()
+        assert not budget.try_retry()
+
+    # both the request and the retry have left the window
+    with mock.patch("anthropic._retry_policy.time.monotonic", return_value=11):
+        budget.record_request()
+        assert budget.try_retry()
+
+
+def test_circuit_breaker_states() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+
+    with mock.patch("anthropic._retry_policy.time.monotonic", return_value=0):
+        assert not breaker.before_request("api.example.com")
+        breaker.record_failure("api.example.com")
+        assert breaker.state("api.example.com") == "closed"
+        breaker.record_failure("api.example.com")
+        assert breaker.state("api.example.com") == "open"
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request("api.example.com")
+        assert exc_info.value.retry_after == 30
+
+        # other hosts are unaffected
+        breaker.before_request("other.example.com")
+
+    with mock.patch("anthropic._retry_policy.time.monotonic", return_value=30):
+        assert breaker.state("api.example.com") == "half_open"
+        # only a single trial request is let through
+        assert breaker.before_request("api.example.com")
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("api.example.com")
+
+        # a failed trial re-opens the circuit
+        breaker.record_failure("api.example.com", trial=True)
+        assert breaker.state("api.example.com") == "open"
+
+    with mock.patch("anthropic._retry_policy.time.monotonic", return_value=60):
+        assert breaker.before_request("api.example.com")
+        breaker.record_success("api.example.com", trial=True)
+        assert breaker.state("api.example.com") == "closed"
+
+    stats = breaker.stats()["api.example.com"]
+    assert (stats.state, stats.consecutive_failures, stats.failures, stats.successes, stats.rejected) == (
+        "closed",
+        0,
+        3,
+        1,
+        2,
+    )
+
+
+def test_circuit_breaker_only_closes_on_the_trial_request() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+
+    with mock.patch("anthropic._retry_policy.time.monotonic", return_value=0):
+        # a request sent before the circuit opened
+        assert not breaker.before_request("api.example.com")
+        breaker.record_failure("api.example.com")
+        assert breaker.state("api.example.com") == "open"
+
+        breaker.record_success("api.example.com")
+        assert breaker.state("api.example.com") == "open"
+
+    with mock.patch("anthropic._retry_policy.time.monotonic", return_value=30):
+        assert breaker.before_request("api.example.com")
+        # neither a late success nor a release of another request ends the trial
+        breaker.record_success("api.example.com")
+        breaker.release("api.example.com")
+        assert breaker.state("api.example.com") == "half_open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("api.example.com")
+
+        breaker.record_success("api.example.com", trial=True)
+        assert breaker.state("api.example.com") == "closed"
+
+
+@mock.patch("anthropic._base_client.BaseClient._calculate_retry_timeout", _no_retry_timeout)
+@pytest.mark.respx(base_url=base_url)
+def test_retry_budget_limits_client_retries(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/messages").mock(return_value=httpx.Response(500, json={"error": "down"}))
+    budget = RetryBudget(ratio=0, min_retries_per_second=0.3, window=10)
+
+    client = Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=2, retry_budget=budget)
+    for _ in range(3):
+        with pytest.raises(InternalServerError):
+            client.with_options(timeout=10).messages.create(
+                model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES
+            )
+
+    # three requests, but only three retries between them
+    assert route.call_count == 6
+    assert client.retry_budget is budget
+    assert budget.stats.retries == 3
+    assert budget.stats.rejected == 2
+
+
+@mock.patch("anthropic._base_client.BaseClient._calculate_retry_timeout", _no_retry_timeout)
+@pytest.mark.respx(base_url=base_url)
+def test_circuit_breaker_fails_fast(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/messages").mock(
+        side_effect=[httpx.ConnectError("refused"), httpx.Response(500, json={"error": "down"})]
+    )
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+    client = Anthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=5, circuit_breaker=breaker)
+    # the second failure opens the circuit, which stops the retries
+    with pytest.raises(InternalServerError):
+        client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+    assert route.call_count == 2
+
+    with pytest.raises(CircuitOpenError):
+        client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+    assert route.call_count == 2
+
+    host = httpx.URL(base_url).host
+    assert breaker.stats()[host].state == "open"
+    assert breaker.stats()[host].rejected == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_circuit_breaker_recovers(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/messages").mock(
+        side_effect=[httpx.Response(503, json={"error": "down"}), httpx.Response(200, json=MESSAGE)]
+    )
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+
+    client = AsyncAnthropic(base_url=base_url, api_key="my-anthropic-api-key", max_retries=0, circuit_breaker=breaker)
+    with pytest.raises(InternalServerError):
+        await client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+
+    # the recovery timeout has passed so the next request is a trial, which closes the circuit
+    await client.messages.create(model="claude-sonnet-4-5", max_tokens=1024, messages=MESSAGES)
+    assert route.call_count == 2
+    assert breaker.state(httpx.URL(base_url).host) == "closed"
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from typing import TypeVar, Iterator, AsyncIterator
+from typing import Any, TypeVar, Iterator, AsyncIterator, cast
 
 import httpx
 import pytest
 
 from anthropic import Anthropic, AsyncAnthropic
+from anthropic.types import (
+    TextBlock,
+    TextDelta,
+    RawMessageStreamEvent,
+    RawContentBlockDeltaEvent,
+    RawContentBlockStartEvent,
+)
+from anthropic._compat import PYDANTIC_V1
 from anthropic._streaming import Stream, AsyncStream, ServerSentEvent
 from anthropic._exceptions import APIStatusError
 
@@ -219,6 +227,81 @@ async def test_multi_byte_character_multiple_chunks(
     assert sse.json() == {"content": "известни"}
 
 
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_multiple_events_in_one_chunk(
+    sync: bool,
+    client: Anthropic,
+    async_client: AsyncAnthropic,
+) -> None:
+    def body() -> Iterator[bytes]:
+        yield b'event: ping\ndata: {"foo":true}\n\nevent: completion\ndata: {"bar":false}\n\nevent: comp'
+        yield b"letion\n\n"
+
+    iterator = make_event_iterator(content=body(), sync=sync, client=client, async_client=async_client)
+
+    sse = await iter_next(iterator)
+    assert sse.event == "ping"
+    assert sse.json() == {"foo": True}
+    assert sse.raw == ["event: ping", 'data: {"foo":true}']
+
+    sse = await iter_next(iterator)
+    assert sse.event == "completion"
+    assert sse.json() == {"bar": False}
+
+    sse = await iter_next(iterator)
+    assert sse.event == "completion"
+    assert sse.data == ""
+
+    await assert_empty_iter(iterator)
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_line_endings_split_across_chunks(
+    sync: bool,
+    client: Anthropic,
+    async_client: AsyncAnthropic,
+) -> None:
+    def body() -> Iterator[bytes]:
+        yield b"event: ping\r"
+        yield b'\ndata: {"foo":true}\r\n\r'
+        yield b"\nevent: completion\r\rdata: "
+        yield b'{"bar":false}\r\r'
+
+    iterator = make_event_iterator(content=body(), sync=sync, client=client, async_client=async_client)
+
+    sse = await iter_next(iterator)
+    assert sse.event == "ping"
+    assert sse.json() == {"foo": True}
+
+    sse = await iter_next(iterator)
+    assert sse.event == "completion"
+    assert sse.data == ""
+
+    sse = await iter_next(iterator)
+    assert sse.event is None
+    assert sse.json() == {"bar": False}
+
+    await assert_empty_iter(iterator)
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_incomplete_trailing_event_is_dropped(
+    sync: bool,
+    client: Anthropic,
+    async_client: AsyncAnthropic,
+) -> None:
+    def body() -> Iterator[bytes]:
+        yield b'data: {"foo":true}\n\n'
+        yield b'data: {"bar":false}\n'
+
+    iterator = make_event_iterator(content=body(), sync=sync, client=client, async_client=async_client)
+
+    sse = await iter_next(iterator)
+    assert sse.json() == {"foo": True}
+
+    await assert_empty_iter(iterator)
+
+
 @pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
 async def test_error_type(
     sync: bool,
@@ -238,6 +321,50 @@ async def test_error_type(
     assert "Overloaded" in str(exc_info.value)
 
 
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+@pytest.mark.parametrize("fast_stream_events", ["true", "false"])
+@pytest.mark.parametrize("client", [False], indirect=True, ids=["loose"])
+@pytest.mark.parametrize("async_client", [False], indirect=True, ids=["loose"])
+async def test_message_stream_events(
+    sync: bool,
+    fast_stream_events: str,
+    client: Anthropic,
+    async_client: AsyncAnthropic,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ANTHROPIC_FAST_STREAM_EVENTS", fast_stream_events)
+    has_constructor = fast_stream_events == "true" and not PYDANTIC_V1
+    assert (client._make_stream_event_constructor(RawMessageStreamEvent) is not None) is has_constructor
+
+    def body() -> Iterator[bytes]:
+        yield b"event: content_block_start\n"
+        yield b'data: {"type":"content_block_start","index":0,"content_block":{"type":"text","text":""}}\n\n'
+        yield b"event: content_block_delta\n"
+        yield b'data: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":"Hello"}}\n\n'
+        yield b"event: content_block_delta\n"
+        yield b'data: {"type":"content_block_delta","index":0,"delta":{"type":"future_delta","foo":1}}\n\n'
+
+    iterator = make_stream_iterator(
+        content=body(), sync=sync, client=client, async_client=async_client, cast_to=RawMessageStreamEvent
+    )
+
+    event = await iter_next(iterator)
+    assert isinstance(event, RawContentBlockStartEvent)
+    assert isinstance(event.content_block, TextBlock)
+
+    event = await iter_next(iterator)
+    assert isinstance(event, RawContentBlockDeltaEvent)
+    assert isinstance(event.delta, TextDelta)
+    assert event.delta.text == "Hello"
+
+    # unknown variants are still handed to `construct_type()`
+    event = await iter_next(iterator)
+    assert isinstance(event, RawContentBlockDeltaEvent)
+    assert event.delta.type == cast(Any, "future_delta")
+
+    await assert_empty_iter(iterator)
+
+
 def test_isinstance_check(client: Anthropic, async_client: AsyncAnthropic) -> None:
     async_stream = AsyncStream(cast_to=object, client=async_client, response=httpx.Response(200, content=b"foo"))
     assert isinstance(async_stream, AsyncStream)
@@ -287,16 +414,17 @@ def make_stream_iterator(
     sync: bool,
     client: Anthropic,
     async_client: AsyncAnthropic,
+    cast_to: Any = object,
 ) -> AsyncIterator[object] | Iterator[object]:
     if sync:
         return Stream(
-            cast_to=object,
+            cast_to=cast_to,
             client=client,
             response=httpx.Response(200, content=content, request=httpx.Request("GET", "https://example.com")),
         ).__stream__()
 
     return AsyncStream(
-        cast_to=object,
+        cast_to=cast_to,
         client=async_client,
         response=httpx.Response(200, content=to_aiter(content), request=httpx.Request("GET", "https://example.com")),
     ).__stream__()
@@ -502,3 +502,53 @@ async def test_strips_notgiven(use_async: bool) -> None:
 async def test_strips_omit(use_async: bool) -> None:
     assert await transform({"foo_bar": "bar"}, Foo1, use_async) == {"fooBar": "bar"}
     assert await transform({"foo_bar": omit}, Foo1, use_async) == {}
+
+
+class Block(TypedDict, total=False):
+    type: Required[str]
+    text: str
+    children: Iterable[Block]
+    created_at: Annotated[date, PropertyInfo(format="iso8601")]
+
+
+class Conversation(TypedDict, total=False):
+    blocks: Iterable[Union[Block, Foo1]]
+    tree: Block
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_skips_plain_subtrees(use_async: bool) -> None:
+    blocks: List[Any] = [{"type": "text", "text": "hello", "children": [{"type": "text", "text": "nested"}]}]
+    tree: Block = {"type": "text", "children": blocks}
+
+    # no type nested in `Block` renames keys, so plain JSON data for it is left as-is
+    result = await transform({"tree": tree}, Conversation, use_async)
+    assert result == {"tree": tree}
+    assert result["tree"] is tree
+
+    # but `Foo1` in the union does, so the blocks are transformed
+    data: Any = {"blocks": [{"foo_bar": "bar"}, *blocks]}
+    assert await transform(data, Conversation, use_async) == {"blocks": [{"fooBar": "bar"}, *blocks]}
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_transforms_values_in_plain_subtrees(use_async: bool) -> None:
+    class Model(BaseModel):
+        type: str
+        text: str
+
+    tree = {
+        "type": "text",
+        "children": (
+            {"type": "text", "created_at": date(2023, 2, 23), "text": omit},
+            Model(type="text", text="model"),
+        ),
+    }
+    assert await transform({"tree": tree}, Conversation, use_async) == {
+        "tree": {
+            "type": "text",
+            "children": [{"type": "text", "created_at": "2023-02-23"}, {"type": "text", "text": "model"}],
+        }
+    }
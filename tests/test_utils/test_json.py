@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import enum
+import json
 import datetime
-from typing import Union
+from typing import Any, List, Union, Iterator
 
+import pytest
 import pydantic
 
-from anthropic import _compat
-from anthropic._utils._json import openapi_dumps
+from anthropic import JSONBackend, _compat, get_json_backend, set_json_backend
+from anthropic._utils._json import json_loads, openapi_dumps
 
 
 class TestOpenapiDumps:
@@ -124,3 +127,117 @@ class TestOpenapiDumps:
         data = {"model": model_with_values}
         json_bytes = openapi_dumps(data)
         assert json_bytes == b'{"model":{"name":"Frank","email":"frank@example.com","phone":null}}'
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+ENCODE_CASES: List[Any] = [
+    {"model": "claude", "max_tokens": 1024, "temperature": 0.7, "top_p": 1.0, "stream": False, "stop": None},
+    {"text": 'caf\u00e9 \u2028 \U0001f600 \x00\x1f\x7f \\ " \n\t', "nested": [[], {}, [{"a": (1, 2)}]]},
+    # each on its own, as a single value the fast backends can't write the same way falls back for the whole body
+    *[[value] for value in (0.0, -0.0, 1e-4, 9999999999999998.0, 1e16, 1e-5, 1e22, 5e-324, 1.7976931348623157e308)],
+    *[[value] for value in (2**63 - 1, -(2**63), 2**64 - 1, 2**64, -(2**63) - 1, 10**30)],
+    {1: "int key"},
+    {None: "none key"},
+    {2.5: "float key"},
+]
+
+DECODE_CASES: List[Any] = [
+    b'{"type":"message","content":[{"type":"text","text":"caf\xc3\xa9"}],"usage":{"input_tokens":1}}',
+    '{"a": 1, "a": 2, "b": [1.5, -0.0, 1e-400, 12345678901234567890123]}',
+    b"18446744073709551616",
+    b"-9223372036854775809",
+    b'"\\ud800"',
+    b"[NaN, Infinity, -Infinity, 1e400]",
+    b"\xef\xbb\xbf{}",
+    "{}".encode("utf-16"),
+    b"  [1 , 2]  ",
+]
+
+
+def _backends() -> Iterator[Any]:
+    yield "stdlib"
+    yield "jiter"
+    for name in ("orjson", "msgspec"):
+        yield pytest.param(name, marks=pytest.mark.skipif(not _installed(name), reason=f"{name} is not installed"))
+
+
+def _installed(name: str) -> bool:
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+def _same(a: Any, b: Any) -> bool:
+    # compares floats by representation so that nan, -0.0 and ints vs floats are told apart
+    return type(a) is type(b) and repr(a) == repr(b)
+
+
+class TestJSONBackend:
+    @pytest.fixture(params=list(_backends()))
+    def backend(self, request: pytest.FixtureRequest) -> Iterator[JSONBackend]:
+        previous = get_json_backend()
+        yield set_json_backend(request.param)
+        set_json_backend(previous)
+
+    @pytest.mark.parametrize("obj", ENCODE_CASES)
+    def test_dumps_matches_stdlib(self, backend: JSONBackend, obj: Any) -> None:
+        assert backend.dumps(obj) == json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def test_dumps_sdk_types(self, backend: JSONBackend) -> None:
+        class User(pydantic.BaseModel):
+            name: str
+            score: float = 0.5
+
+        obj = {"color": Color.RED, "when": datetime.datetime(2023, 1, 1, 12, 0, 0), "user": User(name="Eve")}
+        assert backend.dumps(obj) == b'{"color":"red","when":"2023-01-01T12:00:00","user":{"name":"Eve"}}'
+
+    def test_dumps_errors_match_stdlib(self, backend: JSONBackend) -> None:
+        with pytest.raises(ValueError, match="Out of range float values are not JSON compliant"):
+            backend.dumps({"temperature": float("nan")})
+        with pytest.raises(UnicodeEncodeError):
+            backend.dumps({"text": "\ud800"})
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            backend.dumps({"value": object()})
+
+    @pytest.mark.parametrize("data", DECODE_CASES)
+    def test_loads_matches_stdlib(self, backend: JSONBackend, data: Any) -> None:
+        expected = json.loads(data)
+        actual = backend.loads(data)
+        assert repr(actual) == repr(expected)
+        assert _same(actual, expected)
+
+    def test_loads_errors_match_stdlib(self, backend: JSONBackend) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            backend.loads(b'{"a": ')
+        with pytest.raises(UnicodeDecodeError):
+            backend.loads(b'"\xff"')
+
+
+def test_set_json_backend() -> None:
+    previous = get_json_backend()
+    try:
+        assert set_json_backend("stdlib").name == "stdlib"
+        assert get_json_backend().name == "stdlib"
+
+        class Counting(JSONBackend):
+            calls = 0
+
+            def loads(self, data: Any) -> Any:
+                Counting.calls += 1
+                return super().loads(data)
+
+        set_json_backend(Counting())
+        assert json_loads("[1]") == [1]
+        assert Counting.calls == 1
+
+        assert set_json_backend("auto").name in ("orjson", "msgspec", "jiter")
+
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            set_json_backend("ujson")
+    finally:
+        set_json_backend(previous)